@@ -10,6 +10,8 @@ from elastica.rigidbody.rigid_body import RigidBodyBase
 from elastica.rigidbody.cylinder import Cylinder
 from elastica.rigidbody.sphere import Sphere
 from elastica.surface.plane import Plane
+from elastica.surface.signed_distance_field import SignedDistanceField
+from elastica.surface.heightfield import Heightfield
 from elastica.boundary_conditions import (
     ConstraintBase,
     FreeBC,
@@ -43,11 +45,30 @@ from elastica.contact_forces import (
     RodCylinderContact,
     RodSelfContact,
     RodSphereContact,
+    RodMeshRigidBodyContact,
     RodPlaneContact,
+    RodSDFContact,
     RodPlaneContactWithAnisotropicFriction,
+    RodHeightfieldContactWithAnisotropicFriction,
     CylinderPlaneContact,
+    SphereSphereContact,
+    CylinderCylinderContact,
+    SpherePlaneContact,
+)
+from elastica.contact_broad_phase import (
+    AABBHierarchyBroadPhase,
+    BroadPhase,
+    SweepAndPruneBroadPhase,
+    UniformGridBroadPhase,
+    VerletListBroadPhase,
+)
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    ExportCallBack,
+    MyCallBack,
+    RecorderCallBack,
+    BlockRecorderCallBack,
 )
-from elastica.callback_functions import CallBackBaseClass, ExportCallBack, MyCallBack
 from elastica.dissipation import (
     DamperBase,
     AnalyticalLinearDamper,
@@ -80,5 +101,13 @@ from elastica.timestepper import (
 from elastica.timestepper.symplectic_steppers import PositionVerlet, PEFRL
 from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
-from elastica.restart import save_state, load_state
+from elastica.restart import (
+    save_state,
+    load_state,
+    save_checkpoint,
+    load_checkpoint,
+    read_checkpoint,
+    AsyncCheckpointer,
+)
+from elastica.ensemble import Ensemble
 from elastica.mesh.mesh_initializer import Mesh
@@ -4,6 +4,8 @@ from elastica.contact_utils import (
     _dot_product,
     _norm,
     _find_min_dist,
+    _find_min_dist_batch,
+    _find_min_dist_segment_triangle,
     _find_slipping_elements,
     _node_to_element_mass_or_force,
     _elements_to_nodes_inplace,
@@ -22,9 +24,15 @@ from elastica._linalg import (
     _batch_matrix_transpose,
     _batch_vec_oneD_vec_cross,
 )
+from elastica.collision.AABBCollection import _query_face_hierarchy
+from elastica.surface.signed_distance_field import _sdf_trilinear
+from elastica.surface.heightfield import _heightfield_bilinear
+from math import sqrt
+
 import numpy as np
 from numpy.typing import NDArray
 
+import numba
 from numba import njit
 
 
@@ -272,6 +280,356 @@ def _calculate_contact_forces_rod_rod(
                 external_forces_rod_two[..., j + 1] += net_contact_force
 
 
+@njit(cache=True)  # type: ignore
+def _close_pair_segments(
+    node_one: NDArray[np.int64],
+    elem_one: NDArray[np.int64],
+    node_two: NDArray[np.int64],
+    elem_two: NDArray[np.int64],
+    x_collection: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    length: NDArray[np.float64],
+    tangent: NDArray[np.float64],
+) -> tuple[
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+]:
+    """
+    Element-wise bounding check of the pairs of elements (elem_one[k], elem_two[k])
+    starting at the nodes node_one[k] and node_two[k], as in the contact kernels.
+
+    Returns
+    -------
+    tuple
+        Index of the pairs passing the check, and the start and edge of the segments
+        of their elements, in structure-of-arrays layout for `_find_min_dist_batch`.
+    """
+    n_pairs = node_one.shape[0]
+    close = np.empty(n_pairs, dtype=np.int64)
+    n_close = 0
+    for k in range(n_pairs):
+        ei = elem_one[k]
+        ej = elem_two[k]
+        radii_sum = radius[ei] + radius[ej]
+        length_sum = length[ei] + length[ej]
+        # Same as _norm(x_collection[..., ni] - x_collection[..., nj])
+        norm_del_x_squared = np.float64(0.0)
+        for i in range(3):
+            d = x_collection[i, node_one[k]] - x_collection[i, node_two[k]]
+            norm_del_x_squared += d * d
+        # If outside then don't process
+        if sqrt(norm_del_x_squared) < (radii_sum + length_sum):
+            close[n_close] = k
+            n_close += 1
+
+    x1 = np.empty((3, n_close))
+    e1 = np.empty((3, n_close))
+    x2 = np.empty((3, n_close))
+    e2 = np.empty((3, n_close))
+    for c in range(n_close):
+        k = close[c]
+        for i in range(3):
+            x1[i, c] = x_collection[i, node_one[k]]
+            e1[i, c] = tangent[i, elem_one[k]] * length[elem_one[k]]
+            x2[i, c] = x_collection[i, node_two[k]]
+            e2[i, c] = tangent[i, elem_two[k]] * length[elem_two[k]]
+    return close[:n_close], x1, e1, x2, e2
+
+
+@njit(cache=True, inline="always")  # type: ignore
+def _find_min_dist_batch_in_chunks(
+    x1: NDArray[np.float64],
+    e1: NDArray[np.float64],
+    x2: NDArray[np.float64],
+    e2: NDArray[np.float64],
+    distance_vector: NDArray[np.float64],
+    s: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> None:
+    """
+    `_find_min_dist_batch` over chunks of pairs in a `prange` loop, for the buffered
+    pair kernels. Inlined so that the loop runs in parallel in their parallel builds.
+    """
+    chunk_size = 1024
+    n = x1.shape[1]
+    for chunk in numba.prange((n + chunk_size - 1) // chunk_size):
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, n)
+        _find_min_dist_batch(
+            x1[:, start:stop],
+            e1[:, start:stop],
+            x2[:, start:stop],
+            e2[:, start:stop],
+            distance_vector[:, start:stop],
+            s[start:stop],
+            t[start:stop],
+        )
+
+
+# The pair helpers below are inlined in the numba IR of the pair kernels: as separate
+# functions, their array temporaries make the kernels slower than a single loop body.
+@njit(cache=True, inline="always")  # type: ignore
+def _rod_rod_pair_spring_damping_force(
+    ni: int,
+    nj: int,
+    radii_sum: np.float64,
+    distance_vector: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+) -> tuple[bool, np.float64]:
+    """
+    Part of the contact force between the elements starting at the nodes ni and nj
+    that does not depend on the nodal forces, as in
+    `_calculate_contact_forces_rod_rod`: whether the elements are in contact, and if
+    so the spring and damping force. The distance vector between the elements, from
+    `_find_min_dist`, is normalized in place.
+    """
+    distance_vector_length = _norm(distance_vector)
+    for i in range(3):
+        distance_vector[i] /= distance_vector_length
+    gamma = radii_sum - distance_vector_length
+
+    # If distance is large, don't worry about it
+    if gamma < -1e-5:
+        return False, 0.0
+
+    mask = (gamma > 0.0) * 1.0
+
+    contact_force = contact_k * gamma
+    interpenetration_velocity = 0.5 * (
+        (velocity[..., ni] + velocity[..., ni + 1])
+        - (velocity[..., nj] + velocity[..., nj + 1])
+    )
+    contact_damping_force = contact_nu * _dot_product(
+        interpenetration_velocity, distance_vector
+    )
+    return True, 0.5 * mask * (contact_damping_force + contact_force)
+
+
+@njit(cache=True, inline="always")  # type: ignore
+def _rod_rod_pair_contact_force(
+    ni: int,
+    nj: int,
+    distance_vector: NDArray[np.float64],
+    spring_damping_force: np.float64,
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Contact force on the element starting at the node nj from the element starting at
+    the node ni, adding the normal force from the current nodal forces to the result
+    of `_rod_rod_pair_spring_damping_force`.
+    """
+    # Same as 0.5 * (sum of the forces on the nodes of the element nj) - 0.5 * (sum
+    # of the forces on the nodes of the element ni), component by component
+    normal_force = np.float64(0.0)
+    for i in range(3):
+        rod_one_elemental_force = 0.5 * (
+            external_forces[i, ni]
+            + external_forces[i, ni + 1]
+            + internal_forces[i, ni]
+            + internal_forces[i, ni + 1]
+        )
+        rod_two_elemental_force = 0.5 * (
+            external_forces[i, nj]
+            + external_forces[i, nj + 1]
+            + internal_forces[i, nj]
+            + internal_forces[i, nj + 1]
+        )
+        equilibrium_force = -rod_one_elemental_force + rod_two_elemental_force
+        normal_force += equilibrium_force * distance_vector[i]
+    # Following line same as np.where(normal_force < 0.0, -normal_force, 0.0)
+    normal_force = abs(min(normal_force, 0.0))
+
+    # magnitude* direction
+    return (normal_force + spring_damping_force) * distance_vector
+
+
+@njit(cache=True, inline="always")  # type: ignore
+def _add_rod_rod_pair_contact_force(
+    p: int,
+    q: int,
+    net_contact_force: NDArray[np.float64],
+    node_idx: NDArray[np.int64],
+    local_idx: NDArray[np.int64],
+    n_points: NDArray[np.int64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    ni = node_idx[p]
+    nj = node_idx[q]
+    # Add it to the rods at the end of the day
+    if local_idx[p] == 0:
+        external_forces[..., ni] -= net_contact_force * 2 / 3
+        external_forces[..., ni + 1] -= net_contact_force * 4 / 3
+    elif local_idx[p] == n_points[p] - 1:
+        external_forces[..., ni] -= net_contact_force * 4 / 3
+        external_forces[..., ni + 1] -= net_contact_force * 2 / 3
+    else:
+        external_forces[..., ni] -= net_contact_force
+        external_forces[..., ni + 1] -= net_contact_force
+
+    if local_idx[q] == 0:
+        external_forces[..., nj] += net_contact_force * 2 / 3
+        external_forces[..., nj + 1] += net_contact_force * 4 / 3
+    elif local_idx[q] == n_points[q] - 1:
+        external_forces[..., nj] += net_contact_force * 4 / 3
+        external_forces[..., nj + 1] += net_contact_force * 2 / 3
+    else:
+        external_forces[..., nj] += net_contact_force
+        external_forces[..., nj + 1] += net_contact_force
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_rod_rod_pairs(
+    first: NDArray[np.int64],
+    second: NDArray[np.int64],
+    elem_idx: NDArray[np.int64],
+    node_idx: NDArray[np.int64],
+    local_idx: NDArray[np.int64],
+    n_points: NDArray[np.int64],
+    x_collection: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    length: NDArray[np.float64],
+    tangent: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+) -> None:
+    """
+    Same as `_calculate_contact_forces_rod_rod`, for the element pairs
+    (first[k], second[k]) of rods stored in the same memory block. Elements are given
+    as indices in the arrays elem_idx (index of the element in the block), node_idx
+    (index of its first node in the block), local_idx (index of the element in its rod)
+    and n_points (number of elements of its rod).
+
+    The distances between the segments of the pairs passing the bounding check are
+    computed at once by `_find_min_dist_batch`.
+    """
+    close, x1, e1, x2, e2 = _close_pair_segments(
+        node_idx[first],
+        elem_idx[first],
+        node_idx[second],
+        elem_idx[second],
+        x_collection,
+        radius,
+        length,
+        tangent,
+    )
+    n_close = close.shape[0]
+    distance_vectors = np.empty((3, n_close))
+    s = np.empty(n_close)
+    t = np.empty(n_close)
+    _find_min_dist_batch(x1, e1, x2, e2, distance_vectors, s, t)
+
+    for c in range(n_close):
+        p = first[close[c]]
+        q = second[close[c]]
+        ni = node_idx[p]
+        nj = node_idx[q]
+        distance_vector = distance_vectors[:, c]
+        in_contact, spring_damping_force = _rod_rod_pair_spring_damping_force(
+            ni,
+            nj,
+            radius[elem_idx[p]] + radius[elem_idx[q]],
+            distance_vector,
+            velocity,
+            contact_k,
+            contact_nu,
+        )
+        if in_contact:
+            net_contact_force = _rod_rod_pair_contact_force(
+                ni,
+                nj,
+                distance_vector,
+                spring_damping_force,
+                internal_forces,
+                external_forces,
+            )
+            _add_rod_rod_pair_contact_force(
+                p, q, net_contact_force, node_idx, local_idx, n_points, external_forces
+            )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_rod_rod_pairs_buffered(
+    first: NDArray[np.int64],
+    second: NDArray[np.int64],
+    elem_idx: NDArray[np.int64],
+    node_idx: NDArray[np.int64],
+    local_idx: NDArray[np.int64],
+    n_points: NDArray[np.int64],
+    x_collection: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    length: NDArray[np.float64],
+    tangent: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+) -> None:
+    """
+    Same as `_calculate_contact_forces_rod_rod_pairs`, with the part of the force of
+    every pair that does not depend on nodal forces (distance, spring and damping)
+    computed first, in `prange` loops. The normal force, which depends on the forces
+    added by the previous pairs, is then computed and added to the nodes in the order
+    of the pairs, so the result is the same as the serial kernel, whatever the number
+    of threads.
+    """
+    close, x1, e1, x2, e2 = _close_pair_segments(
+        node_idx[first],
+        elem_idx[first],
+        node_idx[second],
+        elem_idx[second],
+        x_collection,
+        radius,
+        length,
+        tangent,
+    )
+    n_close = close.shape[0]
+    distance_vectors = np.empty((3, n_close))
+    s = np.empty(n_close)
+    t = np.empty(n_close)
+    _find_min_dist_batch_in_chunks(x1, e1, x2, e2, distance_vectors, s, t)
+
+    spring_damping_forces = np.zeros(n_close)
+    in_contact = np.zeros(n_close, dtype=np.bool_)
+    for c in numba.prange(n_close):
+        p = first[close[c]]
+        q = second[close[c]]
+        in_contact[c], spring_damping_forces[c] = _rod_rod_pair_spring_damping_force(
+            node_idx[p],
+            node_idx[q],
+            radius[elem_idx[p]] + radius[elem_idx[q]],
+            distance_vectors[:, c],
+            velocity,
+            contact_k,
+            contact_nu,
+        )
+
+    for c in range(n_close):
+        if in_contact[c]:
+            p = first[close[c]]
+            q = second[close[c]]
+            net_contact_force = _rod_rod_pair_contact_force(
+                node_idx[p],
+                node_idx[q],
+                distance_vectors[:, c],
+                spring_damping_forces[c],
+                internal_forces,
+                external_forces,
+            )
+            _add_rod_rod_pair_contact_force(
+                p, q, net_contact_force, node_idx, local_idx, n_points, external_forces
+            )
+
+
 @njit(cache=True)  # type: ignore
 def _calculate_contact_forces_self_rod(
     x_collection_rod: NDArray[np.float64],
@@ -360,6 +718,197 @@ def _calculate_contact_forces_self_rod(
                 external_forces_rod[..., j + 1] += net_contact_force
 
 
+@njit(cache=True, inline="always")  # type: ignore
+def _self_rod_pair_contact_force(
+    i: int,
+    j: int,
+    radii_sum: np.float64,
+    distance_vector: NDArray[np.float64],
+    velocity_rod: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+    net_contact_force_out: NDArray[np.float64],
+) -> bool:
+    """
+    Whether the elements i and j are in contact, and if so the contact force on the
+    element j from the element i, as in `_calculate_contact_forces_self_rod`, stored
+    in net_contact_force_out. The distance vector between the elements, from
+    `_find_min_dist`, is normalized in place.
+    """
+    distance_vector_length = _norm(distance_vector)
+    for k in range(3):
+        distance_vector[k] /= distance_vector_length
+
+    gamma = radii_sum - distance_vector_length
+
+    # If distance is large, don't worry about it
+    if gamma < -1e-5:
+        return False
+
+    mask = (gamma > 0.0) * 1.0
+
+    contact_force = contact_k * gamma
+    interpenetration_velocity = 0.5 * (
+        (velocity_rod[..., i] + velocity_rod[..., i + 1])
+        - (velocity_rod[..., j] + velocity_rod[..., j + 1])
+    )
+    contact_damping_force = contact_nu * _dot_product(
+        interpenetration_velocity, distance_vector
+    )
+
+    # magnitude* direction
+    net_contact_force_out[:] = (
+        0.5 * mask * (contact_damping_force + contact_force)
+    ) * distance_vector
+    return True
+
+
+@njit(cache=True, inline="always")  # type: ignore
+def _add_self_rod_pair_contact_force(
+    i: int,
+    j: int,
+    net_contact_force: NDArray[np.float64],
+    n_points_rod: int,
+    external_forces_rod: NDArray[np.float64],
+) -> None:
+    # Add it to the rods at the end of the day
+    if i == n_points_rod - 1:
+        external_forces_rod[..., i] -= net_contact_force * 4 / 3
+        external_forces_rod[..., i + 1] -= net_contact_force * 2 / 3
+    else:
+        external_forces_rod[..., i] -= net_contact_force
+        external_forces_rod[..., i + 1] -= net_contact_force
+
+    if j == 0:
+        external_forces_rod[..., j] += net_contact_force * 2 / 3
+        external_forces_rod[..., j + 1] += net_contact_force * 4 / 3
+    else:
+        external_forces_rod[..., j] += net_contact_force
+        external_forces_rod[..., j + 1] += net_contact_force
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_self_rod_pairs(
+    first: NDArray[np.int64],
+    second: NDArray[np.int64],
+    x_collection_rod: NDArray[np.float64],
+    radius_rod: NDArray[np.float64],
+    length_rod: NDArray[np.float64],
+    tangent_rod: NDArray[np.float64],
+    velocity_rod: NDArray[np.float64],
+    external_forces_rod: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+) -> None:
+    """
+    Same as `_calculate_contact_forces_self_rod`, for the element pairs
+    (first[k], second[k]) only, first[k] > second[k]. Pairs closer along the rod than
+    the skip distance must be removed beforehand.
+
+    The distances between the segments of the pairs passing the bounding check are
+    computed at once by `_find_min_dist_batch`.
+    """
+    # We already pass in only the first n_elem x
+    n_points_rod = x_collection_rod.shape[1]
+    close, x1, e1, x2, e2 = _close_pair_segments(
+        first,
+        first,
+        second,
+        second,
+        x_collection_rod,
+        radius_rod,
+        length_rod,
+        tangent_rod,
+    )
+    n_close = close.shape[0]
+    distance_vectors = np.empty((3, n_close))
+    s = np.empty(n_close)
+    t = np.empty(n_close)
+    _find_min_dist_batch(x1, e1, x2, e2, distance_vectors, s, t)
+
+    net_contact_force = np.empty(3)
+    for c in range(n_close):
+        i = first[close[c]]
+        j = second[close[c]]
+        in_contact = _self_rod_pair_contact_force(
+            i,
+            j,
+            radius_rod[i] + radius_rod[j],
+            distance_vectors[:, c],
+            velocity_rod,
+            contact_k,
+            contact_nu,
+            net_contact_force,
+        )
+        if in_contact:
+            _add_self_rod_pair_contact_force(
+                i, j, net_contact_force, n_points_rod, external_forces_rod
+            )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_self_rod_pairs_buffered(
+    first: NDArray[np.int64],
+    second: NDArray[np.int64],
+    x_collection_rod: NDArray[np.float64],
+    radius_rod: NDArray[np.float64],
+    length_rod: NDArray[np.float64],
+    tangent_rod: NDArray[np.float64],
+    velocity_rod: NDArray[np.float64],
+    external_forces_rod: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+) -> None:
+    """
+    Same as `_calculate_contact_forces_self_rod_pairs`, with the force of every pair
+    computed first, in `prange` loops, then added to the nodes in the order of the
+    pairs. Pair forces do not depend on the forces of other pairs, so the result is
+    the same as the serial kernel, whatever the number of threads.
+    """
+    n_points_rod = x_collection_rod.shape[1]
+    close, x1, e1, x2, e2 = _close_pair_segments(
+        first,
+        first,
+        second,
+        second,
+        x_collection_rod,
+        radius_rod,
+        length_rod,
+        tangent_rod,
+    )
+    n_close = close.shape[0]
+    distance_vectors = np.empty((3, n_close))
+    s = np.empty(n_close)
+    t = np.empty(n_close)
+    _find_min_dist_batch_in_chunks(x1, e1, x2, e2, distance_vectors, s, t)
+
+    pair_forces = np.zeros((3, n_close))
+    in_contact = np.zeros(n_close, dtype=np.bool_)
+    for c in numba.prange(n_close):
+        i = first[close[c]]
+        j = second[close[c]]
+        in_contact[c] = _self_rod_pair_contact_force(
+            i,
+            j,
+            radius_rod[i] + radius_rod[j],
+            distance_vectors[:, c],
+            velocity_rod,
+            contact_k,
+            contact_nu,
+            pair_forces[:, c],
+        )
+
+    for c in range(n_close):
+        if in_contact[c]:
+            _add_self_rod_pair_contact_force(
+                first[close[c]],
+                second[close[c]],
+                pair_forces[:, c],
+                n_points_rod,
+                external_forces_rod,
+            )
+
+
 @njit(cache=True)  # type: ignore
 def _calculate_contact_forces_rod_sphere(
     x_collection_rod: NDArray[np.float64],
@@ -486,6 +1035,173 @@ def _calculate_contact_forces_rod_sphere(
     )
 
 
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_rod_mesh(
+    x_collection_rod: NDArray[np.float64],
+    radius_rod: NDArray[np.float64],
+    velocity_rod: NDArray[np.float64],
+    external_forces_rod: NDArray[np.float64],
+    x_body: NDArray[np.float64],
+    body_director_collection: NDArray[np.float64],
+    velocity_body: NDArray[np.float64],
+    omega_body: NDArray[np.float64],
+    external_forces_body: NDArray[np.float64],
+    external_torques_body: NDArray[np.float64],
+    faces: NDArray[np.float64],
+    face_normals: NDArray[np.float64],
+    boxes: NDArray[np.float64],
+    first_child: NDArray[np.int64],
+    face_start: NDArray[np.int64],
+    face_stop: NDArray[np.int64],
+    depth: int,
+    contact_k: np.float64,
+    contact_nu: np.float64,
+    velocity_damping_coefficient: np.float64,
+    friction_coefficient: np.float64,
+) -> None:
+    """
+    Contact forces between the elements of a rod and the faces of a mesh rigid body.
+    Faces, face normals and the hierarchy of their AABBs (`FaceAABBHierarchy`) are
+    given in the material frame of the body. Every element is mapped to that frame,
+    the hierarchy gives the faces near it, and the force is computed from the
+    closest of them, as for a cylinder of zero radius.
+    """
+    n_elems = radius_rod.shape[0]
+    body_total_contact_forces = np.zeros((3))
+    body_total_contact_torques = np.zeros((3))
+    # Material frame to lab frame, and angular velocity in the lab frame
+    director_transpose = body_director_collection.T.copy()
+    omega_body_lab = director_transpose @ omega_body
+
+    stack = np.empty(depth + 2, dtype=np.int64)
+    found = np.empty(faces.shape[2], dtype=np.int64)
+    lower = np.empty(3)
+    upper = np.empty(3)
+    for i in range(n_elems):
+        # Element in the material frame of the body
+        start = body_director_collection @ (x_collection_rod[..., i] - x_body)
+        end = body_director_collection @ (x_collection_rod[..., i + 1] - x_body)
+        edge = end - start
+        for m in range(3):
+            lower[m] = min(start[m], end[m]) - radius_rod[i] - 1e-5
+            upper[m] = max(start[m], end[m]) + radius_rod[i] + 1e-5
+        n_found = _query_face_hierarchy(
+            boxes, first_child, face_start, face_stop, lower, upper, stack, found
+        )
+        if n_found == 0:
+            continue
+
+        # Closest face to the element
+        closest_face = found[0]
+        distance_vector, contact_point = _find_min_dist_segment_triangle(
+            start,
+            edge,
+            faces[:, 0, closest_face],
+            faces[:, 1, closest_face],
+            faces[:, 2, closest_face],
+        )
+        distance_vector_length = _norm(distance_vector)
+        for f in range(1, n_found):
+            face = found[f]
+            potential_distance_vector, potential_contact_point = (
+                _find_min_dist_segment_triangle(
+                    start, edge, faces[:, 0, face], faces[:, 1, face], faces[:, 2, face]
+                )
+            )
+            potential_distance = _norm(potential_distance_vector)
+            if potential_distance < distance_vector_length:
+                closest_face = face
+                distance_vector = potential_distance_vector
+                contact_point = potential_contact_point
+                distance_vector_length = potential_distance
+
+        gamma = radius_rod[i] - distance_vector_length
+
+        # If distance is large, don't worry about it
+        if gamma < -1e-5:
+            continue
+
+        if distance_vector_length > 1e-14:
+            distance_vector = distance_vector / distance_vector_length
+        else:
+            # Element crossing the face: pushed back to the side of its center
+            distance_vector = -face_normals[:, closest_face].copy()
+            if (
+                _dot_product(
+                    0.5 * (start + end) - contact_point, face_normals[:, closest_face]
+                )
+                < 0.0
+            ):
+                distance_vector = -distance_vector
+
+        # Back to the lab frame
+        distance_vector = director_transpose @ distance_vector
+        moment_arm = director_transpose @ contact_point
+
+        # CHECK FOR GAMMA > 0.0, heaviside but we need to overload it in numba
+        # As a quick fix, use this instead
+        mask = (gamma > 0.0) * 1.0
+
+        # Compute contact spring force
+        contact_force = contact_k * gamma * distance_vector
+        interpenetration_velocity = (
+            velocity_body + np.cross(omega_body_lab, moment_arm)
+        ) - 0.5 * (velocity_rod[..., i] + velocity_rod[..., i + 1])
+        # Compute contact damping
+        normal_interpenetration_velocity = (
+            _dot_product(interpenetration_velocity, distance_vector) * distance_vector
+        )
+        contact_damping_force = -contact_nu * normal_interpenetration_velocity
+
+        # magnitude* direction
+        net_contact_force = 0.5 * mask * (contact_damping_force + contact_force)
+
+        # Compute friction
+        slip_interpenetration_velocity = (
+            interpenetration_velocity - normal_interpenetration_velocity
+        )
+        slip_interpenetration_velocity_mag = np.linalg.norm(
+            slip_interpenetration_velocity
+        )
+        slip_interpenetration_velocity_unitized = slip_interpenetration_velocity / (
+            slip_interpenetration_velocity_mag + 1e-14
+        )
+        # Compute friction force in the slip direction.
+        damping_force_in_slip_direction = (
+            velocity_damping_coefficient * slip_interpenetration_velocity_mag
+        )
+        # Compute Coulombic friction
+        coulombic_friction_force = friction_coefficient * np.linalg.norm(
+            net_contact_force
+        )
+        # Compare damping force in slip direction and kinetic friction and minimum is the friction force.
+        friction_force = (
+            -min(damping_force_in_slip_direction, coulombic_friction_force)
+            * slip_interpenetration_velocity_unitized
+        )
+        # Update contact force
+        net_contact_force += friction_force
+
+        # Add it to the rods at the end of the day
+        if i == 0:
+            external_forces_rod[..., i] -= 2 / 3 * net_contact_force
+            external_forces_rod[..., i + 1] -= 4 / 3 * net_contact_force
+        elif i == n_elems - 1:
+            external_forces_rod[..., i] -= 4 / 3 * net_contact_force
+            external_forces_rod[..., i + 1] -= 2 / 3 * net_contact_force
+        else:
+            external_forces_rod[..., i] -= net_contact_force
+            external_forces_rod[..., i + 1] -= net_contact_force
+        body_total_contact_forces += 2.0 * net_contact_force
+        body_total_contact_torques += np.cross(moment_arm, 2.0 * net_contact_force)
+
+    # Update the body external forces and torques
+    external_forces_body[..., 0] += body_total_contact_forces
+    external_torques_body[..., 0] += (
+        body_director_collection @ body_total_contact_torques
+    )
+
+
 @njit(cache=True)  # type: ignore
 def _calculate_contact_forces_rod_plane(
     plane_origin: NDArray[np.float64],
@@ -571,6 +1287,102 @@ def _calculate_contact_forces_rod_plane(
     return (_batch_norm(plane_response_force), no_contact_point_idx)
 
 
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_rod_sdf(
+    distance_grid: NDArray[np.float64],
+    grid_origin: NDArray[np.float64],
+    inv_spacing: NDArray[np.float64],
+    surface_tol: np.float64,
+    k: np.float64,
+    nu: np.float64,
+    elem_idx: NDArray[np.int64],
+    node_idx: NDArray[np.int64],
+    local_idx: NDArray[np.int64],
+    n_points: NDArray[np.int64],
+    radius: NDArray[np.float64],
+    mass: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    """
+    Same as `_calculate_contact_forces_rod_plane`, with the plane replaced at every
+    element by the level set of a signed distance field through the element center:
+    the distance is the interpolated field and the normal its normalized gradient.
+
+    Elements are given as in `RodContactGroup`: index of the element (elem_idx) and
+    of its first node (node_idx) in the arrays, index of the element in its rod
+    (local_idx) and number of elements of its rod (n_points). All the elements of a
+    memory block are handled in one call; the forces of all the elements are computed
+    before any is added.
+    """
+    n_elements = elem_idx.shape[0]
+    response_forces = np.zeros((3, n_elements))
+    normal = np.empty(3)
+    element_position = np.empty(3)
+    for e in range(n_elements):
+        i = node_idx[e]
+        for m in range(3):
+            element_position[m] = 0.5 * (
+                position_collection[m, i] + position_collection[m, i + 1]
+            )
+        distance = _sdf_trilinear(
+            distance_grid, grid_origin, inv_spacing, element_position, normal
+        )
+        separation = distance - radius[elem_idx[e]]
+        # Check if the rod element is in contact with the surface
+        if separation > surface_tol:
+            continue
+        normal_norm = _norm(normal)
+        if normal_norm == 0.0:
+            continue
+        for m in range(3):
+            normal[m] /= normal_norm
+
+        # Compute surface response force, from the total force on the element
+        nodal_weight_first = 1.0 if local_idx[e] == 0 else 0.5
+        nodal_weight_second = 1.0 if local_idx[e] == n_points[e] - 1 else 0.5
+        force_component_along_normal_direction = 0.0
+        for m in range(3):
+            force_component_along_normal_direction += normal[m] * (
+                nodal_weight_first * (internal_forces[m, i] + external_forces[m, i])
+                + nodal_weight_second
+                * (internal_forces[m, i + 1] + external_forces[m, i + 1])
+            )
+        # If the total force component along the normal direction is greater than
+        # zero, the force pushes the rod away from the surface and the response is
+        # zero.
+        surface_response_force = -min(force_component_along_normal_direction, 0.0)
+
+        # Elastic force response due to penetration
+        elastic_force = -k * min(separation, 0.0)
+
+        # Damping force response due to velocity towards the surface
+        normal_component_of_element_velocity = 0.0
+        for m in range(3):
+            normal_component_of_element_velocity += normal[m] * (
+                (
+                    mass[i] * velocity_collection[m, i]
+                    + mass[i + 1] * velocity_collection[m, i + 1]
+                )
+                / (mass[i] + mass[i + 1])
+            )
+        damping_force = -nu * normal_component_of_element_velocity
+
+        for m in range(3):
+            response_forces[m, e] = (
+                surface_response_force + elastic_force + damping_force
+            ) * normal[m]
+
+    # Update the external forces
+    for e in range(n_elements):
+        i = node_idx[e]
+        for m in range(3):
+            external_forces[m, i] += 0.5 * response_forces[m, e]
+            external_forces[m, i + 1] += 0.5 * response_forces[m, e]
+
+
 @njit(cache=True)  # type: ignore
 def _calculate_contact_forces_rod_plane_with_anisotropic_friction(
     plane_origin: NDArray[np.float64],
@@ -784,6 +1596,377 @@ def _calculate_contact_forces_rod_plane_with_anisotropic_friction(
     )
 
 
+@njit(cache=True)  # type: ignore
+def _slip_function(
+    velocity_slip_mag: np.float64, velocity_threshold: np.float64
+) -> np.float64:
+    """Slip function of `_find_slipping_elements` for one element"""
+    if velocity_slip_mag > velocity_threshold:
+        return abs(1.0 - min(1.0, velocity_slip_mag / velocity_threshold - 1.0))
+    return 1.0
+
+
+@njit(cache=True)  # type: ignore
+def _add_rotated_cross(
+    director_collection: NDArray[np.float64],
+    elem: int,
+    first: NDArray[np.float64],
+    second: NDArray[np.float64],
+    out: NDArray[np.float64],
+) -> None:
+    """out[:, elem] += Q @ (first x second), with Q the director of the element"""
+    cross_0 = first[1] * second[2] - first[2] * second[1]
+    cross_1 = first[2] * second[0] - first[0] * second[2]
+    cross_2 = first[0] * second[1] - first[1] * second[0]
+    for m in range(3):
+        out[m, elem] += (
+            director_collection[m, 0, elem] * cross_0
+            + director_collection[m, 1, elem] * cross_1
+            + director_collection[m, 2, elem] * cross_2
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_rod_heightfield_with_anisotropic_friction(
+    heights: NDArray[np.float64],
+    normals: NDArray[np.float64],
+    grid_origin: NDArray[np.float64],
+    inv_spacing: NDArray[np.float64],
+    grid_axes: NDArray[np.int64],
+    up_axis: int,
+    surface_tol: np.float64,
+    slip_velocity_tol: np.float64,
+    k: np.float64,
+    nu: np.float64,
+    kinetic_mu_forward: np.float64,
+    kinetic_mu_backward: np.float64,
+    kinetic_mu_sideways: np.float64,
+    static_mu_forward: np.float64,
+    static_mu_backward: np.float64,
+    static_mu_sideways: np.float64,
+    elem_idx: NDArray[np.int64],
+    node_idx: NDArray[np.int64],
+    local_idx: NDArray[np.int64],
+    n_points: NDArray[np.int64],
+    radius: NDArray[np.float64],
+    mass: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+) -> None:
+    """
+    Same as `_calculate_contact_forces_rod_plane_with_anisotropic_friction`, with the
+    plane replaced at every element by the plane tangent to a heightfield below the
+    element center: the normal is the interpolated terrain normal and the distance
+    is the height of the element above the terrain, projected on that normal.
+
+    Elements are given as in `RodContactGroup`, see `_calculate_contact_forces_rod_sdf`.
+    As in the plane version, the normal response and kinetic friction of all the
+    elements are added first, then the static friction, computed from the total
+    forces after the first step, of all the elements.
+    """
+    n_elements = elem_idx.shape[0]
+    in_contact = np.zeros(n_elements, dtype=np.bool_)
+    plane_response_force_mag = np.zeros(n_elements)
+    slip_function_along_axial_direction = np.zeros(n_elements)
+    slip_function_along_rolling_direction = np.zeros(n_elements)
+    surface_normal = np.zeros((3, n_elements))
+    axial_direction = np.zeros((3, n_elements))
+    rolling_direction = np.zeros((3, n_elements))
+    element_forces = np.zeros((3, n_elements))
+
+    normal = np.empty(3)
+    element_position = np.empty(3)
+    element_velocity = np.empty(3)
+    axial = np.empty(3)
+    rolling = np.empty(3)
+    torque_arm = np.empty(3)
+    rotation_velocity = np.empty(3)
+    vector = np.empty(3)
+    unitized_total_velocity = np.empty(3)
+    friction_force = np.empty(3)
+    axis_u = grid_axes[0]
+    axis_v = grid_axes[1]
+
+    # Normal response and kinetic friction
+    for e in range(n_elements):
+        i = node_idx[e]
+        elem = elem_idx[e]
+        for m in range(3):
+            element_position[m] = 0.5 * (
+                position_collection[m, i] + position_collection[m, i + 1]
+            )
+        (
+            terrain_height,
+            normal[0],
+            normal[1],
+            normal[2],
+        ) = _heightfield_bilinear(
+            heights,
+            normals,
+            grid_origin[axis_u],
+            grid_origin[axis_v],
+            inv_spacing[0],
+            inv_spacing[1],
+            element_position[axis_u],
+            element_position[axis_v],
+        )
+        distance_from_surface = (
+            element_position[up_axis] - grid_origin[up_axis] - terrain_height
+        ) * normal[up_axis]
+        separation = distance_from_surface - radius[elem]
+        # Check if the rod element is in contact with the surface
+        if separation > surface_tol:
+            continue
+        in_contact[e] = True
+
+        # Surface response force, from the total force on the element
+        nodal_weight_first = 1.0 if local_idx[e] == 0 else 0.5
+        nodal_weight_second = 1.0 if local_idx[e] == n_points[e] - 1 else 0.5
+        force_component_along_normal_direction = 0.0
+        normal_component_of_element_velocity = 0.0
+        for m in range(3):
+            force_component_along_normal_direction += normal[m] * (
+                nodal_weight_first * (internal_forces[m, i] + external_forces[m, i])
+                + nodal_weight_second
+                * (internal_forces[m, i + 1] + external_forces[m, i + 1])
+            )
+            element_velocity[m] = (
+                mass[i] * velocity_collection[m, i]
+                + mass[i + 1] * velocity_collection[m, i + 1]
+            ) / (mass[i] + mass[i + 1])
+            normal_component_of_element_velocity += normal[m] * element_velocity[m]
+        response_force_mag = -min(force_component_along_normal_direction, 0.0)
+        elastic_force = -k * min(separation, 0.0)
+        damping_force = -nu * normal_component_of_element_velocity
+        plane_response_force_mag[e] = response_force_mag
+
+        # Friction acts in the tangent plane: project the rod tangent on it to get the
+        # axial direction.
+        tangent_along_normal_direction = 0.0
+        for m in range(3):
+            tangent_along_normal_direction += normal[m] * tangents[m, elem]
+        for m in range(3):
+            axial[m] = tangents[m, elem] - tangent_along_normal_direction * normal[m]
+        inv_axial_norm = 1.0 / (
+            sqrt(axial[0] * axial[0] + axial[1] * axial[1] + axial[2] * axial[2])
+            + 1e-14
+        )
+        velocity_mag_along_axial_direction = 0.0
+        for m in range(3):
+            axial[m] *= inv_axial_norm
+            velocity_mag_along_axial_direction += element_velocity[m] * axial[m]
+        velocity_sign_along_axial_direction = np.sign(
+            velocity_mag_along_axial_direction
+        )
+        kinetic_mu = 0.5 * (
+            kinetic_mu_forward * (1 + velocity_sign_along_axial_direction)
+            + kinetic_mu_backward * (1 - velocity_sign_along_axial_direction)
+        )
+        slip_axial = _slip_function(
+            abs(velocity_mag_along_axial_direction)
+            * sqrt(axial[0] * axial[0] + axial[1] * axial[1] + axial[2] * axial[2]),
+            slip_velocity_tol,
+        )
+
+        # Rolling direction, and slip velocity of the contact point along it,
+        # w_rot = Q.T @ omega @ Q @ r
+        rolling[0] = axial[1] * normal[2] - axial[2] * normal[1]
+        rolling[1] = axial[2] * normal[0] - axial[0] * normal[2]
+        rolling[2] = axial[0] * normal[1] - axial[1] * normal[0]
+        for m in range(3):
+            torque_arm[m] = -normal[m] * radius[elem]
+        for m in range(3):
+            vector[m] = (
+                director_collection[m, 0, elem] * torque_arm[0]
+                + director_collection[m, 1, elem] * torque_arm[1]
+                + director_collection[m, 2, elem] * torque_arm[2]
+            )
+        omega_cross = (
+            omega_collection[1, elem] * vector[2]
+            - omega_collection[2, elem] * vector[1],
+            omega_collection[2, elem] * vector[0]
+            - omega_collection[0, elem] * vector[2],
+            omega_collection[0, elem] * vector[1]
+            - omega_collection[1, elem] * vector[0],
+        )
+        for m in range(3):
+            rotation_velocity[m] = (
+                director_collection[0, m, elem] * omega_cross[0]
+                + director_collection[1, m, elem] * omega_cross[1]
+                + director_collection[2, m, elem] * omega_cross[2]
+            )
+        slip_velocity_mag_along_rolling_direction = 0.0
+        for m in range(3):
+            slip_velocity_mag_along_rolling_direction += (
+                element_velocity[m] + rotation_velocity[m]
+            ) * rolling[m]
+        slip_rolling = _slip_function(
+            abs(slip_velocity_mag_along_rolling_direction)
+            * sqrt(
+                rolling[0] * rolling[0]
+                + rolling[1] * rolling[1]
+                + rolling[2] * rolling[2]
+            ),
+            slip_velocity_tol,
+        )
+
+        # Unitized total slip velocity, to distribute the weight of the rod in the
+        # axial and rolling directions
+        for m in range(3):
+            unitized_total_velocity[m] = (
+                slip_velocity_mag_along_rolling_direction * rolling[m]
+                + velocity_mag_along_axial_direction * axial[m]
+            )
+            vector[m] = unitized_total_velocity[m] + 1e-14
+        inv_total_velocity_norm = 1.0 / sqrt(
+            vector[0] * vector[0] + vector[1] * vector[1] + vector[2] * vector[2]
+        )
+        total_velocity_along_axial_direction = 0.0
+        total_velocity_along_rolling_direction = 0.0
+        for m in range(3):
+            unitized_total_velocity[m] *= inv_total_velocity_norm
+            total_velocity_along_axial_direction += (
+                unitized_total_velocity[m] * axial[m]
+            )
+            total_velocity_along_rolling_direction += (
+                unitized_total_velocity[m] * rolling[m]
+            )
+
+        # Kinetic friction in the axial and rolling directions
+        kinetic_friction_mag_along_axial_direction = -(
+            (1.0 - slip_axial)
+            * kinetic_mu
+            * response_force_mag
+            * total_velocity_along_axial_direction
+        )
+        kinetic_friction_mag_along_rolling_direction = -(
+            (1.0 - slip_rolling)
+            * kinetic_mu_sideways
+            * response_force_mag
+            * total_velocity_along_rolling_direction
+        )
+        for m in range(3):
+            element_forces[m, e] = (
+                (response_force_mag + elastic_force + damping_force) * normal[m]
+                + kinetic_friction_mag_along_axial_direction * axial[m]
+                + kinetic_friction_mag_along_rolling_direction * rolling[m]
+            )
+            friction_force[m] = (
+                kinetic_friction_mag_along_rolling_direction * rolling[m]
+            )
+        # torque = Q @ r @ Fr
+        _add_rotated_cross(
+            director_collection, elem, torque_arm, friction_force, external_torques
+        )
+
+        slip_function_along_axial_direction[e] = slip_axial
+        slip_function_along_rolling_direction[e] = slip_rolling
+        for m in range(3):
+            surface_normal[m, e] = normal[m]
+            axial_direction[m, e] = axial[m]
+            rolling_direction[m, e] = rolling[m]
+
+    for e in range(n_elements):
+        i = node_idx[e]
+        for m in range(3):
+            external_forces[m, i] += 0.5 * element_forces[m, e]
+            external_forces[m, i + 1] += 0.5 * element_forces[m, e]
+            element_forces[m, e] = 0.0
+
+    # Static friction, from the total forces and torques after the kinetic friction
+    for e in range(n_elements):
+        if not in_contact[e]:
+            continue
+        i = node_idx[e]
+        elem = elem_idx[e]
+        nodal_weight_first = 1.0 if local_idx[e] == 0 else 0.5
+        nodal_weight_second = 1.0 if local_idx[e] == n_points[e] - 1 else 0.5
+        force_component_along_axial_direction = 0.0
+        force_component_along_rolling_direction = 0.0
+        for m in range(3):
+            element_total_force = nodal_weight_first * (
+                internal_forces[m, i] + external_forces[m, i]
+            ) + nodal_weight_second * (
+                internal_forces[m, i + 1] + external_forces[m, i + 1]
+            )
+            force_component_along_axial_direction += (
+                element_total_force * axial_direction[m, e]
+            )
+            force_component_along_rolling_direction += (
+                element_total_force * rolling_direction[m, e]
+            )
+
+        # Axial static friction, friction = min(mu N, pushing force)
+        force_component_sign_along_axial_direction = np.sign(
+            force_component_along_axial_direction
+        )
+        static_mu = 0.5 * (
+            static_mu_forward * (1 + force_component_sign_along_axial_direction)
+            + static_mu_backward * (1 - force_component_sign_along_axial_direction)
+        )
+        max_friction_force = (
+            slip_function_along_axial_direction[e]
+            * static_mu
+            * plane_response_force_mag[e]
+        )
+        static_friction_mag_along_axial_direction = -(
+            min(abs(force_component_along_axial_direction), max_friction_force)
+            * force_component_sign_along_axial_direction
+        )
+
+        # Rolling static friction
+        total_torques_along_axial_direction = 0.0
+        for m in range(3):
+            total_torque = 0.0
+            for n in range(3):
+                total_torque += director_collection[n, m, elem] * (
+                    internal_torques[n, elem] + external_torques[n, elem]
+                )
+            total_torques_along_axial_direction += total_torque * axial_direction[m, e]
+        noslip_force = -(
+            (
+                radius[elem] * force_component_along_rolling_direction
+                - 2.0 * total_torques_along_axial_direction
+            )
+            / 3.0
+            / radius[elem]
+        )
+        max_friction_force = (
+            slip_function_along_rolling_direction[e]
+            * static_mu_sideways
+            * plane_response_force_mag[e]
+        )
+        static_friction_mag_along_rolling_direction = min(
+            abs(noslip_force), max_friction_force
+        ) * np.sign(noslip_force)
+
+        for m in range(3):
+            element_forces[m, e] = (
+                static_friction_mag_along_axial_direction * axial_direction[m, e]
+                + static_friction_mag_along_rolling_direction * rolling_direction[m, e]
+            )
+            friction_force[m] = (
+                static_friction_mag_along_rolling_direction * rolling_direction[m, e]
+            )
+            torque_arm[m] = -surface_normal[m, e] * radius[elem]
+        _add_rotated_cross(
+            director_collection, elem, torque_arm, friction_force, external_torques
+        )
+
+    for e in range(n_elements):
+        i = node_idx[e]
+        for m in range(3):
+            external_forces[m, i] += 0.5 * element_forces[m, e]
+            external_forces[m, i + 1] += 0.5 * element_forces[m, e]
+
+
 @njit(cache=True)  # type: ignore
 def _calculate_contact_forces_cylinder_plane(
     plane_origin: NDArray[np.float64],
@@ -848,3 +2031,377 @@ def _calculate_contact_forces_cylinder_plane(
     external_forces += plane_response_force_total
 
     return (_batch_norm(plane_response_force), no_contact_point_idx)
+
+
+@njit(cache=True)  # type: ignore
+def _add_rigid_body_pair_contact_force(
+    gamma: np.float64,
+    normal_x: np.float64,
+    normal_y: np.float64,
+    normal_z: np.float64,
+    arm_one_x: np.float64,
+    arm_one_y: np.float64,
+    arm_one_z: np.float64,
+    arm_two_x: np.float64,
+    arm_two_y: np.float64,
+    arm_two_z: np.float64,
+    i: int,
+    velocity_one: NDArray[np.float64],
+    omega_one: NDArray[np.float64],
+    director_one: NDArray[np.float64],
+    external_forces_one: NDArray[np.float64],
+    external_torques_one: NDArray[np.float64],
+    j: int,
+    velocity_two: NDArray[np.float64],
+    omega_two: NDArray[np.float64],
+    director_two: NDArray[np.float64],
+    external_forces_two: NDArray[np.float64],
+    external_torques_two: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+    velocity_damping_coefficient: np.float64,
+    friction_coefficient: np.float64,
+) -> None:
+    """
+    Contact force between the rigid body i of the first arrays and the rigid body j
+    of the second arrays, given their overlap gamma > 0, the unit normal from i to j,
+    and the moment arms of the contact points about the centers of the bodies. The
+    spring, damping and friction model is the one of
+    `_calculate_contact_forces_rod_cylinder`, with the slip velocity of the contact
+    points including the rotation of the bodies. Vectors are passed and computed as
+    scalars, which keeps the loops over pairs free of array views.
+    """
+    # Angular velocities in the lab frame, omega_lab = Q.T @ omega
+    omega_two_x = (
+        director_two[0, 0, j] * omega_two[0, j]
+        + director_two[1, 0, j] * omega_two[1, j]
+        + director_two[2, 0, j] * omega_two[2, j]
+    )
+    omega_two_y = (
+        director_two[0, 1, j] * omega_two[0, j]
+        + director_two[1, 1, j] * omega_two[1, j]
+        + director_two[2, 1, j] * omega_two[2, j]
+    )
+    omega_two_z = (
+        director_two[0, 2, j] * omega_two[0, j]
+        + director_two[1, 2, j] * omega_two[1, j]
+        + director_two[2, 2, j] * omega_two[2, j]
+    )
+    omega_one_x = (
+        director_one[0, 0, i] * omega_one[0, i]
+        + director_one[1, 0, i] * omega_one[1, i]
+        + director_one[2, 0, i] * omega_one[2, i]
+    )
+    omega_one_y = (
+        director_one[0, 1, i] * omega_one[0, i]
+        + director_one[1, 1, i] * omega_one[1, i]
+        + director_one[2, 1, i] * omega_one[2, i]
+    )
+    omega_one_z = (
+        director_one[0, 2, i] * omega_one[0, i]
+        + director_one[1, 2, i] * omega_one[1, i]
+        + director_one[2, 2, i] * omega_one[2, i]
+    )
+
+    # Velocity of the contact point of j relative to the one of i, v + omega x r
+    relative_velocity_x = (
+        velocity_two[0, j]
+        + omega_two_y * arm_two_z
+        - omega_two_z * arm_two_y
+        - velocity_one[0, i]
+        - (omega_one_y * arm_one_z - omega_one_z * arm_one_y)
+    )
+    relative_velocity_y = (
+        velocity_two[1, j]
+        + omega_two_z * arm_two_x
+        - omega_two_x * arm_two_z
+        - velocity_one[1, i]
+        - (omega_one_z * arm_one_x - omega_one_x * arm_one_z)
+    )
+    relative_velocity_z = (
+        velocity_two[2, j]
+        + omega_two_x * arm_two_y
+        - omega_two_y * arm_two_x
+        - velocity_one[2, i]
+        - (omega_one_x * arm_one_y - omega_one_y * arm_one_x)
+    )
+
+    # Spring and damping along the normal
+    normal_velocity = (
+        relative_velocity_x * normal_x
+        + relative_velocity_y * normal_y
+        + relative_velocity_z * normal_z
+    )
+    normal_force = contact_k * gamma - contact_nu * normal_velocity
+
+    # Friction, opposing the slip velocity of the contact points
+    slip_velocity_x = relative_velocity_x - normal_velocity * normal_x
+    slip_velocity_y = relative_velocity_y - normal_velocity * normal_y
+    slip_velocity_z = relative_velocity_z - normal_velocity * normal_z
+    slip_velocity_mag = sqrt(
+        slip_velocity_x * slip_velocity_x
+        + slip_velocity_y * slip_velocity_y
+        + slip_velocity_z * slip_velocity_z
+    )
+    friction_force = min(
+        velocity_damping_coefficient * slip_velocity_mag,
+        friction_coefficient * abs(normal_force),
+    ) / (slip_velocity_mag + 1e-14)
+
+    # Force on j, and its opposite on i
+    force_x = normal_force * normal_x - friction_force * slip_velocity_x
+    force_y = normal_force * normal_y - friction_force * slip_velocity_y
+    force_z = normal_force * normal_z - friction_force * slip_velocity_z
+    external_forces_two[0, j] += force_x
+    external_forces_two[1, j] += force_y
+    external_forces_two[2, j] += force_z
+    external_forces_one[0, i] -= force_x
+    external_forces_one[1, i] -= force_y
+    external_forces_one[2, i] -= force_z
+
+    # Torques in the frame of each body, torque = Q @ (r x F)
+    torque_x = arm_two_y * force_z - arm_two_z * force_y
+    torque_y = arm_two_z * force_x - arm_two_x * force_z
+    torque_z = arm_two_x * force_y - arm_two_y * force_x
+    for m in range(3):
+        external_torques_two[m, j] += (
+            director_two[m, 0, j] * torque_x
+            + director_two[m, 1, j] * torque_y
+            + director_two[m, 2, j] * torque_z
+        )
+    torque_x = force_y * arm_one_z - force_z * arm_one_y
+    torque_y = force_z * arm_one_x - force_x * arm_one_z
+    torque_z = force_x * arm_one_y - force_y * arm_one_x
+    for m in range(3):
+        external_torques_one[m, i] += (
+            director_one[m, 0, i] * torque_x
+            + director_one[m, 1, i] * torque_y
+            + director_one[m, 2, i] * torque_z
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_sphere_sphere(
+    body_one: NDArray[np.int64],
+    radius_one: NDArray[np.float64],
+    position_one: NDArray[np.float64],
+    velocity_one: NDArray[np.float64],
+    omega_one: NDArray[np.float64],
+    director_one: NDArray[np.float64],
+    external_forces_one: NDArray[np.float64],
+    external_torques_one: NDArray[np.float64],
+    body_two: NDArray[np.int64],
+    radius_two: NDArray[np.float64],
+    position_two: NDArray[np.float64],
+    velocity_two: NDArray[np.float64],
+    omega_two: NDArray[np.float64],
+    director_two: NDArray[np.float64],
+    external_forces_two: NDArray[np.float64],
+    external_torques_two: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+    velocity_damping_coefficient: np.float64,
+    friction_coefficient: np.float64,
+) -> None:
+    """
+    Contact forces and torques for the sphere pairs (body_one[k], body_two[k]), the
+    first sphere of the pair in the first arrays and the second one in the second
+    arrays. For spheres of the same memory block, both sets of arrays are the block
+    arrays; for two spheres, they are the arrays of each sphere.
+    """
+    for k in range(body_one.shape[0]):
+        i = body_one[k]
+        j = body_two[k]
+        distance_x = position_two[0, j] - position_one[0, i]
+        distance_y = position_two[1, j] - position_one[1, i]
+        distance_z = position_two[2, j] - position_one[2, i]
+        distance = sqrt(
+            distance_x * distance_x + distance_y * distance_y + distance_z * distance_z
+        )
+        gamma = radius_one[k] + radius_two[k] - distance
+        if gamma <= 0.0 or distance == 0.0:
+            continue
+        normal_x = distance_x / distance
+        normal_y = distance_y / distance
+        normal_z = distance_z / distance
+        _add_rigid_body_pair_contact_force(
+            gamma,
+            normal_x,
+            normal_y,
+            normal_z,
+            radius_one[k] * normal_x,
+            radius_one[k] * normal_y,
+            radius_one[k] * normal_z,
+            -radius_two[k] * normal_x,
+            -radius_two[k] * normal_y,
+            -radius_two[k] * normal_z,
+            i,
+            velocity_one,
+            omega_one,
+            director_one,
+            external_forces_one,
+            external_torques_one,
+            j,
+            velocity_two,
+            omega_two,
+            director_two,
+            external_forces_two,
+            external_torques_two,
+            contact_k,
+            contact_nu,
+            velocity_damping_coefficient,
+            friction_coefficient,
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_cylinder_cylinder(
+    body_one: NDArray[np.int64],
+    radius_one: NDArray[np.float64],
+    length_one: NDArray[np.float64],
+    position_one: NDArray[np.float64],
+    velocity_one: NDArray[np.float64],
+    omega_one: NDArray[np.float64],
+    director_one: NDArray[np.float64],
+    external_forces_one: NDArray[np.float64],
+    external_torques_one: NDArray[np.float64],
+    body_two: NDArray[np.int64],
+    radius_two: NDArray[np.float64],
+    length_two: NDArray[np.float64],
+    position_two: NDArray[np.float64],
+    velocity_two: NDArray[np.float64],
+    omega_two: NDArray[np.float64],
+    director_two: NDArray[np.float64],
+    external_forces_two: NDArray[np.float64],
+    external_torques_two: NDArray[np.float64],
+    contact_k: np.float64,
+    contact_nu: np.float64,
+    velocity_damping_coefficient: np.float64,
+    friction_coefficient: np.float64,
+) -> None:
+    """
+    Contact forces and torques for the cylinder pairs (body_one[k], body_two[k]),
+    given as in `_calculate_contact_forces_sphere_sphere`. As in
+    `_calculate_contact_forces_rod_cylinder`, the contact is found from the closest
+    points of the axes of the cylinders, so their ends are rounded. The distances
+    between the axes of all the pairs are computed at once by `_find_min_dist_batch`.
+    """
+    n_pairs = body_one.shape[0]
+    x1 = np.empty((3, n_pairs))
+    e1 = np.empty((3, n_pairs))
+    x2 = np.empty((3, n_pairs))
+    e2 = np.empty((3, n_pairs))
+    for k in range(n_pairs):
+        i = body_one[k]
+        j = body_two[k]
+        # Axis of the cylinder from its start, the tangent being the third director
+        for m in range(3):
+            e1[m, k] = length_one[k] * director_one[2, m, i]
+            x1[m, k] = position_one[m, i] - 0.5 * e1[m, k]
+            e2[m, k] = length_two[k] * director_two[2, m, j]
+            x2[m, k] = position_two[m, j] - 0.5 * e2[m, k]
+    distance_vectors = np.empty((3, n_pairs))
+    s = np.empty(n_pairs)
+    t = np.empty(n_pairs)
+    _find_min_dist_batch(x1, e1, x2, e2, distance_vectors, s, t)
+
+    for k in range(n_pairs):
+        distance = sqrt(
+            distance_vectors[0, k] * distance_vectors[0, k]
+            + distance_vectors[1, k] * distance_vectors[1, k]
+            + distance_vectors[2, k] * distance_vectors[2, k]
+        )
+        gamma = radius_one[k] + radius_two[k] - distance
+        if gamma <= 0.0 or distance == 0.0:
+            continue
+        i = body_one[k]
+        j = body_two[k]
+        normal_x = distance_vectors[0, k] / distance
+        normal_y = distance_vectors[1, k] / distance
+        normal_z = distance_vectors[2, k] / distance
+        # Contact points on the surfaces, about the centers
+        _add_rigid_body_pair_contact_force(
+            gamma,
+            normal_x,
+            normal_y,
+            normal_z,
+            x1[0, k] + t[k] * e1[0, k] + radius_one[k] * normal_x - position_one[0, i],
+            x1[1, k] + t[k] * e1[1, k] + radius_one[k] * normal_y - position_one[1, i],
+            x1[2, k] + t[k] * e1[2, k] + radius_one[k] * normal_z - position_one[2, i],
+            x2[0, k] + s[k] * e2[0, k] - radius_two[k] * normal_x - position_two[0, j],
+            x2[1, k] + s[k] * e2[1, k] - radius_two[k] * normal_y - position_two[1, j],
+            x2[2, k] + s[k] * e2[2, k] - radius_two[k] * normal_z - position_two[2, j],
+            i,
+            velocity_one,
+            omega_one,
+            director_one,
+            external_forces_one,
+            external_torques_one,
+            j,
+            velocity_two,
+            omega_two,
+            director_two,
+            external_forces_two,
+            external_torques_two,
+            contact_k,
+            contact_nu,
+            velocity_damping_coefficient,
+            friction_coefficient,
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _calculate_contact_forces_sphere_plane(
+    plane_origin: NDArray[np.float64],
+    plane_normal: NDArray[np.float64],
+    surface_tol: np.float64,
+    k: np.float64,
+    nu: np.float64,
+    body_idx: NDArray[np.int64],
+    radius: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    """
+    Same as `_calculate_contact_forces_cylinder_plane`, for the spheres body_idx of a
+    memory block of rigid bodies: the distance to the plane is measured from the
+    surface of the sphere.
+    """
+    for e in range(body_idx.shape[0]):
+        i = body_idx[e]
+        distance_from_plane = 0.0
+        force_component_along_normal_direction = 0.0
+        normal_component_of_velocity = 0.0
+        for m in range(3):
+            distance_from_plane += plane_normal[m] * (
+                position_collection[m, i] - plane_origin[m]
+            )
+            force_component_along_normal_direction += (
+                plane_normal[m] * external_forces[m, i]
+            )
+            normal_component_of_velocity += plane_normal[m] * velocity_collection[m, i]
+        separation = distance_from_plane - radius[e]
+        # Check if the sphere is in contact with the plane
+        if separation > surface_tol:
+            continue
+        # The plane cancels the part of the forces pushing the sphere into it
+        plane_response_force = -min(force_component_along_normal_direction, 0.0)
+        elastic_force = -k * min(separation, 0.0)
+        damping_force = -nu * normal_component_of_velocity
+        for m in range(3):
+            external_forces[m, i] += (
+                plane_response_force + elastic_force + damping_force
+            ) * plane_normal[m]
+
+
+# Multithreaded variants of the buffered pair kernels, selected with `parallel=True`
+# in RodRodContact and RodSelfContact. They are compiled on first use and not cached,
+# since numba's cache index does not distinguish two compilations of the same
+# function with different flags.
+_calculate_contact_forces_rod_rod_pairs_parallel = njit(parallel=True)(
+    _calculate_contact_forces_rod_rod_pairs_buffered.py_func
+)
+_calculate_contact_forces_self_rod_pairs_parallel = njit(parallel=True)(
+    _calculate_contact_forces_self_rod_pairs_buffered.py_func
+)
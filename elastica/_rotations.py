@@ -1,6 +1,7 @@
 __doc__ = """ Rotation kernels """
 
 import functools
+from typing import Optional
 from itertools import combinations
 
 import numpy as np
@@ -10,7 +11,7 @@ from numpy import sqrt
 from numpy import arccos
 from numpy.typing import NDArray
 
-from numba import njit
+from numba import njit, prange
 
 from elastica._linalg import _batch_matmul
 
@@ -81,7 +82,10 @@ def _rotate(
 
 
 @njit(cache=True)  # type: ignore
-def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]:
+def _inv_rotate(
+    director_collection: NDArray[np.float64],
+    out: Optional[NDArray[np.float64]] = None,
+) -> NDArray[np.float64]:
     """
     Calculated rate of change using Rodrigues' formula
 
@@ -89,6 +93,7 @@ def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]
     ----------
     director_collection : The collection of frames/directors at every element,
     numpy.ndarray of shape (dim, dim, n)
+    out : Optional array of shape (dim, n-1) the axes are written into
 
     Returns
     -------
@@ -101,9 +106,12 @@ def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]
 
     """
     blocksize = director_collection.shape[2] - 1
-    vector_collection = np.empty((3, blocksize))
+    if out is None:
+        vector_collection = np.empty((3, blocksize))
+    else:
+        vector_collection = out
 
-    for k in range(blocksize):
+    for k in prange(blocksize):
         # Q_{i+i}Q^T_{i} collection
         vector_collection[0, k] = (
             director_collection[2, 0, k + 1] * director_collection[1, 0, k]
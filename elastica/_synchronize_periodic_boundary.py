@@ -92,18 +92,18 @@ class _ConstrainPeriodicBoundaries(ConstraintBase):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    def constrain_values(self, rod: RodType, time: np.float64) -> None:
+    def constrain_values(self, system: RodType, time: np.float64) -> None:
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.position_collection, rod.periodic_boundary_nodes_idx
+            system.position_collection, system.periodic_boundary_nodes_idx
         )
         _synchronize_periodic_boundary_of_matrix_collection(
-            rod.director_collection, rod.periodic_boundary_elems_idx
+            system.director_collection, system.periodic_boundary_elems_idx
         )
 
-    def constrain_rates(self, rod: RodType, time: np.float64) -> None:
+    def constrain_rates(self, system: RodType, time: np.float64) -> None:
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.velocity_collection, rod.periodic_boundary_nodes_idx
+            system.velocity_collection, system.periodic_boundary_nodes_idx
         )
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.omega_collection, rod.periodic_boundary_elems_idx
+            system.omega_collection, system.periodic_boundary_elems_idx
         )
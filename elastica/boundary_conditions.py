@@ -1,6 +1,6 @@
 __doc__ = """ Built-in boundary condition implementationss """
 
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Callable, Optional, TypeVar, Generic
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,6 +11,7 @@ from numba import njit
 
 from elastica._linalg import _batch_matvec, _batch_matrix_transpose
 from elastica._rotations import _get_rotation_matrix
+from elastica.utils import block_ranges
 from elastica.typing import SystemType, RodType, RigidBodyType, ConstrainingIndex
 
 
@@ -771,3 +772,260 @@ class HelicalBucklingBC(ConstraintBase):
 
             system.velocity_collection[..., -1] = -self.shrink_vel
             system.omega_collection[..., -1] = -self.ang_vel
+
+
+# Batched implementations, applying the OneEndFixedBC, GeneralConstraint and
+# FixedConstraint registered on many systems of the same memory block in one call.
+# They are registered in elastica.modules.constraints and merged by the operator plan
+# at finalize, see elastica.modules.operator_plan.
+
+
+def _gather_constrained_indices(
+    instances: list[ConstraintBase],
+    block: Any,
+    system_indices: NDArray[np.int32],
+) -> tuple[
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.bool_],
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.bool_],
+]:
+    """
+    Nodes and elements constrained by the instances, as indices in the arrays of the
+    memory block, in the order the instances constrain them. Each node comes with its
+    fixed position and translational selector, each element with its fixed directors
+    and rotational selector. Entries using their selector are those of
+    `GeneralConstraint`; the others are fixed in all degrees of freedom.
+    """
+    node_start, node_end, elem_start, elem_end = block_ranges(block, system_indices)
+
+    node_indices: list[int] = []
+    fixed_positions: list[NDArray[np.float64]] = []
+    translational_selectors: list[NDArray[np.float64]] = []
+    node_use_selector: list[bool] = []
+    element_indices: list[int] = []
+    fixed_directors: list[NDArray[np.float64]] = []
+    rotational_selectors: list[NDArray[np.float64]] = []
+    element_use_selector: list[bool] = []
+
+    all_dofs = np.ones(3)
+    no_directors = np.zeros((3, 3))
+    for r, instance in enumerate(instances):
+        n_nodes = node_end[r] - node_start[r]
+        n_elems = elem_end[r] - elem_start[r]
+        if type(instance) is OneEndFixedBC:
+            node_indices.append(node_start[r])
+            fixed_positions.append(instance.fixed_position_collection.reshape(3))
+            translational_selectors.append(all_dofs)
+            node_use_selector.append(False)
+            element_indices.append(elem_start[r])
+            fixed_directors.append(instance.fixed_directors_collection.reshape(3, 3))
+            rotational_selectors.append(all_dofs)
+            element_use_selector.append(False)
+        elif type(instance) in (GeneralConstraint, FixedConstraint):
+            # FixedConstraint is a GeneralConstraint fixing all degrees of freedom
+            use_selector = type(instance) is GeneralConstraint
+            for i, idx in enumerate(instance.constrained_position_idx):
+                node_indices.append(node_start[r] + idx % n_nodes)
+                fixed_positions.append(instance.fixed_positions[:, i])
+                translational_selectors.append(
+                    instance.translational_constraint_selector
+                )
+                node_use_selector.append(use_selector)
+            for i, idx in enumerate(instance.constrained_director_idx):
+                element_indices.append(elem_start[r] + idx % n_elems)
+                fixed_directors.append(
+                    instance.fixed_directors[..., i]
+                    if hasattr(instance, "fixed_directors")
+                    else no_directors
+                )
+                rotational_selectors.append(instance.rotational_constraint_selector)
+                element_use_selector.append(use_selector)
+        else:
+            raise TypeError(
+                "No batched implementation for {}.".format(type(instance).__name__)
+            )
+
+    def stack(values: list[NDArray[Any]], shape: tuple[int, ...]) -> NDArray[Any]:
+        if not values:
+            return np.zeros(shape + (0,))
+        return np.stack([np.asarray(v, dtype=np.float64) for v in values], axis=-1)
+
+    return (
+        np.array(node_indices, dtype=np.int64),
+        stack(fixed_positions, (3,)),
+        stack(translational_selectors, (3,)),
+        np.array(node_use_selector, dtype=np.bool_),
+        np.array(element_indices, dtype=np.int64),
+        stack(fixed_directors, (3, 3)),
+        stack(rotational_selectors, (3,)),
+        np.array(element_use_selector, dtype=np.bool_),
+    )
+
+
+def _batched_constrain_values(
+    instances: list[ConstraintBase], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `constrain_values` of `OneEndFixedBC`, `GeneralConstraint` and
+    `FixedConstraint`. The fixed positions and directors are read when the operator is
+    created, at finalize.
+    """
+    (
+        node_indices,
+        fixed_positions,
+        translational_selectors,
+        node_use_selector,
+        element_indices,
+        fixed_directors,
+        _,
+        element_use_selector,
+    ) = _gather_constrained_indices(instances, block, system_indices)
+    # GeneralConstraint only constrains the rates of the directors
+    fixed_elements = ~element_use_selector
+    element_indices = element_indices[fixed_elements]
+    fixed_directors = np.ascontiguousarray(fixed_directors[..., fixed_elements])
+    position_collection = block.position_collection
+    director_collection = block.director_collection
+
+    def constrain_values(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_constrain_values(
+            node_indices,
+            fixed_positions,
+            translational_selectors,
+            node_use_selector,
+            element_indices,
+            fixed_directors,
+            position_collection,
+            director_collection,
+        )
+
+    return constrain_values
+
+
+def _batched_constrain_rates(
+    instances: list[ConstraintBase], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `constrain_rates` of `OneEndFixedBC`, `GeneralConstraint` and
+    `FixedConstraint`.
+    """
+    (
+        node_indices,
+        _,
+        translational_selectors,
+        node_use_selector,
+        element_indices,
+        _,
+        rotational_selectors,
+        element_use_selector,
+    ) = _gather_constrained_indices(instances, block, system_indices)
+    velocity_collection = block.velocity_collection
+    omega_collection = block.omega_collection
+    director_collection = block.director_collection
+
+    def constrain_rates(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_constrain_rates(
+            node_indices,
+            translational_selectors,
+            node_use_selector,
+            element_indices,
+            rotational_selectors,
+            element_use_selector,
+            velocity_collection,
+            omega_collection,
+            director_collection,
+        )
+
+    return constrain_rates
+
+
+@njit(cache=True)  # type: ignore
+def _batch_constrain_values(
+    node_indices: NDArray[np.int64],
+    fixed_positions: NDArray[np.float64],
+    translational_selectors: NDArray[np.float64],
+    node_use_selector: NDArray[np.bool_],
+    element_indices: NDArray[np.int64],
+    fixed_directors: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+) -> None:
+    """
+    Sets the constrained positions and directors, computed as in
+    `GeneralConstraint.nb_constrain_translational_values` for nodes using their
+    selector, and copied from the fixed values otherwise.
+    """
+    for n in range(node_indices.shape[0]):
+        k = node_indices[n]
+        if node_use_selector[n]:
+            for i in range(3):
+                position_collection[i, k] = (
+                    1.0 - translational_selectors[i, n]
+                ) * position_collection[i, k] + translational_selectors[
+                    i, n
+                ] * fixed_positions[
+                    i, n
+                ]
+        else:
+            for i in range(3):
+                position_collection[i, k] = fixed_positions[i, n]
+
+    for n in range(element_indices.shape[0]):
+        k = element_indices[n]
+        for i in range(3):
+            for j in range(3):
+                director_collection[i, j, k] = fixed_directors[i, j, n]
+
+
+@njit(cache=True)  # type: ignore
+def _batch_constrain_rates(
+    node_indices: NDArray[np.int64],
+    translational_selectors: NDArray[np.float64],
+    node_use_selector: NDArray[np.bool_],
+    element_indices: NDArray[np.int64],
+    rotational_selectors: NDArray[np.float64],
+    element_use_selector: NDArray[np.bool_],
+    velocity_collection: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+) -> None:
+    """
+    Removes the constrained velocities and angular velocities. Entries using their
+    selector are computed as in `GeneralConstraint.nb_constrain_translational_rates`
+    and `GeneralConstraint.nb_constrain_rotational_rates`, the angular velocity being
+    masked in the lab frame; the others are set to zero.
+    """
+    for n in range(node_indices.shape[0]):
+        k = node_indices[n]
+        if node_use_selector[n]:
+            for i in range(3):
+                velocity_collection[i, k] = (
+                    1.0 - translational_selectors[i, n]
+                ) * velocity_collection[i, k]
+        else:
+            for i in range(3):
+                velocity_collection[i, k] = 0.0
+
+    omega_lab_frame = np.empty(3)
+    for n in range(element_indices.shape[0]):
+        k = element_indices[n]
+        if element_use_selector[n]:
+            # Rotate to the lab frame, summed in the same order as _batch_matvec
+            for i in range(3):
+                omega = 0.0
+                for j in range(3):
+                    omega += director_collection[j, i, k] * omega_collection[j, k]
+                omega_lab_frame[i] = (1.0 - rotational_selectors[i, n]) * omega
+            for i in range(3):
+                omega = 0.0
+                for j in range(3):
+                    omega += director_collection[i, j, k] * omega_lab_frame[j]
+                omega_collection[i, k] = omega
+        else:
+            for i in range(3):
+                omega_collection[i, k] = 0.0
@@ -95,6 +95,246 @@ class MyCallBack(CallBackBaseClass):
             return
 
 
+class RecorderCallBack(CallBackBaseClass):
+    """
+    RecorderCallBack records fields of a system into preallocated arrays, instead of
+    appending a new copy of each field to a list at each sample.
+
+    The arrays, of shape (capacity, *field shape), are allocated at the first sample
+    and written in place afterwards. The recorded samples are accessed, in
+    chronological order and without copy, with `history`.
+
+    When more than `capacity` samples are taken, a fixed-capacity recorder keeps the
+    first samples and ignores the others (with a warning), while a ring buffer
+    (`ring_buffer=True`) keeps the last `capacity` samples. The ring buffer stores each
+    sample twice so that the last samples are always contiguous in memory.
+
+        Attributes
+        ----------
+        step_skip: int
+            Collect data using make_callback method every step_skip step.
+        capacity: int
+            Maximum number of samples kept.
+        fields: tuple[str, ...]
+            Names of the recorded system attributes.
+        n_samples: int
+            Number of samples taken so far, including overwritten or ignored ones.
+    """
+
+    def __init__(
+        self,
+        step_skip: int,
+        capacity: Optional[int] = None,
+        final_time: Optional[float] = None,
+        time_step: Optional[float] = None,
+        fields: tuple[str, ...] = (
+            "position_collection",
+            "director_collection",
+            "velocity_collection",
+        ),
+        ring_buffer: bool = False,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        step_skip: int
+            Collect data using make_callback method every step_skip step.
+        capacity: Optional[int]
+            Number of samples to allocate. If None, it is computed from `final_time`
+            and `time_step` to hold all samples of the simulation.
+        final_time: Optional[float]
+            Final time of the simulation, used if `capacity` is None.
+        time_step: Optional[float]
+            Time step of the simulation, used if `capacity` is None.
+        fields: tuple[str, ...]
+            Names of the recorded system attributes. Time and step are always recorded.
+        ring_buffer: bool
+            If True, keep the last `capacity` samples instead of the first ones.
+        """
+        CallBackBaseClass.__init__(self)
+        if capacity is None:
+            if final_time is None or time_step is None:
+                raise ValueError(
+                    "Either capacity, or final_time and time_step, must be given."
+                )
+            total_steps = int(round(final_time / time_step))
+            capacity = total_steps // step_skip + 1
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}.")
+
+        self.step_skip = step_skip
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self.ring_buffer = ring_buffer
+        self.n_samples = 0
+
+        # Ring buffer stores each sample at k and k + capacity
+        n_rows = 2 * capacity if ring_buffer else capacity
+        self._buffers: dict[str, NDArray[Any]] = {
+            "time": np.empty(n_rows, dtype=np.float64),
+            "step": np.empty(n_rows, dtype=np.int64),
+        }
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+
+        if current_step % self.step_skip != 0:
+            return
+
+        if self.n_samples == 0:
+            for name in self.fields:
+                field = np.asarray(getattr(system, name))
+                self._buffers[name] = np.empty(
+                    (self._buffers["time"].shape[0],) + field.shape, dtype=field.dtype
+                )
+
+        if self.ring_buffer:
+            row = self.n_samples % self.capacity
+            rows: tuple[int, ...] = (row, row + self.capacity)
+        elif self.n_samples < self.capacity:
+            rows = (self.n_samples,)
+        else:
+            if self.n_samples == self.capacity:
+                logging.warning(
+                    f"RecorderCallBack is full ({self.capacity} samples). Further "
+                    "samples are ignored. Increase capacity or use ring_buffer=True."
+                )
+            self.n_samples += 1
+            return
+
+        for row in rows:
+            self._buffers["time"][row] = time
+            self._buffers["step"][row] = current_step
+            for name in self.fields:
+                self._buffers[name][row] = getattr(system, name)
+        self.n_samples += 1
+
+    def history(self, name: str) -> NDArray[Any]:
+        """
+        Recorded samples of a field, oldest first, of shape (n, *field shape). The
+        returned array is a view of the recorder memory: it is not copied, and samples
+        taken later may overwrite it in a ring buffer.
+
+        Parameters
+        ----------
+        name: str
+            "time", "step" or one of `fields`.
+
+        Returns
+        -------
+        NDArray
+        """
+        n_kept = min(self.n_samples, self.capacity)
+        if name not in self._buffers:
+            if name in self.fields:
+                # Nothing recorded yet
+                return np.empty((0,))
+            raise KeyError(f"{name} is not recorded.")
+        start = 0
+        if self.ring_buffer and self.n_samples > self.capacity:
+            start = self.n_samples % self.capacity
+        return self._buffers[name][start : start + n_kept]
+
+    def as_dict(self) -> dict[str, NDArray[Any]]:
+        """
+        Returns
+        -------
+        dict[str, NDArray]
+            History of time, step and all recorded fields, see `history`.
+        """
+        return {name: self.history(name) for name in ("time", "step") + self.fields}
+
+
+class BlockRecorderCallBack(RecorderCallBack):
+    """
+    BlockRecorderCallBack records fields of a whole memory block, such as
+    `MemoryBlockCosseratRod` or `MemoryBlockRigidBody`, with one copy per field per
+    sample for all systems in the block. It is attached with
+    `collect_block_diagnostics`, and the recorded data is read per system with
+    `system_history`, which slices the block history without copy. Ghost entries
+    between rods are stored, and only dropped when a system is sliced.
+
+    Examples
+    --------
+    >>> recorder = simulator.collect_block_diagnostics(
+    ...     MemoryBlockCosseratRod
+    ... ).using(BlockRecorderCallBack, step_skip=100, final_time=1.0, time_step=1e-4)
+    >>> simulator.finalize()
+    >>> ...
+    >>> positions = recorder.instance.system_history(
+    ...     "position_collection", simulator.get_system_index(rod)
+    ... )  # (n_samples, 3, n_nodes of rod)
+
+    See `RecorderCallBack` for the parameters.
+    """
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        if self.n_samples == 0 and current_step % self.step_skip == 0:
+            self._find_layout(system)
+        super().make_callback(system, time, current_step)
+
+    def _find_layout(self, block: Any) -> None:
+        """
+        Stores the range of each system along the last axis of each recorded field.
+        """
+        self.system_idx_list = np.array(block.system_idx_list)
+        self._ranges: dict[str, tuple[NDArray[np.int64], NDArray[np.int64]]] = {}
+        if not hasattr(block, "start_idx_in_rod_nodes"):
+            # One node and one element per system, e.g. rigid bodies
+            start = np.arange(block.n_systems)
+            for name in self.fields:
+                self._ranges[name] = (start, start + 1)
+            return
+
+        domains = [
+            (block.n_nodes, "nodes"),
+            (block.n_elems, "elems"),
+            (block.n_voronoi, "voronoi"),
+        ]
+        for name in self.fields:
+            size = np.shape(getattr(block, name))[-1]
+            for n, domain in domains:
+                if size == n:
+                    self._ranges[name] = (
+                        getattr(block, f"start_idx_in_rod_{domain}"),
+                        getattr(block, f"end_idx_in_rod_{domain}"),
+                    )
+                    break
+            else:
+                raise ValueError(
+                    f"{name} is not defined on nodes, elements or voronoi of the block."
+                )
+
+    def system_history(self, name: str, sys_idx: int) -> NDArray[Any]:
+        """
+        Recorded samples of a field for one system of the block, oldest first, of
+        shape (n, ..., n_entries of the system). The returned array is a view of the
+        recorder memory, see `RecorderCallBack.history`.
+
+        Parameters
+        ----------
+        name: str
+            One of `fields`.
+        sys_idx: int
+            Index of the system in the simulator, see `get_system_index`.
+
+        Returns
+        -------
+        NDArray
+        """
+        if self.n_samples == 0:
+            raise RuntimeError("Nothing was recorded yet.")
+        block_idx = np.flatnonzero(self.system_idx_list == sys_idx)
+        if block_idx.size == 0:
+            raise KeyError(f"System {sys_idx} is not in the recorded block.")
+        start, end = self._ranges[name]
+        return self.history(name)[..., start[block_idx[0]] : end[block_idx[0]]]
+
+
 class ExportCallBack(CallBackBaseClass):
     """
     ExportCallback is an example callback class to demonstrate
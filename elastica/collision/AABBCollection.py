@@ -3,9 +3,11 @@
 
 from typing_extensions import Self
 
+import numba
 import numpy as np
 from numpy.typing import NDArray
 from elastica.utils import MaxDimension
+from elastica.contact_utils import _closest_point_on_triangle
 
 
 class AABBCollection:
@@ -150,6 +152,9 @@ class AABBHierarchy:
             # If they are the same, then its an exact power of four which is good
             # the same code works
             self.n_levels = n_levels_bound_above + 1
+        # Every AABB in the final level needs at least one dof
+        while 4 ** (self.n_levels - 1) > n_positions:
+            self.n_levels -= 1
 
         n_aabbs_in_final_level = 4 ** (self.n_levels - 1)
         self.avg_n_dofs_in_final_level = n_positions // n_aabbs_in_final_level
@@ -226,6 +231,24 @@ class AABBHierarchy:
         # Add one for the middle level
         # self.aabb.append(AABBCollection(position_collection, dimension_collection, self.n_aabbs_in_first_level))
 
+        # Flat copy of the hierarchy, for refit and traversal in compiled code. AABBs
+        # are stored level by level from the top: the i-th AABB of level l is
+        # boxes[..., (4**l - 1) // 3 + i], and its children are the AABBs 4 * k + 1 to
+        # 4 * k + 4, k being its index in boxes. The i-th AABB of the final level
+        # covers the dofs leaf_start[i]:leaf_start[i + 1], as in self.aabb.
+        n_dofs_in_final_level = np.full(
+            n_aabbs_in_final_level, self.avg_n_dofs_in_final_level
+        )
+        n_dofs_in_final_level[
+            n_aabbs_in_final_level - self.extra_n_dofs_in_final_level :
+        ] += 1
+        self.leaf_start = np.zeros(n_aabbs_in_final_level + 1, dtype=np.int64)
+        self.leaf_start[1:] = np.cumsum(n_dofs_in_final_level)
+        self.boxes = np.empty(
+            (MaxDimension.value(), 2, (4**self.n_levels - 1) // 3)
+        )  # 2 for min and max
+        self.refit(position_collection, dimension_collection)
+
     def n_aabbs_at_level(self, i: int) -> int:
         assert i < self.n_levels
         return 4 ** (i)
@@ -276,6 +299,389 @@ class AABBHierarchy:
                 ]._update(self.aabb[start_idx_in_aabb_list:stop_idx_in_aabb_list])
             count_elapsed_n_aabbs += n_aabbs_in_next_level
 
+    def refit(
+        self,
+        position_collection: NDArray[np.float64],
+        dimension_collection: NDArray[np.float64],
+    ) -> None:
+        """
+        Updates the flat copy of the hierarchy (boxes) for new positions and
+        dimensions, keeping the dofs covered by each AABB. Faster than update, which
+        updates the AABBCollection objects instead.
+        """
+        _refit_hierarchy(
+            self.boxes, self.leaf_start, position_collection, dimension_collection
+        )
+
+    def find_overlapping_leaves(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Pairs (a, b), a <= b, of AABBs of the final level that overlap, including
+        each AABB with itself, found by traversing the flat copy of the hierarchy.
+        AABBs are given by their index in the final level.
+        """
+        n_pairs = _traverse_hierarchy(self.boxes, np.empty(0, dtype=np.int64))
+        pairs = np.empty(2 * n_pairs, dtype=np.int64)
+        _traverse_hierarchy(self.boxes, pairs)
+        return pairs[:n_pairs], pairs[n_pairs:]
+
+
+@numba.njit(cache=True)  # type: ignore
+def _refit_hierarchy(
+    boxes: NDArray[np.float64],
+    leaf_start: NDArray[np.int64],
+    position_collection: NDArray[np.float64],
+    dimension_collection: NDArray[np.float64],
+) -> None:
+    n_leaves = leaf_start.shape[0] - 1
+    leaf_offset = boxes.shape[2] - n_leaves
+    # Final level from the dofs, as in AABBCollection.update
+    for leaf in range(n_leaves):
+        node = leaf_offset + leaf
+        for i in range(boxes.shape[0]):
+            low = position_collection[i, leaf_start[leaf]]
+            high = low
+            dimension = dimension_collection[i, leaf_start[leaf]]
+            for k in range(leaf_start[leaf] + 1, leaf_start[leaf + 1]):
+                low = min(low, position_collection[i, k])
+                high = max(high, position_collection[i, k])
+                dimension = max(dimension, dimension_collection[i, k])
+            boxes[i, 0, node] = low - dimension
+            boxes[i, 1, node] = high + dimension
+    # Other levels from their children, bottom up
+    for node in range(leaf_offset - 1, -1, -1):
+        for i in range(boxes.shape[0]):
+            boxes[i, 0, node] = boxes[i, 0, 4 * node + 1]
+            boxes[i, 1, node] = boxes[i, 1, 4 * node + 1]
+            for child in range(4 * node + 2, 4 * node + 5):
+                boxes[i, 0, node] = min(boxes[i, 0, node], boxes[i, 0, child])
+                boxes[i, 1, node] = max(boxes[i, 1, node], boxes[i, 1, child])
+
+
+@numba.njit(cache=True)  # type: ignore
+def _are_boxes_overlapping(boxes: NDArray[np.float64], a: int, b: int) -> bool:
+    for i in range(boxes.shape[0]):
+        if boxes[i, 0, a] > boxes[i, 1, b] or boxes[i, 0, b] > boxes[i, 1, a]:
+            return False
+    return True
+
+
+@numba.njit(cache=True)  # type: ignore
+def _traverse_hierarchy(boxes: NDArray[np.float64], pairs: NDArray[np.int64]) -> int:
+    """
+    Counts the pairs of overlapping AABBs of the final level, and stores them in pairs
+    (first AABBs, then second AABBs) unless pairs is empty.
+    """
+    n_nodes = boxes.shape[2]
+    # Every level has 4 times as many AABBs as the one above
+    n_leaves = 1
+    while (4 * n_leaves - 1) // 3 < n_nodes:
+        n_leaves *= 4
+    leaf_offset = n_nodes - n_leaves
+    store = pairs.shape[0] > 0
+    n_stored = pairs.shape[0] // 2
+
+    # Pairs of AABBs of the same level, a <= b, whose children are still to be visited.
+    # Each visited pair pushes at most 16 pairs, one level below.
+    depth = 1
+    while (4**depth - 1) // 3 < n_nodes:
+        depth += 1
+    stack = np.empty((16 * depth + 1, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = 0
+    n_stack = 1
+    n_pairs = 0
+    while n_stack > 0:
+        n_stack -= 1
+        a = stack[n_stack, 0]
+        b = stack[n_stack, 1]
+        if a != b and not _are_boxes_overlapping(boxes, a, b):
+            continue
+        if a >= leaf_offset:
+            if store:
+                pairs[n_pairs] = a - leaf_offset
+                pairs[n_stored + n_pairs] = b - leaf_offset
+            n_pairs += 1
+            continue
+        for child_a in range(4 * a + 1, 4 * a + 5):
+            # Children of an AABB with itself: each pair of children once
+            first_child_b = child_a if a == b else 4 * b + 1
+            for child_b in range(first_child_b, 4 * b + 5):
+                stack[n_stack, 0] = child_a
+                stack[n_stack, 1] = child_b
+                n_stack += 1
+    return n_pairs
+
+
+class FaceAABBHierarchy:
+    """
+    Binary hierarchy of AABBs over the triangular faces of a mesh, built top down by
+    splitting the faces of every AABB in two halves along the axis of largest spread
+    of their centers.
+
+    The hierarchy is built once, in the frame the vertices are given in (for a rigid
+    body, its material frame); queries are made in the same frame.
+    """
+
+    def __init__(
+        self,
+        faces: NDArray[np.float64],
+        faces_per_leaf: int = 4,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        faces: numpy.ndarray
+            3D (dim, 3, n_faces) array containing data with 'float' type.
+            Vertices of the faces.
+        faces_per_leaf: int
+            Maximum number of faces in an AABB of the final level.
+        """
+        if faces_per_leaf < 1:
+            raise ValueError(
+                "The number of faces per leaf must be positive, got {}.".format(
+                    faces_per_leaf
+                )
+            )
+        self.n_faces = faces.shape[-1]
+        (
+            self.face_order,
+            self.boxes,
+            self.first_child,
+            self.face_start,
+            self.face_stop,
+            self.depth,
+        ) = _build_face_hierarchy(np.asarray(faces, dtype=np.float64), faces_per_leaf)
+        # Faces of a leaf are contiguous
+        self.faces = np.ascontiguousarray(faces[..., self.face_order])
+
+    def query(
+        self, lower: NDArray[np.float64], upper: NDArray[np.float64]
+    ) -> NDArray[np.int64]:
+        """
+        Index in `faces` of the faces in the leaves whose AABB overlaps the box from
+        lower to upper.
+        """
+        stack = np.empty(self.depth + 2, dtype=np.int64)
+        found = np.empty(self.n_faces, dtype=np.int64)
+        n_found = _query_face_hierarchy(
+            self.boxes,
+            self.first_child,
+            self.face_start,
+            self.face_stop,
+            np.asarray(lower, dtype=np.float64),
+            np.asarray(upper, dtype=np.float64),
+            stack,
+            found,
+        )
+        return found[:n_found]
+
+    def closest_faces(
+        self, points: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """
+        Closest face to each point, by a traversal skipping the AABBs further from
+        the point than the closest face found so far.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            2D (dim, n_points) array containing data with 'float' type.
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.float64]]
+            Index in `faces` of the closest face, and closest point on it, of each
+            point.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        closest_face = np.empty(points.shape[1], dtype=np.int64)
+        closest_point = np.empty_like(points)
+        _closest_faces_in_hierarchy(
+            self.boxes,
+            self.first_child,
+            self.face_start,
+            self.face_stop,
+            self.faces,
+            self.depth,
+            points,
+            closest_face,
+            closest_point,
+        )
+        return closest_face, closest_point
+
+
+@numba.njit(cache=True)  # type: ignore
+def _build_face_hierarchy(faces: NDArray[np.float64], faces_per_leaf: int) -> tuple[
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.int64],
+    NDArray[np.int64],
+    NDArray[np.int64],
+    int,
+]:
+    """
+    Builds the hierarchy of `FaceAABBHierarchy`. The root is node 0, the children of
+    a node are first_child and first_child + 1 (-1 for leaves), and the faces of a
+    node are face_order[face_start:face_stop].
+    """
+    n_faces = faces.shape[2]
+    centers = np.empty((3, n_faces))
+    for k in range(n_faces):
+        for i in range(3):
+            centers[i, k] = (faces[i, 0, k] + faces[i, 1, k] + faces[i, 2, k]) / 3.0
+
+    face_order = np.arange(n_faces)
+    # A binary tree with at least one face per leaf has less than 2 * n_faces nodes
+    max_nodes = max(2 * n_faces - 1, 1)
+    boxes = np.empty((3, 2, max_nodes))
+    first_child = np.full(max_nodes, -1, dtype=np.int64)
+    face_start = np.zeros(max_nodes, dtype=np.int64)
+    face_stop = np.zeros(max_nodes, dtype=np.int64)
+    node_depth = np.zeros(max_nodes, dtype=np.int64)
+    face_stop[0] = n_faces
+    n_nodes = 1
+    depth = 0
+    # Nodes are split in the order they are created
+    for node in range(max_nodes):
+        if node == n_nodes:
+            break
+        start = face_start[node]
+        stop = face_stop[node]
+        depth = max(depth, node_depth[node])
+        for i in range(3):
+            low = np.inf
+            high = -np.inf
+            for k in range(start, stop):
+                for m in range(3):
+                    low = min(low, faces[i, m, face_order[k]])
+                    high = max(high, faces[i, m, face_order[k]])
+            boxes[i, 0, node] = low
+            boxes[i, 1, node] = high
+        if stop - start <= faces_per_leaf:
+            continue
+
+        # Split at the median along the axis of largest spread of the face centers
+        axis = 0
+        largest_spread = -1.0
+        for i in range(3):
+            low = np.inf
+            high = -np.inf
+            for k in range(start, stop):
+                low = min(low, centers[i, face_order[k]])
+                high = max(high, centers[i, face_order[k]])
+            if high - low > largest_spread:
+                largest_spread = high - low
+                axis = i
+        segment = face_order[start:stop]
+        face_order[start:stop] = segment[np.argsort(centers[axis, segment])]
+        middle = (start + stop) // 2
+
+        first_child[node] = n_nodes
+        face_start[n_nodes] = start
+        face_stop[n_nodes] = middle
+        face_start[n_nodes + 1] = middle
+        face_stop[n_nodes + 1] = stop
+        node_depth[n_nodes] = node_depth[node] + 1
+        node_depth[n_nodes + 1] = node_depth[node] + 1
+        n_nodes += 2
+
+    return (
+        face_order,
+        boxes[..., :n_nodes].copy(),
+        first_child[:n_nodes].copy(),
+        face_start[:n_nodes].copy(),
+        face_stop[:n_nodes].copy(),
+        depth,
+    )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _query_face_hierarchy(
+    boxes: NDArray[np.float64],
+    first_child: NDArray[np.int64],
+    face_start: NDArray[np.int64],
+    face_stop: NDArray[np.int64],
+    lower: NDArray[np.float64],
+    upper: NDArray[np.float64],
+    stack: NDArray[np.int64],
+    found: NDArray[np.int64],
+) -> int:
+    """
+    Stores in found the faces (positions in the ordered faces) of the leaves whose
+    AABB overlaps the box from lower to upper, and returns their number. stack must
+    hold depth + 2 nodes.
+    """
+    n_found = 0
+    stack[0] = 0
+    n_stack = 1
+    while n_stack > 0:
+        n_stack -= 1
+        node = stack[n_stack]
+        overlapping = True
+        for i in range(3):
+            if boxes[i, 0, node] > upper[i] or lower[i] > boxes[i, 1, node]:
+                overlapping = False
+                break
+        if not overlapping:
+            continue
+        if first_child[node] < 0:
+            for k in range(face_start[node], face_stop[node]):
+                found[n_found] = k
+                n_found += 1
+            continue
+        stack[n_stack] = first_child[node] + 1
+        stack[n_stack + 1] = first_child[node]
+        n_stack += 2
+    return n_found
+
+
+@numba.njit(cache=True)  # type: ignore
+def _closest_faces_in_hierarchy(
+    boxes: NDArray[np.float64],
+    first_child: NDArray[np.int64],
+    face_start: NDArray[np.int64],
+    face_stop: NDArray[np.int64],
+    faces: NDArray[np.float64],
+    depth: int,
+    points: NDArray[np.float64],
+    closest_face: NDArray[np.int64],
+    closest_point: NDArray[np.float64],
+) -> None:
+    stack = np.empty(depth + 2, dtype=np.int64)
+    for p in range(points.shape[1]):
+        point = points[:, p]
+        best_distance_squared = np.inf
+        stack[0] = 0
+        n_stack = 1
+        while n_stack > 0:
+            n_stack -= 1
+            node = stack[n_stack]
+            # Distance from the point to the AABB of the node
+            box_distance_squared = 0.0
+            for i in range(3):
+                excess = max(
+                    boxes[i, 0, node] - point[i], point[i] - boxes[i, 1, node], 0.0
+                )
+                box_distance_squared += excess * excess
+            if box_distance_squared >= best_distance_squared:
+                continue
+            if first_child[node] < 0:
+                for k in range(face_start[node], face_stop[node]):
+                    candidate = _closest_point_on_triangle(
+                        point, faces[:, 0, k], faces[:, 1, k], faces[:, 2, k]
+                    )
+                    distance_squared = 0.0
+                    for i in range(3):
+                        distance_squared += (candidate[i] - point[i]) ** 2
+                    if distance_squared < best_distance_squared:
+                        best_distance_squared = distance_squared
+                        closest_face[p] = k
+                        closest_point[:, p] = candidate
+                continue
+            stack[n_stack] = first_child[node] + 1
+            stack[n_stack + 1] = first_child[node]
+            n_stack += 2
+
 
 def are_aabb_intersecting(
     first_aabb_collection: NDArray[np.float64],
@@ -0,0 +1,813 @@
+__doc__ = """
+Broad phase of contact detection between the elements of many rods, or between many
+rigid bodies. A broad phase returns candidate element pairs, which are then checked
+exactly by the contact kernels (narrow phase), so it only needs to return a superset
+of the pairs in contact.
+"""
+
+from typing import Any, Optional
+
+import numba
+import numpy as np
+from numpy.typing import NDArray
+
+from elastica.collision.AABBCollection import AABBHierarchy
+from elastica.rigidbody.sphere import Sphere
+from elastica.typing import BlockSystemType
+
+# Relative margin on the cutoff distance of the broad phase, so that rounding never
+# drops a pair accepted by the narrow phase.
+_CUTOFF_MARGIN = 1e-10
+
+# Largest number of cells per element for which the uniform grid numbers its cells
+# densely, instead of hashing them.
+_DENSE_CELLS_PER_ELEMENT = 8
+
+
+class BroadPhase:
+    """
+    This is the base class for broad phases. A broad phase finds all pairs of elements
+    (p, q), p < q, such that
+
+        |x_p - x_q| < reach_p + reach_q,
+
+    where x is a point of the element and reach is the distance beyond which the
+    element cannot touch any other element. It may also return pairs farther apart.
+
+    Notes
+    -----
+    Every new broad phase must be derived from BroadPhase.
+    """
+
+    def find_pairs(
+        self, positions: NDArray[np.float64], reach: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Parameters
+        ----------
+        positions: NDArray[np.float64]
+            2D (dim, n) array containing data with 'float' type.
+            Point of each element.
+        reach: NDArray[np.float64]
+            1D (n) array containing data with 'float' type.
+            Reach of each element.
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            First and second element of each candidate pair, first < second.
+        """
+        raise NotImplementedError
+
+
+class UniformGridBroadPhase(BroadPhase):
+    """
+    Broad phase sorting the elements into a uniform grid of cubic cells (a cell list),
+    of size twice the largest reach by default. Candidate pairs are found among the
+    elements of the same and neighbouring cells, so the cost grows linearly with the
+    number of elements as long as their reach is similar. Cells are indexed directly
+    when the grid covering the elements is small, e.g. for a pile of rigid bodies, and
+    hashed otherwise.
+
+    Examples
+    --------
+    >>> simulator.detect_contact_among(
+    ...     rods, broad_phase=UniformGridBroadPhase()
+    ... ).using(RodRodContact, k=1e4, nu=10)
+    """
+
+    def __init__(self, cell_size: Optional[float] = None) -> None:
+        """
+        Parameters
+        ----------
+        cell_size: Optional[float]
+            Size of the grid cells. It is raised to twice the largest reach if smaller,
+            so that no pair is missed. Default is twice the largest reach.
+        """
+        self.cell_size = cell_size
+
+    def find_pairs(
+        self, positions: NDArray[np.float64], reach: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        if reach.shape[0] < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        cell_size = 2.0 * np.max(reach) * (1.0 + _CUTOFF_MARGIN)
+        if self.cell_size is not None:
+            cell_size = max(cell_size, self.cell_size)
+        return _find_pairs_uniform_grid(positions, reach, cell_size)  # type: ignore
+
+
+@numba.njit(cache=True)  # type: ignore
+def _is_candidate_pair(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    p: int,
+    q: int,
+) -> bool:
+    distance_squared = 0.0
+    for i in range(3):
+        d = positions[i, p] - positions[i, q]
+        distance_squared += d * d
+    cutoff = (reach[p] + reach[q]) * (1.0 + _CUTOFF_MARGIN)
+    return distance_squared < cutoff * cutoff
+
+
+@numba.njit(cache=True)  # type: ignore
+def _find_pairs_uniform_grid(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    cell_size: np.float64,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Cell list: elements are sorted by their cell (counting sort), and each element is
+    compared with the elements of its cell and of half of the neighbouring cells.
+    Cells are numbered densely over the grid covering the elements when it has at
+    most _DENSE_CELLS_PER_ELEMENT cells per element, e.g. for packed bodies, and
+    hashed into 2n buckets otherwise, e.g. for long rods spread in space.
+    """
+    n = positions.shape[1]
+    cells = np.empty((3, n), dtype=np.int64)
+    for i in range(3):
+        low = positions[i].min()
+        for p in range(n):
+            cells[i, p] = int((positions[i, p] - low) / cell_size)
+    n_cells_y = cells[1].max() + 1
+    n_cells_z = cells[2].max() + 1
+    # Compared in floating point, as the number of cells of sparse grids may overflow
+    n_cells = (cells[0].max() + 1.0) * n_cells_y * n_cells_z
+    if n_cells <= _DENSE_CELLS_PER_ELEMENT * n:
+        n_buckets = int(n_cells)
+        grid_shape = np.array([cells[0].max() + 1, n_cells_y, n_cells_z])
+    else:
+        n_buckets = 1
+        while n_buckets < 2 * n:
+            n_buckets *= 2
+        grid_shape = np.zeros(3, dtype=np.int64)
+
+    buckets = np.empty(n, dtype=np.int64)
+    for p in range(n):
+        buckets[p] = _cell_bucket(
+            cells[0, p],
+            cells[1, p],
+            cells[2, p],
+            grid_shape[0],
+            grid_shape[1],
+            grid_shape[2],
+            n_buckets,
+        )
+
+    # Elements of bucket b are order[bucket_start[b]:bucket_start[b + 1]]
+    bucket_start = np.zeros(n_buckets + 1, dtype=np.int64)
+    for p in range(n):
+        bucket_start[buckets[p] + 1] += 1
+    for b in range(n_buckets):
+        bucket_start[b + 1] += bucket_start[b]
+    fill = bucket_start[:-1].copy()
+    order = np.empty(n, dtype=np.int64)
+    for p in range(n):
+        order[fill[buckets[p]]] = p
+        fill[buckets[p]] += 1
+
+    # Pairs are counted first, then stored in arrays of the exact size.
+    n_pairs = _scan_uniform_grid(
+        positions,
+        reach,
+        cells,
+        grid_shape,
+        order,
+        bucket_start,
+        np.empty(0, dtype=np.int64),
+    )
+    pairs = np.empty(2 * n_pairs, dtype=np.int64)
+    _scan_uniform_grid(positions, reach, cells, grid_shape, order, bucket_start, pairs)
+    return pairs[:n_pairs], pairs[n_pairs:]
+
+
+@numba.njit(cache=True)  # type: ignore
+def _cell_bucket(
+    cx: int, cy: int, cz: int, n_x: int, n_y: int, n_z: int, n_buckets: int
+) -> int:
+    """
+    Bucket of the cell (cx, cy, cz): its index in the dense grid of n_x * n_y * n_z
+    cells, -1 for a cell outside of it, and its hash for a hashed grid (n_x = 0).
+    """
+    if n_x == 0:
+        return ((cx * 73856093) ^ (cy * 19349663) ^ (cz * 83492791)) & (n_buckets - 1)
+    if cx < 0 or cy < 0 or cz < 0 or cx >= n_x or cy >= n_y or cz >= n_z:
+        return -1
+    return (cx * n_y + cy) * n_z + cz
+
+
+@numba.njit(cache=True)  # type: ignore
+def _scan_uniform_grid(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    cells: NDArray[np.int64],
+    grid_shape: NDArray[np.int64],
+    order: NDArray[np.int64],
+    bucket_start: NDArray[np.int64],
+    pairs: NDArray[np.int64],
+) -> int:
+    """
+    Counts the candidate pairs, and stores them in pairs (first elements, then second
+    elements) unless pairs is empty.
+    """
+    n = positions.shape[1]
+    n_buckets = bucket_start.shape[0] - 1
+    n_x = grid_shape[0]
+    n_y = grid_shape[1]
+    n_z = grid_shape[2]
+    hashed = n_x == 0
+    store = pairs.shape[0] > 0
+    n_stored = pairs.shape[0] // 2
+    n_pairs = 0
+    for p in range(n):
+        # Half stencil: the cell of p and the 13 neighbouring cells that come after
+        # it, so that each pair of cells is visited once.
+        for dx in range(2):
+            cx = cells[0, p] + dx
+            for dy in range(-dx, 2):
+                cy = cells[1, p] + dy
+                for dz in range(-1, 2):
+                    if dx == 0 and dy == 0 and dz < 0:
+                        continue
+                    cz = cells[2, p] + dz
+                    b = _cell_bucket(cx, cy, cz, n_x, n_y, n_z, n_buckets)
+                    if b < 0:
+                        continue
+                    for k in range(bucket_start[b], bucket_start[b + 1]):
+                        q = order[k]
+                        if dx == 0 and dy == 0 and dz == 0 and q <= p:
+                            continue
+                        # Each element lies in one cell: for a hashed grid, the
+                        # exact cell check drops elements of other cells sharing
+                        # the bucket.
+                        if hashed and (
+                            cells[0, q] != cx or cells[1, q] != cy or cells[2, q] != cz
+                        ):
+                            continue
+                        if _is_candidate_pair(positions, reach, p, q):
+                            if store:
+                                pairs[n_pairs] = min(p, q)
+                                pairs[n_stored + n_pairs] = max(p, q)
+                            n_pairs += 1
+    return n_pairs
+
+
+class AABBHierarchyBroadPhase(BroadPhase):
+    """
+    Broad phase traversing an `AABBHierarchy` of the elements, each element being
+    bounded by a cube of half side its reach. The hierarchy is built at the first call
+    and refit at every call, as the elements keep their order. It suits elements
+    ordered along rods, such as a long rod in self contact, since neighbouring elements
+    then share AABBs.
+
+    Examples
+    --------
+    >>> simulator.detect_contact_between(rod, rod).using(
+    ...     RodSelfContact, k=1e4, nu=10, broad_phase=AABBHierarchyBroadPhase()
+    ... )
+    """
+
+    def __init__(self, elements_per_leaf: int = 4) -> None:
+        """
+        Parameters
+        ----------
+        elements_per_leaf: int
+            Average number of elements in each AABB of the final level of the
+            hierarchy. Default is 4.
+        """
+        if elements_per_leaf < 1:
+            raise ValueError(
+                "The number of elements per leaf must be positive, got {}.".format(
+                    elements_per_leaf
+                )
+            )
+        self.elements_per_leaf = elements_per_leaf
+        self.hierarchy: Optional[AABBHierarchy] = None
+
+    def find_pairs(
+        self, positions: NDArray[np.float64], reach: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        n = reach.shape[0]
+        if n < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        dimensions = np.empty((3, n))
+        dimensions[:] = reach * (1.0 + _CUTOFF_MARGIN)
+        if self.hierarchy is None or self.hierarchy.leaf_start[-1] != n:
+            self.hierarchy = AABBHierarchy(
+                positions, dimensions, min(self.elements_per_leaf, n)
+            )
+        else:
+            self.hierarchy.refit(positions, dimensions)
+
+        first_leaf, second_leaf = self.hierarchy.find_overlapping_leaves()
+        leaf_start = self.hierarchy.leaf_start
+        n_pairs = _find_pairs_in_leaves(
+            positions,
+            reach,
+            leaf_start,
+            first_leaf,
+            second_leaf,
+            np.empty(0, dtype=np.int64),
+        )
+        pairs = np.empty(2 * n_pairs, dtype=np.int64)
+        _find_pairs_in_leaves(
+            positions, reach, leaf_start, first_leaf, second_leaf, pairs
+        )
+        return pairs[:n_pairs], pairs[n_pairs:]
+
+
+@numba.njit(cache=True)  # type: ignore
+def _find_pairs_in_leaves(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    leaf_start: NDArray[np.int64],
+    first_leaf: NDArray[np.int64],
+    second_leaf: NDArray[np.int64],
+    pairs: NDArray[np.int64],
+) -> int:
+    """
+    Counts the candidate pairs among the elements of overlapping leaves, and stores
+    them in pairs (first elements, then second elements) unless pairs is empty.
+    """
+    store = pairs.shape[0] > 0
+    n_stored = pairs.shape[0] // 2
+    n_pairs = 0
+    for k in range(first_leaf.shape[0]):
+        a = first_leaf[k]
+        b = second_leaf[k]
+        for p in range(leaf_start[a], leaf_start[a + 1]):
+            # Leaves cover consecutive elements, so p < q
+            start = p + 1 if a == b else leaf_start[b]
+            for q in range(start, leaf_start[b + 1]):
+                if _is_candidate_pair(positions, reach, p, q):
+                    if store:
+                        pairs[n_pairs] = p
+                        pairs[n_stored + n_pairs] = q
+                    n_pairs += 1
+    return n_pairs
+
+
+class SweepAndPruneBroadPhase(BroadPhase):
+    """
+    Sweep and prune broad phase: the elements are kept sorted by the lower end of
+    their interval along one axis (position minus reach), and each element is compared
+    with the following elements until their lower end passes its upper end. The order
+    of the previous call is sorted again by insertion sort, which takes about linear
+    time as elements barely move between calls, so the cost grows as n + k, k being
+    the number of pairs overlapping along the axis.
+
+    It suits scenes spread along one axis, such as rods lying side by side on a plane.
+
+    Attributes
+    ----------
+    axis: Optional[int]
+        Sweep axis. If None at the first call, the axis along which the elements are
+        the most spread is used.
+    n_swaps: int
+        Number of swaps of the insertion sort at the last call.
+
+    Examples
+    --------
+    >>> simulator.detect_contact_among(
+    ...     rods, broad_phase=SweepAndPruneBroadPhase()
+    ... ).using(RodRodContact, k=1e4, nu=10)
+    """
+
+    def __init__(self, axis: Optional[int] = None) -> None:
+        """
+        Parameters
+        ----------
+        axis: Optional[int]
+            Sweep axis, 0, 1 or 2. Default is the axis along which the elements are the
+            most spread at the first call.
+        """
+        if axis is not None and axis not in (0, 1, 2):
+            raise ValueError("The sweep axis must be 0, 1 or 2, got {}.".format(axis))
+        self.axis = axis
+        self.n_swaps = 0
+        self._order = np.empty(0, dtype=np.int64)
+
+    def find_pairs(
+        self, positions: NDArray[np.float64], reach: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        n = reach.shape[0]
+        if self._order.shape[0] != n:
+            # New set of elements: start again from their order in the arrays
+            self._order = np.arange(n, dtype=np.int64)
+            if self.axis is None and n > 0:
+                spread = positions.max(axis=1) - positions.min(axis=1)
+                self.axis = int(np.argmax(spread))
+        if n < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        assert self.axis is not None
+        padded_reach = reach * (1.0 + _CUTOFF_MARGIN)
+        lower = positions[self.axis] - padded_reach
+        upper = positions[self.axis] + padded_reach
+        self.n_swaps = _insertion_sort(self._order, lower)
+        n_pairs = _sweep(
+            positions, reach, self._order, lower, upper, np.empty(0, dtype=np.int64)
+        )
+        pairs = np.empty(2 * n_pairs, dtype=np.int64)
+        _sweep(positions, reach, self._order, lower, upper, pairs)
+        return pairs[:n_pairs], pairs[n_pairs:]
+
+
+@numba.njit(cache=True)  # type: ignore
+def _insertion_sort(order: NDArray[np.int64], keys: NDArray[np.float64]) -> int:
+    """
+    Sorts order in place so that keys[order] increases, and returns the number of
+    swaps, about linear for an almost sorted order.
+    """
+    n_swaps = 0
+    for i in range(1, order.shape[0]):
+        p = order[i]
+        key = keys[p]
+        k = i - 1
+        while k >= 0 and keys[order[k]] > key:
+            order[k + 1] = order[k]
+            k -= 1
+            n_swaps += 1
+        order[k + 1] = p
+    return n_swaps
+
+
+@numba.njit(cache=True)  # type: ignore
+def _sweep(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    order: NDArray[np.int64],
+    lower: NDArray[np.float64],
+    upper: NDArray[np.float64],
+    pairs: NDArray[np.int64],
+) -> int:
+    """
+    Counts the candidate pairs, and stores them in pairs (first elements, then second
+    elements) unless pairs is empty.
+    """
+    n = order.shape[0]
+    # Copies in sorted order, so that the sweep reads contiguous memory
+    sorted_positions = np.empty((n, 3))
+    sorted_reach = np.empty(n)
+    sorted_lower = np.empty(n)
+    for i in range(n):
+        p = order[i]
+        for d in range(3):
+            sorted_positions[i, d] = positions[d, p]
+        sorted_reach[i] = reach[p]
+        sorted_lower[i] = lower[p]
+
+    store = pairs.shape[0] > 0
+    n_stored = pairs.shape[0] // 2
+    n_pairs = 0
+    for i in range(n):
+        upper_i = upper[order[i]]
+        for k in range(i + 1, n):
+            # Following elements start further along the axis
+            if sorted_lower[k] > upper_i:
+                break
+            distance_squared = 0.0
+            for d in range(3):
+                delta = sorted_positions[i, d] - sorted_positions[k, d]
+                distance_squared += delta * delta
+            cutoff = (sorted_reach[i] + sorted_reach[k]) * (1.0 + _CUTOFF_MARGIN)
+            if distance_squared < cutoff * cutoff:
+                if store:
+                    pairs[n_pairs] = min(order[i], order[k])
+                    pairs[n_stored + n_pairs] = max(order[i], order[k])
+                n_pairs += 1
+    return n_pairs
+
+
+class VerletListBroadPhase(BroadPhase):
+    """
+    Broad phase keeping a neighbour (Verlet) list of candidate pairs, found by another
+    broad phase with the reach of each element increased by half the skin. The list is
+    reused until, since it was built, the largest displacement of an element plus the
+    largest increase of a reach exceeds half the skin. Until then, no pair can come
+    closer than the sum of their reaches without being in the list.
+
+    As the list is reused across stages and time steps, the broad phase runs once
+    every few steps instead of once per stage.
+
+    Attributes
+    ----------
+    skin: float
+    broad_phase: BroadPhase
+        Broad phase building the list.
+    n_calls: int
+        Number of calls of find_pairs.
+    n_rebuilds: int
+        Number of times the list was built.
+    n_pairs: int
+        Number of pairs in the current list.
+    max_pairs: int
+        Largest number of pairs in the list so far.
+
+    Examples
+    --------
+    >>> simulator.detect_contact_among(
+    ...     rods, broad_phase=VerletListBroadPhase(skin=0.2 * base_radius)
+    ... ).using(RodRodContact, k=1e4, nu=10)
+    """
+
+    def __init__(self, skin: float, broad_phase: Optional[BroadPhase] = None) -> None:
+        """
+        Parameters
+        ----------
+        skin: float
+            Margin added to the cutoff distance of the pairs in the list. A larger skin
+            makes longer lists, rebuilt less often.
+        broad_phase: Optional[BroadPhase]
+            Broad phase building the list. Default is UniformGridBroadPhase.
+        """
+        if not skin > 0.0:
+            raise ValueError("The skin must be positive, got {}.".format(skin))
+        self.skin = float(skin)
+        self.broad_phase = (
+            UniformGridBroadPhase() if broad_phase is None else broad_phase
+        )
+        self.n_calls = 0
+        self.n_rebuilds = 0
+        self.n_pairs = 0
+        self.max_pairs = 0
+        self._positions = np.empty((3, 0))
+        self._reach = np.empty(0)
+        self._pairs = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def find_pairs(
+        self, positions: NDArray[np.float64], reach: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Returns the same arrays as long as the list is not rebuilt.
+        """
+        self.n_calls += 1
+        if self._positions.shape != positions.shape or _list_expired(
+            positions, reach, self._positions, self._reach, 0.5 * self.skin
+        ):
+            self._pairs = self.broad_phase.find_pairs(
+                positions, reach + 0.5 * self.skin
+            )
+            self._positions = positions.copy()
+            self._reach = reach.copy()
+            self.n_rebuilds += 1
+            self.n_pairs = self._pairs[0].shape[0]
+            self.max_pairs = max(self.max_pairs, self.n_pairs)
+        return self._pairs
+
+
+@numba.njit(cache=True)  # type: ignore
+def _list_expired(
+    positions: NDArray[np.float64],
+    reach: NDArray[np.float64],
+    positions_at_build: NDArray[np.float64],
+    reach_at_build: NDArray[np.float64],
+    half_skin: np.float64,
+) -> bool:
+    """
+    Checks if the largest displacement plus the largest increase of reach since the
+    list was built exceeds half the skin.
+    """
+    n = positions.shape[1]
+    max_displacement_squared = 0.0
+    max_reach_increase = 0.0
+    for p in range(n):
+        displacement_squared = 0.0
+        for i in range(3):
+            d = positions[i, p] - positions_at_build[i, p]
+            displacement_squared += d * d
+        max_displacement_squared = max(max_displacement_squared, displacement_squared)
+        max_reach_increase = max(max_reach_increase, reach[p] - reach_at_build[p])
+    return np.sqrt(max_displacement_squared) + max_reach_increase > half_skin
+
+
+class RodContactGroup:
+    """
+    Elements of a group of rods stored in the same memory block, for contact among the
+    rods of the group. The contact points of an element are its first node and its
+    tangent, as in `RodRodContact`, so the element i of a rod lies between the nodes i
+    and i + 1 of the rod.
+
+    `candidate_pairs` returns the pairs of elements of different rods found by the
+    broad phase, ordered as if one contact had been registered per pair of rods,
+    in the order of the group, i.e. for each rod a, for each following rod b, for each
+    element i of a and each element j of b.
+
+    Attributes
+    ----------
+    block: BlockSystemType
+        Memory block holding the rods.
+    broad_phase: BroadPhase
+    elem_idx: NDArray[np.int64]
+        Index of each element of the group in the block.
+    node_idx: NDArray[np.int64]
+        Index of the first node of each element of the group in the block.
+    local_idx: NDArray[np.int64]
+        Index of each element of the group in its rod.
+    n_points: NDArray[np.int64]
+        Number of elements of the rod of each element of the group.
+    rank: NDArray[np.int64]
+        Position in the group of the rod of each element of the group.
+    """
+
+    def __init__(
+        self,
+        block: BlockSystemType,
+        rod_indices: NDArray[np.int64],
+        broad_phase: Optional[BroadPhase] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        block: BlockSystemType
+            Memory block holding the rods.
+        rod_indices: NDArray[np.int64]
+            Index of each rod of the group in the block, in the order of the group.
+        broad_phase: Optional[BroadPhase]
+            Default is UniformGridBroadPhase.
+        """
+        self.block = block
+        self.broad_phase = (
+            UniformGridBroadPhase() if broad_phase is None else broad_phase
+        )
+
+        elem_idx, node_idx, local_idx, n_points, rank = [], [], [], [], []
+        for k, rod_idx in enumerate(rod_indices):
+            start_node = block.start_idx_in_rod_nodes[rod_idx]
+            start_elem = block.start_idx_in_rod_elems[rod_idx]
+            # As in RodRodContact, the last node of the rod starts no element
+            n = block.end_idx_in_rod_nodes[rod_idx] - start_node - 1
+            elem_idx.append(start_elem + np.arange(n))
+            node_idx.append(start_node + np.arange(n))
+            local_idx.append(np.arange(n))
+            n_points.append(np.full(n, n))
+            rank.append(np.full(n, k))
+        self.elem_idx = np.concatenate(elem_idx).astype(np.int64)
+        self.node_idx = np.concatenate(node_idx).astype(np.int64)
+        self.local_idx = np.concatenate(local_idx).astype(np.int64)
+        self.n_points = np.concatenate(n_points).astype(np.int64)
+        self.rank = np.concatenate(rank).astype(np.int64)
+
+        # Candidate pairs are ordered again only when the broad phase returns new
+        # arrays, e.g. when a Verlet list is rebuilt.
+        self._broad_phase_pairs: Optional[
+            tuple[NDArray[np.int64], NDArray[np.int64]]
+        ] = None
+        self._candidate_pairs = (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+        )
+
+    def element_reach(self) -> NDArray[np.float64]:
+        """
+        Reach of each element of the group: two elements are checked by the narrow
+        phase only if their first nodes are closer than the sum of their reaches.
+        """
+        block: Any = self.block
+        return block.radius[self.elem_idx] + block.lengths[self.elem_idx]
+
+    def element_positions(self) -> NDArray[np.float64]:
+        """First node of each element of the group."""
+        block: Any = self.block
+        return block.position_collection[:, self.node_idx]
+
+    def candidate_pairs(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            Elements of the first and second rod of each candidate pair, as indices
+            in the group arrays, in contact order (see class documentation).
+        """
+        pairs = self.broad_phase.find_pairs(
+            self.element_positions(), self.element_reach()
+        )
+        if (
+            self._broad_phase_pairs is not None
+            and pairs[0] is self._broad_phase_pairs[0]
+            and pairs[1] is self._broad_phase_pairs[1]
+        ):
+            return self._candidate_pairs
+        self._broad_phase_pairs = pairs
+
+        first, second = pairs
+        rank = self.rank
+        different_rods = rank[first] != rank[second]
+        first, second = first[different_rods], second[different_rods]
+        # Element of the rod that comes first in the group goes first
+        swap = rank[first] > rank[second]
+        first, second = np.where(swap, second, first), np.where(swap, first, second)
+        order = np.lexsort(
+            (
+                self.local_idx[second],
+                self.local_idx[first],
+                rank[second],
+                rank[first],
+            )
+        )
+        self._candidate_pairs = (first[order], second[order])
+        return self._candidate_pairs
+
+
+class RigidBodyContactGroup:
+    """
+    Bodies of a group of rigid bodies stored in the same memory block, for contact
+    among the bodies of the group, e.g. the grains of a granular medium. Each body is
+    seen by the broad phase as its center and the radius of its bounding sphere.
+
+    `candidate_pairs` returns the pairs of bodies found by the broad phase, ordered as
+    if one contact had been registered per pair of bodies, in the order of the group,
+    i.e. for each body a, for each following body b.
+
+    Attributes
+    ----------
+    block: BlockSystemType
+        Memory block holding the bodies.
+    broad_phase: BroadPhase
+    body_idx: NDArray[np.int64]
+        Index of each body of the group in the block.
+    radius: NDArray[np.float64]
+        Radius of each body of the group.
+    length: NDArray[np.float64]
+        Length of each body of the group.
+    reach: NDArray[np.float64]
+        Radius of the bounding sphere of each body of the group, about its center.
+    """
+
+    def __init__(
+        self,
+        block: BlockSystemType,
+        body_indices: NDArray[np.int64],
+        systems: list[Any],
+        broad_phase: Optional[BroadPhase] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        block: BlockSystemType
+            Memory block holding the bodies.
+        body_indices: NDArray[np.int64]
+            Index of each body of the group in the block, in the order of the group.
+        systems: list
+            Bodies of the group, in the order of the group, with a radius and a
+            length, e.g. `Sphere` or `Cylinder`.
+        broad_phase: Optional[BroadPhase]
+            Default is UniformGridBroadPhase.
+        """
+        self.block = block
+        self.broad_phase = (
+            UniformGridBroadPhase() if broad_phase is None else broad_phase
+        )
+        self.body_idx = np.asarray(body_indices, dtype=np.int64)
+        self.radius = np.array([system.radius for system in systems], dtype=np.float64)
+        self.length = np.array([system.length for system in systems], dtype=np.float64)
+        # The bounding sphere of a sphere is the sphere itself, the one of a cylinder
+        # goes through the rims of its end faces.
+        self.reach = np.array(
+            [
+                (
+                    system.radius
+                    if isinstance(system, Sphere)
+                    else np.hypot(system.radius, 0.5 * system.length)
+                )
+                for system in systems
+            ],
+            dtype=np.float64,
+        )
+
+        self._broad_phase_pairs: Optional[
+            tuple[NDArray[np.int64], NDArray[np.int64]]
+        ] = None
+        self._candidate_pairs = (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+        )
+
+    def body_positions(self) -> NDArray[np.float64]:
+        """Center of each body of the group."""
+        block: Any = self.block
+        return block.position_collection[:, self.body_idx]
+
+    def candidate_pairs(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            First and second body of each candidate pair, as indices in the group
+            arrays, in contact order (see class documentation).
+        """
+        pairs = self.broad_phase.find_pairs(self.body_positions(), self.reach)
+        if (
+            self._broad_phase_pairs is not None
+            and pairs[0] is self._broad_phase_pairs[0]
+            and pairs[1] is self._broad_phase_pairs[1]
+        ):
+            return self._candidate_pairs
+        self._broad_phase_pairs = pairs
+
+        first, second = pairs
+        order = np.lexsort((second, first))
+        self._candidate_pairs = (first[order], second[order])
+        return self._candidate_pairs
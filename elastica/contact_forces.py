@@ -1,13 +1,23 @@
 __doc__ = """ Numba implementation module containing contact between rods and rigid bodies and other rods rigid bodies or surfaces."""
 
-from typing import TypeVar, Generic, Type
+from typing import Any, Optional, TypeVar, Generic, Type
 from elastica.typing import RodType, SystemType, SurfaceType
 
 from elastica.rod.rod_base import RodBase
 from elastica.rigidbody.cylinder import Cylinder
 from elastica.rigidbody.sphere import Sphere
+from elastica.rigidbody.mesh_rigid_body import MeshRigidBody
 from elastica.surface.plane import Plane
 from elastica.surface.surface_base import SurfaceBase
+from elastica.surface.signed_distance_field import SignedDistanceField
+from elastica.surface.heightfield import Heightfield
+from elastica.collision.AABBCollection import FaceAABBHierarchy
+from elastica.contact_broad_phase import (
+    AABBHierarchyBroadPhase,
+    BroadPhase,
+    RigidBodyContactGroup,
+    RodContactGroup,
+)
 from elastica.contact_utils import (
     _prune_using_aabbs_rod_cylinder,
     _prune_using_aabbs_rod_rod,
@@ -16,11 +26,20 @@ from elastica.contact_utils import (
 from elastica._contact_functions import (
     _calculate_contact_forces_rod_cylinder,
     _calculate_contact_forces_rod_rod,
-    _calculate_contact_forces_self_rod,
+    _calculate_contact_forces_rod_rod_pairs,
+    _calculate_contact_forces_rod_rod_pairs_parallel,
+    _calculate_contact_forces_self_rod_pairs,
+    _calculate_contact_forces_self_rod_pairs_parallel,
     _calculate_contact_forces_rod_sphere,
+    _calculate_contact_forces_rod_mesh,
     _calculate_contact_forces_rod_plane,
+    _calculate_contact_forces_rod_sdf,
     _calculate_contact_forces_rod_plane_with_anisotropic_friction,
+    _calculate_contact_forces_rod_heightfield_with_anisotropic_friction,
     _calculate_contact_forces_cylinder_plane,
+    _calculate_contact_forces_sphere_sphere,
+    _calculate_contact_forces_cylinder_cylinder,
+    _calculate_contact_forces_sphere_plane,
 )
 import numpy as np
 from numpy.typing import NDArray
@@ -90,6 +109,20 @@ class NoContact(Generic[S1, S2]):
         """
         pass
 
+    def apply_contact_among(self, group: RodContactGroup) -> None:
+        """
+        Apply contact forces and torques among the rods of a group, see
+        `detect_contact_among`. Only contact classes between rods, or between rods
+        and a static obstacle given at construction, implement it.
+
+        Parameters
+        ----------
+        group: RodContactGroup
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support contact among a group of rods."
+        )
+
 
 class RodRodContact(NoContact):
     """
@@ -105,9 +138,18 @@ class RodRodContact(NoContact):
     ...    nu=10,
     ... )
 
+    How to define contact among many rods, with one broad phase over all their
+    elements instead of one contact per pair of rods.
+
+    >>> simulator.detect_contact_among(rods).using(
+    ...    RodRodContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
     """
 
-    def __init__(self, k: np.float64, nu: np.float64) -> None:
+    def __init__(self, k: np.float64, nu: np.float64, parallel: bool = False) -> None:
         """
         Parameters
         ----------
@@ -115,10 +157,16 @@ class RodRodContact(NoContact):
             Contact spring constant.
         nu : float
             Contact damping constant.
+        parallel : bool
+            If True, contact among a group of rods computes the distance, spring and
+            damping forces of the element pairs on multiple threads, then adds the
+            forces in the order of the pairs, with the same result as serially.
+            Default is False.
         """
         super(RodRodContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.parallel = parallel
 
     def apply_contact(self, system_one: RodType, system_two: RodType) -> None:
         """
@@ -166,6 +214,41 @@ class RodRodContact(NoContact):
             self.nu,
         )
 
+    def apply_contact_among(self, group: RodContactGroup) -> None:
+        """
+        Apply contact forces and torques among the rods of a group. The result is the
+        same as one contact per pair of rods, registered in the order of the group.
+
+        Parameters
+        ----------
+        group: RodContactGroup
+
+        """
+        first, second = group.candidate_pairs()
+        block = group.block
+        kernel = (
+            _calculate_contact_forces_rod_rod_pairs_parallel
+            if self.parallel
+            else _calculate_contact_forces_rod_rod_pairs
+        )
+        kernel(
+            first,
+            second,
+            group.elem_idx,
+            group.node_idx,
+            group.local_idx,
+            group.n_points,
+            block.position_collection,
+            block.radius,
+            block.lengths,
+            block.tangents,
+            block.velocity_collection,
+            block.internal_forces,
+            block.external_forces,
+            self.k,
+            self.nu,
+        )
+
 
 class RodCylinderContact(NoContact):
     """
@@ -275,6 +358,11 @@ class RodSelfContact(NoContact):
     """
     This class is modeling self contact of rod.
 
+    The pairs of elements that may be in contact are found by a broad phase, by
+    default an `AABBHierarchyBroadPhase` refit at every call, so that the cost grows
+    about linearly with the number of elements instead of quadratically. Forces are
+    the same as if every pair of elements were checked.
+
     Examples
     --------
     How to define contact rod self contact.
@@ -287,7 +375,13 @@ class RodSelfContact(NoContact):
 
     """
 
-    def __init__(self, k: float, nu: float) -> None:
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        broad_phase: Optional[BroadPhase] = None,
+        parallel: bool = False,
+    ) -> None:
         """
 
         Parameters
@@ -296,10 +390,21 @@ class RodSelfContact(NoContact):
             Contact spring constant.
         nu : float
             Contact damping constant.
+        broad_phase : Optional[BroadPhase]
+            Broad phase finding the pairs of elements that may be in contact. Default
+            is AABBHierarchyBroadPhase.
+        parallel : bool
+            If True, the forces of the element pairs are computed on multiple threads,
+            then added in a fixed order, with the same result as serially. Default is
+            False.
         """
         super(RodSelfContact, self).__init__()
         self.k = np.float64(k)
         self.nu = np.float64(nu)
+        self.broad_phase = (
+            AABBHierarchyBroadPhase() if broad_phase is None else broad_phase
+        )
+        self.parallel = parallel
 
     def _check_systems_validity(
         self,
@@ -323,10 +428,19 @@ class RodSelfContact(NoContact):
         system_two: RodType
 
         """
-        _calculate_contact_forces_self_rod(
-            system_one.position_collection[
-                ..., :-1
-            ],  # Discount last node, we want element start position
+        x_collection = system_one.position_collection[..., :-1]
+        first, second = self._candidate_pairs(
+            x_collection, system_one.radius, system_one.lengths
+        )
+        kernel = (
+            _calculate_contact_forces_self_rod_pairs_parallel
+            if self.parallel
+            else _calculate_contact_forces_self_rod_pairs
+        )
+        kernel(
+            first,
+            second,
+            x_collection,
             system_one.radius,
             system_one.lengths,
             system_one.tangents,
@@ -336,6 +450,25 @@ class RodSelfContact(NoContact):
             self.nu,
         )
 
+    def _candidate_pairs(
+        self,
+        x_collection: NDArray[np.float64],
+        radius: NDArray[np.float64],
+        lengths: NDArray[np.float64],
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Pairs (i, j) of elements found by the broad phase, j further down the rod than
+        the skip distance of i, in the order of `_calculate_contact_forces_self_rod`
+        (i increasing, then j decreasing).
+        """
+        lower, upper = self.broad_phase.find_pairs(x_collection, radius + lengths)
+        # Neighbouring elements always touch, they are skipped
+        skip = 1 + np.ceil(0.8 * np.pi * radius / lengths).astype(np.int64)
+        far = upper - lower >= skip[upper]
+        first, second = upper[far], lower[far]
+        order = np.lexsort((-second, first))
+        return first[order], second[order]
+
 
 class RodSphereContact(NoContact):
     """
@@ -445,6 +578,127 @@ class RodSphereContact(NoContact):
         )
 
 
+class RodMeshRigidBodyContact(NoContact):
+    """
+    This class is for applying contact forces between rod-mesh rigid body.
+    First system is always rod and second system is always mesh rigid body.
+    In addition to the contact forces, user can define apply friction forces between rod and mesh rigid body that
+    are in contact. For details on friction model refer to this [1]_.
+
+    The faces of the mesh are indexed by a `FaceAABBHierarchy`, built once in the
+    material frame of the body, at the first contact computation. Every step, rod
+    elements are mapped to that frame and only test the faces near them; the force
+    on an element comes from its closest face. Faces have no thickness, so rod
+    elements must not cross the mesh surface by more than their radius.
+
+    Notes
+    -----
+    The `velocity_damping_coefficient` is set to a high value (e.g. 1e4) to minimize slip and simulate stiction
+    (static friction), while friction_coefficient corresponds to the Coulombic friction coefficient.
+
+    Examples
+    --------
+    How to define contact between rod and mesh rigid body.
+
+    >>> simulator.detect_contact_between(rod, mesh_rigid_body).using(
+    ...    RodMeshRigidBodyContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
+    .. [1] Preclik T., Popa Constantin., Rude U., Regularizing a Time-Stepping Method for Rigid Multibody Dynamics, Multibody Dynamics 2011, ECCOMAS. URL: https://www10.cs.fau.de/publications/papers/2011/Preclik_Multibody_Ext_Abstr.pdf
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        velocity_damping_coefficient: float = 0.0,
+        friction_coefficient: float = 0.0,
+        faces_per_leaf: int = 4,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        velocity_damping_coefficient : float
+            Velocity damping coefficient between rigid-body and rod contact is used to apply friction force in the
+            slip direction.
+        friction_coefficient : float
+            For Coulombic friction coefficient for rigid-body and rod contact.
+        faces_per_leaf : int
+            Maximum number of faces in an AABB of the final level of the hierarchy.
+        """
+        super(RodMeshRigidBodyContact, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.velocity_damping_coefficient = np.float64(velocity_damping_coefficient)
+        self.friction_coefficient = np.float64(friction_coefficient)
+        self.faces_per_leaf = faces_per_leaf
+        self.hierarchy: Optional[FaceAABBHierarchy] = None
+        self._face_normals: NDArray[np.float64] = np.empty((3, 0))
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [MeshRigidBody]
+
+    def apply_contact(self, system_one: RodType, system_two: MeshRigidBody) -> None:
+        """
+        Apply contact forces and torques between RodType object and MeshRigidBody object.
+
+        Parameters
+        ----------
+        system_one: RodType
+        system_two: MeshRigidBody
+
+        """
+        if self.hierarchy is None:
+            self._build_hierarchy(system_two)
+        hierarchy = self.hierarchy
+        assert hierarchy is not None
+
+        _calculate_contact_forces_rod_mesh(
+            system_one.position_collection,
+            system_one.radius,
+            system_one.velocity_collection,
+            system_one.external_forces,
+            system_two.position_collection[..., 0],
+            system_two.director_collection[..., 0],
+            system_two.velocity_collection[..., 0],
+            system_two.omega_collection[..., 0],
+            system_two.external_forces,
+            system_two.external_torques,
+            hierarchy.faces,
+            self._face_normals,
+            hierarchy.boxes,
+            hierarchy.first_child,
+            hierarchy.face_start,
+            hierarchy.face_stop,
+            hierarchy.depth,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+    def _build_hierarchy(self, system_two: MeshRigidBody) -> None:
+        """
+        Builds the hierarchy of the faces of the mesh in the material frame of the
+        body, from their position relative to the center of mass stored by the body.
+        """
+        faces = (
+            system_two.distance_to_faces_from_center_of_mass[np.newaxis, ...]
+            * system_two.direction_to_faces_from_center_of_mass_in_material_frame
+        )
+        self.hierarchy = FaceAABBHierarchy(faces, self.faces_per_leaf)
+        self._face_normals = np.ascontiguousarray(
+            system_two.face_normals_in_material_frame[..., self.hierarchy.face_order]
+        )
+
+
 class RodPlaneContact(NoContact):
     """
     This class is for applying contact forces between rod-plane.
@@ -512,6 +766,149 @@ class RodPlaneContact(NoContact):
         )
 
 
+class RodSDFContact(NoContact):
+    """
+    This class is for applying contact forces between rod and a static obstacle given
+    by a signed distance field, see `SignedDistanceField`.
+    First system is always rod and second system is always signed distance field.
+    The contact model is the one of `RodPlaneContact`, with the plane replaced at
+    every element by the level set of the field through the element center, so the
+    cost is one field lookup per element, whatever the complexity of the obstacle.
+
+    Examples
+    --------
+    How to define contact between rod and signed distance field.
+
+    >>> simulator.detect_contact_between(rod, signed_distance_field).using(
+    ...    RodSDFContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
+    How to define contact between every rod of a group and the obstacle, with all
+    the elements of the group handled in one call over their memory block.
+
+    >>> simulator.detect_contact_among(rods).using(
+    ...    RodSDFContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    surface=signed_distance_field,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        surface: Optional[SignedDistanceField] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        surface : Optional[SignedDistanceField]
+            Obstacle of the contact among a group of rods. Not used for contact
+            between a rod and a signed distance field.
+        """
+        super(RodSDFContact, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.surface_tol = np.float64(1.0e-4)
+        self.surface = surface
+        # Elements of the rod of the last apply_contact, as in RodContactGroup
+        self._rod_elements: tuple[NDArray[np.int64], ...] = ()
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [SignedDistanceField]
+
+    def apply_contact(
+        self, system_one: RodType, system_two: SignedDistanceField
+    ) -> None:
+        """
+        Apply contact forces between RodType object and SignedDistanceField object.
+
+        Parameters
+        ----------
+        system_one: RodType
+        system_two: SignedDistanceField
+
+        """
+        # As in RodContactGroup, the last node of the rod starts no element
+        n_elems = system_one.position_collection.shape[1] - 1
+        if len(self._rod_elements) == 0 or self._rod_elements[0].shape[0] != n_elems:
+            elements = np.arange(n_elems, dtype=np.int64)
+            self._rod_elements = (
+                elements,
+                elements,
+                elements,
+                np.full(n_elems, n_elems, dtype=np.int64),
+            )
+        elem_idx, node_idx, local_idx, n_points = self._rod_elements
+        self._apply(
+            system_two,
+            elem_idx,
+            node_idx,
+            local_idx,
+            n_points,
+            system_one,
+        )
+
+    def apply_contact_among(self, group: RodContactGroup) -> None:
+        """
+        Apply contact forces between every rod of a group and the surface given at
+        construction, in one call over all the elements of the group.
+
+        Parameters
+        ----------
+        group: RodContactGroup
+
+        """
+        if self.surface is None:
+            raise ValueError(
+                "RodSDFContact needs a surface for contact among a group of rods."
+            )
+        self._apply(
+            self.surface,
+            group.elem_idx,
+            group.node_idx,
+            group.local_idx,
+            group.n_points,
+            group.block,
+        )
+
+    def _apply(
+        self,
+        surface: SignedDistanceField,
+        elem_idx: NDArray[np.int64],
+        node_idx: NDArray[np.int64],
+        local_idx: NDArray[np.int64],
+        n_points: NDArray[np.int64],
+        rods: Any,
+    ) -> None:
+        _calculate_contact_forces_rod_sdf(
+            surface.distance,
+            surface.origin[:, 0],
+            1.0 / surface.spacing,
+            self.surface_tol,
+            self.k,
+            self.nu,
+            elem_idx,
+            node_idx,
+            local_idx,
+            n_points,
+            rods.radius,
+            rods.mass,
+            rods.position_collection,
+            rods.velocity_collection,
+            rods.internal_forces,
+            rods.external_forces,
+        )
+
+
 class RodPlaneContactWithAnisotropicFriction(NoContact):
     """
     This class is for applying contact forces between rod-plane with friction.
@@ -615,6 +1012,194 @@ class RodPlaneContactWithAnisotropicFriction(NoContact):
         )
 
 
+class RodHeightfieldContactWithAnisotropicFriction(NoContact):
+    """
+    This class is for applying contact forces between rod and a heightfield terrain
+    with anisotropic friction, see `Heightfield`.
+    First system is always rod and second system is always heightfield.
+    The contact and friction model is the one of
+    `RodPlaneContactWithAnisotropicFriction`, with the plane replaced at every
+    element by the plane tangent to the terrain below the element center, so the
+    cost is one grid lookup per element, whatever the size of the terrain.
+
+    Examples
+    --------
+    How to define contact between rod and heightfield.
+
+    >>> simulator.detect_contact_between(rod, heightfield).using(
+    ...    RodHeightfieldContactWithAnisotropicFriction,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    slip_velocity_tol = 1e-4,
+    ...    static_mu_array = np.array([0.0,0.0,0.0]),
+    ...    kinetic_mu_array = np.array([1.0,2.0,3.0]),
+    ... )
+
+    How to define contact between every rod of a group and the terrain, with all the
+    elements of the group handled in one call over their memory block.
+
+    >>> simulator.detect_contact_among(rods).using(
+    ...    RodHeightfieldContactWithAnisotropicFriction,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    slip_velocity_tol = 1e-4,
+    ...    static_mu_array = np.array([0.0,0.0,0.0]),
+    ...    kinetic_mu_array = np.array([1.0,2.0,3.0]),
+    ...    surface=heightfield,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        slip_velocity_tol: float,
+        static_mu_array: NDArray[np.float64],
+        kinetic_mu_array: NDArray[np.float64],
+        surface: Optional[Heightfield] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        slip_velocity_tol: float
+            Velocity tolerance to determine if the element is slipping or not.
+        static_mu_array: numpy.ndarray
+            1D (3,) array containing data with 'float' type.
+            [forward, backward, sideways] static friction coefficients.
+        kinetic_mu_array: numpy.ndarray
+            1D (3,) array containing data with 'float' type.
+            [forward, backward, sideways] kinetic friction coefficients.
+        surface : Optional[Heightfield]
+            Terrain of the contact among a group of rods. Not used for contact
+            between a rod and a heightfield.
+        """
+        super(RodHeightfieldContactWithAnisotropicFriction, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.surface_tol = np.float64(1.0e-4)
+        self.slip_velocity_tol = np.float64(slip_velocity_tol)
+        (
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+        ) = np.asarray(static_mu_array, dtype=np.float64)
+        (
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+        ) = np.asarray(kinetic_mu_array, dtype=np.float64)
+        self.surface = surface
+        # Elements of the rod of the last apply_contact, as in RodContactGroup
+        self._rod_elements: tuple[NDArray[np.int64], ...] = ()
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [Heightfield]
+
+    def apply_contact(self, system_one: RodType, system_two: Heightfield) -> None:
+        """
+        Apply contact forces and torques between RodType object and Heightfield
+        object with anisotropic friction.
+
+        Parameters
+        ----------
+        system_one: RodType
+        system_two: Heightfield
+
+        """
+        # As in RodContactGroup, the last node of the rod starts no element
+        n_elems = system_one.position_collection.shape[1] - 1
+        if len(self._rod_elements) == 0 or self._rod_elements[0].shape[0] != n_elems:
+            elements = np.arange(n_elems, dtype=np.int64)
+            self._rod_elements = (
+                elements,
+                elements,
+                elements,
+                np.full(n_elems, n_elems, dtype=np.int64),
+            )
+        elem_idx, node_idx, local_idx, n_points = self._rod_elements
+        self._apply(
+            system_two,
+            elem_idx,
+            node_idx,
+            local_idx,
+            n_points,
+            system_one,
+        )
+
+    def apply_contact_among(self, group: RodContactGroup) -> None:
+        """
+        Apply contact forces and torques between every rod of a group and the
+        surface given at construction, in one call over all the elements of the
+        group.
+
+        Parameters
+        ----------
+        group: RodContactGroup
+
+        """
+        if self.surface is None:
+            raise ValueError(
+                "RodHeightfieldContactWithAnisotropicFriction needs a surface for "
+                "contact among a group of rods."
+            )
+        self._apply(
+            self.surface,
+            group.elem_idx,
+            group.node_idx,
+            group.local_idx,
+            group.n_points,
+            group.block,
+        )
+
+    def _apply(
+        self,
+        surface: Heightfield,
+        elem_idx: NDArray[np.int64],
+        node_idx: NDArray[np.int64],
+        local_idx: NDArray[np.int64],
+        n_points: NDArray[np.int64],
+        rods: Any,
+    ) -> None:
+        _calculate_contact_forces_rod_heightfield_with_anisotropic_friction(
+            surface.heights,
+            surface.normals,
+            surface.origin[:, 0],
+            1.0 / surface.spacing,
+            surface.grid_axes,
+            surface.up_axis,
+            self.surface_tol,
+            self.slip_velocity_tol,
+            self.k,
+            self.nu,
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+            elem_idx,
+            node_idx,
+            local_idx,
+            n_points,
+            rods.radius,
+            rods.mass,
+            rods.tangents,
+            rods.position_collection,
+            rods.director_collection,
+            rods.velocity_collection,
+            rods.omega_collection,
+            rods.internal_forces,
+            rods.external_forces,
+            rods.internal_torques,
+            rods.external_torques,
+        )
+
+
 class CylinderPlaneContact(NoContact):
     """
     This class is for applying contact forces between cylinder-plane.
@@ -684,6 +1269,388 @@ class CylinderPlaneContact(NoContact):
         )
 
 
+class SphereSphereContact(NoContact):
+    """
+    This class is for applying contact forces between sphere-sphere, e.g. between the
+    grains of a granular medium. The normal force is a spring and damper on the
+    overlap of the spheres, and the friction model is the one of `RodSphereContact`,
+    using the slip velocity of the contact points, including the rotation of the
+    spheres.
+
+    Examples
+    --------
+    How to define contact between two spheres.
+
+    >>> simulator.detect_contact_between(first_sphere, second_sphere).using(
+    ...    SphereSphereContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
+    How to define contact among many spheres, with one broad phase over all of them
+    instead of one contact per pair of spheres.
+
+    >>> simulator.detect_contact_among(spheres).using(
+    ...    SphereSphereContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    velocity_damping_coefficient=1e2,
+    ...    friction_coefficient=0.5,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        velocity_damping_coefficient: float = 0.0,
+        friction_coefficient: float = 0.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        velocity_damping_coefficient : float
+            Velocity damping coefficient between the spheres, used to apply friction
+            force in the slip direction.
+        friction_coefficient : float
+            Coulombic friction coefficient between the spheres.
+        """
+        super(SphereSphereContact, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.velocity_damping_coefficient = np.float64(velocity_damping_coefficient)
+        self.friction_coefficient = np.float64(friction_coefficient)
+        self._first_body = np.zeros(1, dtype=np.int64)
+
+    @property
+    def _allowed_system_one(self) -> list[Type]:
+        return [Sphere]
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [Sphere]
+
+    def apply_contact(self, system_one: Sphere, system_two: Sphere) -> None:
+        """
+        Apply contact forces and torques between two Sphere objects.
+
+        Parameters
+        ----------
+        system_one: Sphere
+        system_two: Sphere
+
+        """
+        _calculate_contact_forces_sphere_sphere(
+            self._first_body,
+            np.array([system_one.radius]),
+            system_one.position_collection,
+            system_one.velocity_collection,
+            system_one.omega_collection,
+            system_one.director_collection,
+            system_one.external_forces,
+            system_one.external_torques,
+            self._first_body,
+            np.array([system_two.radius]),
+            system_two.position_collection,
+            system_two.velocity_collection,
+            system_two.omega_collection,
+            system_two.director_collection,
+            system_two.external_forces,
+            system_two.external_torques,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+    def apply_contact_among(self, group: RigidBodyContactGroup) -> None:  # type: ignore[override]
+        """
+        Apply contact forces and torques among the spheres of a group, for the pairs
+        found by its broad phase.
+
+        Parameters
+        ----------
+        group: RigidBodyContactGroup
+
+        """
+        first, second = group.candidate_pairs()
+        block: Any = group.block
+        _calculate_contact_forces_sphere_sphere(
+            group.body_idx[first],
+            group.radius[first],
+            block.position_collection,
+            block.velocity_collection,
+            block.omega_collection,
+            block.director_collection,
+            block.external_forces,
+            block.external_torques,
+            group.body_idx[second],
+            group.radius[second],
+            block.position_collection,
+            block.velocity_collection,
+            block.omega_collection,
+            block.director_collection,
+            block.external_forces,
+            block.external_torques,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+
+class CylinderCylinderContact(NoContact):
+    """
+    This class is for applying contact forces between cylinder-cylinder. As in
+    `RodCylinderContact`, the contact is found from the closest points of the axes of
+    the cylinders, so that their ends are treated as rounded. The force model is the
+    one of `SphereSphereContact`.
+
+    Examples
+    --------
+    How to define contact between two cylinders.
+
+    >>> simulator.detect_contact_between(first_cylinder, second_cylinder).using(
+    ...    CylinderCylinderContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
+    How to define contact among many cylinders, with one broad phase over all of them
+    instead of one contact per pair of cylinders.
+
+    >>> simulator.detect_contact_among(cylinders).using(
+    ...    CylinderCylinderContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        velocity_damping_coefficient: float = 0.0,
+        friction_coefficient: float = 0.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        velocity_damping_coefficient : float
+            Velocity damping coefficient between the cylinders, used to apply
+            friction force in the slip direction.
+        friction_coefficient : float
+            Coulombic friction coefficient between the cylinders.
+        """
+        super(CylinderCylinderContact, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.velocity_damping_coefficient = np.float64(velocity_damping_coefficient)
+        self.friction_coefficient = np.float64(friction_coefficient)
+        self._first_body = np.zeros(1, dtype=np.int64)
+
+    @property
+    def _allowed_system_one(self) -> list[Type]:
+        return [Cylinder]
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [Cylinder]
+
+    def apply_contact(self, system_one: Cylinder, system_two: Cylinder) -> None:
+        """
+        Apply contact forces and torques between two Cylinder objects.
+
+        Parameters
+        ----------
+        system_one: Cylinder
+        system_two: Cylinder
+
+        """
+        _calculate_contact_forces_cylinder_cylinder(
+            self._first_body,
+            np.array([system_one.radius]),
+            np.array([system_one.length]),
+            system_one.position_collection,
+            system_one.velocity_collection,
+            system_one.omega_collection,
+            system_one.director_collection,
+            system_one.external_forces,
+            system_one.external_torques,
+            self._first_body,
+            np.array([system_two.radius]),
+            np.array([system_two.length]),
+            system_two.position_collection,
+            system_two.velocity_collection,
+            system_two.omega_collection,
+            system_two.director_collection,
+            system_two.external_forces,
+            system_two.external_torques,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+    def apply_contact_among(self, group: RigidBodyContactGroup) -> None:  # type: ignore[override]
+        """
+        Apply contact forces and torques among the cylinders of a group, for the
+        pairs found by its broad phase.
+
+        Parameters
+        ----------
+        group: RigidBodyContactGroup
+
+        """
+        first, second = group.candidate_pairs()
+        block: Any = group.block
+        _calculate_contact_forces_cylinder_cylinder(
+            group.body_idx[first],
+            group.radius[first],
+            group.length[first],
+            block.position_collection,
+            block.velocity_collection,
+            block.omega_collection,
+            block.director_collection,
+            block.external_forces,
+            block.external_torques,
+            group.body_idx[second],
+            group.radius[second],
+            group.length[second],
+            block.position_collection,
+            block.velocity_collection,
+            block.omega_collection,
+            block.director_collection,
+            block.external_forces,
+            block.external_torques,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+
+class SpherePlaneContact(NoContact):
+    """
+    This class is for applying contact forces between sphere-plane.
+    First system is always sphere and second system is always plane.
+    The contact model is the one of `CylinderPlaneContact`, with the distance to the
+    plane measured from the surface of the sphere.
+
+    Examples
+    --------
+    How to define contact between sphere and plane.
+
+    >>> simulator.detect_contact_between(sphere, plane).using(
+    ...    SpherePlaneContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+
+    How to define contact between every sphere of a group and the plane, with all the
+    spheres handled in one call over their memory block.
+
+    >>> simulator.detect_contact_among(spheres).using(
+    ...    SpherePlaneContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    surface=plane,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        surface: Optional[SurfaceType] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        surface : Optional[SurfaceType]
+            Plane of the contact among a group of spheres. Not used for contact
+            between a sphere and a plane.
+        """
+        super(SpherePlaneContact, self).__init__()
+        self.k = np.float64(k)
+        self.nu = np.float64(nu)
+        self.surface_tol = np.float64(1.0e-4)
+        self.surface = surface
+        self._first_body = np.zeros(1, dtype=np.int64)
+
+    @property
+    def _allowed_system_one(self) -> list[Type]:
+        return [Sphere]
+
+    @property
+    def _allowed_system_two(self) -> list[Type]:
+        return [SurfaceBase]
+
+    def apply_contact(self, system_one: Sphere, system_two: SurfaceType) -> None:
+        """
+        Apply contact forces between Sphere object and Plane object.
+
+        Parameters
+        ----------
+        system_one: Sphere
+        system_two: SurfaceBase
+
+        """
+        _calculate_contact_forces_sphere_plane(
+            system_two.origin[:, 0],
+            system_two.normal,
+            self.surface_tol,
+            self.k,
+            self.nu,
+            self._first_body,
+            np.array([system_one.radius]),
+            system_one.position_collection,
+            system_one.velocity_collection,
+            system_one.external_forces,
+        )
+
+    def apply_contact_among(self, group: RigidBodyContactGroup) -> None:  # type: ignore[override]
+        """
+        Apply contact forces between every sphere of a group and the plane given at
+        construction, in one call over all the spheres of the group.
+
+        Parameters
+        ----------
+        group: RigidBodyContactGroup
+
+        """
+        if self.surface is None:
+            raise ValueError(
+                "SpherePlaneContact needs a surface for contact among a group of "
+                "spheres."
+            )
+        block: Any = group.block
+        _calculate_contact_forces_sphere_plane(
+            self.surface.origin[:, 0],
+            self.surface.normal,
+            self.surface_tol,
+            self.k,
+            self.nu,
+            group.body_idx,
+            group.radius,
+            block.position_collection,
+            block.velocity_collection,
+            block.external_forces,
+        )
+
+
 def common_check_systems_identity(
     system_one: S1,
     system_two: S2,
@@ -105,6 +105,229 @@ def _find_min_dist(
     return x2 + s * e2 - x1 - t * e1, x2 + s * e2, x1 - t * e1
 
 
+@numba.njit(cache=True)  # type: ignore
+def _dot_product_of_columns(
+    a: NDArray[np.float64], b: NDArray[np.float64], k: int
+) -> np.float64:
+    # Same as _dot_product(a[:, k], b[:, k])
+    total: np.float64 = np.float64(0.0)
+    for i in range(3):
+        total += a[i, k] * b[i, k]
+    return total
+
+
+@numba.njit(cache=True, error_model="numpy")  # type: ignore
+def _find_min_dist_batch(
+    x1: NDArray[np.float64],
+    e1: NDArray[np.float64],
+    x2: NDArray[np.float64],
+    e2: NDArray[np.float64],
+    distance_vector: NDArray[np.float64],
+    s: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> None:
+    """
+    Same as `_find_min_dist` for the segment pairs (x1[:, k], e1[:, k]),
+    (x2[:, k], e2[:, k]), in structure-of-arrays layout. The distance vectors and the
+    parameters of the closest points, x2 + s * e2 and x1 + t * e1, are stored in
+    distance_vector, s and t, with the same values as `_find_min_dist`.
+
+    Every candidate of `_find_min_dist` is computed for every pair and the closest
+    one is selected by conditional expressions instead of branches, so the loop has
+    no data-dependent control flow. Divisions by zero for degenerate segments give
+    inf or nan in candidates that are not selected (numpy error model).
+    """
+    for k in range(x1.shape[1]):
+        e1e1 = _dot_product_of_columns(e1, e1, k)
+        e1e2 = _dot_product_of_columns(e1, e2, k)
+        e2e2 = _dot_product_of_columns(e2, e2, k)
+
+        x1e1 = _dot_product_of_columns(x1, e1, k)
+        x1e2 = _dot_product_of_columns(x1, e2, k)
+        x2e1 = _dot_product_of_columns(e1, x2, k)
+        x2e2 = _dot_product_of_columns(x2, e2, k)
+
+        # Parallel segments
+        t_parallel = _clip((x2e1 - x1e1) / e1e1, 0.0, 1.0)
+        s_parallel = _clip((x1e2 + t_parallel * e1e2 - x2e2) / e2e2, 0.0, 1.0)
+
+        # Closest points inside both segments
+        s_inside = (e1e1 * (x1e2 - x2e2) + e1e2 * (x2e1 - x1e1)) / (
+            e1e1 * e2e2 - (e1e2) ** 2
+        )
+        t_inside = (e1e2 * s_inside + x2e1 - x1e1) / e1e1
+
+        # Closest points on the ends of the segments: s = 0, s = 1, t = 0, t = 1
+        t_s0 = _clip((x2e1 - x1e1) / e1e1, 0.0, 1.0)
+        t_s1 = _clip((x2e1 + e1e2 - x1e1) / e1e1, 0.0, 1.0)
+        s_t0 = _clip((x1e2 - x2e2) / e2e2, 0.0, 1.0)
+        s_t1 = _clip((x1e2 + e1e2 - x2e2) / e2e2, 0.0, 1.0)
+        d_s0 = 0.0
+        d_s1 = 0.0
+        d_t0 = 0.0
+        d_t1 = 0.0
+        for i in range(3):
+            d = x1[i, k] + e1[i, k] * t_s0 - x2[i, k]
+            d_s0 += d * d
+            d = x1[i, k] + e1[i, k] * t_s1 - x2[i, k] - e2[i, k]
+            d_s1 += d * d
+            d = x2[i, k] + s_t0 * e2[i, k] - x1[i, k]
+            d_t0 += d * d
+            d = x2[i, k] + s_t1 * e2[i, k] - x1[i, k] - e1[i, k]
+            d_t1 += d * d
+        d_s0 = sqrt(d_s0)
+        d_s1 = sqrt(d_s1)
+        d_t0 = sqrt(d_t0)
+        d_t1 = sqrt(d_t1)
+
+        # Same order of comparisons as _find_min_dist
+        s_end = 1.0 if d_s1 < d_s0 else 0.0
+        t_end = t_s1 if d_s1 < d_s0 else t_s0
+        d_end = d_s1 if d_s1 < d_s0 else d_s0
+        s_end, t_end, d_end = (
+            (s_t0, 0.0, d_t0) if d_t0 < d_end else (s_end, t_end, d_end)
+        )
+        s_end, t_end = (s_t1, 1.0) if d_t1 < d_end else (s_end, t_end)
+
+        parallel = abs(1.0 - e1e2**2 / (e1e1 * e2e2)) < 1e-6
+        outside = _out_of_bounds(s_inside, 0.0, 1.0) or _out_of_bounds(
+            t_inside, 0.0, 1.0
+        )
+        s_k = s_parallel if parallel else (s_end if outside else s_inside)
+        t_k = t_parallel if parallel else (t_end if outside else t_inside)
+        s[k] = s_k
+        t[k] = t_k
+        for i in range(3):
+            distance_vector[i, k] = (
+                x2[i, k] + s_k * e2[i, k] - x1[i, k] - t_k * e1[i, k]
+            )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _closest_point_on_triangle(
+    p: NDArray[np.float64],
+    a: NDArray[np.float64],
+    b: NDArray[np.float64],
+    c: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Closest point to p on the triangle (a, b, c), found from the Voronoi region of
+    the triangle p lies in.
+
+    References
+    ----------
+    Ericson C., Real-Time Collision Detection, Section 5.1.5 (2004)
+    """
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    d1 = _dot_product(ab, ap)
+    d2 = _dot_product(ac, ap)
+    # Vertex region of a
+    if d1 <= 0.0 and d2 <= 0.0:
+        return a.copy()
+
+    bp = p - b
+    d3 = _dot_product(ab, bp)
+    d4 = _dot_product(ac, bp)
+    # Vertex region of b
+    if d3 >= 0.0 and d4 <= d3:
+        return b.copy()
+
+    # Edge region of ab
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+        return a + (d1 / (d1 - d3)) * ab
+
+    cp = p - c
+    d5 = _dot_product(ab, cp)
+    d6 = _dot_product(ac, cp)
+    # Vertex region of c
+    if d6 >= 0.0 and d5 <= d6:
+        return c.copy()
+
+    # Edge region of ac
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+        return a + (d2 / (d2 - d6)) * ac
+
+    # Edge region of bc
+    va = d3 * d6 - d5 * d4
+    if va <= 0.0 and (d4 - d3) >= 0.0 and (d5 - d6) >= 0.0:
+        return b + ((d4 - d3) / ((d4 - d3) + (d5 - d6))) * (c - b)
+
+    # Face region
+    denominator = 1.0 / (va + vb + vc)
+    return a + (vb * denominator) * ab + (vc * denominator) * ac
+
+
+@numba.njit(cache=True)  # type: ignore
+def _find_min_dist_segment_triangle(
+    x1: NDArray[np.float64],
+    e1: NDArray[np.float64],
+    a: NDArray[np.float64],
+    b: NDArray[np.float64],
+    c: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Shortest vector from the segment starting at x1 with edge e1 to the triangle
+    (a, b, c).
+
+    If the segment does not cross the triangle, the closest points are either an end
+    of the segment and a point of the triangle, or a point of the segment and a
+    point of an edge of the triangle; every case is checked. If it crosses the
+    triangle, the distance is zero.
+
+    Returns
+    -------
+    tuple
+        Distance vector, from the segment to the triangle, and contact point on the
+        triangle.
+    """
+    ab = b - a
+    ac = c - a
+
+    # Segment crossing the triangle, from the Moller-Trumbore ray-triangle test
+    h = np.cross(e1, ac)
+    det = _dot_product(ab, h)
+    if abs(det) > 1e-14:
+        inv_det = 1.0 / det
+        ax = x1 - a
+        u = inv_det * _dot_product(ax, h)
+        q = np.cross(ax, ab)
+        v = inv_det * _dot_product(e1, q)
+        t = inv_det * _dot_product(ac, q)
+        if u >= 0.0 and v >= 0.0 and u + v <= 1.0 and t >= 0.0 and t <= 1.0:
+            return np.zeros(3), x1 + t * e1
+
+    # Ends of the segment against the triangle
+    contact_point = _closest_point_on_triangle(x1, a, b, c)
+    distance_vector = contact_point - x1
+    minimum_distance = _norm(distance_vector)
+
+    x2 = x1 + e1
+    potential_contact_point = _closest_point_on_triangle(x2, a, b, c)
+    potential_distance_vector = potential_contact_point - x2
+    potential_distance = _norm(potential_distance_vector)
+    if potential_distance < minimum_distance:
+        contact_point = potential_contact_point
+        distance_vector = potential_distance_vector
+        minimum_distance = potential_distance
+
+    # Segment against the edges of the triangle
+    for start, edge in ((a, ab), (b, c - b), (a, ac)):
+        potential_distance_vector, potential_contact_point, _ = _find_min_dist(
+            x1, e1, start, edge
+        )
+        potential_distance = _norm(potential_distance_vector)
+        if potential_distance < minimum_distance:
+            contact_point = potential_contact_point
+            distance_vector = potential_distance_vector
+            minimum_distance = potential_distance
+
+    return distance_vector, contact_point
+
+
 @numba.njit(cache=True)  # type: ignore
 def _aabbs_not_intersecting(
     aabb_one: NDArray[np.float64], aabb_two: NDArray[np.float64]
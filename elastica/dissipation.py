@@ -5,9 +5,10 @@ Built in damper module implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 from elastica.typing import RodType, SystemType
+from elastica.utils import block_ranges
 
 from numba import njit
 
@@ -352,3 +353,262 @@ def nb_filter_rate(
         filter_term[..., 0] = 0.0
         filter_term[..., -1] = 0.0
     rate_collection[...] = rate_collection - filter_term
+
+
+# Batched implementations, applying the dampers registered on many rods of the same
+# memory block in one call. They are registered in elastica.modules.damping and merged
+# by the operator plan at finalize, see elastica.modules.operator_plan.
+
+
+def _batched_analytical_linear_damper(
+    instances: list[AnalyticalLinearDamper],
+    block: Any,
+    system_indices: NDArray[np.int32],
+) -> Callable[..., None]:
+    """
+    Batched `AnalyticalLinearDamper.dampen_rates`. The damping coefficients of the
+    instances are copied, at every call, into arrays covering the whole memory block,
+    with coefficient 1 on the ghosts and on the rods without damper, so that the rates
+    of the block are damped in one sweep. A rod with several dampers gets one layer of
+    coefficients per damper, applied in order.
+
+    The rotational damping factors, coefficient to the power of the dilatation, are
+    computed at every call for the whole block, with one `np.power` into a
+    preallocated buffer. Computing them as `exp(dilatation * log(coefficient))`, with
+    the logarithm taken at finalize, would be cheaper, but neither that form nor the
+    scalar `pow` of numba reproduce `np.power` bit for bit, and both would change the
+    trajectories of `AnalyticalLinearDamper`.
+    """
+    node_start, node_end, elem_start, elem_end = block_ranges(block, system_indices)
+    layer = np.zeros(len(instances), dtype=np.int64)
+    n_dampers: dict[int, int] = {}
+    for r, system_idx in enumerate(system_indices):
+        layer[r] = n_dampers.get(int(system_idx), 0)
+        n_dampers[int(system_idx)] = layer[r] + 1
+    n_layers = int(layer.max()) + 1
+
+    velocity_collection = block.velocity_collection
+    omega_collection = block.omega_collection
+    dilatation = block.dilatation
+    translational_damping_coefficient = np.ones(
+        (n_layers, velocity_collection.shape[1])
+    )
+    rotational_damping_coefficient = np.ones((n_layers, 3, omega_collection.shape[1]))
+    rotational_damping_factor = np.ones_like(rotational_damping_coefficient)
+
+    def dampen_rates(time: np.float64 = np.float64(0.0)) -> None:
+        # Coefficients changed after finalize are applied as by the per-rod operators
+        for r, instance in enumerate(instances):
+            translational_damping_coefficient[layer[r], node_start[r] : node_end[r]] = (
+                instance.translational_damping_coefficient
+            )
+            rotational_damping_coefficient[layer[r], :, elem_start[r] : elem_end[r]] = (
+                instance.rotational_damping_coefficient
+            )
+        np.power(
+            rotational_damping_coefficient,
+            dilatation,
+            out=rotational_damping_factor,
+        )
+        _batch_analytical_linear_damping(
+            translational_damping_coefficient,
+            rotational_damping_factor,
+            velocity_collection,
+            omega_collection,
+        )
+
+    return dampen_rates
+
+
+@njit(cache=True)  # type: ignore
+def _batch_analytical_linear_damping(
+    translational_damping_coefficient: NDArray[np.float64],
+    rotational_damping_factor: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+) -> None:
+    """
+    Damps the rates of the memory block in place, layer after layer, computed as in
+    `AnalyticalLinearDamper.dampen_rates`.
+    """
+    for layer in range(translational_damping_coefficient.shape[0]):
+        for i in range(3):
+            for k in range(velocity_collection.shape[1]):
+                velocity_collection[i, k] = (
+                    velocity_collection[i, k]
+                    * translational_damping_coefficient[layer, k]
+                )
+            for k in range(omega_collection.shape[1]):
+                omega_collection[i, k] = (
+                    omega_collection[i, k] * rotational_damping_factor[layer, i, k]
+                )
+
+
+def _batched_laplace_dissipation_filter(
+    instances: list[LaplaceDissipationFilter],
+    block: Any,
+    system_indices: NDArray[np.int32],
+) -> Callable[..., None]:
+    """
+    Batched `LaplaceDissipationFilter.dampen_rates`. The Laplacian is swept over the
+    whole memory block, with the filter order of each slot read from arrays built at
+    finalize: slots of rods without filter and ghosts are skipped, the end slots of
+    straight rods are zeroed after each pass, as are the periodic boundaries of ring
+    rods, which hold the rates at the other end of the ring for the first pass. A rod
+    with several filters gets one layer of filter orders per filter, applied in order.
+
+    The sweep reproduces the filter functions chosen by `LaplaceDissipationFilter`, so
+    only instances of exactly this class are accepted: subclasses may pick another one.
+    """
+    for instance in instances:
+        if type(instance) is not LaplaceDissipationFilter:
+            raise TypeError(
+                "No batched implementation for {}.".format(type(instance).__name__)
+            )
+    node_start, node_end, elem_start, elem_end = block_ranges(block, system_indices)
+    layer = np.zeros(len(instances), dtype=np.int64)
+    n_filters: dict[int, int] = {}
+    for r, system_idx in enumerate(system_indices):
+        layer[r] = n_filters.get(int(system_idx), 0)
+        n_filters[int(system_idx)] = layer[r] + 1
+    n_layers = int(layer.max()) + 1
+    filter_order = np.array([instance.filter_order for instance in instances])
+    ring_rod = np.array([bool(instance.system.ring_rod_flag) for instance in instances])
+
+    velocity_collection = block.velocity_collection
+    omega_collection = block.omega_collection
+    node_slots = _filter_slots(
+        velocity_collection.shape[1],
+        node_start,
+        node_end,
+        filter_order,
+        ring_rod,
+        layer,
+        n_layers,
+        getattr(block, "periodic_boundary_nodes_idx", np.zeros((2, 0))),
+    )
+    elem_slots = _filter_slots(
+        omega_collection.shape[1],
+        elem_start,
+        elem_end,
+        filter_order,
+        ring_rod,
+        layer,
+        n_layers,
+        getattr(block, "periodic_boundary_elems_idx", np.zeros((2, 0))),
+    )
+    # Filter terms are allocated once, and only their filtered slots are used
+    velocity_filter_term = np.zeros_like(velocity_collection)
+    omega_filter_term = np.zeros_like(omega_collection)
+
+    def dampen_rates(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_filter_rate(velocity_collection, velocity_filter_term, *node_slots)
+        _batch_filter_rate(omega_collection, omega_filter_term, *elem_slots)
+
+    return dampen_rates
+
+
+def _filter_slots(
+    n_slots: int,
+    start: NDArray[np.int64],
+    end: NDArray[np.int64],
+    filter_order: NDArray[np.int64],
+    ring_rod: NDArray[np.bool_],
+    layer: NDArray[np.int64],
+    n_layers: int,
+    periodic_boundary_idx: NDArray[np.int32],
+) -> tuple[
+    NDArray[np.int64],
+    NDArray[np.bool_],
+    NDArray[np.bool_],
+    NDArray[np.int64],
+    NDArray[np.int64],
+    NDArray[np.int64],
+]:
+    """
+    Filter order, interior and rod masks of the slots of the memory block, per layer,
+    and periodic boundaries of the filtered ring rods, as (layer, slot, referenced
+    slot).
+    """
+    slot_filter_order = np.zeros((n_layers, n_slots), dtype=np.int64)
+    interior = np.zeros((n_layers, n_slots), dtype=np.bool_)
+    in_rod = np.zeros((n_layers, n_slots), dtype=np.bool_)
+    periodic_layer: list[int] = []
+    periodic_slot: list[int] = []
+    periodic_reference: list[int] = []
+    for r in range(start.shape[0]):
+        slots = slice(start[r], end[r])
+        slot_filter_order[layer[r], slots] = filter_order[r]
+        in_rod[layer[r], slots] = True
+        if ring_rod[r]:
+            interior[layer[r], slots] = True
+            # The slots before and after the ring rod hold its last and first rates
+            for k in range(periodic_boundary_idx.shape[1]):
+                if periodic_boundary_idx[0, k] in (start[r] - 1, end[r]):
+                    slot_filter_order[layer[r], periodic_boundary_idx[0, k]] = (
+                        filter_order[r]
+                    )
+                    periodic_layer.append(layer[r])
+                    periodic_slot.append(periodic_boundary_idx[0, k])
+                    periodic_reference.append(periodic_boundary_idx[1, k])
+        else:
+            interior[layer[r], start[r] + 1 : end[r] - 1] = True
+    return (
+        slot_filter_order,
+        interior,
+        in_rod,
+        np.array(periodic_layer, dtype=np.int64),
+        np.array(periodic_slot, dtype=np.int64),
+        np.array(periodic_reference, dtype=np.int64),
+    )
+
+
+@njit(cache=True)  # type: ignore
+def _batch_filter_rate(
+    rate_collection: NDArray[np.float64],
+    filter_term: NDArray[np.float64],
+    filter_order: NDArray[np.int64],
+    interior: NDArray[np.bool_],
+    in_rod: NDArray[np.bool_],
+    periodic_layer: NDArray[np.int64],
+    periodic_slot: NDArray[np.int64],
+    periodic_reference: NDArray[np.int64],
+) -> None:
+    """
+    Filters the rates of the memory block in place, layer after layer, computed as in
+    `nb_filter_rate`. Each pass of the Laplacian is done in one sweep, keeping the
+    value of the previous slot before its update.
+    """
+    n_slots = rate_collection.shape[1]
+    for layer in range(filter_order.shape[0]):
+        n_passes = 0
+        for k in range(n_slots):
+            n_passes = max(n_passes, filter_order[layer, k])
+
+        for i in range(3):
+            for k in range(n_slots):
+                if filter_order[layer, k] > 0:
+                    filter_term[i, k] = rate_collection[i, k]
+            for p in range(periodic_layer.shape[0]):
+                if periodic_layer[p] == layer:
+                    filter_term[i, periodic_slot[p]] = rate_collection[
+                        i, periodic_reference[p]
+                    ]
+
+            for n in range(n_passes):
+                previous = 0.0
+                for k in range(n_slots):
+                    current = filter_term[i, k]
+                    if filter_order[layer, k] > n:
+                        if interior[layer, k]:
+                            filter_term[i, k] = (
+                                -filter_term[i, k + 1] - previous + 2.0 * current
+                            ) / 4.0
+                        else:
+                            # dont touch boundary values
+                            filter_term[i, k] = 0.0
+                    previous = current
+
+            for k in range(n_slots):
+                if in_rod[layer, k]:
+                    rate_collection[i, k] = rate_collection[i, k] - filter_term[i, k]
@@ -0,0 +1,416 @@
+__doc__ = """
+Ensemble of replicas of the same simulation, advanced together in one simulator.
+
+All rods of all replicas are packed into the same `MemoryBlockCosseratRod`, so one
+`integrate` call advances every replica in lockstep, and the kernels of the block run
+over all replicas at once instead of once per simulator.
+
+Features (forcing, constraints, damping, ...) are still registered on each system of
+each replica. Features with a batched implementation are merged into one operator per
+memory block at finalize, see `elastica.modules.operator_plan`; the others run once per
+system. Their parameters stay on the feature instances, and are gathered and set per
+replica with `feature_parameter` and `set_feature_parameter`.
+"""
+
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from elastica.typing import SystemCollectionType, SystemType
+from elastica.rod.rod_base import RodBase
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.modules.operator_plan import OperatorPlan
+
+
+class Ensemble:
+    """
+    Builds `n_replicas` replicas of the same system layout into one simulator.
+
+    Each replica is built by `build_replica(simulator, replica_idx, **parameters)`, which
+    appends the systems of the replica and their features (forcing, constraints,
+    damping, callbacks, ...) to the simulator and returns the appended systems. The
+    per-replica parameters are given as arrays whose first axis runs over replicas, and
+    the replica receives its own row of each array. They are only passed to
+    `build_replica`; the ensemble does not write them anywhere itself.
+
+    After finalize, `set_block_parameter` writes per-replica values straight into an
+    array of the memory block, e.g. the bend and shear matrices, so that material
+    parameters of all replicas can be changed without building the simulator again.
+    Likewise, `feature_parameter` and `set_feature_parameter` read and write a
+    parameter of the features of one class, e.g. the forcing or damping coefficients,
+    as one array with the replica as first axis.
+
+    Examples
+    --------
+    >>> def build_replica(simulator, replica_idx, youngs_modulus):
+    ...     rod = ea.CosseratRod.straight_rod(..., youngs_modulus=youngs_modulus)
+    ...     simulator.append(rod)
+    ...     simulator.constrain(rod).using(ea.OneEndFixedBC, ...)
+    ...     return [rod]
+    >>>
+    >>> ensemble = Ensemble(
+    ...     simulator,
+    ...     n_replicas=64,
+    ...     build_replica=build_replica,
+    ...     parameters={"youngs_modulus": np.linspace(1e5, 1e6, 64)},
+    ... )
+    >>> simulator.finalize()
+    >>> integrate(ea.PositionVerlet(), simulator, final_time, total_steps)
+    >>> positions = ensemble.replica_view("position_collection")  # (64, 3, n)
+    >>> ensemble.set_block_parameter("bend_matrix", bend_matrices)  # (64, 3, 3)
+    >>> gravity = np.zeros((64, 3))
+    >>> gravity[:, 2] = np.linspace(-9.81, -1.62, 64)
+    >>> ensemble.set_feature_parameter(ea.GravityForces, "acc_gravity", gravity)
+
+    Attributes
+    ----------
+    simulator: SystemCollectionType
+        Simulator holding all replicas.
+    n_replicas: int
+        Number of replicas.
+    parameters: dict[str, NDArray]
+        Per-replica parameters, first axis runs over replicas.
+    replicas: list[list[SystemType]]
+        Systems of each replica, in the order returned by `build_replica`.
+    """
+
+    def __init__(
+        self,
+        simulator: SystemCollectionType,
+        n_replicas: int,
+        build_replica: Callable[..., Iterable[SystemType]],
+        parameters: Optional[dict[str, ArrayLike]] = None,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        simulator: SystemCollectionType
+            Simulator, not finalized, that only holds the replicas.
+        n_replicas: int
+            Number of replicas.
+        build_replica: Callable[..., Iterable[SystemType]]
+            Builds one replica, see class documentation.
+        parameters: Optional[dict[str, ArrayLike]]
+            Per-replica parameters, each of length `n_replicas` along its first axis.
+        """
+        if n_replicas < 1:
+            raise ValueError(f"n_replicas must be positive, got {n_replicas}.")
+
+        self.simulator = simulator
+        self.n_replicas = n_replicas
+        self.parameters: dict[str, NDArray[Any]] = {}
+        for name, values in (parameters or {}).items():
+            values = np.asarray(values)
+            if values.ndim == 0 or values.shape[0] != n_replicas:
+                raise ValueError(
+                    f"Parameter {name} must have {n_replicas} entries along its "
+                    f"first axis, got shape {values.shape}."
+                )
+            self.parameters[name] = values
+
+        self.replicas: list[list[SystemType]] = []
+        for replica_idx in range(n_replicas):
+            replica_parameters = {
+                name: values[replica_idx] for name, values in self.parameters.items()
+            }
+            systems = list(build_replica(simulator, replica_idx, **replica_parameters))
+            self._check_layout(systems)
+            self.replicas.append(systems)
+
+    def _check_layout(self, systems: list[SystemType]) -> None:
+        """Checks that the replica has the same system layout as the first one."""
+        if not self.replicas:
+            return
+        reference = self.replicas[0]
+        if len(systems) != len(reference) or any(
+            type(system) is not type(reference_system)
+            or getattr(system, "n_elems", None)
+            != getattr(reference_system, "n_elems", None)
+            for system, reference_system in zip(systems, reference)
+        ):
+            raise ValueError(
+                f"Replica {len(self.replicas)} does not have the same system layout as "
+                "replica 0. All replicas must have the same types of systems, in the "
+                "same order, with the same number of elements."
+            )
+
+    def replica_systems(self, replica_idx: int) -> list[SystemType]:
+        """
+        Returns the systems of a replica.
+
+        Parameters
+        ----------
+        replica_idx: int
+            Index of the replica.
+        """
+        return self.replicas[replica_idx]
+
+    def replica_view(self, attribute: str) -> NDArray[Any]:
+        """
+        Returns a view of a Cosserat rod block array with the replica as first axis,
+        of shape (n_replicas, ..., n) where n is the number of nodes, elements or
+        voronoi spanned by the rods of one replica. Ghosts between the rods of a replica
+        are included. No data is copied, so writing into the view changes the state.
+        Should be called after finalize.
+
+        Parameters
+        ----------
+        attribute: str
+            Name of the array in the memory block, e.g. "position_collection".
+
+        Returns
+        -------
+        NDArray
+            View of the array with shape (n_replicas, ..., n).
+        """
+        block, rod_indices = self._locate_rods()
+        array: NDArray[Any] = getattr(block, attribute)
+        start_idx, end_idx, _ = _rod_ranges(block, array, attribute)
+
+        # Range spanned by the rods of each replica in the block
+        starts = start_idx[rod_indices].min(axis=1)
+        ends = end_idx[rod_indices].max(axis=1)
+        span = ends[0] - starts[0]
+        stride = starts[1] - starts[0] if self.n_replicas > 1 else 0
+        if np.any(ends - starts != span) or np.any(np.diff(starts) != stride):
+            raise ValueError(
+                "Replicas are not evenly spaced in the memory block, which happens "
+                "with ring rods. Use replica_systems instead."
+            )
+
+        item_stride = array.strides[-1]
+        return np.lib.stride_tricks.as_strided(
+            array[..., starts[0] :],
+            shape=(self.n_replicas,) + array.shape[:-1] + (span,),
+            strides=(stride * item_stride,) + array.strides[:-1] + (item_stride,),
+        )
+
+    def set_block_parameter(self, attribute: str, values: ArrayLike) -> None:
+        """
+        Writes one value per replica into a Cosserat rod block array, over all nodes,
+        elements or voronoi of the rods of each replica. The periodic boundaries of
+        ring rods are updated too. Ghosts are left untouched. Should be called after
+        finalize.
+
+        Quantities derived from the array are not recomputed: e.g. a new Young's
+        modulus is set by writing both "bend_matrix" and "shear_matrix".
+
+        Parameters
+        ----------
+        attribute: str
+            Name of the array in the memory block, e.g. "bend_matrix".
+        values: ArrayLike
+            Values of shape (n_replicas, ...), where each row broadcasts to the shape
+            of one node, element or voronoi entry of the array, e.g. (n_replicas, 3, 3)
+            or (n_replicas,) for "bend_matrix".
+        """
+        block, rod_indices = self._locate_rods()
+        array: NDArray[Any] = getattr(block, attribute)
+        start_idx, end_idx, periodic_boundary_idx = _rod_ranges(block, array, attribute)
+        values = np.asarray(values, dtype=array.dtype)
+        if values.ndim == 0 or values.shape[0] != self.n_replicas:
+            raise ValueError(
+                f"values must have {self.n_replicas} entries along their first axis, "
+                f"got shape {values.shape}."
+            )
+
+        for replica_values, replica_rod_indices in zip(values, rod_indices):
+            for rod_idx in replica_rod_indices:
+                array[..., start_idx[rod_idx] : end_idx[rod_idx]] = replica_values[
+                    ..., np.newaxis
+                ]
+        array[..., periodic_boundary_idx[0]] = array[..., periodic_boundary_idx[1]]
+
+    def feature_parameter(self, feature_cls: type, attribute: str) -> NDArray[Any]:
+        """
+        Returns a parameter of the features of exactly the class `feature_cls`, e.g.
+        "acc_gravity" of `GravityForces`, stacked with the replica as first axis, of
+        shape (n_replicas, n_features_per_replica, ...). Features of a replica are in
+        the order they were registered. The array is a copy: use
+        `set_feature_parameter` to change the parameter. Should be called after
+        finalize.
+
+        Parameters
+        ----------
+        feature_cls: type
+            Class of the features, e.g. `GravityForces` or `AnalyticalLinearDamper`.
+        attribute: str
+            Name of the parameter on the features, e.g. "acc_gravity".
+
+        Returns
+        -------
+        NDArray
+            Parameter of each feature of each replica.
+        """
+        return np.array(
+            [
+                [getattr(feature, attribute) for feature in features]
+                for features in self._locate_features(feature_cls)
+            ]
+        )
+
+    def set_feature_parameter(
+        self, feature_cls: type, attribute: str, values: ArrayLike
+    ) -> None:
+        """
+        Writes one value per replica into a parameter of the features of exactly the
+        class `feature_cls`, for all these features of each replica. Array parameters
+        keep their shape and data type, scalar parameters their type. Forcing and
+        damping operators, batched or not, read their parameters at every step, so the
+        new values apply from the next step on. Batched constraints read theirs at
+        finalize. Should be called after finalize.
+
+        Quantities derived from the parameter are not recomputed: e.g. the damping of
+        `AnalyticalLinearDamper` is set through "translational_damping_coefficient"
+        and "rotational_damping_coefficient", not through the damping constant.
+
+        Parameters
+        ----------
+        feature_cls: type
+            Class of the features, e.g. `GravityForces` or `AnalyticalLinearDamper`.
+        attribute: str
+            Name of the parameter on the features, e.g. "acc_gravity".
+        values: ArrayLike
+            Values of shape (n_replicas, ...), where each row broadcasts to the shape
+            of the parameter of one feature, e.g. (n_replicas, 3) for "acc_gravity".
+        """
+        values = np.asarray(values)
+        if values.ndim == 0 or values.shape[0] != self.n_replicas:
+            raise ValueError(
+                f"values must have {self.n_replicas} entries along their first axis, "
+                f"got shape {values.shape}."
+            )
+
+        for replica_values, features in zip(values, self._locate_features(feature_cls)):
+            for feature in features:
+                parameter = getattr(feature, attribute)
+                if isinstance(parameter, np.ndarray):
+                    # A new array, since features may share their parameter arrays
+                    value: Any = np.empty_like(parameter)
+                    value[...] = replica_values
+                else:
+                    value = type(parameter)(replica_values)
+                setattr(feature, attribute, value)
+
+    def _locate_features(self, feature_cls: type) -> list[list[Any]]:
+        """
+        Returns the features of exactly the class `feature_cls` registered on the
+        systems of each replica, in the order they were registered, with the same
+        number of features for every replica.
+        """
+        replica_of_system = {
+            id(system): replica_idx
+            for replica_idx, systems in enumerate(self.replicas)
+            for system in systems
+        }
+        features: list[list[Any]] = [[] for _ in range(self.n_replicas)]
+        seen: set[int] = set()
+        for group_name in (
+            "_feature_group_synchronize",
+            "_feature_group_constrain_values",
+            "_feature_group_constrain_rates",
+        ):
+            for operator in getattr(self.simulator, group_name, ()):
+                method, system = OperatorPlan._describe(operator)
+                if method is None:
+                    continue
+                feature = operator.func.__self__  # type: ignore
+                if (
+                    type(feature) is not feature_cls
+                    or id(feature) in seen
+                    or id(system) not in replica_of_system
+                ):
+                    continue
+                seen.add(id(feature))
+                features[replica_of_system[id(system)]].append(feature)
+
+        n_features = len(features[0])
+        if n_features == 0:
+            raise RuntimeError(
+                f"No {feature_cls.__name__} found on the replicas. feature_parameter "
+                "and set_feature_parameter should be called after finalize."
+            )
+        if any(len(replica_features) != n_features for replica_features in features):
+            raise ValueError(
+                f"Replicas do not have the same number of {feature_cls.__name__}."
+            )
+        return features
+
+    def _locate_rods(self) -> tuple[MemoryBlockCosseratRod, NDArray[np.int32]]:
+        """
+        Returns the Cosserat rod memory block and the index in the block of each rod
+        of each replica, of shape (n_replicas, n_rods_per_replica).
+        """
+        blocks = [
+            block
+            for block in self.simulator.block_systems()
+            if isinstance(block, MemoryBlockCosseratRod)
+        ]
+        if not blocks:
+            raise RuntimeError(
+                "No Cosserat rod memory block found. replica_view and "
+                "set_block_parameter should be called after finalize, on an ensemble "
+                "of Cosserat rods."
+            )
+        location_of_system = {
+            sys_idx: (block, rod_idx)
+            for block in blocks
+            for rod_idx, sys_idx in enumerate(block.system_idx_list)
+        }
+        locations = [
+            [
+                location_of_system[self.simulator.get_system_index(system)]
+                for system in systems
+                if isinstance(system, RodBase)
+            ]
+            for systems in self.replicas
+        ]
+        replica_blocks = {
+            id(block): block for replica in locations for block, _ in replica
+        }
+        if len(replica_blocks) > 1:
+            raise ValueError(
+                f"The rods of the replicas span {len(replica_blocks)} Cosserat rod "
+                "memory blocks, while replica_view and set_block_parameter need them "
+                "in one block. Use replica_systems instead."
+            )
+        rod_indices = np.array(
+            [[rod_idx for _, rod_idx in replica] for replica in locations],
+            dtype=np.int32,
+        )
+        if rod_indices.ndim != 2 or rod_indices.shape[1] == 0:
+            raise RuntimeError("Replicas do not contain Cosserat rods.")
+        (block,) = replica_blocks.values()
+        return block, rod_indices
+
+
+def _rod_ranges(
+    block: MemoryBlockCosseratRod, array: NDArray[Any], attribute: str
+) -> tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.int32]]:
+    """
+    Returns the start and end index of each rod in a block array, and the periodic
+    boundary indices of its domain (nodes, elements or voronoi).
+    """
+    if array.shape[-1] == block.n_nodes:
+        return (
+            block.start_idx_in_rod_nodes,
+            block.end_idx_in_rod_nodes,
+            block.periodic_boundary_nodes_idx,
+        )
+    elif array.shape[-1] == block.n_elems:
+        return (
+            block.start_idx_in_rod_elems,
+            block.end_idx_in_rod_elems,
+            block.periodic_boundary_elems_idx,
+        )
+    elif array.shape[-1] == block.n_voronoi:
+        return (
+            block.start_idx_in_rod_voronoi,
+            block.end_idx_in_rod_voronoi,
+            block.periodic_boundary_voronoi_idx,
+        )
+    raise ValueError(
+        f"{attribute} is not defined on nodes, elements or voronoi of the block."
+    )
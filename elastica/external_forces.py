@@ -1,14 +1,14 @@
 __doc__ = """ Numba implementation module for boundary condition implementations that apply
 external forces to the system."""
 
-from typing import TypeVar, Generic
+from typing import Any, Callable, TypeVar, Generic
 
 import numpy as np
 from numpy.typing import NDArray
 
 from elastica._linalg import _batch_matvec
 from elastica.typing import SystemType, RodType, RigidBodyType
-from elastica.utils import _bspline
+from elastica.utils import _bspline, block_ranges
 
 from numba import njit
 from elastica._linalg import _batch_product_i_k_to_ik
@@ -596,3 +596,213 @@ class EndpointForcesSinusoidal(NoForces):
             # Update external forces
             system.external_forces[..., 0] += start_force
             system.external_forces[..., -1] += end_force
+
+
+# Batched implementations, applying the forcing registered on many systems of the
+# same memory block in one call. They are registered in elastica.modules.forcing and
+# merged by the operator plan at finalize, see elastica.modules.operator_plan.
+
+
+def _parameter_buffer(
+    instances: list[Any], attribute: str, shape: tuple[int, ...]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Buffer holding the parameter of each instance along its last axis, filled by
+    `_gather_parameters`, and a view of it with the parameter reshaped to `shape`.
+    """
+    buffer = np.empty(
+        np.shape(getattr(instances[0], attribute)) + (len(instances),),
+        dtype=np.float64,
+    )
+    return buffer, buffer.reshape(shape + (len(instances),))
+
+
+def _gather_parameters(
+    instances: list[Any], attribute: str, buffer: NDArray[np.float64]
+) -> None:
+    """
+    Copy the parameter of each instance into `buffer`. Called at every step, so that
+    parameters changed after finalize are applied as by the per-system operators.
+    """
+    for index, instance in enumerate(instances):
+        buffer[..., index] = getattr(instance, attribute)
+
+
+def _batched_gravity_forces(
+    instances: list[GravityForces], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `GravityForces.apply_forces`. The gravitational accelerations are read
+    from the instances at every call.
+    """
+    node_start, node_end, _, _ = block_ranges(block, system_indices)
+    gravity_buffer, acc_gravity = _parameter_buffer(instances, "acc_gravity", (3,))
+    mass = block.mass
+    external_forces = block.external_forces
+
+    def apply_forces(time: np.float64 = np.float64(0.0)) -> None:
+        _gather_parameters(instances, "acc_gravity", gravity_buffer)
+        _batch_gravity_forces(acc_gravity, node_start, node_end, mass, external_forces)
+
+    return apply_forces
+
+
+def _batched_uniform_forces(
+    instances: list[UniformForces], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `UniformForces.apply_forces`. The forces are read from the instances at
+    every call.
+    """
+    node_start, node_end, elem_start, elem_end = block_ranges(block, system_indices)
+    n_elems = elem_end - elem_start
+    force_buffer, force = _parameter_buffer(instances, "force", (3,))
+    force_on_one_element = np.empty_like(force)
+    external_forces = block.external_forces
+
+    def apply_forces(time: np.float64 = np.float64(0.0)) -> None:
+        _gather_parameters(instances, "force", force_buffer)
+        np.divide(force, n_elems, out=force_on_one_element)
+        _batch_uniform_forces(
+            force_on_one_element, node_start, node_end, external_forces
+        )
+
+    return apply_forces
+
+
+def _batched_uniform_torques(
+    instances: list[UniformTorques], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `UniformTorques.apply_torques`. The torques are read from the instances
+    at every call.
+    """
+    _, _, elem_start, elem_end = block_ranges(block, system_indices)
+    n_elems = elem_end - elem_start
+    torque_buffer, torque = _parameter_buffer(instances, "torque", (3,))
+    torque_on_one_element = np.empty_like(torque)
+    director_collection = block.director_collection
+    external_torques = block.external_torques
+
+    def apply_torques(time: np.float64 = np.float64(0.0)) -> None:
+        _gather_parameters(instances, "torque", torque_buffer)
+        np.divide(torque, n_elems, out=torque_on_one_element)
+        _batch_uniform_torques(
+            torque_on_one_element,
+            elem_start,
+            elem_end,
+            director_collection,
+            external_torques,
+        )
+
+    return apply_torques
+
+
+def _batched_endpoint_forces(
+    instances: list[EndpointForces], block: Any, system_indices: NDArray[np.int32]
+) -> Callable[..., None]:
+    """
+    Batched `EndpointForces.apply_forces`. The forces and ramp up times are read from
+    the instances at every call.
+    """
+    node_start, node_end, _, _ = block_ranges(block, system_indices)
+    start_buffer, start_force = _parameter_buffer(instances, "start_force", (3,))
+    end_buffer, end_force = _parameter_buffer(instances, "end_force", (3,))
+    ramp_buffer, ramp_up_time = _parameter_buffer(instances, "ramp_up_time", ())
+    external_forces = block.external_forces
+
+    def apply_forces(time: np.float64 = np.float64(0.0)) -> None:
+        _gather_parameters(instances, "start_force", start_buffer)
+        _gather_parameters(instances, "end_force", end_buffer)
+        _gather_parameters(instances, "ramp_up_time", ramp_buffer)
+        _batch_end_point_forces(
+            start_force,
+            end_force,
+            ramp_up_time,
+            np.float64(time),
+            node_start,
+            node_end,
+            external_forces,
+        )
+
+    return apply_forces
+
+
+@njit(cache=True)  # type: ignore
+def _batch_gravity_forces(
+    acc_gravity: NDArray[np.float64],
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    mass: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    """
+    Gravitational forces on the nodes of each system r, acc_gravity[:, r] * mass,
+    computed as in `GravityForces.compute_gravity_forces`.
+    """
+    for r in range(node_start.shape[0]):
+        for i in range(3):
+            for k in range(node_start[r], node_end[r]):
+                external_forces[i, k] += acc_gravity[i, r] * mass[k]
+
+
+@njit(cache=True)  # type: ignore
+def _batch_uniform_forces(
+    force_on_one_element: NDArray[np.float64],
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    """
+    Uniform force on the nodes of each system r, halved on the end nodes, computed as
+    in `UniformForces.apply_forces`.
+    """
+    for r in range(node_start.shape[0]):
+        for i in range(3):
+            for k in range(node_start[r], node_end[r]):
+                external_forces[i, k] += force_on_one_element[i, r]
+            # Because mass of first and last node is half
+            external_forces[i, node_start[r]] -= 0.5 * force_on_one_element[i, r]
+            external_forces[i, node_end[r] - 1] -= 0.5 * force_on_one_element[i, r]
+
+
+@njit(cache=True)  # type: ignore
+def _batch_uniform_torques(
+    torque_on_one_element: NDArray[np.float64],
+    elem_start: NDArray[np.int64],
+    elem_end: NDArray[np.int64],
+    director_collection: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+) -> None:
+    """
+    Uniform torque on the elements of each system r, brought to the frame of each
+    element, computed as in `UniformTorques.apply_torques`.
+    """
+    for r in range(elem_start.shape[0]):
+        for k in range(elem_start[r], elem_end[r]):
+            for i in range(3):
+                torque = 0.0
+                for j in range(3):
+                    torque += director_collection[i, j, k] * torque_on_one_element[j, r]
+                external_torques[i, k] += torque
+
+
+@njit(cache=True)  # type: ignore
+def _batch_end_point_forces(
+    start_force: NDArray[np.float64],
+    end_force: NDArray[np.float64],
+    ramp_up_time: NDArray[np.float64],
+    time: np.float64,
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    external_forces: NDArray[np.float64],
+) -> None:
+    """
+    Forces on the end nodes of each system r, ramped up until ramp_up_time[r],
+    computed as in `EndpointForces.compute_end_point_forces`.
+    """
+    for r in range(node_start.shape[0]):
+        factor = min(np.float64(1.0), time / ramp_up_time[r])
+        for i in range(3):
+            external_forces[i, node_start[r]] += start_force[i, r] * factor
+            external_forces[i, node_end[r] - 1] += end_force[i, r] * factor
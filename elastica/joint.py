@@ -1,10 +1,14 @@
 __doc__ = """ Module containing joint classes to connect multiple rods together. """
 __all__ = ["FreeJoint", "HingeJoint", "FixedJoint", "get_relative_rotation_two_systems"]
 
+from typing import Any, Callable
+
 from elastica._rotations import _inv_rotate
 from elastica.typing import SystemType, RodType, ConnectionIndex, RigidBodyType
+from elastica.utils import block_ranges
 
 import numpy as np
+from numba import njit
 from numpy.typing import NDArray
 
 
@@ -383,3 +387,323 @@ def get_relative_rotation_two_systems(
         system_one.director_collection[..., index_one]
         @ system_two.director_collection[..., index_two].T
     )
+
+
+def _joint_slots(
+    block: Any,
+    system_indices: NDArray[np.int32],
+    connect_indices: NDArray[np.int32],
+    on_nodes: bool,
+) -> NDArray[np.int64]:
+    """
+    Slots, in the node or element arrays of the memory block, of the connected node or
+    element of each system. Connection indices count from the end of the system when
+    negative, as in numpy.
+    """
+    node_start, node_end, elem_start, elem_end = block_ranges(block, system_indices)
+    start, end = (node_start, node_end) if on_nodes else (elem_start, elem_end)
+    size = end - start
+    index = np.asarray(connect_indices, dtype=np.int64)
+    if np.any((index < -size) | (index >= size)):
+        raise IndexError(
+            "Connection index out of range of the {} of the connected system.".format(
+                "nodes" if on_nodes else "elements"
+            )
+        )
+    return start + np.where(index < 0, index + size, index)
+
+
+def _batched_free_joints(
+    instances: list[FreeJoint],
+    block_one: Any,
+    system_indices_one: NDArray[np.int32],
+    connect_indices_one: NDArray[np.int32],
+    block_two: Any,
+    system_indices_two: NDArray[np.int32],
+    connect_indices_two: NDArray[np.int32],
+) -> Callable[..., None]:
+    """
+    Batched `FreeJoint` connections. The stiffness and damping coefficients are read
+    when the operator is created, at finalize.
+    """
+    node_one = _joint_slots(block_one, system_indices_one, connect_indices_one, True)
+    node_two = _joint_slots(block_two, system_indices_two, connect_indices_two, True)
+    k = np.array([instance.k for instance in instances], dtype=np.float64)
+    nu = np.array([instance.nu for instance in instances], dtype=np.float64)
+
+    def apply_forces_and_torques(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_joint_forces(
+            k,
+            nu,
+            node_one,
+            block_one.position_collection,
+            block_one.velocity_collection,
+            block_one.external_forces,
+            node_two,
+            block_two.position_collection,
+            block_two.velocity_collection,
+            block_two.external_forces,
+        )
+
+    return apply_forces_and_torques
+
+
+def _batched_hinge_joints(
+    instances: list[HingeJoint],
+    block_one: Any,
+    system_indices_one: NDArray[np.int32],
+    connect_indices_one: NDArray[np.int32],
+    block_two: Any,
+    system_indices_two: NDArray[np.int32],
+    connect_indices_two: NDArray[np.int32],
+) -> Callable[..., None]:
+    """
+    Batched `HingeJoint` connections. The coefficients and normal directions are read
+    when the operator is created, at finalize.
+    """
+    node_one = _joint_slots(block_one, system_indices_one, connect_indices_one, True)
+    node_two = _joint_slots(block_two, system_indices_two, connect_indices_two, True)
+    elem_one = _joint_slots(block_one, system_indices_one, connect_indices_one, False)
+    elem_two = _joint_slots(block_two, system_indices_two, connect_indices_two, False)
+    k = np.array([instance.k for instance in instances], dtype=np.float64)
+    nu = np.array([instance.nu for instance in instances], dtype=np.float64)
+    kt = np.array([instance.kt for instance in instances], dtype=np.float64)
+    normal_direction = np.stack(
+        [
+            np.asarray(instance.normal_direction, dtype=np.float64).reshape(3)
+            for instance in instances
+        ],
+        axis=-1,
+    )
+
+    def apply_forces_and_torques(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_joint_forces(
+            k,
+            nu,
+            node_one,
+            block_one.position_collection,
+            block_one.velocity_collection,
+            block_one.external_forces,
+            node_two,
+            block_two.position_collection,
+            block_two.velocity_collection,
+            block_two.external_forces,
+        )
+        _batch_hinge_joint_torques(
+            kt,
+            normal_direction,
+            elem_one,
+            block_one.director_collection,
+            block_one.external_torques,
+            elem_two,
+            block_two.director_collection,
+            block_two.external_torques,
+        )
+
+    return apply_forces_and_torques
+
+
+def _batched_fixed_joints(
+    instances: list[FixedJoint],
+    block_one: Any,
+    system_indices_one: NDArray[np.int32],
+    connect_indices_one: NDArray[np.int32],
+    block_two: Any,
+    system_indices_two: NDArray[np.int32],
+    connect_indices_two: NDArray[np.int32],
+) -> Callable[..., None]:
+    """
+    Batched `FixedJoint` connections. The coefficients and rest rotation matrices are
+    read when the operator is created, at finalize.
+    """
+    node_one = _joint_slots(block_one, system_indices_one, connect_indices_one, True)
+    node_two = _joint_slots(block_two, system_indices_two, connect_indices_two, True)
+    elem_one = _joint_slots(block_one, system_indices_one, connect_indices_one, False)
+    elem_two = _joint_slots(block_two, system_indices_two, connect_indices_two, False)
+    k = np.array([instance.k for instance in instances], dtype=np.float64)
+    nu = np.array([instance.nu for instance in instances], dtype=np.float64)
+    kt = np.array([instance.kt for instance in instances], dtype=np.float64)
+    nut = np.array([instance.nut for instance in instances], dtype=np.float64)
+    rest_rotation_matrix = np.stack(
+        [
+            np.asarray(instance.rest_rotation_matrix, dtype=np.float64)
+            for instance in instances
+        ],
+        axis=-1,
+    )
+
+    def apply_forces_and_torques(time: np.float64 = np.float64(0.0)) -> None:
+        _batch_joint_forces(
+            k,
+            nu,
+            node_one,
+            block_one.position_collection,
+            block_one.velocity_collection,
+            block_one.external_forces,
+            node_two,
+            block_two.position_collection,
+            block_two.velocity_collection,
+            block_two.external_forces,
+        )
+        _batch_fixed_joint_torques(
+            kt,
+            nut,
+            rest_rotation_matrix,
+            elem_one,
+            block_one.director_collection,
+            block_one.omega_collection,
+            block_one.external_torques,
+            elem_two,
+            block_two.director_collection,
+            block_two.omega_collection,
+            block_two.external_torques,
+        )
+
+    return apply_forces_and_torques
+
+
+@njit(cache=True)  # type: ignore
+def _batch_joint_forces(
+    k: NDArray[np.float64],
+    nu: NDArray[np.float64],
+    node_one: NDArray[np.int64],
+    position_one: NDArray[np.float64],
+    velocity_one: NDArray[np.float64],
+    external_forces_one: NDArray[np.float64],
+    node_two: NDArray[np.int64],
+    position_two: NDArray[np.float64],
+    velocity_two: NDArray[np.float64],
+    external_forces_two: NDArray[np.float64],
+) -> None:
+    """
+    Spring-damper force of each joint j between the nodes node_one[j] and
+    node_two[j], computed as in `FreeJoint.apply_forces`.
+    """
+    for j in range(k.shape[0]):
+        one = node_one[j]
+        two = node_two[j]
+        for i in range(3):
+            contact_force = k[j] * (position_two[i, two] - position_one[i, one]) + nu[
+                j
+            ] * (velocity_two[i, two] - velocity_one[i, one])
+            external_forces_one[i, one] += contact_force
+            external_forces_two[i, two] -= contact_force
+
+
+@njit(cache=True)  # type: ignore
+def _batch_hinge_joint_torques(
+    kt: NDArray[np.float64],
+    normal_direction: NDArray[np.float64],
+    elem_one: NDArray[np.int64],
+    director_one: NDArray[np.float64],
+    external_torques_one: NDArray[np.float64],
+    elem_two: NDArray[np.int64],
+    director_two: NDArray[np.float64],
+    external_torques_two: NDArray[np.float64],
+) -> None:
+    """
+    Restoring torque of each joint j, bringing the tangent of the element elem_two[j]
+    back to the plane of normal_direction[:, j], computed as in
+    `HingeJoint.apply_torques`.
+    """
+    tangent = np.empty(3)
+    force_direction = np.empty(3)
+    torque = np.empty(3)
+    for j in range(kt.shape[0]):
+        one = elem_one[j]
+        two = elem_two[j]
+        projection = 0.0
+        for i in range(3):
+            tangent[i] = director_two[2, i, two]
+            projection += tangent[i] * normal_direction[i, j]
+        for i in range(3):
+            force_direction[i] = -projection * normal_direction[i, j]
+        torque[0] = kt[j] * (
+            tangent[1] * force_direction[2] - tangent[2] * force_direction[1]
+        )
+        torque[1] = kt[j] * (
+            tangent[2] * force_direction[0] - tangent[0] * force_direction[2]
+        )
+        torque[2] = kt[j] * (
+            tangent[0] * force_direction[1] - tangent[1] * force_direction[0]
+        )
+        _add_rotated(-1.0, director_one, one, torque, external_torques_one)
+        _add_rotated(1.0, director_two, two, torque, external_torques_two)
+
+
+@njit(cache=True)  # type: ignore
+def _batch_fixed_joint_torques(
+    kt: NDArray[np.float64],
+    nut: NDArray[np.float64],
+    rest_rotation_matrix: NDArray[np.float64],
+    elem_one: NDArray[np.int64],
+    director_one: NDArray[np.float64],
+    omega_one: NDArray[np.float64],
+    external_torques_one: NDArray[np.float64],
+    elem_two: NDArray[np.int64],
+    director_two: NDArray[np.float64],
+    omega_two: NDArray[np.float64],
+    external_torques_two: NDArray[np.float64],
+) -> None:
+    """
+    Rotational spring-damper torque of each joint j, driving the relative rotation of
+    the elements elem_one[j] and elem_two[j] to rest_rotation_matrix[..., j], computed
+    as in `FixedJoint.apply_torques`.
+    """
+    rel_rot = np.empty((3, 3))
+    # Identity followed by the transposed deviation, as given to _inv_rotate
+    rotation_pair = np.zeros((3, 3, 2))
+    for i in range(3):
+        rotation_pair[i, i, 0] = 1.0
+    torque = np.empty(3)
+    for j in range(kt.shape[0]):
+        one = elem_one[j]
+        two = elem_two[j]
+        # rel_rot: C_12 = C_1I @ C_I2
+        for a in range(3):
+            for b in range(3):
+                value = 0.0
+                for c in range(3):
+                    value += director_one[a, c, one] * director_two[b, c, two]
+                rel_rot[a, b] = value
+        # error_rot: C_22* = C_21 @ C_12*
+        for a in range(3):
+            for b in range(3):
+                value = 0.0
+                for c in range(3):
+                    value += rel_rot[c, a] * rest_rotation_matrix[c, b, j]
+                rotation_pair[b, a, 1] = value
+        rot_vec = _inv_rotate(rotation_pair)
+
+        for a in range(3):
+            # rotation vector and deviation in rotation velocity in inertial frame
+            rot_vec_inertial_frame = 0.0
+            omega_inertial_frame_two = 0.0
+            omega_inertial_frame_one = 0.0
+            for c in range(3):
+                rot_vec_inertial_frame += director_two[c, a, two] * rot_vec[c, 0]
+                omega_inertial_frame_two += director_two[c, a, two] * omega_two[c, two]
+                omega_inertial_frame_one += director_one[c, a, one] * omega_one[c, one]
+            dev_omega = omega_inertial_frame_two - omega_inertial_frame_one
+            torque[a] = kt[j] * rot_vec_inertial_frame - nut[j] * dev_omega
+        _add_rotated(-1.0, director_one, one, torque, external_torques_one)
+        _add_rotated(1.0, director_two, two, torque, external_torques_two)
+
+
+@njit(cache=True)  # type: ignore
+def _add_rotated(
+    sign: float,
+    director_collection: NDArray[np.float64],
+    elem: int,
+    vector: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+) -> None:
+    """Adds or subtracts director_collection[..., elem] @ vector to the element torque"""
+    for a in range(3):
+        value = 0.0
+        for b in range(3):
+            value += director_collection[a, b, elem] * vector[b]
+        if sign > 0.0:
+            external_torques[a, elem] += value
+        else:
+            external_torques[a, elem] -= value
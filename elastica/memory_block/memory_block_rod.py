@@ -1,12 +1,21 @@
 __doc__ = """Create block-structure class for collection of Cosserat rod systems."""
 import numpy as np
-from typing import Literal, Callable
+import numba
+from typing import Any, Literal, Callable, Optional
 from elastica.typing import SystemIdxType, RodType
-from elastica.rod.data_structures import _RodSymplecticStepperMixin
+from elastica.rod.data_structures import (
+    _RodSymplecticStepperMixin,
+    overload_operator_kinematic_numba,
+    overload_operator_kinematic_numba_parallel,
+)
 from elastica.reset_functions_for_block_structure import _reset_scalar_ghost
 from elastica.rod.cosserat_rod import (
     CosseratRod,
     _compute_sigma_kappa_for_blockstructure,
+    _compute_internal_forces_and_torques,
+    _compute_internal_forces_and_torques_parallel,
+    _update_accelerations_and_rates,
+    _update_accelerations_and_rates_parallel,
 )
 from elastica._synchronize_periodic_boundary import (
     _synchronize_periodic_boundary_of_vector_collection,
@@ -20,6 +29,60 @@ from .utils import (
 )
 
 
+class _InternalLoadsWorkspace:
+    """
+    Scratch buffers passed to `_compute_internal_forces_and_torques` for the
+    intermediate quantities of the internal force and torque computation.
+    They are allocated once when the block is constructed and overwritten at every
+    call, so they never hold state between time-steps.
+
+    Attributes
+    ----------
+    sigma_difference: numpy.ndarray
+        sigma - rest_sigma on elements, shape (3, n_elems).
+    cosserat_internal_stress: numpy.ndarray
+        Q^T n_L / e on elements, shape (3, n_elems).
+    kappa_difference: numpy.ndarray
+        kappa - rest_kappa on voronoi, shape (3, n_voronoi).
+    r_dot_v: numpy.ndarray
+        r_i . v_i on nodes, shape (n_nodes,).
+    r_plus_one_dot_v: numpy.ndarray
+        r_{i+1} . v_i on elements, shape (n_elems,).
+    voronoi_dilatation_inv_cube_cached: numpy.ndarray
+        1 / voronoi_dilatation^3 on voronoi, shape (n_voronoi,).
+    scaled_internal_couple: numpy.ndarray
+        tau_L / voronoi_dilatation^3 on voronoi, shape (3, n_voronoi).
+    scaled_kappa_cross_internal_couple: numpy.ndarray
+        (kappa x tau_L) * rest_voronoi_lengths / voronoi_dilatation^3 on voronoi,
+        shape (3, n_voronoi).
+    bend_twist_couple_3D: numpy.ndarray
+        Quadrature of scaled_kappa_cross_internal_couple, shape (3, n_elems).
+    material_tangents: numpy.ndarray
+        Q t on elements, shape (3, n_elems).
+    shear_stretch_couple: numpy.ndarray
+        (Q t x n_L) * rest_lengths on elements, shape (3, n_elems).
+    J_omega_upon_e: numpy.ndarray
+        J omega / e on elements, shape (3, n_elems).
+    lagrangian_transport: numpy.ndarray
+        (J omega / e) x omega on elements, shape (3, n_elems).
+    """
+
+    def __init__(self, n_nodes: int, n_elems: int, n_voronoi: int) -> None:
+        self.sigma_difference = np.zeros((3, n_elems))
+        self.cosserat_internal_stress = np.zeros((3, n_elems))
+        self.kappa_difference = np.zeros((3, n_voronoi))
+        self.r_dot_v = np.zeros((n_nodes))
+        self.r_plus_one_dot_v = np.zeros((n_elems))
+        self.voronoi_dilatation_inv_cube_cached = np.zeros((n_voronoi))
+        self.scaled_internal_couple = np.zeros((3, n_voronoi))
+        self.scaled_kappa_cross_internal_couple = np.zeros((3, n_voronoi))
+        self.bend_twist_couple_3D = np.zeros((3, n_elems))
+        self.material_tangents = np.zeros((3, n_elems))
+        self.shear_stretch_couple = np.zeros((3, n_elems))
+        self.J_omega_upon_e = np.zeros((3, n_elems))
+        self.lagrangian_transport = np.zeros((3, n_elems))
+
+
 class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
     """
     Memory block class for Cosserat rod equations. This class is derived from Cosserat Rod class in order to inherit
@@ -168,6 +231,13 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         self._allocate_block_variables_in_elements(systems)
         self._allocate_blocks_variables_in_voronoi(systems)
         self._allocate_blocks_variables_for_symplectic_stepper(systems)
+        self.workspace = _InternalLoadsWorkspace(
+            self.n_nodes, self.n_elems, self.n_voronoi
+        )
+
+        # Serial kernels are used unless the simulator is finalized with parallel=True
+        self.parallel_kernels: bool = False
+        self.num_threads: Optional[int] = None
 
         # Reset ghosts of mass, rest length and rest voronoi length to 1. Otherwise
         # since ghosts are not modified, this causes a division by zero error.
@@ -202,6 +272,146 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         # Initialize the mixin class for symplectic time-stepper.
         _RodSymplecticStepperMixin.__init__(self)
 
+    def enable_parallel_kernels(self, num_threads: Optional[int] = None) -> None:
+        """
+        Use the multithreaded kernels to compute internal loads and advance the states
+        of this block. Results are identical to the serial kernels.
+
+        Parameters
+        ----------
+        num_threads: Optional[int]
+            Number of threads used by the kernels of this block. If None, numba's
+            current setting is used (NUMBA_NUM_THREADS by default).
+
+        """
+        if num_threads is not None and not (
+            1 <= num_threads <= numba.config.NUMBA_NUM_THREADS
+        ):
+            raise ValueError(
+                f"num_threads must be between 1 and NUMBA_NUM_THREADS "
+                f"({numba.config.NUMBA_NUM_THREADS}), got {num_threads}."
+            )
+        self.parallel_kernels = True
+        self.num_threads = num_threads
+
+    def _run_kernel(
+        self,
+        serial_kernel: Callable[..., None],
+        parallel_kernel: Callable[..., None],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Call the serial or the parallel kernel. The parallel kernel runs with the
+        thread count of this block, and numba's previous thread count, a per-thread
+        global shared with other simulators and user code, is restored afterwards.
+        """
+        if not self.parallel_kernels:
+            serial_kernel(*args, **kwargs)
+        elif self.num_threads is None:
+            parallel_kernel(*args, **kwargs)
+        else:
+            previous_num_threads = numba.get_num_threads()
+            numba.set_num_threads(self.num_threads)
+            try:
+                parallel_kernel(*args, **kwargs)
+            finally:
+                numba.set_num_threads(previous_num_threads)
+
+    def update_kinematic_states(self, time: np.float64, prefac: np.float64) -> None:
+        """
+        Advance the positions and directors of the block, (x,Q) += prefac * (v,ω).
+        """
+        self._run_kernel(
+            overload_operator_kinematic_numba,
+            overload_operator_kinematic_numba_parallel,
+            self.n_nodes,
+            prefac,
+            self.position_collection,
+            self.director_collection,
+            self.velocity_collection,
+            self.omega_collection,
+        )
+
+    def compute_internal_forces_and_torques(self, time: np.float64) -> None:
+        """
+        Compute internal forces and torques of the block. Intermediate quantities are
+        stored in the preallocated workspace, so no memory is allocated at each call.
+
+        Parameters
+        ----------
+        time: np.float64
+            current time
+
+        """
+        workspace = self.workspace
+        self._run_kernel(
+            _compute_internal_forces_and_torques,
+            _compute_internal_forces_and_torques_parallel,
+            self.position_collection,
+            self.velocity_collection,
+            self.volume,
+            self.lengths,
+            self.tangents,
+            self.radius,
+            self.rest_lengths,
+            self.rest_voronoi_lengths,
+            self.dilatation,
+            self.dilatation_rate,
+            self.voronoi_dilatation,
+            self.director_collection,
+            self.sigma,
+            self.rest_sigma,
+            self.shear_matrix,
+            self.internal_stress,
+            self.internal_forces,
+            self.bend_matrix,
+            self.kappa,
+            self.rest_kappa,
+            self.mass_second_moment_of_inertia,
+            self.omega_collection,
+            self.internal_couple,
+            self.internal_torques,
+            self.ghost_elems_idx,
+            self.ghost_voronoi_idx,
+            sigma_difference=workspace.sigma_difference,
+            cosserat_internal_stress=workspace.cosserat_internal_stress,
+            kappa_difference=workspace.kappa_difference,
+            r_dot_v=workspace.r_dot_v,
+            r_plus_one_dot_v=workspace.r_plus_one_dot_v,
+            voronoi_dilatation_inv_cube_cached=workspace.voronoi_dilatation_inv_cube_cached,
+            scaled_internal_couple=workspace.scaled_internal_couple,
+            scaled_kappa_cross_internal_couple=workspace.scaled_kappa_cross_internal_couple,
+            bend_twist_couple_3D=workspace.bend_twist_couple_3D,
+            material_tangents=workspace.material_tangents,
+            shear_stretch_couple=workspace.shear_stretch_couple,
+            J_omega_upon_e=workspace.J_omega_upon_e,
+            lagrangian_transport=workspace.lagrangian_transport,
+        )
+
+    def update_dynamic_states(self, time: np.float64, prefac: np.float64) -> None:
+        """
+        Update the accelerations and advance the rates of the block in one compiled call.
+        Equivalent to `update_accelerations` followed by (v,ω) += prefac * (dv/dt, dω/dt),
+        without allocating the scaled (dv/dt, dω/dt) collection.
+        """
+        self._run_kernel(
+            _update_accelerations_and_rates,
+            _update_accelerations_and_rates_parallel,
+            prefac,
+            self.acceleration_collection,
+            self.internal_forces,
+            self.external_forces,
+            self.mass,
+            self.alpha_collection,
+            self.inv_mass_second_moment_of_inertia,
+            self.internal_torques,
+            self.external_torques,
+            self.dilatation,
+            self.velocity_collection,
+            self.omega_collection,
+        )
+
     def _allocate_block_variables_in_nodes(self, systems: list[RodType]) -> None:
         """
         This function takes system collection and allocates the variables on
@@ -5,7 +5,7 @@ Base System
 Basic coordinating for multiple, smaller systems that have an independently integrable
 interface (i.e. works with symplectic or explicit routines `timestepper.py`.)
 """
-from typing import Type, Generator, Any, overload
+from typing import TYPE_CHECKING, Type, Generator, Iterable, Any, Optional, overload
 from typing import final
 from elastica.typing import (
     SystemType,
@@ -25,10 +25,17 @@ from elastica.rod.rod_base import RodBase
 from elastica.rigidbody.rigid_body import RigidBodyBase
 from elastica.surface.surface_base import SurfaceBase
 
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.restart import SimulatorSnapshot, snapshot_state, restore_state
+
 from .memory_block import construct_memory_block_structures
 from .operator_group import OperatorGroupFIFO
+from .operator_plan import OperatorPlan
 from .protocol import ModuleProtocol
 
+if TYPE_CHECKING:
+    from elastica.timestepper.protocol import StepperProtocol
+
 
 class BaseSystemCollection(MutableSequence):
     """
@@ -69,6 +76,22 @@ class BaseSystemCollection(MutableSequence):
             OperatorCallbackType, ModuleProtocol
         ] = OperatorGroupFIFO()
         self._feature_group_finalize: list[OperatorFinalizeType] = []
+        # Operators executed by synchronize, constrain_values, constrain_rates and
+        # apply_callbacks. Until the end of finalize, they are the feature groups
+        # themselves. Finalize then replaces them with compiled operator plans.
+        self._operator_plans: dict[str, OperatorPlan] = {}
+        self._operators_synchronize: Iterable[OperatorType] = (
+            self._feature_group_synchronize
+        )
+        self._operators_constrain_values: Iterable[OperatorType] = (
+            self._feature_group_constrain_values
+        )
+        self._operators_constrain_rates: Iterable[OperatorType] = (
+            self._feature_group_constrain_rates
+        )
+        self._operators_callback: Iterable[OperatorCallbackType] = (
+            self._feature_group_callback
+        )
         # We need to initialize our mixin classes
         super().__init__()
 
@@ -215,12 +238,29 @@ class BaseSystemCollection(MutableSequence):
             yield block
 
     @final
-    def finalize(self) -> None:
+    def finalize(
+        self,
+        parallel: bool = False,
+        num_threads: Optional[int] = None,
+        parallel_threshold: int = 10_000,
+    ) -> None:
         """
         This method finalizes the simulator class. When it is called, it is assumed that the user has appended
         all rod-like objects to the simulator as well as all boundary conditions, callbacks, etc.,
         acting on these rod-like objects. After the finalize method called,
         the user cannot add new features to the simulator class.
+
+        Parameters
+        ----------
+        parallel: bool
+            If True, Cosserat rod memory blocks with at least `parallel_threshold` elements
+            use multithreaded kernels. Smaller blocks keep the serial kernels, since the
+            threading overhead outweighs the gain. Default is False.
+        num_threads: Optional[int]
+            Number of threads used by the multithreaded kernels. If None, numba's
+            setting is used (NUMBA_NUM_THREADS by default).
+        parallel_threshold: int
+            Minimum number of elements in a memory block to use multithreaded kernels.
         """
 
         assert not self._finalize_flag, "The finalize cannot be called twice."
@@ -228,6 +268,13 @@ class BaseSystemCollection(MutableSequence):
 
         # Construct memory block
         self.__final_blocks = construct_memory_block_structures(self.__systems)
+        if parallel:
+            for block in self.__final_blocks:
+                if (
+                    isinstance(block, MemoryBlockCosseratRod)
+                    and block.n_elems >= parallel_threshold
+                ):
+                    block.enable_parallel_kernels(num_threads)
         # FIXME: We need this to make ring-rod working.
         # But probably need to be refactored
         self.__systems.extend(self.__final_blocks)
@@ -240,38 +287,162 @@ class BaseSystemCollection(MutableSequence):
         self._feature_group_finalize.clear()
         del self._feature_group_finalize
 
+        self._compile_operator_plans()
+
+    @final
+    def _compile_operator_plans(self) -> None:
+        """
+        Compile the operator groups into operator plans: operators that do nothing
+        are dropped, and operators that have a batched implementation are merged per
+        memory block. See `elastica.modules.operator_plan`.
+        """
+        rod_locations: dict[int, tuple[BlockSystemType, int]] = {}
+        block_members: dict[int, set[int]] = {}
+        for block in self.__final_blocks:
+            system_idx_list = getattr(block, "system_idx_list", [])
+            block_members[id(block)] = set()
+            for rod_idx, sys_idx in enumerate(system_idx_list):
+                system = self.__systems[sys_idx]
+                rod_locations[id(system)] = (block, rod_idx)
+                block_members[id(block)].add(id(system))
+
+        self._operator_plans = {
+            "synchronize": OperatorPlan(
+                self._feature_group_synchronize, rod_locations, block_members
+            ),
+            "constrain_values": OperatorPlan(
+                self._feature_group_constrain_values, rod_locations, block_members
+            ),
+            "constrain_rates": OperatorPlan(
+                self._feature_group_constrain_rates, rod_locations, block_members
+            ),
+            "callback": OperatorPlan(
+                self._feature_group_callback, rod_locations, block_members
+            ),
+        }
+        self._operators_synchronize = self._operator_plans["synchronize"].operators
+        self._operators_constrain_values = self._operator_plans[
+            "constrain_values"
+        ].operators
+        self._operators_constrain_rates = self._operator_plans[
+            "constrain_rates"
+        ].operators
+        self._operators_callback = self._operator_plans["callback"].operators
+
+    @final
+    def operator_plan_report(
+        self, time_stepper: Optional["StepperProtocol"] = None
+    ) -> dict[str, Any]:
+        """
+        Report how the operators of each group were compiled at finalize, see
+        `OperatorPlan.report`. Should be called after finalize.
+
+        Parameters
+        ----------
+        time_stepper: Optional[StepperProtocol]
+            If given, the number of Python calls made by the operators at each time-step
+            of this stepper is reported under "calls_per_step".
+
+        Returns
+        -------
+        dict[str, Any]
+            Report of each group, keyed by group name.
+        """
+        assert self._finalize_flag, "The operator plans are compiled at finalize."
+        report: dict[str, Any] = {
+            name: plan.report() for name, plan in self._operator_plans.items()
+        }
+        if time_stepper is not None:
+            # Each stage but the last one synchronizes and constrains rates; every
+            # stage constrains values; callbacks are applied once per step.
+            n_stages = time_stepper.n_stages
+            report["calls_per_step"] = (
+                (n_stages - 1) * report["synchronize"]["calls"]
+                + n_stages * report["constrain_values"]["calls"]
+                + (n_stages - 1) * report["constrain_rates"]["calls"]
+                + report["callback"]["calls"]
+            )
+        return report
+
+    @final
+    def snapshot(
+        self,
+        time: np.float64 = np.float64(0.0),
+        out: Optional[SimulatorSnapshot] = None,
+    ) -> SimulatorSnapshot:
+        """
+        Copy the state of the systems and of their features (forcing, constraints,
+        damping, contact, connections, callbacks) into memory. Should be called after
+        finalize.
+
+        Parameters
+        ----------
+        time: np.float64
+            Simulation time, returned by `restore`.
+        out: Optional[SimulatorSnapshot]
+            Snapshot of this simulator whose buffers are reused instead of allocating
+            new ones.
+
+        Returns
+        -------
+        SimulatorSnapshot
+        """
+        assert self._finalize_flag, "The snapshot can only be taken after finalize."
+        return snapshot_state(self, time, out)
+
+    @final
+    def restore(self, snapshot: SimulatorSnapshot) -> np.float64:
+        """
+        Restore a snapshot taken from this simulator, in place.
+
+        Parameters
+        ----------
+        snapshot: SimulatorSnapshot
+
+        Returns
+        -------
+        np.float64
+            Simulation time given when the snapshot was taken.
+        """
+        assert self._finalize_flag, "The snapshot can only be restored after finalize."
+        return restore_state(self, snapshot)
+
     @final
     def synchronize(self, time: np.float64) -> None:
         """
         Call synchronize functions for all features.
-        Features are registered in _feature_group_synchronize.
+        Features are registered in _feature_group_synchronize, and compiled
+        into an operator plan at finalize.
         """
-        for func in self._feature_group_synchronize:
+        for func in self._operators_synchronize:
             func(time=time)
 
     @final
     def constrain_values(self, time: np.float64) -> None:
         """
         Call constrain values functions for all features.
-        Features are registered in _feature_group_constrain_values.
+        Features are registered in _feature_group_constrain_values, and compiled
+        into an operator plan at finalize.
         """
-        for func in self._feature_group_constrain_values:
+        for func in self._operators_constrain_values:
             func(time=time)
 
     @final
     def constrain_rates(self, time: np.float64) -> None:
         """
         Call constrain rates functions for all features.
-        Features are registered in _feature_group_constrain_rates.
+        Features are registered in _feature_group_constrain_rates, and compiled
+        into an operator plan at finalize.
         """
-        for func in self._feature_group_constrain_rates:
+        for func in self._operators_constrain_rates:
             func(time=time)
 
     @final
     def apply_callbacks(self, time: np.float64, current_step: int) -> None:
         """
         Call callback functions for all features.
-        Features are registered in _feature_group_callback.
+        Features are registered in _feature_group_callback, and compiled
+        into an operator plan at finalize.
         """
-        for func in self._feature_group_callback:
+        for func in self._operators_callback:
             func(time=time, current_step=current_step)
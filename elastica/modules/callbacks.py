@@ -4,9 +4,14 @@ CallBacks
 
 Provides the callBack interface to collect data over time (see `callback_functions.py`).
 """
-from typing import Type, Any
+from typing import Type, Any, Iterable, Optional
 from typing_extensions import Self  # 3.11: from typing import Self
-from elastica.typing import SystemType, SystemIdxType, OperatorFinalizeType
+from elastica.typing import (
+    SystemType,
+    SystemIdxType,
+    OperatorFinalizeType,
+    BlockSystemType,
+)
 from .protocol import ModuleProtocol
 
 import functools
@@ -15,6 +20,10 @@ import numpy as np
 
 from elastica.callback_functions import CallBackBaseClass
 from .protocol import SystemCollectionProtocol
+from .operator_plan import register_noop_operator
+
+# Operators calling this method are dropped from the operator plan at finalize
+register_noop_operator(CallBackBaseClass.make_callback)
 
 
 class CallBacks:
@@ -60,14 +69,41 @@ class CallBacks:
 
         return _callback
 
+    def collect_block_diagnostics(
+        self: SystemCollectionProtocol, block_type: Type[BlockSystemType]
+    ) -> ModuleProtocol:
+        """
+        This method calls a user-defined call-back class for the memory block of the
+        given type, which holds all systems of that kind (e.g. `MemoryBlockCosseratRod`
+        for all Cosserat rods). The callback receives the block, so it can collect data
+        from all systems at once, see `BlockRecorderCallBack`.
+
+        Parameters
+        ----------
+        block_type: Type[BlockSystemType]
+            Type of the memory block, e.g. `MemoryBlockCosseratRod`.
+
+        Returns
+        -------
+
+        """
+        _callback: ModuleProtocol = _BlockCallBack(block_type)
+        self._callback_list.append(_callback)
+        self._feature_group_callback.append_id(_callback)
+
+        return _callback
+
     def _finalize_callback(self: SystemCollectionProtocol) -> None:
         # dev : the first index stores the rod index to collect data.
         for callback in self._callback_list:
-            sys_id = callback.id()
+            if isinstance(callback, _BlockCallBack):
+                system = callback.find_block(self.block_systems())
+            else:
+                system = self[callback.id()]
             callback_instance = callback.instantiate()
 
             callback_operator = functools.partial(
-                callback_instance.make_callback, system=self[sys_id]
+                callback_instance.make_callback, system=system
             )
             self._feature_group_callback.add_operators(callback, [callback_operator])
 
@@ -104,6 +140,7 @@ class _CallBack:
         self._callback_cls: Type[CallBackBaseClass]
         self._args: Any
         self._kwargs: Any
+        self._instance: Optional[CallBackBaseClass] = None
 
     def using(
         self,
@@ -147,9 +184,56 @@ class _CallBack:
             )
 
         try:
-            return self._callback_cls(*self._args, **self._kwargs)
+            self._instance = self._callback_cls(*self._args, **self._kwargs)
         except (TypeError, IndexError):
             raise TypeError(
                 r"Unable to construct callback class.\n"
                 r"Did you provide all necessary callback properties?"
             )
+        return self._instance
+
+    @property
+    def instance(self) -> CallBackBaseClass:
+        """
+        Callback object constructed at finalize, e.g. to read the data collected by a
+        `RecorderCallBack`.
+        """
+        if self._instance is None:
+            raise RuntimeError(
+                "The callback is constructed at finalize. Call finalize first."
+            )
+        return self._instance
+
+
+class _BlockCallBack(_CallBack):
+    """
+    CallBack module private class, for callbacks acting on a memory block
+
+        Attributes
+        ----------
+        _block_type: type of the memory block
+    """
+
+    def __init__(self, block_type: Type[BlockSystemType]):
+        """
+
+        Parameters
+        ----------
+        block_type: type
+            Type of the memory block
+        """
+        super().__init__(-1)
+        self._block_type = block_type
+
+    def id(self) -> Any:
+        return self._block_type
+
+    def find_block(self, blocks: Iterable[BlockSystemType]) -> BlockSystemType:
+        """Returns the memory block of the given type"""
+        for block in blocks:
+            if isinstance(block, self._block_type):
+                return block
+        raise RuntimeError(
+            "No memory block of type {0} was found. Did you append systems of this "
+            "kind to the simulator?".format(self._block_type.__name__)
+        )
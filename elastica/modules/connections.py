@@ -3,7 +3,10 @@ Connect
 -------
 
 Provides the connections interface to connect entities (rods,
-rigid bodies) using joints (see `joints.py`).
+rigid bodies) using joints (see `joints.py`). Connections using the same joint class
+(`FreeJoint`, `HingeJoint` or `FixedJoint`) between systems of the same memory blocks
+are merged into a single batched operator at finalize. The parameters of the merged
+joints are read at finalize.
 """
 from typing import Type, cast, Any
 from typing_extensions import Self
@@ -16,9 +19,21 @@ from elastica.typing import (
 )
 import numpy as np
 import functools
-from elastica.joint import FreeJoint
+from elastica.joint import (
+    FreeJoint,
+    HingeJoint,
+    FixedJoint,
+    _batched_free_joints,
+    _batched_hinge_joints,
+    _batched_fixed_joints,
+)
 
 from .protocol import SystemCollectionProtocol, ModuleProtocol
+from .operator_plan import register_batched_connection
+
+register_batched_connection(FreeJoint, _batched_free_joints)
+register_batched_connection(HingeJoint, _batched_hinge_joints)
+register_batched_connection(FixedJoint, _batched_fixed_joints)
 
 
 class Connections:
@@ -115,6 +130,8 @@ class Connections:
             connect_instance: FreeJoint = connection.instantiate()
 
             # FIXME: lambda t is included because OperatorType takes time as an argument
+            # The operator plan recognizes connections by these keywords and merges
+            # those of the same joint class, see `operator_plan`.
             func = functools.partial(
                 apply_forces_and_torques,
                 connect_instance=connect_instance,
@@ -3,6 +3,12 @@ Constraints
 -----------
 
 Provides the constraints interface to enforce displacement boundary conditions (see `boundary_conditions.py`).
+
+At finalize, the `OneEndFixedBC`, `GeneralConstraint` and `FixedConstraint` registered
+on the systems of a memory block are merged into one operator constraining the values
+and one constraining the rates, which gather every constrained node and element of the
+block. The fixed positions and directors of the merged constraints are read at
+finalize.
 """
 from typing import Any, Type, cast
 from typing_extensions import Self
@@ -11,7 +17,15 @@ import functools
 
 import numpy as np
 
-from elastica.boundary_conditions import ConstraintBase
+from elastica.boundary_conditions import (
+    ConstraintBase,
+    FreeBC,
+    OneEndFixedBC,
+    GeneralConstraint,
+    FixedConstraint,
+    _batched_constrain_values,
+    _batched_constrain_rates,
+)
 
 from elastica.typing import (
     SystemIdxType,
@@ -21,6 +35,21 @@ from elastica.typing import (
     BlockSystemType,
 )
 from .protocol import SystemCollectionProtocol, ModuleProtocol
+from .operator_plan import register_noop_operator, register_batched_operator
+
+# Operators calling these methods are dropped from the operator plan at finalize
+register_noop_operator(FreeBC.constrain_values)
+register_noop_operator(FreeBC.constrain_rates)
+
+# Operators calling these methods on instances of exactly these classes, for systems
+# of the same memory block, are merged into one operator at finalize. The three
+# classes share their batched implementation; subclasses keep their own operators.
+register_batched_operator(OneEndFixedBC.constrain_values, _batched_constrain_values)
+register_batched_operator(GeneralConstraint.constrain_values, _batched_constrain_values)
+register_batched_operator(FixedConstraint.constrain_values, _batched_constrain_values)
+register_batched_operator(OneEndFixedBC.constrain_rates, _batched_constrain_rates)
+register_batched_operator(GeneralConstraint.constrain_rates, _batched_constrain_rates)
+register_batched_operator(FixedConstraint.constrain_rates, _batched_constrain_rates)
 
 
 class Constraints:
@@ -5,7 +5,7 @@ Contact
 Provides the contact interface to apply contact forces between objects
 (rods, rigid bodies, surfaces).
 """
-from typing import Type, Any
+from typing import Type, Any, Iterable, Optional
 from typing_extensions import Self
 from elastica.typing import (
     SystemIdxType,
@@ -20,7 +20,14 @@ import functools
 
 import numpy as np
 
-from elastica.contact_forces import NoContact
+from elastica.contact_forces import NoContact, common_check_systems_validity
+from elastica.contact_broad_phase import (
+    BroadPhase,
+    RigidBodyContactGroup,
+    RodContactGroup,
+)
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +80,46 @@ class Contact:
 
         return _contact
 
+    def detect_contact_among(
+        self: SystemCollectionProtocol,
+        systems: Iterable[SystemType],
+        broad_phase: Optional[BroadPhase] = None,
+    ) -> ModuleProtocol:
+        """
+        This method adds contact detection among all pairs of a group of rods, using
+        the selected contact class. Instead of one contact per pair of rods, a single
+        broad phase over all elements of the group finds the element pairs that may be
+        in contact, and the contact class is applied to these pairs only. The contact
+        class must implement `apply_contact_among`, e.g. `RodRodContact`, or
+        `RodSDFContact` for contact between every rod of the group and an obstacle.
+        Groups of rigid bodies work the same way, with one broad phase over the
+        bodies, e.g. with `SphereSphereContact`.
+
+        Parameters
+        ----------
+        systems : Iterable[SystemType]
+            Rods or rigid bodies of the group.
+        broad_phase : Optional[BroadPhase]
+            Broad phase used to find candidate element pairs. Default is
+            `UniformGridBroadPhase`.
+
+        Returns
+        -------
+
+        """
+        sys_indices = [self.get_system_index(system) for system in systems]
+        if len(set(sys_indices)) != len(sys_indices):
+            raise ValueError("A system appears more than once in the contact group.")
+        if len(sys_indices) < 2:
+            raise ValueError("Contact among systems needs at least two systems.")
+
+        # Create _ContactAmong object, cache it and return to user
+        _contact = _ContactAmong(sys_indices, broad_phase)
+        self._contacts.append(_contact)
+        self._feature_group_synchronize.append_id(_contact)
+
+        return _contact
+
     def _finalize_contact(self: SystemCollectionProtocol) -> None:
 
         # dev : the first indices stores the
@@ -90,7 +137,32 @@ class Contact:
                 system_two=self[second_sys_idx],
             )
 
+        def apply_contact_among(
+            time: np.float64,
+            contact_instance: NoContact,
+            contact_group: "RodContactGroup | RigidBodyContactGroup",
+        ) -> None:
+            contact_instance.apply_contact_among(contact_group)
+
         for contact in self._contacts:
+            if isinstance(contact, _ContactAmong):
+                contact_instance = contact.instantiate()
+                contact_group = contact.make_group(
+                    contact_instance,
+                    [self[sys_idx] for sys_idx in contact.id()],
+                    self.block_systems(),
+                )
+                func = functools.partial(
+                    apply_contact_among,
+                    contact_instance=contact_instance,
+                    contact_group=contact_group,
+                )
+                self._feature_group_synchronize.add_operators(contact, [func])
+
+                if not self._feature_group_synchronize.is_last(contact):
+                    warnings()
+                continue
+
             first_sys_idx, second_sys_idx = contact.id()
             contact_instance = contact.instantiate()
 
@@ -196,3 +268,70 @@ class _Contact:
                 r"Unable to construct contact class.\n"
                 r"Did you provide all necessary contact properties?"
             )
+
+
+class _ContactAmong(_Contact):
+    """
+    Contact module private class, for contact among a group of rods or rigid bodies
+
+    Attributes
+    ----------
+    sys_indices: list[SystemIdxType]
+    broad_phase: Optional[BroadPhase]
+    """
+
+    def __init__(
+        self,
+        sys_indices: list[SystemIdxType],
+        broad_phase: Optional[BroadPhase] = None,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        sys_indices
+        broad_phase
+        """
+        super().__init__(sys_indices[0], sys_indices[1])
+        self.sys_indices = sys_indices
+        self.broad_phase = broad_phase
+
+    def id(self) -> Any:
+        return self.sys_indices
+
+    def make_group(
+        self,
+        contact_instance: NoContact,
+        systems: list[SystemType],
+        blocks: Iterable[Any],
+    ) -> "RodContactGroup | RigidBodyContactGroup":
+        """Checks the systems and locates them in their memory block"""
+        if type(contact_instance).apply_contact_among is NoContact.apply_contact_among:
+            raise TypeError(
+                "{0} does not support contact among a group of rods.".format(
+                    type(contact_instance).__name__
+                )
+            )
+        # Systems of the group all play the part of the first system
+        for system in systems:
+            common_check_systems_validity(system, contact_instance._allowed_system_one)
+
+        for block in blocks:
+            if not isinstance(block, (MemoryBlockCosseratRod, MemoryBlockRigidBody)):
+                continue
+            idx_of_system = {
+                sys_idx: idx for idx, sys_idx in enumerate(block.system_idx_list)
+            }
+            if all(sys_idx in idx_of_system for sys_idx in self.sys_indices):
+                indices = np.array(
+                    [idx_of_system[sys_idx] for sys_idx in self.sys_indices],
+                    dtype=np.int64,
+                )
+                if isinstance(block, MemoryBlockRigidBody):
+                    return RigidBodyContactGroup(
+                        block, indices, systems, self.broad_phase
+                    )
+                return RodContactGroup(block, indices, self.broad_phase)
+        raise TypeError(
+            "Contact among systems needs all systems in the same memory block."
+        )
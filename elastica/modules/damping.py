@@ -7,6 +7,11 @@ Damping
 Provides the damper interface to apply damping
 on the rods. (see `dissipation.py`).
 
+At finalize, the `AnalyticalLinearDamper` and the `LaplaceDissipationFilter`
+registered on the rods of a memory block are merged into one operator per class, acting
+on the rates of the whole block. The parameters of the merged dampers are read at
+finalize.
+
 """
 
 from typing import Any, Type, List
@@ -16,9 +21,25 @@ import functools
 
 import numpy as np
 
-from elastica.dissipation import DamperBase
+from elastica.dissipation import (
+    DamperBase,
+    AnalyticalLinearDamper,
+    LaplaceDissipationFilter,
+    _batched_analytical_linear_damper,
+    _batched_laplace_dissipation_filter,
+)
 from elastica.typing import RodType, SystemType, SystemIdxType
 from .protocol import SystemCollectionProtocol, ModuleProtocol
+from .operator_plan import register_batched_operator
+
+# Operators calling these methods on instances of exactly these classes, for rods of
+# the same memory block, are merged into one operator at finalize
+register_batched_operator(
+    AnalyticalLinearDamper.dampen_rates, _batched_analytical_linear_damper
+)
+register_batched_operator(
+    LaplaceDissipationFilter.dampen_rates, _batched_laplace_dissipation_filter
+)
 
 
 class Damping:
@@ -4,6 +4,13 @@ Forcing
 
 Provides the forcing interface to apply forces and torques to rod-like objects
 (external point force, muscle torques, etc).
+
+At finalize, the `GravityForces`, `UniformForces`, `UniformTorques` and
+`EndpointForces` registered on the systems of a memory block are merged into one
+operator per class, applied to the arrays of the block, and methods that do nothing,
+such as `GravityForces.apply_torques`, are dropped. Only instances of exactly these
+classes are merged, subclasses keep their own operators, and the merged operators
+read the parameters of the instances at every step.
 """
 import logging
 import functools
@@ -12,9 +19,31 @@ from typing_extensions import Self
 
 import numpy as np
 
-from elastica.external_forces import NoForces
+from elastica.external_forces import (
+    NoForces,
+    GravityForces,
+    UniformForces,
+    UniformTorques,
+    EndpointForces,
+    _batched_gravity_forces,
+    _batched_uniform_forces,
+    _batched_uniform_torques,
+    _batched_endpoint_forces,
+)
 from elastica.typing import SystemType, SystemIdxType
 from .protocol import SystemCollectionProtocol, ModuleProtocol
+from .operator_plan import register_noop_operator, register_batched_operator
+
+# Operators calling these methods are dropped from the operator plan at finalize
+register_noop_operator(NoForces.apply_forces)
+register_noop_operator(NoForces.apply_torques)
+
+# Operators calling these methods on instances of exactly these classes, for systems
+# of the same memory block, are merged into one operator at finalize
+register_batched_operator(GravityForces.apply_forces, _batched_gravity_forces)
+register_batched_operator(UniformForces.apply_forces, _batched_uniform_forces)
+register_batched_operator(UniformTorques.apply_torques, _batched_uniform_torques)
+register_batched_operator(EndpointForces.apply_forces, _batched_endpoint_forces)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +44,9 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
         A list of lists of operators. Each list of operators corresponds to a feature.
     _operator_ids : list[int]
         A list of ids of the features.
+    _features : list[F]
+        The features, kept alive so that their ids are not reused by features
+        created later, e.g. at finalize.
 
     Methods
     -------
@@ -59,6 +62,7 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
     def __init__(self) -> None:
         self._operator_collection: list[list[T]] = []
         self._operator_ids: list[int] = []
+        self._features: list[F] = []
 
     def __iter__(self) -> Iterator[T]:
         """Returns an operator iterator to satisfy the Iterable protocol."""
@@ -69,6 +73,7 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
     def append_id(self, feature: F) -> None:
         """Appends the id of the feature to the list of ids."""
         self._operator_ids.append(id(feature))
+        self._features.append(feature)
         self._operator_collection.append([])
 
     def add_operators(self, feature: F, operators: list[T]) -> None:
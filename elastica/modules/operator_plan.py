@@ -0,0 +1,403 @@
+__doc__ = """
+Execution plan for operator groups. At finalize, the operators registered in each
+feature group (synchronize, constrain values, constrain rates, callback) are compiled
+into a flat list in which
+
+* operators whose method does nothing are dropped,
+* operators acting on rods of the same memory block are merged into a single batched
+  operator, if their methods are registered with the same batched implementation,
+* connections between systems of the same two memory blocks are merged into a single
+  batched operator, if their joint class has a batched implementation,
+* all other operators are kept as they are (per-object fallback).
+
+Batched implementations reproduce the methods of the classes they are registered
+for, including the helpers these methods call. They are therefore only used for
+instances of exactly these classes: instances of subclasses, which may override any
+helper, keep their per-object operators.
+"""
+
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, Union
+from typing import Protocol
+
+import functools
+
+import numpy as np
+from numpy.typing import NDArray
+
+from elastica.typing import BlockSystemType
+
+T = TypeVar("T", bound=Callable)
+
+
+class BatchedOperatorFactory(Protocol):
+    """
+    Creates one operator that applies `instances[i]` to the rod `rod_indices[i]` of the
+    memory block `block`, for all i, in order. The returned operator is called with the
+    same keyword arguments as the operators of its group, e.g. `time` for synchronize.
+    """
+
+    def __call__(
+        self,
+        instances: list[Any],
+        block: BlockSystemType,
+        rod_indices: NDArray[np.int32],
+    ) -> Callable[..., None]: ...
+
+
+class BatchedConnectionFactory(Protocol):
+    """
+    Creates one operator that applies the joint `instances[i]` between the node or
+    element `connect_indices_one[i]` of the system `system_indices_one[i]` of the
+    memory block `block_one` and the node or element `connect_indices_two[i]` of the
+    system `system_indices_two[i]` of the memory block `block_two`, for all i, in
+    order. The returned operator is called with `time`.
+    """
+
+    def __call__(
+        self,
+        instances: list[Any],
+        block_one: BlockSystemType,
+        system_indices_one: NDArray[np.int32],
+        connect_indices_one: NDArray[np.int32],
+        block_two: BlockSystemType,
+        system_indices_two: NDArray[np.int32],
+        connect_indices_two: NDArray[np.int32],
+    ) -> Callable[..., None]: ...
+
+
+_noop_methods: set[Callable] = set()
+_batched_methods: dict[Callable, BatchedOperatorFactory] = {}
+_batched_connections: dict[type, BatchedConnectionFactory] = {}
+
+# Keywords of the connection operators created by `Connections`
+_CONNECTION_KEYWORDS = frozenset(
+    (
+        "connect_instance",
+        "system_one",
+        "first_connect_idx",
+        "system_two",
+        "second_connect_idx",
+    )
+)
+
+
+def register_noop_operator(method: Callable) -> None:
+    """
+    Register a method that does nothing, e.g. `NoForces.apply_torques`. Operators
+    calling this method are dropped from the plan. Subclasses overriding the method
+    are not affected, since the lookup uses the function object.
+
+    Parameters
+    ----------
+    method: Callable
+        Function of the class, e.g. `NoForces.apply_torques`.
+    """
+    _noop_methods.add(method)
+
+
+def register_batched_operator(
+    method: Callable, factory: BatchedOperatorFactory
+) -> None:
+    """
+    Register a batched implementation of a method, e.g. `GravityForces.apply_forces`.
+    Operators calling this method on rods of the same memory block are merged into the
+    operator returned by `factory`. Methods registered with the same factory, e.g. the
+    `constrain_values` of several constraint classes, are merged together, and the
+    factory receives their instances in order.
+
+    Only instances whose class defines the method are merged. Instances of subclasses
+    keep their per-object operators, whether they override the method or only the
+    helpers it calls.
+
+    Parameters
+    ----------
+    method: Callable
+        Function of the class, e.g. `GravityForces.apply_forces`.
+    factory: BatchedOperatorFactory
+        Creates the batched operator from the instances, the memory block and the
+        indices of the rods in the memory block.
+    """
+    _batched_methods[method] = factory
+
+
+def register_batched_connection(
+    joint_cls: type, factory: BatchedConnectionFactory
+) -> None:
+    """
+    Register a batched implementation of a joint class, e.g. `FixedJoint`. Connections
+    using this joint between systems of the same two memory blocks are merged into the
+    operator returned by `factory`. Subclasses of the joint are not affected, since the
+    lookup uses the class of the joint.
+
+    Parameters
+    ----------
+    joint_cls: type
+        Joint class, e.g. `FixedJoint`.
+    factory: BatchedConnectionFactory
+        Creates the batched operator from the joints, and the memory block, indices
+        of the systems in the memory block and connection indices of both sides.
+    """
+    _batched_connections[joint_cls] = factory
+
+
+class _Batch:
+    def __init__(
+        self, factory: Callable, blocks: tuple[BlockSystemType, ...], position: int
+    ) -> None:
+        self.factory = factory
+        self.blocks = blocks
+        # Index of the batch in the compiled list
+        self.position = position
+        self.operators: list[Callable] = []
+        self.instances: list[Any] = []
+        # Indices given to the factory after each block, one list per index
+        self.indices: list[list[int]] = []
+        # Systems touched by the operators placed after the batch since it was
+        # opened. A later operator can only join the batch if its systems are not
+        # among them.
+        self.touched: set[int] = set()
+
+    def append(self, operator: Callable, instance: Any, *indices: int) -> None:
+        self.operators.append(operator)
+        self.instances.append(instance)
+        if not self.indices:
+            self.indices = [[] for _ in indices]
+        for column, index in zip(self.indices, indices):
+            column.append(index)
+
+    def build(self) -> Callable:
+        per_block = len(self.indices) // len(self.blocks)
+        arguments: list[Any] = []
+        for b, block in enumerate(self.blocks):
+            arguments.append(block)
+            for column in self.indices[b * per_block : (b + 1) * per_block]:
+                arguments.append(np.array(column, dtype=np.int32))
+        return self.factory(self.instances, *arguments)
+
+
+class OperatorPlan(Generic[T]):
+    """
+    Flat list of operators compiled from an operator group, see module documentation.
+
+    Merging never changes the order of the operators acting on a given system: an
+    operator joins a batch only if no operator between the first member of the batch
+    and itself acts on its system. Operators are assumed to act only on the systems
+    they are given. Connection operators act on their two systems. Other operators
+    that are not bound methods, such as contact closures, can act on any system, so
+    they close all open batches.
+
+    Attributes
+    ----------
+    operators: list[T]
+        Operators to call, in order.
+    n_registered: int
+        Number of operators in the group.
+    n_skipped: int
+        Number of operators dropped because their method does nothing.
+    n_batched: int
+        Number of operators merged into batched operators.
+    n_batches: int
+        Number of batched operators.
+    """
+
+    def __init__(
+        self,
+        operators: Iterable[T],
+        rod_locations: dict[int, tuple[BlockSystemType, int]],
+        block_members: dict[int, set[int]],
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        operators: Iterable[T]
+            Operators of the group, in order.
+        rod_locations: dict[int, tuple[BlockSystemType, int]]
+            Memory block and index in the block of each rod, keyed by id of the rod.
+        block_members: dict[int, set[int]]
+            Ids of the systems in each memory block, keyed by id of the block.
+        """
+        self._rod_locations = rod_locations
+        self._block_members = block_members
+
+        self.n_registered = 0
+        self.n_skipped = 0
+        self.n_batched = 0
+        self.n_batches = 0
+
+        entries: list[Union[T, _Batch]] = []
+        open_batches: dict[tuple[Any, ...], _Batch] = {}
+        for operator in operators:
+            self.n_registered += 1
+            connection = self._describe_connection(operator)
+            if connection is not None:
+                touched = self._touched_systems(connection[1])
+                touched |= self._touched_systems(connection[3])  # type: ignore
+                key, blocks, instance, indices = self._connection_batch(connection)
+            else:
+                method, system = self._describe(operator)
+
+                if method is not None and method in _noop_methods:
+                    self.n_skipped += 1
+                    continue
+
+                touched = self._touched_systems(system)
+                if touched is None:
+                    # Unknown reach: nothing after this operator may move before it.
+                    open_batches.clear()
+                    entries.append(operator)
+                    continue
+
+                key, blocks, instance, indices = self._method_batch(
+                    operator, method, system
+                )
+
+            if key is not None:
+                batch = open_batches.get(key)
+                if batch is None or not touched.isdisjoint(batch.touched):
+                    batch = _Batch(key[0], blocks, len(entries))
+                    open_batches[key] = batch
+                    entries.append(batch)
+                batch.append(operator, instance, *indices)
+                position = batch.position
+            else:
+                entries.append(operator)
+                position = len(entries) - 1
+
+            # An operator that joined a batch moved up to the position of the batch:
+            # it stays ahead of the batches opened after it.
+            for open_batch in open_batches.values():
+                if open_batch.position < position:
+                    open_batch.touched.update(touched)
+
+        self.operators: list[T] = []
+        for entry in entries:
+            if not isinstance(entry, _Batch):
+                self.operators.append(entry)
+            elif len(entry.operators) == 1:
+                # Nothing to merge
+                self.operators.append(entry.operators[0])
+            else:
+                self.operators.append(entry.build())  # type: ignore
+                self.n_batched += len(entry.operators)
+                self.n_batches += 1
+
+    def __iter__(self):  # type: ignore
+        return iter(self.operators)
+
+    def __len__(self) -> int:
+        return len(self.operators)
+
+    @property
+    def n_calls(self) -> int:
+        """Number of Python calls made each time the group is executed."""
+        return len(self.operators)
+
+    def report(self) -> dict[str, int]:
+        """
+        Returns
+        -------
+        dict[str, int]
+            Number of registered, skipped, batched operators, number of batches and
+            number of Python calls made each time the group is executed.
+        """
+        return {
+            "registered": self.n_registered,
+            "skipped": self.n_skipped,
+            "batched": self.n_batched,
+            "batches": self.n_batches,
+            "calls": self.n_calls,
+        }
+
+    @staticmethod
+    def _describe(operator: Callable) -> tuple[Optional[Callable], Any]:
+        """
+        Returns the function of the bound method called by the operator and the system
+        it is called on, or (None, None) if the operator is not of that form.
+        """
+        if not isinstance(operator, functools.partial):
+            return None, None
+        method = getattr(operator.func, "__func__", None)
+        if method is None or not hasattr(operator.func, "__self__"):
+            return None, None
+        if "system" in operator.keywords and not operator.args:
+            return method, operator.keywords["system"]
+        if len(operator.args) == 1 and not operator.keywords:
+            return method, operator.args[0]
+        return method, None
+
+    @staticmethod
+    def _describe_connection(operator: Callable) -> Optional[tuple[Any, ...]]:
+        """
+        Returns the joint, first system, first connection index, second system and
+        second connection index of a connection operator, or None if the operator is
+        not a connection.
+        """
+        if (
+            not isinstance(operator, functools.partial)
+            or operator.args
+            or operator.keywords.keys() != _CONNECTION_KEYWORDS
+        ):
+            return None
+        return (
+            operator.keywords["connect_instance"],
+            operator.keywords["system_one"],
+            operator.keywords["first_connect_idx"],
+            operator.keywords["system_two"],
+            operator.keywords["second_connect_idx"],
+        )
+
+    def _method_batch(
+        self, operator: Callable, method: Optional[Callable], system: Any
+    ) -> tuple[Optional[tuple[Any, ...]], tuple[Any, ...], Any, tuple[int, ...]]:
+        """
+        Returns the key of the batch the operator can join, the blocks and instance
+        given to its factory and the index of the rod, or a None key.
+        """
+        if method not in _batched_methods or id(system) not in self._rod_locations:
+            return None, (), None, ()
+        instance = operator.func.__self__  # type: ignore
+        # Exact class only: a subclass may override helpers of the method
+        if vars(type(instance)).get(method.__name__) is not method:
+            return None, (), None, ()
+        block, rod_idx = self._rod_locations[id(system)]
+        factory = _batched_methods[method]
+        return ((factory, id(block)), (block,), instance, (rod_idx,))
+
+    def _connection_batch(
+        self, connection: tuple[Any, ...]
+    ) -> tuple[Optional[tuple[Any, ...]], tuple[Any, ...], Any, tuple[int, ...]]:
+        """
+        Returns the key of the batch the connection can join, the blocks and joint
+        given to its factory and the system and connection indices of both sides, or
+        a None key. Only connections at a single index on each side are merged.
+        """
+        joint, system_one, index_one, system_two, index_two = connection
+        if (
+            type(joint) not in _batched_connections
+            or id(system_one) not in self._rod_locations
+            or id(system_two) not in self._rod_locations
+            or not isinstance(index_one, (int, np.integer))
+            or not isinstance(index_two, (int, np.integer))
+        ):
+            return None, (), None, ()
+        block_one, rod_one = self._rod_locations[id(system_one)]
+        block_two, rod_two = self._rod_locations[id(system_two)]
+        factory = _batched_connections[type(joint)]
+        return (
+            (factory, id(block_one), id(block_two)),
+            (block_one, block_two),
+            joint,
+            (rod_one, int(index_one), rod_two, int(index_two)),
+        )
+
+    def _touched_systems(self, system: Any) -> Optional[set[int]]:
+        """
+        Returns the ids of the systems the operator acts on, or None if unknown.
+        A memory block acts on all of its rods.
+        """
+        if system is None:
+            return None
+        if id(system) in self._block_members:
+            return self._block_members[id(system)] | {id(system)}
+        return {id(system)}
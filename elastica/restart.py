@@ -1,11 +1,16 @@
 __doc__ = """Generate or load restart file implementations."""
 
 import numpy as np
+from numpy.typing import NDArray
 import os
+import json
+import functools
+import queue
+import threading
 from itertools import groupby
 from .memory_block import MemoryBlockCosseratRod, MemoryBlockRigidBody
 
-from typing import Iterable, Iterator, Any
+from typing import Iterable, Iterator, Any, Optional
 
 
 def all_equal(iterable: Iterable[Any]) -> bool:
@@ -112,3 +117,617 @@ def load_state(
         print("Load complete: {}".format(directory))
 
     return time_list[0]
+
+
+# Checkpoint file layout:
+#   magic (16 bytes) | version (uint32) | header size (uint64) | header (JSON, utf-8)
+#   | padding | data
+# Arrays are stored in C order, each starting at a multiple of _CHECKPOINT_ALIGNMENT
+# from the beginning of the file, at the offset given in the header.
+_CHECKPOINT_MAGIC = b"PYELASTICA-CKPT\x00"
+_CHECKPOINT_VERSION = 1
+_CHECKPOINT_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _CHECKPOINT_ALIGNMENT) * _CHECKPOINT_ALIGNMENT
+
+
+def _block_storage(block: Any) -> dict[str, NDArray[Any]]:
+    """
+    Arrays owning the memory of a block: contiguous storage of the dofs, and index
+    arrays of the layout (rods, ghosts). Attributes of the systems are views of them.
+    """
+    return {
+        name: value
+        for name, value in block.__dict__.items()
+        if isinstance(value, np.ndarray) and value.base is None
+    }
+
+
+def _write_checkpoint(
+    path: str,
+    blocks: list[tuple[str, int, dict[str, NDArray[Any]]]],
+    time: np.float64,
+    stepper_name: Optional[str],
+) -> None:
+    """
+    Write a checkpoint file from the type name, number of systems and storage arrays
+    of each block, see `save_checkpoint`.
+    """
+    blocks_header: list[dict[str, Any]] = []
+    arrays: list[tuple[int, NDArray[Any]]] = []
+    offset = 0
+    for block_type, n_systems, storage in blocks:
+        arrays_header = []
+        for name, array in storage.items():
+            offset = _align(offset)
+            arrays_header.append(
+                {
+                    "name": name,
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape),
+                    "offset": offset,
+                }
+            )
+            arrays.append((offset, array))
+            offset += array.nbytes
+        blocks_header.append(
+            {
+                "type": block_type,
+                "n_systems": n_systems,
+                "arrays": arrays_header,
+            }
+        )
+
+    header = json.dumps(
+        {
+            "time": float(time),
+            "stepper": stepper_name,
+            "blocks": blocks_header,
+        }
+    ).encode("utf-8")
+    preamble = (
+        _CHECKPOINT_MAGIC
+        + np.uint32(_CHECKPOINT_VERSION).astype("<u4").tobytes()
+        + np.uint64(len(header)).astype("<u8").tobytes()
+        + header
+    )
+    data_start = _align(len(preamble))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(preamble)
+        for array_offset, array in arrays:
+            file.seek(data_start + array_offset)
+            file.write(np.ascontiguousarray(array).data)
+        file.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def save_checkpoint(
+    simulator: Any,
+    path: str,
+    time: np.float64 = np.float64(0.0),
+    time_stepper: Optional[Any] = None,
+    verbose: bool = False,
+) -> None:
+    """
+    Save the state of all memory blocks of a finalized simulator in one binary file.
+    Each contiguous array of a block is written once, together with the layout of the
+    block (system indices, rod sizes, ghost indices) and a small JSON header holding
+    the time and the stepper. The file can be read with `read_checkpoint`, which maps
+    it in memory instead of reading it. The file is written next to `path` first and
+    then moved in place, so an interrupted save does not corrupt an older checkpoint.
+
+    Parameters
+    ----------
+    simulator : object
+        Finalized simulator object.
+    path : str
+        File path. Parent directories are created if needed.
+    time : float
+        Simulation time.
+    time_stepper : Optional[object]
+        Stepper used for the simulation. Its class name is stored in the header.
+    verbose : boolean
+    """
+    _write_checkpoint(
+        path,
+        [
+            (type(block).__name__, int(block.n_systems), _block_storage(block))
+            for block in simulator.block_systems()
+        ],
+        time,
+        None if time_stepper is None else type(time_stepper).__name__,
+    )
+
+    if verbose:
+        print("Save complete: {}".format(path))
+
+
+def read_checkpoint(
+    path: str,
+) -> tuple[dict[str, Any], list[dict[str, NDArray[Any]]]]:
+    """
+    Map a checkpoint written by `save_checkpoint` in memory. No data is read until the
+    arrays are accessed.
+
+    Parameters
+    ----------
+    path : str
+        File path.
+
+    Returns
+    -------
+    header : dict
+        Time ("time"), stepper name ("stepper") and description of the blocks
+        ("blocks").
+    arrays : list[dict[str, NDArray]]
+        Read-only arrays of each block, keyed by name, in the order of the blocks.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    n_preamble = len(_CHECKPOINT_MAGIC) + 12
+    if data.size < n_preamble or bytes(data[: len(_CHECKPOINT_MAGIC)]) != (
+        _CHECKPOINT_MAGIC
+    ):
+        raise ValueError(f"{path} is not a checkpoint file.")
+    version, header_size = (
+        int(data[16:20].view("<u4")[0]),
+        int(data[20:28].view("<u8")[0]),
+    )
+    if version != _CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version {version} is not supported, expected "
+            f"{_CHECKPOINT_VERSION}."
+        )
+    header = json.loads(bytes(data[n_preamble : n_preamble + header_size]))
+    data_start = _align(n_preamble + header_size)
+
+    arrays: list[dict[str, NDArray[Any]]] = []
+    for block_header in header["blocks"]:
+        block_arrays = {}
+        for entry in block_header["arrays"]:
+            dtype = np.dtype(entry["dtype"])
+            start = data_start + entry["offset"]
+            stop = start + dtype.itemsize * int(np.prod(entry["shape"]))
+            block_arrays[entry["name"]] = (
+                data[start:stop].view(dtype).reshape(entry["shape"])
+            )
+        arrays.append(block_arrays)
+    return header, arrays
+
+
+def load_checkpoint(
+    simulator: Any,
+    path: str,
+    time_stepper: Optional[Any] = None,
+    verbose: bool = False,
+) -> float:
+    """
+    Load a checkpoint written by `save_checkpoint` into a finalized simulator with the
+    same systems. The file is mapped in memory and each block array is copied once.
+
+    Parameters
+    ----------
+    simulator : object
+        Finalized simulator object.
+    path : str
+        File path.
+    time_stepper : Optional[object]
+        If given, must be of the same class as the stepper stored in the checkpoint.
+    verbose : boolean
+
+    Returns
+    ------
+    time : float
+        Simulation time of systems when they are saved.
+    """
+    header, arrays = read_checkpoint(path)
+
+    if time_stepper is not None and header["stepper"] is not None:
+        if type(time_stepper).__name__ != header["stepper"]:
+            raise ValueError(
+                f"Checkpoint was saved with {header['stepper']}, not "
+                f"{type(time_stepper).__name__}."
+            )
+
+    blocks = list(simulator.block_systems())
+    if len(blocks) != len(header["blocks"]):
+        raise ValueError(
+            f"Checkpoint has {len(header['blocks'])} memory blocks, the simulator "
+            f"has {len(blocks)}."
+        )
+    # Check all layouts before modifying anything
+    for block_idx, (block, block_header, block_arrays) in enumerate(
+        zip(blocks, header["blocks"], arrays)
+    ):
+        storage = _block_storage(block)
+        if type(block).__name__ != block_header["type"] or storage.keys() != (
+            block_arrays.keys()
+        ):
+            raise ValueError(
+                f"Memory block {block_idx} of the simulator does not match the "
+                "checkpoint."
+            )
+        for name, array in storage.items():
+            saved = block_arrays[name]
+            if array.shape != saved.shape or (
+                np.issubdtype(array.dtype, np.integer)
+                and not np.array_equal(array, saved)
+            ):
+                raise ValueError(
+                    f"Layout of memory block {block_idx} does not match the "
+                    f"checkpoint: {name} differs."
+                )
+
+    for block, block_arrays in zip(blocks, arrays):
+        for name, array in _block_storage(block).items():
+            if not np.issubdtype(array.dtype, np.integer):
+                np.copyto(array, block_arrays[name])
+
+    if verbose:
+        print("Load complete: {}".format(path))
+
+    return header["time"]
+
+
+class AsyncCheckpointer:
+    """
+    Writes checkpoints (see `save_checkpoint`) of a finalized simulator on a
+    background thread, so the time loop does not wait for the disk.
+
+    At every `step_skip` steps, `make_checkpoint` copies the memory blocks into one of
+    `max_pending` preallocated buffers and hands it to the writer thread. The copy is
+    the only cost paid by the time loop. If all buffers are still waiting to be
+    written, `make_checkpoint` waits until one is free (back-pressure), so memory use is
+    bounded by `max_pending` copies of the state. Errors raised by the writer thread
+    are raised again by the next call to `make_checkpoint`, `flush` or `close`.
+
+    Pass the checkpointer to `integrate`, or call `make_checkpoint` in a custom time
+    loop. `integrate` waits for the checkpoints it queued but does not close the
+    checkpointer, so that it can be reused by further calls, e.g. when a simulation
+    is run in several segments. The owner calls `close` at the end, or uses the
+    checkpointer in a `with` statement, to stop the writer thread.
+
+    Attributes
+    ----------
+    n_written : int
+        Number of checkpoints written to disk.
+    n_waits : int
+        Number of times the time loop waited for a free buffer.
+    saved_paths : list[str]
+        Paths of the checkpoints written to disk, in order.
+    """
+
+    def __init__(
+        self,
+        simulator: Any,
+        directory: str,
+        step_skip: int,
+        filename: str = "checkpoint",
+        max_pending: int = 2,
+        time_stepper: Optional[Any] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        simulator : object
+            Finalized simulator object.
+        directory : str
+            Directory to save the checkpoints. Created if it does not exist.
+        step_skip : int
+            Interval, in steps, between checkpoints.
+        filename : str
+            Checkpoints are saved as <filename>_<step>.ckpt.
+        max_pending : int
+            Number of state buffers. 2 (double buffering) lets the time loop fill
+            one buffer while the other one is written.
+        time_stepper : Optional[object]
+            Stepper used for the simulation, stored in the checkpoints.
+        """
+        if step_skip < 1:
+            raise ValueError(f"step_skip must be positive, got {step_skip}.")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive, got {max_pending}.")
+
+        self.step_skip = step_skip
+        self.save_path = os.path.join(directory, filename) + "_{:09d}.ckpt"
+        self.stepper_name = (
+            None if time_stepper is None else type(time_stepper).__name__
+        )
+        self.n_written = 0
+        self.n_waits = 0
+        self.saved_paths: list[str] = []
+
+        blocks = list(simulator.block_systems())
+        self._sources = [_block_storage(block) for block in blocks]
+        self._layout = [
+            (type(block).__name__, int(block.n_systems)) for block in blocks
+        ]
+        self._free_buffers: queue.Queue = queue.Queue()
+        for _ in range(max_pending):
+            self._free_buffers.put(
+                [
+                    {name: np.empty_like(array) for name, array in source.items()}
+                    for source in self._sources
+                ]
+            )
+        # Never full: the number of jobs is bounded by the number of buffers
+        self._jobs: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def make_checkpoint(self, time: np.float64, current_step: int) -> None:
+        """
+        Copy the state and queue it for writing, if `current_step` is a multiple of
+        `step_skip`.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time.
+        current_step : int
+            Number of steps done.
+        """
+        self._raise_error()
+        if current_step % self.step_skip != 0:
+            return
+
+        try:
+            buffers = self._free_buffers.get_nowait()
+        except queue.Empty:
+            self.n_waits += 1
+            buffers = self._free_buffers.get()
+            self._raise_error()
+        for source, buffer in zip(self._sources, buffers):
+            for name, array in source.items():
+                np.copyto(buffer[name], array)
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._write_loop, name="elastica-checkpoint", daemon=True
+            )
+            self._thread.start()
+        self._jobs.put((self.save_path.format(current_step), buffers, time))
+
+    def _write_loop(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                return
+            path, buffers, time = job
+            try:
+                if self._error is None:
+                    _write_checkpoint(
+                        path,
+                        [
+                            (block_type, n_systems, buffer)
+                            for (block_type, n_systems), buffer in zip(
+                                self._layout, buffers
+                            )
+                        ],
+                        time,
+                        self.stepper_name,
+                    )
+                    self.saved_paths.append(path)
+                    self.n_written += 1
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._free_buffers.put(buffers)
+                self._jobs.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Writing a checkpoint failed.") from error
+
+    def flush(self) -> None:
+        """Wait until all queued checkpoints are written."""
+        self._jobs.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write all queued checkpoints and stop the writer thread."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def get_last_saved_path(self) -> Optional[str]:
+        """
+        Return last saved file path. If no file has been saved,
+        return None
+        """
+        return self.saved_paths[-1] if self.saved_paths else None
+
+    def __enter__(self) -> "AsyncCheckpointer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SimulatorSnapshot:
+    """
+    In-memory copy of the state of a finalized simulator, created by
+    `BaseSystemCollection.snapshot` and restored by `BaseSystemCollection.restore`.
+
+    The snapshot holds one buffer per contiguous array of each memory block (positions,
+    directors, velocities, ... of all systems in the block), and the state of every
+    forcing, constraint, damping, contact, connection and callback object:
+
+    * numpy arrays are copied into preallocated buffers and copied back in place,
+    * numbers, strings and booleans are stored and reassigned,
+    * lists and dicts (e.g. recorded callback data) are shallow-copied and restored in
+      place, so samples recorded after the snapshot are dropped.
+
+    Other attributes, such as references to systems, are left untouched. Passing a
+    snapshot as `out` to `BaseSystemCollection.snapshot` reuses its buffers.
+
+    Attributes
+    ----------
+    time: np.float64
+        Simulation time given when the snapshot was taken.
+    """
+
+    def __init__(self, simulator: Any) -> None:
+        self.time = np.float64(0.0)
+        self._simulator_id = id(simulator)
+        # (live array, buffer)
+        self._arrays: list[tuple[NDArray[Any], NDArray[Any]]] = []
+        # (object, attribute name)
+        self._attributes: list[tuple[Any, str]] = []
+        self._attribute_values: list[Any] = []
+        # live container
+        self._containers: list["list[Any] | dict[Any, Any]"] = []
+        self._container_values: list["list[Any] | dict[Any, Any]"] = []
+
+        for block in simulator.block_systems():
+            for array in block.__dict__.values():
+                # Contiguous storage of the block, attributes of the systems are views
+                if (
+                    isinstance(array, np.ndarray)
+                    and array.base is None
+                    and np.issubdtype(array.dtype, np.floating)
+                ):
+                    self._arrays.append((array, np.empty_like(array)))
+
+        for feature in _feature_instances(simulator):
+            for name, value in vars(feature).items():
+                if isinstance(value, np.ndarray):
+                    self._arrays.append((value, np.empty_like(value)))
+                elif isinstance(value, (int, float, bool, str, np.number, np.bool_)):
+                    self._attributes.append((feature, name))
+                elif isinstance(value, (list, dict)):
+                    self._containers.append(value)
+
+    def _capture(self, time: np.float64) -> None:
+        self.time = time
+        for array, buffer in self._arrays:
+            np.copyto(buffer, array)
+        self._attribute_values = [getattr(obj, name) for obj, name in self._attributes]
+        self._container_values = [
+            _shallow_copy(container) for container in self._containers
+        ]
+
+    def _restore(self) -> np.float64:
+        for array, buffer in self._arrays:
+            np.copyto(array, buffer)
+        for (obj, name), value in zip(self._attributes, self._attribute_values):
+            setattr(obj, name, value)
+        for container, value in zip(self._containers, self._container_values):
+            _restore_in_place(container, value)
+        return self.time
+
+
+def _feature_instances(simulator: Any) -> list[Any]:
+    """
+    Returns the forcing, constraint, damping, contact, connection and callback objects
+    of the simulator, each once, from the operators registered in its feature groups.
+    """
+    instances: dict[int, Any] = {}
+    for group in (
+        simulator._feature_group_synchronize,
+        simulator._feature_group_constrain_values,
+        simulator._feature_group_constrain_rates,
+        simulator._feature_group_callback,
+    ):
+        for operator in group:
+            if not isinstance(operator, functools.partial):
+                continue
+            candidates = [getattr(operator.func, "__self__", None)]
+            candidates += [
+                operator.keywords.get(name)
+                for name in ("contact_instance", "connect_instance")
+            ]
+            for candidate in candidates:
+                if candidate is not None and hasattr(candidate, "__dict__"):
+                    instances[id(candidate)] = candidate
+    return list(instances.values())
+
+
+def _shallow_copy(container: "list[Any] | dict[Any, Any]") -> Any:
+    if isinstance(container, list):
+        return [_shallow_copy(item) for item in container]
+    if isinstance(container, dict):
+        return {key: _shallow_copy(item) for key, item in container.items()}
+    return container
+
+
+def _restore_in_place(
+    container: "list[Any] | dict[Any, Any]", value: "list[Any] | dict[Any, Any]"
+) -> None:
+    if isinstance(container, list):
+        container[:] = [_restore_nested(item) for item in value]  # type: ignore
+    else:
+        # Keep nested containers (e.g. lists referenced by the user) alive
+        for key, item in value.items():  # type: ignore
+            if key in container and isinstance(container[key], (list, dict)):
+                _restore_in_place(container[key], item)
+            else:
+                container[key] = _restore_nested(item)
+        for key in list(container.keys()):
+            if key not in value:
+                del container[key]
+
+
+def _restore_nested(item: Any) -> Any:
+    # Stored copies must not be handed out, otherwise a later restore would see the
+    # modifications made after this one.
+    return _shallow_copy(item)
+
+
+def snapshot_state(
+    simulator: Any,
+    time: np.float64 = np.float64(0.0),
+    out: Optional[SimulatorSnapshot] = None,
+) -> SimulatorSnapshot:
+    """
+    Copy the state of a finalized simulator into memory, see `SimulatorSnapshot`.
+
+    Parameters
+    ----------
+    simulator : object
+        Finalized simulator object.
+    time : float
+        Simulation time, returned by `restore_state`.
+    out : Optional[SimulatorSnapshot]
+        Snapshot of the same simulator whose buffers are reused.
+
+    Returns
+    -------
+    SimulatorSnapshot
+    """
+    if out is None:
+        out = SimulatorSnapshot(simulator)
+    elif out._simulator_id != id(simulator):
+        raise ValueError("The snapshot was taken from another simulator.")
+    out._capture(np.float64(time))
+    return out
+
+
+def restore_state(simulator: Any, snapshot: SimulatorSnapshot) -> np.float64:
+    """
+    Copy a snapshot back into the simulator it was taken from, in place.
+
+    Parameters
+    ----------
+    simulator : object
+        Simulator object the snapshot was taken from.
+    snapshot : SimulatorSnapshot
+
+    Returns
+    -------
+    time : float
+        Simulation time given when the snapshot was taken.
+    """
+    if snapshot._simulator_id != id(simulator):
+        raise ValueError("The snapshot was taken from another simulator.")
+    return snapshot._restore()
@@ -18,6 +18,7 @@ from elastica._linalg import (
     _batch_matvec,
 )
 from elastica._rotations import _inv_rotate
+from elastica.reset_functions_for_block_structure import _reset_vector_ghost
 from elastica._calculus import (
     quadrature_kernel_for_block_structure,
     difference_kernel_for_block_structure,
@@ -30,6 +31,23 @@ from .knot_theory import KnotTheory
 position_difference_kernel = _difference
 position_average = _average
 
+# Builds of the helpers that are inlined in the internal load kernels below, so that
+# the `prange` loops of the helpers also run in parallel in the parallel build of
+# these kernels. They are not cached, since they are compiled as part of the kernels.
+_difference_inlined = numba.njit(inline="always")(_difference.py_func)
+_average_inlined = numba.njit(inline="always")(_average.py_func)
+_batch_norm_inlined = numba.njit(inline="always")(_batch_norm.py_func)
+_batch_dot_inlined = numba.njit(inline="always")(_batch_dot.py_func)
+_batch_matvec_inlined = numba.njit(inline="always")(_batch_matvec.py_func)
+_batch_cross_inlined = numba.njit(inline="always")(_batch_cross.py_func)
+_inv_rotate_inlined = numba.njit(inline="always")(_inv_rotate.py_func)
+_difference_kernel_for_block_structure_inlined = numba.njit(inline="always")(
+    difference_kernel_for_block_structure.py_func
+)
+_quadrature_kernel_for_block_structure_inlined = numba.njit(inline="always")(
+    quadrature_kernel_for_block_structure.py_func
+)
+
 
 @functools.lru_cache(maxsize=1)
 def _get_z_vector() -> NDArray[np.float64]:
@@ -541,7 +559,8 @@ class CosseratRod(RodBase, KnotTheory):
             internal_couple,
             ring_rod_flag,
         )
-        rod.REQUISITE_MODULES.append(Constraints)
+        # Per instance: appending to the class list would affect straight rods too
+        rod.REQUISITE_MODULES = rod.REQUISITE_MODULES + [Constraints]
         return rod
 
     def compute_internal_forces_and_torques(
@@ -559,8 +578,9 @@ class CosseratRod(RodBase, KnotTheory):
             current time
 
         """
-        _compute_internal_forces(
+        _compute_internal_forces_and_torques(
             self.position_collection,
+            self.velocity_collection,
             self.volume,
             self.lengths,
             self.tangents,
@@ -568,6 +588,7 @@ class CosseratRod(RodBase, KnotTheory):
             self.rest_lengths,
             self.rest_voronoi_lengths,
             self.dilatation,
+            self.dilatation_rate,
             self.voronoi_dilatation,
             self.director_collection,
             self.sigma,
@@ -575,28 +596,14 @@ class CosseratRod(RodBase, KnotTheory):
             self.shear_matrix,
             self.internal_stress,
             self.internal_forces,
-            self.ghost_elems_idx,
-        )
-
-        _compute_internal_torques(
-            self.position_collection,
-            self.velocity_collection,
-            self.tangents,
-            self.lengths,
-            self.rest_lengths,
-            self.director_collection,
-            self.rest_voronoi_lengths,
             self.bend_matrix,
-            self.rest_kappa,
             self.kappa,
-            self.voronoi_dilatation,
+            self.rest_kappa,
             self.mass_second_moment_of_inertia,
             self.omega_collection,
-            self.internal_stress,
             self.internal_couple,
-            self.dilatation,
-            self.dilatation_rate,
             self.internal_torques,
+            self.ghost_elems_idx,
             self.ghost_voronoi_idx,
         )
 
@@ -707,9 +714,13 @@ class CosseratRod(RodBase, KnotTheory):
 
 
 # Below is the numba-implementation of Cosserat Rod equations. They don't need to be visible by users.
+# The kernels take optional buffers for their intermediate quantities, so that memory blocks
+# can compute internal loads without allocating (see `_InternalLoadsWorkspace`). They are
+# inlined so that their `prange` loops run in parallel in the parallel builds at the end of
+# this section.
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_geometry_from_state(
     position_collection: NDArray[np.float64],
     volume: NDArray[np.float64],
@@ -724,20 +735,21 @@ def _compute_geometry_from_state(
 
     # Note : we can use the two-point difference kernel, but it needs unnecessary padding
     # and hence will always be slower
-    position_diff = position_difference_kernel(position_collection)
-    # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
-    lengths[:] = _batch_norm(position_diff) + 1e-14
-    # _reset_scalar_ghost(lengths, ghost_elems_idx, 1.0)
-
-    for k in range(lengths.shape[0]):
-        tangents[0, k] = position_diff[0, k] / lengths[k]
-        tangents[1, k] = position_diff[1, k] / lengths[k]
-        tangents[2, k] = position_diff[2, k] / lengths[k]
+    # Position differences are stored in tangents, and normalized below
+    _difference_inlined(position_collection, tangents)
+    _batch_norm_inlined(tangents, lengths)
+
+    for k in numba.prange(lengths.shape[0]):
+        # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
+        lengths[k] += 1e-14
+        tangents[0, k] /= lengths[k]
+        tangents[1, k] /= lengths[k]
+        tangents[2, k] /= lengths[k]
         # resize based on volume conservation
         radius[k] = np.sqrt(volume[k] / lengths[k] / np.pi)
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_all_dilatations(
     position_collection: NDArray[np.float64],
     volume: NDArray[np.float64],
@@ -755,50 +767,54 @@ def _compute_all_dilatations(
     _compute_geometry_from_state(position_collection, volume, lengths, tangents, radius)
     # Caveat : Needs already set rest_lengths and rest voronoi domain lengths
     # Put in initialization
-    for k in range(lengths.shape[0]):
+    for k in numba.prange(lengths.shape[0]):
         dilatation[k] = lengths[k] / rest_lengths[k]
 
     # Cmopute eq (3.4) from 2018 RSOS paper
     # Note : we can use trapezoidal kernel, but it has padding and will be slower
-    voronoi_lengths = position_average(lengths)
+    # Voronoi lengths are stored in voronoi_dilatation, and scaled below
+    _average_inlined(lengths, voronoi_dilatation)
 
     # Cmopute eq (3.45 from 2018 RSOS paper
-    for k in range(voronoi_lengths.shape[0]):
-        voronoi_dilatation[k] = voronoi_lengths[k] / rest_voronoi_lengths[k]
+    for k in numba.prange(voronoi_dilatation.shape[0]):
+        voronoi_dilatation[k] /= rest_voronoi_lengths[k]
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_dilatation_rate(
     position_collection: NDArray[np.float64],
     velocity_collection: NDArray[np.float64],
     lengths: NDArray[np.float64],
     rest_lengths: NDArray[np.float64],
     dilatation_rate: NDArray[np.float64],
+    r_dot_v: Optional[NDArray[np.float64]] = None,
+    r_plus_one_dot_v: Optional[NDArray[np.float64]] = None,
 ) -> None:
     """
     Update dilatation_rate given position, velocity, length, and rest_length
     """
     # TODO Use the vector formula rather than separating it out
     # self.lengths = l_i = |r^{i+1} - r^{i}|
-    r_dot_v = _batch_dot(position_collection, velocity_collection)
-    r_plus_one_dot_v = _batch_dot(
-        position_collection[..., 1:], velocity_collection[..., :-1]
+    r_dot_v = _batch_dot_inlined(position_collection, velocity_collection, r_dot_v)
+    r_plus_one_dot_v = _batch_dot_inlined(
+        position_collection[..., 1:], velocity_collection[..., :-1], r_plus_one_dot_v
     )
-    r_dot_v_plus_one = _batch_dot(
-        position_collection[..., :-1], velocity_collection[..., 1:]
+    # r_dot_v_plus_one is stored in dilatation_rate
+    _batch_dot_inlined(
+        position_collection[..., :-1], velocity_collection[..., 1:], dilatation_rate
     )
 
     blocksize = lengths.shape[0]
 
-    for k in range(blocksize):
+    for k in numba.prange(blocksize):
         dilatation_rate[k] = (
-            (r_dot_v[k] + r_dot_v[k + 1] - r_dot_v_plus_one[k] - r_plus_one_dot_v[k])
+            (r_dot_v[k] + r_dot_v[k + 1] - dilatation_rate[k] - r_plus_one_dot_v[k])
             / lengths[k]
             / rest_lengths[k]
         )
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_shear_stretch_strains(
     position_collection: NDArray[np.float64],
     volume: NDArray[np.float64],
@@ -829,11 +845,14 @@ def _compute_shear_stretch_strains(
         voronoi_dilatation,
     )
 
-    z_vector = np.array([0.0, 0.0, 1.0]).reshape(3, -1)
-    sigma[:] = dilatation * _batch_matvec(director_collection, tangents) - z_vector
+    _batch_matvec_inlined(director_collection, tangents, sigma)
+    for k in numba.prange(sigma.shape[1]):
+        sigma[0, k] = dilatation[k] * sigma[0, k]
+        sigma[1, k] = dilatation[k] * sigma[1, k]
+        sigma[2, k] = dilatation[k] * sigma[2, k] - 1.0
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_internal_shear_stretch_stresses_from_model(
     position_collection: NDArray[np.float64],
     volume: NDArray[np.float64],
@@ -849,6 +868,7 @@ def _compute_internal_shear_stretch_stresses_from_model(
     rest_sigma: NDArray[np.float64],
     shear_matrix: NDArray[np.float64],
     internal_stress: NDArray[np.float64],
+    sigma_difference: Optional[NDArray[np.float64]] = None,
 ) -> None:
     """
     Update <internal stress> given <shear matrix, sigma, and rest_sigma>.
@@ -870,10 +890,18 @@ def _compute_internal_shear_stretch_stresses_from_model(
         director_collection,
         sigma,
     )
-    internal_stress[:] = _batch_matvec(shear_matrix, sigma - rest_sigma)
 
+    blocksize = sigma.shape[1]
+    if sigma_difference is None:
+        sigma_difference = np.empty((3, blocksize))
+    for k in numba.prange(blocksize):
+        for i in range(3):
+            sigma_difference[i, k] = sigma[i, k] - rest_sigma[i, k]
 
-@numba.njit(cache=True)  # type: ignore
+    _batch_matvec_inlined(shear_matrix, sigma_difference, internal_stress)
+
+
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_bending_twist_strains(
     director_collection: NDArray[np.float64],
     rest_voronoi_lengths: NDArray[np.float64],
@@ -882,15 +910,15 @@ def _compute_bending_twist_strains(
     """
     Update <curvature/twist (kappa)> given <director and rest_voronoi_length>.
     """
-    temp = _inv_rotate(director_collection)
+    _inv_rotate_inlined(director_collection, kappa)
     blocksize = rest_voronoi_lengths.shape[0]
-    for k in range(blocksize):
-        kappa[0, k] = temp[0, k] / rest_voronoi_lengths[k]
-        kappa[1, k] = temp[1, k] / rest_voronoi_lengths[k]
-        kappa[2, k] = temp[2, k] / rest_voronoi_lengths[k]
+    for k in numba.prange(blocksize):
+        kappa[0, k] /= rest_voronoi_lengths[k]
+        kappa[1, k] /= rest_voronoi_lengths[k]
+        kappa[2, k] /= rest_voronoi_lengths[k]
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_internal_bending_twist_stresses_from_model(
     director_collection: NDArray[np.float64],
     rest_voronoi_lengths: NDArray[np.float64],
@@ -898,6 +926,7 @@ def _compute_internal_bending_twist_stresses_from_model(
     bend_matrix: NDArray[np.float64],
     kappa: NDArray[np.float64],
     rest_kappa: NDArray[np.float64],
+    kappa_difference: Optional[NDArray[np.float64]] = None,
 ) -> None:
     """
     Upate <internal couple> given <curvature(kappa) and bend_matrix>.
@@ -911,15 +940,16 @@ def _compute_internal_bending_twist_stresses_from_model(
     )  # concept : needs to compute kappa
 
     blocksize = kappa.shape[1]
-    temp = np.empty((3, blocksize))
-    for i in range(3):
-        for k in range(blocksize):
-            temp[i, k] = kappa[i, k] - rest_kappa[i, k]
+    if kappa_difference is None:
+        kappa_difference = np.empty((3, blocksize))
+    for k in numba.prange(blocksize):
+        for i in range(3):
+            kappa_difference[i, k] = kappa[i, k] - rest_kappa[i, k]
 
-    internal_couple[:] = _batch_matvec(bend_matrix, temp)
+    _batch_matvec_inlined(bend_matrix, kappa_difference, internal_couple)
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_internal_forces(
     position_collection: NDArray[np.float64],
     volume: NDArray[np.float64],
@@ -937,6 +967,8 @@ def _compute_internal_forces(
     internal_stress: NDArray[np.float64],
     internal_forces: NDArray[np.float64],
     ghost_elems_idx: NDArray[np.float64],
+    sigma_difference: Optional[NDArray[np.float64]] = None,
+    cosserat_internal_stress: Optional[NDArray[np.float64]] = None,
 ) -> None:
     """
     Update <internal force> given <director, internal_stress and velocity>.
@@ -959,28 +991,29 @@ def _compute_internal_forces(
         rest_sigma,
         shear_matrix,
         internal_stress,
+        sigma_difference,
     )
 
     # Signifies Q^T n_L / e
     # Not using batch matvec as I don't want to take directors.T here
 
     blocksize = internal_stress.shape[1]
-    cosserat_internal_stress = np.zeros((3, blocksize))
+    if cosserat_internal_stress is None:
+        cosserat_internal_stress = np.empty((3, blocksize))
 
     for i in range(3):
-        for j in range(3):
-            for k in range(blocksize):
-                cosserat_internal_stress[i, k] += (
-                    director_collection[j, i, k] * internal_stress[j, k]
-                )
-
-    cosserat_internal_stress /= dilatation
-    internal_forces[:] = difference_kernel_for_block_structure(
-        cosserat_internal_stress, ghost_elems_idx
+        for k in numba.prange(blocksize):
+            material_stress = 0.0
+            for j in range(3):
+                material_stress += director_collection[j, i, k] * internal_stress[j, k]
+            cosserat_internal_stress[i, k] = material_stress / dilatation[k]
+
+    _difference_kernel_for_block_structure_inlined(
+        cosserat_internal_stress, ghost_elems_idx, internal_forces
     )
 
 
-@numba.njit(cache=True)  # type: ignore
+@numba.njit(cache=True, inline="always")  # type: ignore
 def _compute_internal_torques(
     position_collection: NDArray[np.float64],
     velocity_collection: NDArray[np.float64],
@@ -1001,6 +1034,17 @@ def _compute_internal_torques(
     dilatation_rate: NDArray[np.float64],
     internal_torques: NDArray[np.float64],
     ghost_voronoi_idx: NDArray[np.int32],
+    kappa_difference: Optional[NDArray[np.float64]] = None,
+    r_dot_v: Optional[NDArray[np.float64]] = None,
+    r_plus_one_dot_v: Optional[NDArray[np.float64]] = None,
+    voronoi_dilatation_inv_cube_cached: Optional[NDArray[np.float64]] = None,
+    scaled_internal_couple: Optional[NDArray[np.float64]] = None,
+    scaled_kappa_cross_internal_couple: Optional[NDArray[np.float64]] = None,
+    bend_twist_couple_3D: Optional[NDArray[np.float64]] = None,
+    material_tangents: Optional[NDArray[np.float64]] = None,
+    shear_stretch_couple: Optional[NDArray[np.float64]] = None,
+    J_omega_upon_e: Optional[NDArray[np.float64]] = None,
+    lagrangian_transport: Optional[NDArray[np.float64]] = None,
 ) -> None:
     """
     Update <internal torque>.
@@ -1014,61 +1058,200 @@ def _compute_internal_torques(
         bend_matrix,
         kappa,
         rest_kappa,
+        kappa_difference,
     )
     # Compute dilatation rate when needed, dilatation itself is done before
     # in internal_stresses
     _compute_dilatation_rate(
-        position_collection, velocity_collection, lengths, rest_lengths, dilatation_rate
+        position_collection,
+        velocity_collection,
+        lengths,
+        rest_lengths,
+        dilatation_rate,
+        r_dot_v,
+        r_plus_one_dot_v,
     )
 
-    # FIXME: change memory overload instead for the below calls!
-    voronoi_dilatation_inv_cube_cached = 1.0 / voronoi_dilatation**3
+    n_elems = internal_torques.shape[1]
+    n_voronoi = voronoi_dilatation.shape[0]
+    if voronoi_dilatation_inv_cube_cached is None:
+        voronoi_dilatation_inv_cube_cached = np.empty((n_voronoi))
+    if scaled_internal_couple is None:
+        scaled_internal_couple = np.empty((3, n_voronoi))
+    if scaled_kappa_cross_internal_couple is None:
+        scaled_kappa_cross_internal_couple = np.empty((3, n_voronoi))
+    if bend_twist_couple_3D is None:
+        bend_twist_couple_3D = np.empty((3, n_elems))
+    if material_tangents is None:
+        material_tangents = np.empty((3, n_elems))
+    if shear_stretch_couple is None:
+        shear_stretch_couple = np.empty((3, n_elems))
+    if J_omega_upon_e is None:
+        J_omega_upon_e = np.empty((3, n_elems))
+    if lagrangian_transport is None:
+        lagrangian_transport = np.empty((3, n_elems))
+
+    for k in numba.prange(n_voronoi):
+        voronoi_dilatation_inv_cube_cached[k] = 1.0 / voronoi_dilatation[k] ** 3
+        for i in range(3):
+            scaled_internal_couple[i, k] = (
+                internal_couple[i, k] * voronoi_dilatation_inv_cube_cached[k]
+            )
     # Delta(\tau_L / \Epsilon^3)
-    bend_twist_couple_2D = difference_kernel_for_block_structure(
-        internal_couple * voronoi_dilatation_inv_cube_cached, ghost_voronoi_idx
+    # Stored in internal_torques, the other couples are added to it below
+    _difference_kernel_for_block_structure_inlined(
+        scaled_internal_couple, ghost_voronoi_idx, internal_torques
     )
     # \mathcal{A}[ (\kappa x \tau_L ) * \hat{D} / \Epsilon^3 ]
-    bend_twist_couple_3D = quadrature_kernel_for_block_structure(
-        _batch_cross(kappa, internal_couple)
-        * rest_voronoi_lengths
-        * voronoi_dilatation_inv_cube_cached,
-        ghost_voronoi_idx,
+    _batch_cross_inlined(kappa, internal_couple, scaled_kappa_cross_internal_couple)
+    for k in numba.prange(n_voronoi):
+        for i in range(3):
+            scaled_kappa_cross_internal_couple[i, k] = (
+                scaled_kappa_cross_internal_couple[i, k]
+                * rest_voronoi_lengths[k]
+                * voronoi_dilatation_inv_cube_cached[k]
+            )
+    _quadrature_kernel_for_block_structure_inlined(
+        scaled_kappa_cross_internal_couple, ghost_voronoi_idx, bend_twist_couple_3D
     )
     # (Qt x n_L) * \hat{l}
-    shear_stretch_couple = (
-        _batch_cross(_batch_matvec(director_collection, tangents), internal_stress)
-        * rest_lengths
-    )
+    _batch_matvec_inlined(director_collection, tangents, material_tangents)
+    _batch_cross_inlined(material_tangents, internal_stress, shear_stretch_couple)
+    for k in numba.prange(n_elems):
+        for i in range(3):
+            shear_stretch_couple[i, k] *= rest_lengths[k]
 
     # I apply common sub expression elimination here, as J w / e is used in both the lagrangian and dilatation
     # terms
     # TODO : the _batch_matvec kernel needs to depend on the representation of J, and should be coded as such
-    J_omega_upon_e = (
-        _batch_matvec(mass_second_moment_of_inertia, omega_collection) / dilatation
+    _batch_matvec_inlined(
+        mass_second_moment_of_inertia, omega_collection, J_omega_upon_e
     )
+    for k in numba.prange(n_elems):
+        for i in range(3):
+            J_omega_upon_e[i, k] /= dilatation[k]
 
     # (J \omega_L / e) x \omega_L
     # Warning : Do not do micro-optimization here : you can ignore dividing by dilatation as we later multiply by it
     # but this causes confusion and violates SRP
-    lagrangian_transport = _batch_cross(J_omega_upon_e, omega_collection)
+    _batch_cross_inlined(J_omega_upon_e, omega_collection, lagrangian_transport)
 
     # Note : in the computation of dilatation_rate, there is an optimization opportunity as dilatation rate has
     # a dilatation-like term in the numerator, which we cancel here
-    # (J \omega_L / e^2) . (de/dt)
-    unsteady_dilatation = J_omega_upon_e * dilatation_rate / dilatation
-
-    blocksize = internal_torques.shape[1]
-    for i in range(3):
-        for k in range(blocksize):
+    # (J \omega_L / e^2) . (de/dt) is the unsteady dilatation term
+    for k in numba.prange(n_elems):
+        for i in range(3):
             internal_torques[i, k] = (
-                bend_twist_couple_2D[i, k]
+                internal_torques[i, k]
                 + bend_twist_couple_3D[i, k]
                 + shear_stretch_couple[i, k]
                 + lagrangian_transport[i, k]
-                + unsteady_dilatation[i, k]
+                + J_omega_upon_e[i, k] * dilatation_rate[k] / dilatation[k]
             )
 
 
+@numba.njit(cache=True, inline="always")  # type: ignore
+def _compute_internal_forces_and_torques(
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    volume: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    rest_lengths: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    dilatation_rate: NDArray[np.float64],
+    voronoi_dilatation: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    sigma: NDArray[np.float64],
+    rest_sigma: NDArray[np.float64],
+    shear_matrix: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    bend_matrix: NDArray[np.float64],
+    kappa: NDArray[np.float64],
+    rest_kappa: NDArray[np.float64],
+    mass_second_moment_of_inertia: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    internal_couple: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    ghost_elems_idx: NDArray[np.int32],
+    ghost_voronoi_idx: NDArray[np.int32],
+    sigma_difference: Optional[NDArray[np.float64]] = None,
+    cosserat_internal_stress: Optional[NDArray[np.float64]] = None,
+    kappa_difference: Optional[NDArray[np.float64]] = None,
+    r_dot_v: Optional[NDArray[np.float64]] = None,
+    r_plus_one_dot_v: Optional[NDArray[np.float64]] = None,
+    voronoi_dilatation_inv_cube_cached: Optional[NDArray[np.float64]] = None,
+    scaled_internal_couple: Optional[NDArray[np.float64]] = None,
+    scaled_kappa_cross_internal_couple: Optional[NDArray[np.float64]] = None,
+    bend_twist_couple_3D: Optional[NDArray[np.float64]] = None,
+    material_tangents: Optional[NDArray[np.float64]] = None,
+    shear_stretch_couple: Optional[NDArray[np.float64]] = None,
+    J_omega_upon_e: Optional[NDArray[np.float64]] = None,
+    lagrangian_transport: Optional[NDArray[np.float64]] = None,
+) -> None:
+    """
+    Update <internal force and internal torque> in a single compiled call.
+    Internal torques use the geometry and internal stress computed for the forces.
+    The optional buffers hold intermediate quantities; they are allocated when not given.
+    """
+    _compute_internal_forces(
+        position_collection,
+        volume,
+        lengths,
+        tangents,
+        radius,
+        rest_lengths,
+        rest_voronoi_lengths,
+        dilatation,
+        voronoi_dilatation,
+        director_collection,
+        sigma,
+        rest_sigma,
+        shear_matrix,
+        internal_stress,
+        internal_forces,
+        ghost_elems_idx,
+        sigma_difference,
+        cosserat_internal_stress,
+    )
+
+    _compute_internal_torques(
+        position_collection,
+        velocity_collection,
+        tangents,
+        lengths,
+        rest_lengths,
+        director_collection,
+        rest_voronoi_lengths,
+        bend_matrix,
+        rest_kappa,
+        kappa,
+        voronoi_dilatation,
+        mass_second_moment_of_inertia,
+        omega_collection,
+        internal_stress,
+        internal_couple,
+        dilatation,
+        dilatation_rate,
+        internal_torques,
+        ghost_voronoi_idx,
+        kappa_difference,
+        r_dot_v,
+        r_plus_one_dot_v,
+        voronoi_dilatation_inv_cube_cached,
+        scaled_internal_couple,
+        scaled_kappa_cross_internal_couple,
+        bend_twist_couple_3D,
+        material_tangents,
+        shear_stretch_couple,
+        J_omega_upon_e,
+        lagrangian_transport,
+    )
+
+
 @numba.njit(cache=True)  # type: ignore
 def _update_accelerations(
     acceleration_collection: NDArray[np.float64],
@@ -1104,6 +1287,64 @@ def _update_accelerations(
                 ) * dilatation[k]
 
 
+@numba.njit(cache=True)  # type: ignore
+def _update_accelerations_and_rates(
+    prefac: np.float64,
+    acceleration_collection: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+    mass: NDArray[np.float64],
+    alpha_collection: NDArray[np.float64],
+    inv_mass_second_moment_of_inertia: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+) -> None:
+    """
+    Update <acceleration and angular acceleration> and advance
+    <velocity and angular velocity> by prefac * <acceleration and angular acceleration>.
+
+    Fuses `_update_accelerations` and the symplectic dynamic update, (v,ω) += prefac * (dv/dt, dω/dt),
+    with the same order of floating point operations.
+    """
+
+    blocksize_acc = internal_forces.shape[1]
+    blocksize_alpha = internal_torques.shape[1]
+
+    for k in numba.prange(blocksize_acc):
+        for i in range(3):
+            acceleration_collection[i, k] = (
+                internal_forces[i, k] + external_forces[i, k]
+            ) / mass[k]
+            velocity_collection[i, k] += prefac * acceleration_collection[i, k]
+
+    for k in numba.prange(blocksize_alpha):
+        for i in range(3):
+            alpha = 0.0
+            for j in range(3):
+                alpha += (
+                    inv_mass_second_moment_of_inertia[i, j, k]
+                    * (internal_torques[j, k] + external_torques[j, k])
+                ) * dilatation[k]
+            alpha_collection[i, k] = alpha
+            omega_collection[i, k] += prefac * alpha
+
+
+# Multithreaded variants of the memory block kernels, selected with
+# `finalize(parallel=True)`. They share the source of the serial kernels, whose
+# `prange` loops (including those of the inlined kernels) only run in parallel here.
+# They are compiled on first use and not cached, since numba's cache index does not
+# distinguish two compilations of the same function with different flags.
+_compute_internal_forces_and_torques_parallel = numba.njit(parallel=True)(
+    _compute_internal_forces_and_torques.py_func
+)
+_update_accelerations_and_rates_parallel = numba.njit(parallel=True)(
+    _update_accelerations_and_rates.py_func
+)
+
+
 @numba.njit(cache=True)  # type: ignore
 def _zeroed_out_external_forces_and_torques(
     external_forces: NDArray[np.float64], external_torques: NDArray[np.float64]
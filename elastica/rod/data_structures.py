@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 from typing_extensions import Self
 import numpy as np
 from numpy.typing import NDArray
-from numba import njit
+from numba import njit, prange
 from elastica._rotations import _get_rotation_matrix, _rotate
 from elastica._linalg import _batch_matmul
 
@@ -75,6 +75,37 @@ class _RodSymplecticStepperMixin:
         self.update_accelerations(time)
         return self.dynamic_states.dynamic_rates(time, prefac)
 
+    def update_kinematic_states(
+        self: SymplecticSystemProtocol,
+        time: np.float64,
+        prefac: np.float64,
+    ) -> None:
+        """
+        Advance the positions and directors, (x,Q) += prefac * (v,ω).
+        """
+        overload_operator_kinematic_numba(
+            self.n_nodes,
+            prefac,
+            self.kinematic_states.position_collection,
+            self.kinematic_states.director_collection,
+            self.velocity_collection,
+            self.omega_collection,
+        )
+
+    def update_dynamic_states(
+        self: SymplecticSystemProtocol,
+        time: np.float64,
+        prefac: np.float64,
+    ) -> None:
+        """
+        Update the accelerations and advance the rates, (v,ω) += prefac * (dv/dt, dω/dt).
+        Systems with a compiled kernel for both operations can override this method.
+        """
+        overload_operator_dynamic_numba(
+            self.dynamic_states.rate_collection,
+            self.dynamic_rates(time, prefac),
+        )
+
 
 def _bootstrap_from_data(
     stepper_type: str,
@@ -455,15 +486,58 @@ def overload_operator_kinematic_numba(
     method
     """
     # x += v*dt
-    for i in range(3):
-        for k in range(n_nodes):
+    for k in prange(n_nodes):
+        for i in range(3):
             position_collection[i, k] += prefac * velocity_collection[i, k]
-    rotation_matrix = _get_rotation_matrix(1.0, prefac * omega_collection)
-    director_collection[:] = _batch_matmul(rotation_matrix, director_collection)
+
+    # Q = R(ω*dt) Q
+    # Same arithmetic as _batch_matmul(_get_rotation_matrix(1.0, prefac * ω), Q),
+    # but the rotation is done element by element, on scalars, to avoid allocating
+    # the (3, 3, n_elems) rotation and product collections at every stage.
+    blocksize = director_collection.shape[2]
+    for k in prange(blocksize):
+        v0 = prefac * omega_collection[0, k]
+        v1 = prefac * omega_collection[1, k]
+        v2 = prefac * omega_collection[2, k]
+
+        theta = np.sqrt(v0 * v0 + v1 * v1 + v2 * v2)
+
+        v0 /= theta + 1e-14
+        v1 /= theta + 1e-14
+        v2 /= theta + 1e-14
+
+        u_prefix = np.sin(theta)
+        u_sq_prefix = 1.0 - np.cos(theta)
+
+        r00 = 1.0 - u_sq_prefix * (v1 * v1 + v2 * v2)
+        r11 = 1.0 - u_sq_prefix * (v0 * v0 + v2 * v2)
+        r22 = 1.0 - u_sq_prefix * (v0 * v0 + v1 * v1)
+
+        r01 = u_prefix * v2 + u_sq_prefix * v0 * v1
+        r10 = -u_prefix * v2 + u_sq_prefix * v0 * v1
+        r02 = -u_prefix * v1 + u_sq_prefix * v0 * v2
+        r20 = u_prefix * v1 + u_sq_prefix * v0 * v2
+        r12 = u_prefix * v0 + u_sq_prefix * v1 * v2
+        r21 = -u_prefix * v0 + u_sq_prefix * v1 * v2
+
+        for m in range(3):
+            d0 = director_collection[0, m, k]
+            d1 = director_collection[1, m, k]
+            d2 = director_collection[2, m, k]
+            director_collection[0, m, k] = 0.0 + r00 * d0 + r01 * d1 + r02 * d2
+            director_collection[1, m, k] = 0.0 + r10 * d0 + r11 * d1 + r12 * d2
+            director_collection[2, m, k] = 0.0 + r20 * d0 + r21 * d1 + r22 * d2
 
     return
 
 
+# Multithreaded variant, selected with `finalize(parallel=True)`. Compiled on first
+# use and not cached, see `_compute_internal_forces_and_torques_parallel`.
+overload_operator_kinematic_numba_parallel = njit(parallel=True)(
+    overload_operator_kinematic_numba.py_func
+)
+
+
 class _DynamicState:
     """State storing (v,ω, dv/dt, dω/dt) for symplectic steppers.
 
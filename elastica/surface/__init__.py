@@ -1,3 +1,5 @@
 __doc__ = """Surface classes"""
 from elastica.surface.surface_base import SurfaceBase
 from elastica.surface.plane import Plane
+from elastica.surface.signed_distance_field import SignedDistanceField
+from elastica.surface.heightfield import Heightfield
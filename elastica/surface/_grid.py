@@ -0,0 +1,18 @@
+__doc__ = """Kernels shared by the surfaces sampled on regular grids"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, inline="always")  # type: ignore
+def _grid_cell(
+    x: np.float64, origin: np.float64, inv_spacing: np.float64, n: int
+) -> tuple[int, np.float64, np.float64]:
+    """
+    Index of the cell along an axis, fraction of the cell before x, and distance from
+    x to the grid along the axis.
+    """
+    u = (x - origin) * inv_spacing
+    clamped = min(max(u, 0.0), n - 1.0)
+    index = min(int(clamped), n - 2)
+    return index, clamped - index, (u - clamped) / inv_spacing
@@ -0,0 +1,270 @@
+__doc__ = """Terrain surface given by heights sampled on a regular 2D grid"""
+
+from typing import Callable
+
+import numba
+import numpy as np
+from numpy.typing import NDArray
+
+from elastica.surface.surface_base import SurfaceBase
+from elastica.surface._grid import _grid_cell
+
+
+class Heightfield(SurfaceBase):
+    """
+    Terrain given by its height above a regular 2D grid, e.g. the uneven ground of a
+    snake or locomotion simulation. The grid spans the two axes other than the up
+    axis, in increasing order: x and y for the default up axis z, x and z for the up
+    axis y. Surface normals are computed once at the grid points, from central
+    differences of the heights; height and normal at any point are interpolated
+    bilinearly from the 4 grid points around it, so a lookup costs the same for any
+    grid size. Points outside the grid see the terrain at the closest border.
+
+    Attributes
+    ----------
+    heights: numpy.ndarray
+        2D (n_u, n_v) array containing data with 'float' type.
+        Height of the terrain at the grid points, relative to the origin.
+    normals: numpy.ndarray
+        3D (n_u, n_v, 3) array containing data with 'float' type.
+        Unit normal of the terrain at the grid points, pointing up.
+    origin: numpy.ndarray
+        2D (3, 1) array containing data with 'float' type.
+        Position of the grid point (0, 0) at height zero.
+    spacing: numpy.ndarray
+        1D (2,) array containing data with 'float' type.
+        Distance between grid points along the two axes of the grid.
+    up_axis: int
+        Axis along which heights are measured.
+    """
+
+    def __init__(
+        self,
+        heights: NDArray[np.float64],
+        origin: NDArray[np.float64],
+        spacing: "float | NDArray[np.float64]",
+        up_axis: int = 2,
+    ) -> None:
+        """
+        Heightfield initializer.
+
+        Parameters
+        ----------
+        heights: np.ndarray
+            Height of the terrain at the grid points, along the up axis.
+            Expect (n_u, n_v)-shaped array, with at least 2 points per axis.
+        origin: np.ndarray
+            Position of the grid point (0, 0) at height zero.
+            Expect (3,) or (3,1)-shaped array.
+        spacing: float | np.ndarray
+            Distance between grid points, the same along both axes or one per axis.
+        up_axis: int
+            Axis along which heights are measured, 0, 1 or 2.
+        """
+        super().__init__()
+        heights = np.asarray(heights, dtype=np.float64)
+        if heights.ndim != 2 or min(heights.shape) < 2:
+            raise ValueError(
+                "The heights must be 2D with at least 2 points per axis, got "
+                "shape {}.".format(heights.shape)
+            )
+        spacing = np.broadcast_to(np.asarray(spacing, dtype=np.float64), (2,)).copy()
+        if np.any(spacing <= 0.0):
+            raise ValueError(
+                "The grid spacing must be positive, got {}.".format(spacing)
+            )
+        if up_axis not in (0, 1, 2):
+            raise ValueError("The up axis must be 0, 1 or 2, got {}.".format(up_axis))
+
+        self.heights = np.ascontiguousarray(heights)
+        self.origin = np.asarray(origin, dtype=np.float64).reshape(3, 1)
+        self.spacing = spacing
+        self.up_axis = int(up_axis)
+        self.grid_axes = np.array(
+            [axis for axis in range(3) if axis != self.up_axis], dtype=np.int64
+        )
+        self.normals = self._compute_normals()
+
+    @classmethod
+    def from_function(
+        cls,
+        function: Callable[
+            [NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]
+        ],
+        lower: NDArray[np.float64],
+        upper: NDArray[np.float64],
+        spacing: float,
+        up_axis: int = 2,
+    ) -> "Heightfield":
+        """
+        Samples a height function on a grid covering the rectangle from lower to
+        upper.
+
+        Parameters
+        ----------
+        function: Callable
+            Height at the grid coordinates, (u, v) -> height, with u and v arrays of
+            the same shape, e.g. `lambda x, y: 0.1 * np.sin(x)`.
+        lower: np.ndarray
+            Lower corner of the grid, in the grid axes. Expect (2,)-shaped array.
+        upper: np.ndarray
+            Upper corner of the grid, rounded up to a whole number of grid spacings.
+            Expect (2,)-shaped array.
+        spacing: float
+            Distance between grid points.
+        up_axis: int
+            Axis along which heights are measured, 0, 1 or 2.
+
+        Returns
+        -------
+        Heightfield
+        """
+        lower = np.asarray(lower, dtype=np.float64)
+        n_points = (
+            np.maximum(
+                np.ceil((np.asarray(upper, dtype=np.float64) - lower) / spacing - 1e-9),
+                1,
+            ).astype(np.int64)
+            + 1
+        )
+        u, v = np.meshgrid(
+            lower[0] + spacing * np.arange(n_points[0]),
+            lower[1] + spacing * np.arange(n_points[1]),
+            indexing="ij",
+        )
+        heights = np.asarray(function(u, v), dtype=np.float64).reshape(u.shape)
+        origin = np.zeros(3)
+        origin[[axis for axis in range(3) if axis != up_axis]] = lower
+        return cls(heights, origin, spacing, up_axis)
+
+    def _compute_normals(self) -> NDArray[np.float64]:
+        """Unit normals (n_u, n_v, 3) at the grid points"""
+        slope_u, slope_v = np.gradient(self.heights, *self.spacing, edge_order=1)
+        normals = np.zeros(self.heights.shape + (3,))
+        normals[..., self.grid_axes[0]] = -slope_u
+        normals[..., self.grid_axes[1]] = -slope_v
+        normals[..., self.up_axis] = 1.0
+        normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+        return np.ascontiguousarray(normals)
+
+    def evaluate(
+        self, points: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Interpolated height of the terrain and unit normal below the points.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Expect (3, n)-shaped array.
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64]]
+            Position of the terrain along the up axis (n,) and normal (3, n) below
+            the points.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        height = np.empty(points.shape[1])
+        normal = np.empty((3, points.shape[1]))
+        _evaluate_heightfield(
+            self.heights,
+            self.normals,
+            self.origin[:, 0],
+            1.0 / self.spacing,
+            self.grid_axes,
+            self.up_axis,
+            points,
+            height,
+            normal,
+        )
+        return height, normal
+
+
+@numba.njit(cache=True)  # type: ignore
+def _heightfield_bilinear(
+    heights: NDArray[np.float64],
+    normals: NDArray[np.float64],
+    origin_u: np.float64,
+    origin_v: np.float64,
+    inv_spacing_u: np.float64,
+    inv_spacing_v: np.float64,
+    u: np.float64,
+    v: np.float64,
+) -> tuple[np.float64, np.float64, np.float64, np.float64]:
+    """
+    Height of the terrain, relative to the origin, and unit normal at the grid
+    coordinates (u, v), interpolated bilinearly. Points outside the grid are moved to
+    the closest border. Taking and returning scalars keeps the lookup free of array
+    views in the loops over elements.
+    """
+    i0, fu, _ = _grid_cell(u, origin_u, inv_spacing_u, heights.shape[0])
+    j0, fv, _ = _grid_cell(v, origin_v, inv_spacing_v, heights.shape[1])
+    w00 = (1.0 - fu) * (1.0 - fv)
+    w10 = fu * (1.0 - fv)
+    w01 = (1.0 - fu) * fv
+    w11 = fu * fv
+
+    normal_0 = (
+        w00 * normals[i0, j0, 0]
+        + w10 * normals[i0 + 1, j0, 0]
+        + w01 * normals[i0, j0 + 1, 0]
+        + w11 * normals[i0 + 1, j0 + 1, 0]
+    )
+    normal_1 = (
+        w00 * normals[i0, j0, 1]
+        + w10 * normals[i0 + 1, j0, 1]
+        + w01 * normals[i0, j0 + 1, 1]
+        + w11 * normals[i0 + 1, j0 + 1, 1]
+    )
+    normal_2 = (
+        w00 * normals[i0, j0, 2]
+        + w10 * normals[i0 + 1, j0, 2]
+        + w01 * normals[i0, j0 + 1, 2]
+        + w11 * normals[i0 + 1, j0 + 1, 2]
+    )
+    inv_normal_norm = 1.0 / np.sqrt(
+        normal_0 * normal_0 + normal_1 * normal_1 + normal_2 * normal_2
+    )
+    height = (
+        w00 * heights[i0, j0]
+        + w10 * heights[i0 + 1, j0]
+        + w01 * heights[i0, j0 + 1]
+        + w11 * heights[i0 + 1, j0 + 1]
+    )
+    return (
+        height,
+        normal_0 * inv_normal_norm,
+        normal_1 * inv_normal_norm,
+        normal_2 * inv_normal_norm,
+    )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _evaluate_heightfield(
+    heights: NDArray[np.float64],
+    normals: NDArray[np.float64],
+    origin: NDArray[np.float64],
+    inv_spacing: NDArray[np.float64],
+    grid_axes: NDArray[np.int64],
+    up_axis: int,
+    points: NDArray[np.float64],
+    height_out: NDArray[np.float64],
+    normal_out: NDArray[np.float64],
+) -> None:
+    axis_u = grid_axes[0]
+    axis_v = grid_axes[1]
+    for k in range(points.shape[1]):
+        height, normal_out[0, k], normal_out[1, k], normal_out[2, k] = (
+            _heightfield_bilinear(
+                heights,
+                normals,
+                origin[axis_u],
+                origin[axis_v],
+                inv_spacing[0],
+                inv_spacing[1],
+                points[axis_u, k],
+                points[axis_v, k],
+            )
+        )
+        height_out[k] = origin[up_axis] + height
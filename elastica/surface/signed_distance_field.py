@@ -0,0 +1,401 @@
+__doc__ = """Surface given by a signed distance field sampled on a grid"""
+
+from typing import Any, Callable
+
+import numba
+import numpy as np
+from numpy.typing import NDArray
+
+from elastica.collision.AABBCollection import FaceAABBHierarchy
+from elastica.surface.surface_base import SurfaceBase
+from elastica.surface._grid import _grid_cell
+
+
+class SignedDistanceField(SurfaceBase):
+    """
+    Static obstacle given by its signed distance field, sampled on a regular grid:
+    negative inside the obstacle, positive outside. Distance and gradient at any
+    point are interpolated trilinearly from the 8 grid points around it, so the cost
+    of a lookup does not depend on the complexity of the obstacle. Points outside the
+    grid are given the value at the closest point of the grid plus their distance to
+    the grid.
+
+    Grids are built from a function (see `from_function` and the primitives
+    `sphere_distance`, `box_distance` and `capsule_distance`) or from a closed mesh
+    (see `from_mesh`).
+
+    Attributes
+    ----------
+    distance: numpy.ndarray
+        3D (n_x, n_y, n_z) array containing data with 'float' type.
+        Signed distance at the grid points.
+    origin: numpy.ndarray
+        2D (3, 1) array containing data with 'float' type.
+        Position of the grid point (0, 0, 0).
+    spacing: numpy.ndarray
+        1D (3,) array containing data with 'float' type.
+        Distance between grid points along each axis.
+    """
+
+    def __init__(
+        self,
+        distance: NDArray[np.float64],
+        origin: NDArray[np.float64],
+        spacing: "float | NDArray[np.float64]",
+    ) -> None:
+        """
+        Signed distance field initializer.
+
+        Parameters
+        ----------
+        distance: np.ndarray
+            Signed distance at the grid points, negative inside the obstacle.
+            Expect (n_x, n_y, n_z)-shaped array, with at least 2 points per axis.
+        origin: np.ndarray
+            Position of the grid point (0, 0, 0).
+            Expect (3,) or (3,1)-shaped array.
+        spacing: float | np.ndarray
+            Distance between grid points, the same along every axis or one per axis.
+        """
+        super().__init__()
+        distance = np.asarray(distance, dtype=np.float64)
+        if distance.ndim != 3 or min(distance.shape) < 2:
+            raise ValueError(
+                "The distance grid must be 3D with at least 2 points per axis, got "
+                "shape {}.".format(distance.shape)
+            )
+        spacing = np.broadcast_to(np.asarray(spacing, dtype=np.float64), (3,)).copy()
+        if np.any(spacing <= 0.0):
+            raise ValueError(
+                "The grid spacing must be positive, got {}.".format(spacing)
+            )
+
+        self.distance = np.ascontiguousarray(distance)
+        self.origin = np.asarray(origin, dtype=np.float64).reshape(3, 1)
+        self.spacing = spacing
+
+    @classmethod
+    def from_function(
+        cls,
+        function: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+        lower: NDArray[np.float64],
+        upper: NDArray[np.float64],
+        spacing: float,
+    ) -> "SignedDistanceField":
+        """
+        Samples an analytical signed distance function on a grid covering the box
+        from lower to upper.
+
+        Parameters
+        ----------
+        function: Callable
+            Signed distance of an array of points, (3, n) -> (n,), e.g.
+            `lambda x: sphere_distance(x, center, radius)`. Unions of obstacles are
+            the minimum of their distances; the free space inside an obstacle, e.g. a
+            pipe lumen, is its opposite.
+        lower: np.ndarray
+            Lower corner of the grid. Expect (3,)-shaped array.
+        upper: np.ndarray
+            Upper corner of the grid, rounded up to a whole number of grid spacings.
+            Expect (3,)-shaped array.
+        spacing: float
+            Distance between grid points.
+
+        Returns
+        -------
+        SignedDistanceField
+        """
+        points, shape = _grid_points(lower, upper, spacing)
+        distance = np.asarray(function(points), dtype=np.float64).reshape(shape)
+        return cls(distance, np.asarray(lower, dtype=np.float64), spacing)
+
+    @classmethod
+    def from_mesh(
+        cls,
+        mesh: Any,
+        spacing: float,
+        padding: float = 0.0,
+    ) -> "SignedDistanceField":
+        """
+        Computes the signed distance to a closed mesh with outward face normals, on a
+        grid covering the mesh. The distance at each grid point is the distance to
+        the closest face, found with a `FaceAABBHierarchy`. Its sign is the side the
+        point lies on of the angle-weighted pseudo-normal [1]_ at the closest point:
+        the face normal inside a face, the sum of the normals of the two faces
+        sharing an edge on an edge, and the normals of the faces around a vertex
+        weighted by their angle at the vertex on a vertex. The normal of the closest
+        face alone gives the wrong sign where the closest point is on an edge or a
+        vertex of the mesh. Vertices are shared between faces by their coordinates.
+
+        Parameters
+        ----------
+        mesh: Mesh
+            Mesh with `faces` (3, 3, n_faces) and `face_normals` (3, n_faces), e.g.
+            `elastica.Mesh`.
+        spacing: float
+            Distance between grid points.
+        padding: float
+            Margin added around the bounding box of the mesh.
+
+        Returns
+        -------
+        SignedDistanceField
+
+        References
+        ----------
+        .. [1] Baerentzen, J. A., Aanaes, H. (2005). Signed distance computation using
+            the angle weighted pseudonormal. IEEE Transactions on Visualization and
+            Computer Graphics, 11(3), 243-253.
+        """
+        faces = np.asarray(mesh.faces, dtype=np.float64)
+        lower = faces.min(axis=(1, 2)) - padding
+        upper = faces.max(axis=(1, 2)) + padding
+        points, shape = _grid_points(lower, upper, spacing)
+
+        hierarchy = FaceAABBHierarchy(faces)
+        face_normals = np.asarray(mesh.face_normals, dtype=np.float64)[
+            :, hierarchy.face_order
+        ]
+        closest_face, closest_point = hierarchy.closest_faces(points)
+        offset = points - closest_point
+        distance = np.linalg.norm(offset, axis=0)
+        normals = _closest_point_pseudo_normals(
+            hierarchy.faces, face_normals, closest_face, closest_point
+        )
+        inside = np.einsum("ik,ik->k", offset, normals) < 0.0
+        distance[inside] *= -1.0
+        return cls(distance.reshape(shape), lower, spacing)
+
+    def evaluate(
+        self, points: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Interpolated signed distance and its gradient at the points.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Expect (3, n)-shaped array.
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64]]
+            Signed distance (n,) and gradient (3, n) at the points.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        distance = np.empty(points.shape[1])
+        gradient = np.empty((3, points.shape[1]))
+        _evaluate_sdf(
+            self.distance,
+            self.origin[:, 0],
+            1.0 / self.spacing,
+            points,
+            distance,
+            gradient,
+        )
+        return distance, gradient
+
+
+def _grid_points(
+    lower: NDArray[np.float64], upper: NDArray[np.float64], spacing: float
+) -> tuple[NDArray[np.float64], tuple[int, int, int]]:
+    """Points (3, n) of the grid from lower to upper, in C order, and grid shape"""
+    lower = np.asarray(lower, dtype=np.float64)
+    n_points = (
+        np.maximum(
+            np.ceil((np.asarray(upper, dtype=np.float64) - lower) / spacing - 1e-9), 1
+        ).astype(np.int64)
+        + 1
+    )
+    axes = [lower[i] + spacing * np.arange(n_points[i]) for i in range(3)]
+    grid = np.meshgrid(*axes, indexing="ij")
+    shape = (int(n_points[0]), int(n_points[1]), int(n_points[2]))
+    return np.vstack([axis.ravel() for axis in grid]), shape
+
+
+def _closest_point_pseudo_normals(
+    faces: NDArray[np.float64],
+    face_normals: NDArray[np.float64],
+    closest_face: NDArray[np.int64],
+    closest_point: NDArray[np.float64],
+    tolerance: float = 1e-8,
+) -> NDArray[np.float64]:
+    """
+    Angle-weighted pseudo-normals (3, n) of the mesh at points lying on its faces.
+
+    A point is on the edge opposite to a corner of its face when its barycentric
+    coordinate for that corner is below the tolerance, and on a vertex when two of
+    its barycentric coordinates are.
+    """
+    n_faces = faces.shape[2]
+    # Weld the corners of the faces into vertices by their coordinates
+    corners = faces.transpose(2, 1, 0).reshape(-1, 3)
+    _, vertex_index = np.unique(corners, axis=0, return_inverse=True)
+    vertex_index = vertex_index.reshape(n_faces, 3)
+
+    # Vertex pseudo-normals, weighted by the angle of each face at the vertex
+    vertex_normals = np.zeros((vertex_index.max() + 1, 3))
+    for corner in range(3):
+        first = faces[:, (corner + 1) % 3] - faces[:, corner]
+        second = faces[:, (corner + 2) % 3] - faces[:, corner]
+        cosine = np.einsum("ik,ik->k", first, second) / (
+            np.linalg.norm(first, axis=0) * np.linalg.norm(second, axis=0)
+        )
+        angle = np.arccos(np.clip(cosine, -1.0, 1.0))
+        np.add.at(vertex_normals, vertex_index[:, corner], (angle * face_normals).T)
+
+    # Edge pseudo-normals; edge `corner` of a face is opposite to that corner
+    edges = np.sort(
+        np.stack(
+            [vertex_index[:, [(c + 1) % 3, (c + 2) % 3]] for c in range(3)], axis=1
+        ),
+        axis=2,
+    ).reshape(-1, 2)
+    _, edge_index = np.unique(edges, axis=0, return_inverse=True)
+    edge_index = edge_index.reshape(n_faces, 3)
+    edge_normals = np.zeros((edge_index.max() + 1, 3))
+    for corner in range(3):
+        np.add.at(edge_normals, edge_index[:, corner], face_normals.T)
+
+    # Barycentric coordinates of the points in their faces
+    face_corners = faces[..., closest_face]
+    first = face_corners[:, 1] - face_corners[:, 0]
+    second = face_corners[:, 2] - face_corners[:, 0]
+    relative = closest_point - face_corners[:, 0]
+    d00 = np.einsum("ik,ik->k", first, first)
+    d01 = np.einsum("ik,ik->k", first, second)
+    d11 = np.einsum("ik,ik->k", second, second)
+    d20 = np.einsum("ik,ik->k", relative, first)
+    d21 = np.einsum("ik,ik->k", relative, second)
+    denominator = d00 * d11 - d01 * d01
+    barycentric = np.empty((3, closest_face.shape[0]))
+    barycentric[1] = (d11 * d20 - d01 * d21) / denominator
+    barycentric[2] = (d00 * d21 - d01 * d20) / denominator
+    barycentric[0] = 1.0 - barycentric[1] - barycentric[2]
+    on_edge = barycentric < tolerance
+    n_on_edge = on_edge.sum(axis=0)
+
+    normals = face_normals[:, closest_face].copy()
+    edge_points = np.flatnonzero(n_on_edge == 1)
+    corner = np.argmax(on_edge[:, edge_points], axis=0)
+    normals[:, edge_points] = edge_normals[
+        edge_index[closest_face[edge_points], corner]
+    ].T
+    vertex_points = np.flatnonzero(n_on_edge == 2)
+    corner = np.argmin(on_edge[:, vertex_points], axis=0)
+    normals[:, vertex_points] = vertex_normals[
+        vertex_index[closest_face[vertex_points], corner]
+    ].T
+    return normals
+
+
+def sphere_distance(
+    points: NDArray[np.float64], center: NDArray[np.float64], radius: float
+) -> NDArray[np.float64]:
+    """Signed distance of the points (3, n) to a sphere"""
+    return np.linalg.norm(points - np.reshape(center, (3, 1)), axis=0) - radius
+
+
+def box_distance(
+    points: NDArray[np.float64],
+    center: NDArray[np.float64],
+    half_extents: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Signed distance of the points (3, n) to an axis aligned box"""
+    q = np.abs(points - np.reshape(center, (3, 1))) - np.reshape(half_extents, (3, 1))
+    outside = np.linalg.norm(np.maximum(q, 0.0), axis=0)
+    inside = np.minimum(q.max(axis=0), 0.0)
+    return outside + inside
+
+
+def capsule_distance(
+    points: NDArray[np.float64],
+    start: NDArray[np.float64],
+    end: NDArray[np.float64],
+    radius: float,
+) -> NDArray[np.float64]:
+    """
+    Signed distance of the points (3, n) to a capsule, the points closer than radius
+    to the segment from start to end
+    """
+    start = np.reshape(start, (3, 1))
+    axis = np.reshape(end, (3, 1)) - start
+    t = np.clip(
+        np.einsum("ik,i->k", points - start, axis[:, 0])
+        / np.dot(axis[:, 0], axis[:, 0]),
+        0.0,
+        1.0,
+    )
+    return np.linalg.norm(points - start - t * axis, axis=0) - radius
+
+
+@numba.njit(cache=True)  # type: ignore
+def _sdf_trilinear(
+    distance: NDArray[np.float64],
+    origin: NDArray[np.float64],
+    inv_spacing: NDArray[np.float64],
+    point: NDArray[np.float64],
+    gradient: NDArray[np.float64],
+) -> np.float64:
+    """
+    Signed distance at the point, interpolated trilinearly, with its gradient stored
+    in gradient. Points outside the grid are moved to the closest point of the grid,
+    and their distance to it is added to the value.
+    """
+    i0, fx, excess_x = _grid_cell(
+        point[0], origin[0], inv_spacing[0], distance.shape[0]
+    )
+    j0, fy, excess_y = _grid_cell(
+        point[1], origin[1], inv_spacing[1], distance.shape[1]
+    )
+    k0, fz, excess_z = _grid_cell(
+        point[2], origin[2], inv_spacing[2], distance.shape[2]
+    )
+    excess_squared = excess_x * excess_x + excess_y * excess_y + excess_z * excess_z
+    c000 = distance[i0, j0, k0]
+    c100 = distance[i0 + 1, j0, k0]
+    c010 = distance[i0, j0 + 1, k0]
+    c110 = distance[i0 + 1, j0 + 1, k0]
+    c001 = distance[i0, j0, k0 + 1]
+    c101 = distance[i0 + 1, j0, k0 + 1]
+    c011 = distance[i0, j0 + 1, k0 + 1]
+    c111 = distance[i0 + 1, j0 + 1, k0 + 1]
+
+    # Along x, then y, then z
+    c00 = c000 + fx * (c100 - c000)
+    c10 = c010 + fx * (c110 - c010)
+    c01 = c001 + fx * (c101 - c001)
+    c11 = c011 + fx * (c111 - c011)
+    c0 = c00 + fy * (c10 - c00)
+    c1 = c01 + fy * (c11 - c01)
+    value = c0 + fz * (c1 - c0)
+
+    # Derivatives of the interpolation with respect to the fractions
+    dx00 = c100 - c000
+    dx10 = c110 - c010
+    dx01 = c101 - c001
+    dx11 = c111 - c011
+    dx0 = dx00 + fy * (dx10 - dx00)
+    dx1 = dx01 + fy * (dx11 - dx01)
+    gradient[0] = (dx0 + fz * (dx1 - dx0)) * inv_spacing[0]
+    gradient[1] = ((c10 - c00) + fz * ((c11 - c01) - (c10 - c00))) * inv_spacing[1]
+    gradient[2] = (c1 - c0) * inv_spacing[2]
+
+    return value + np.sqrt(excess_squared)
+
+
+@numba.njit(cache=True)  # type: ignore
+def _evaluate_sdf(
+    distance: NDArray[np.float64],
+    origin: NDArray[np.float64],
+    inv_spacing: NDArray[np.float64],
+    points: NDArray[np.float64],
+    distance_out: NDArray[np.float64],
+    gradient_out: NDArray[np.float64],
+) -> None:
+    gradient = np.empty(3)
+    for k in range(points.shape[1]):
+        distance_out[k] = _sdf_trilinear(
+            distance, origin, inv_spacing, points[:, k], gradient
+        )
+        gradient_out[:, k] = gradient
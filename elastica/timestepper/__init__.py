@@ -1,6 +1,6 @@
 __doc__ = """Timestepping utilities to be used with Rod and RigidBody classes"""
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional
 from elastica.typing import SystemCollectionType, SteppersOperatorsType
 
 import numpy as np
@@ -10,6 +10,9 @@ from elastica.systems import is_system_a_collection
 
 from .protocol import StepperProtocol
 
+if TYPE_CHECKING:
+    from elastica.restart import AsyncCheckpointer
+
 
 # Deprecated: Remove in the future version
 # Many script still uses this method to control timestep. Keep it for backward compatibility
@@ -36,6 +39,7 @@ def integrate(
     n_steps: int = 1000,
     restart_time: float = 0.0,
     progress_bar: bool = True,
+    checkpointer: Optional["AsyncCheckpointer"] = None,
 ) -> float:
     """
 
@@ -53,6 +57,15 @@ def integrate(
         The timestamp of the first integration step. (default: 0.0)
     progress_bar : bool
         Toggle the tqdm progress bar. (default: True)
+    checkpointer : Optional[AsyncCheckpointer]
+        If given, checkpoints are taken after each step and written on a background
+        thread. Steps are counted from time 0, i.e. the first step of this call is
+        step round(restart_time / dt) + 1, so that a resumed run continues the
+        numbering of the checkpoints instead of overwriting them. All checkpoints are
+        written when the function returns. The checkpointer is not closed, so it can
+        be passed to further calls; call its `close` method, or use it in a `with`
+        statement, once the simulation is done. Only supported for system
+        collections. (default: None)
     """
     assert final_time > 0.0, "Final time is negative!"
     assert n_steps > 0, "Number of integration steps is negative!"
@@ -61,9 +74,21 @@ def integrate(
     time = np.float64(restart_time)
 
     if is_system_a_collection(systems):
-        for i in tqdm(range(n_steps), disable=(not progress_bar)):
-            time = stepper.step(systems, time, dt)
+        if checkpointer is None:
+            for i in tqdm(range(n_steps), disable=(not progress_bar)):
+                time = stepper.step(systems, time, dt)
+        else:
+            start_step = int(round(restart_time / dt))
+            for i in tqdm(range(n_steps), disable=(not progress_bar)):
+                time = stepper.step(systems, time, dt)
+                checkpointer.make_checkpoint(time, start_step + i + 1)
+            checkpointer.flush()
     else:
+        if checkpointer is not None:
+            raise TypeError(
+                "Checkpoints can only be taken of a system collection, "
+                f"got {type(systems).__name__}."
+            )
         # Typing is ignored since this part only exist for unit-testing
         for i in tqdm(range(n_steps), disable=(not progress_bar)):
             time = stepper.step_single_instance(systems, time, dt)  # type: ignore[arg-type]
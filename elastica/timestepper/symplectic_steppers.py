@@ -28,6 +28,50 @@ is referred to the same section on `explicit_steppers.py`.
 """
 
 
+def _update_kinematic_states(
+    System: SymplecticSystemProtocol, time: np.float64, prefac: np.float64
+) -> None:
+    """
+    (x,Q) += prefac * (v,ω)
+
+    Systems providing `update_kinematic_states`, such as rods and memory blocks,
+    advance their own states. Other systems implementing `SymplecticSystemProtocol`
+    use the default kernel.
+    """
+    update_kinematic_states = getattr(System, "update_kinematic_states", None)
+    if update_kinematic_states is not None:
+        update_kinematic_states(time, prefac)
+    else:
+        overload_operator_kinematic_numba(
+            System.n_nodes,
+            prefac,
+            System.kinematic_states.position_collection,
+            System.kinematic_states.director_collection,
+            System.velocity_collection,
+            System.omega_collection,
+        )
+
+
+def _update_dynamic_states(
+    System: SymplecticSystemProtocol, time: np.float64, prefac: np.float64
+) -> None:
+    """
+    (v,ω) += prefac * (dv/dt, dω/dt)
+
+    Systems providing `update_dynamic_states`, such as rods and memory blocks,
+    advance their own states. Other systems implementing `SymplecticSystemProtocol`
+    go through `dynamic_rates`.
+    """
+    update_dynamic_states = getattr(System, "update_dynamic_states", None)
+    if update_dynamic_states is not None:
+        update_dynamic_states(time, prefac)
+    else:
+        overload_operator_dynamic_numba(
+            System.dynamic_states.rate_collection,
+            System.dynamic_rates(time, prefac),
+        )
+
+
 class SymplecticStepperMixin:
     def __init__(self: SymplecticStepperProtocol):
         self.steps_and_prefactors: SteppersOperatorsType = self.step_methods()
@@ -181,22 +225,12 @@ class PositionVerlet(SymplecticStepperMixin):
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
         prefac = self._first_prefactor(dt)
-        overload_operator_kinematic_numba(
-            System.n_nodes,
-            prefac,
-            System.kinematic_states.position_collection,
-            System.kinematic_states.director_collection,
-            System.velocity_collection,
-            System.omega_collection,
-        )
+        _update_kinematic_states(System, time, prefac)
 
     def _first_dynamic_step(
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
-        overload_operator_dynamic_numba(
-            System.dynamic_states.rate_collection,
-            System.dynamic_rates(time, dt),
-        )
+        _update_dynamic_states(System, time, dt)
 
 
 class PEFRL(SymplecticStepperMixin):
@@ -241,24 +275,14 @@ class PEFRL(SymplecticStepperMixin):
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
         prefac = self._first_kinematic_prefactor(dt)
-        overload_operator_kinematic_numba(
-            System.n_nodes,
-            prefac,
-            System.kinematic_states.position_collection,
-            System.kinematic_states.director_collection,
-            System.velocity_collection,
-            System.omega_collection,
-        )
+        _update_kinematic_states(System, time, prefac)
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
 
     def _first_dynamic_step(
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
         prefac = self.lambda_dash_coeff * dt
-        overload_operator_dynamic_numba(
-            System.dynamic_states.rate_collection,
-            System.dynamic_rates(time, prefac),
-        )
+        _update_dynamic_states(System, time, prefac)
         # System.dynamic_states += prefac * System.dynamic_rates(time, prefac)
 
     def _second_kinematic_prefactor(self, dt: np.float64) -> np.float64:
@@ -268,24 +292,14 @@ class PEFRL(SymplecticStepperMixin):
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
         prefac = self._second_kinematic_prefactor(dt)
-        overload_operator_kinematic_numba(
-            System.n_nodes,
-            prefac,
-            System.kinematic_states.position_collection,
-            System.kinematic_states.director_collection,
-            System.velocity_collection,
-            System.omega_collection,
-        )
+        _update_kinematic_states(System, time, prefac)
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
 
     def _second_dynamic_step(
         self, System: SymplecticSystemProtocol, time: np.float64, dt: np.float64
     ) -> None:
         prefac = self.λ * dt
-        overload_operator_dynamic_numba(
-            System.dynamic_states.rate_collection,
-            System.dynamic_rates(time, prefac),
-        )
+        _update_dynamic_states(System, time, prefac)
         # System.dynamic_states += prefac * System.dynamic_rates(time, prefac)
 
     def _third_kinematic_prefactor(self, dt: np.float64) -> np.float64:
@@ -296,12 +310,5 @@ class PEFRL(SymplecticStepperMixin):
     ) -> None:
         prefac = self._third_kinematic_prefactor(dt)
         # Need to fill in
-        overload_operator_kinematic_numba(
-            System.n_nodes,
-            prefac,
-            System.kinematic_states.position_collection,
-            System.kinematic_states.director_collection,
-            System.velocity_collection,
-            System.omega_collection,
-        )
+        _update_kinematic_states(System, time, prefac)
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
@@ -226,3 +226,37 @@ def __bspline_impl__(  # type: ignore[no-any-unimported]
     knots_updated[n_upd - (degree) :] = x_pts[-1]
 
     return BSpline(knots_updated, t_c, degree, extrapolate=False), x_pts, t_c
+
+
+def block_ranges(
+    block: Any, system_indices: NDArray[np.int32]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Range of nodes and range of elements of each system in the arrays of a memory
+    block, as start and end indices. A rigid body has one node and one element.
+
+    Parameters
+    ----------
+    block: MemoryBlockCosseratRod or MemoryBlockRigidBody
+    system_indices: NDArray[np.int32]
+        Indices of the systems in the memory block.
+
+    Returns
+    -------
+    tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]
+        Start and end of the nodes, start and end of the elements of each system.
+    """
+    system_indices = np.asarray(system_indices, dtype=np.int64)
+    if not hasattr(block, "start_idx_in_rod_nodes"):
+        return (
+            system_indices,
+            system_indices + 1,
+            system_indices,
+            system_indices + 1,
+        )
+    return (
+        block.start_idx_in_rod_nodes[system_indices].astype(np.int64),
+        block.end_idx_in_rod_nodes[system_indices].astype(np.int64),
+        block.start_idx_in_rod_elems[system_indices].astype(np.int64),
+        block.end_idx_in_rod_elems[system_indices].astype(np.int64),
+    )
@@ -5,7 +5,13 @@ import os
 import logging
 import numpy as np
 from numpy.testing import assert_allclose
-from elastica.callback_functions import CallBackBaseClass, MyCallBack, ExportCallBack
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    MyCallBack,
+    ExportCallBack,
+    RecorderCallBack,
+    BlockRecorderCallBack,
+)
 from elastica.utils import Tolerance
 import tempfile
 import pytest
@@ -102,6 +108,185 @@ class TestMyCallBackClass:
         )
 
 
+class TestRecorderCallBackClass:
+    @staticmethod
+    def record(recorder, mock_rod, n_steps):
+        expected = {"time": [], "step": [], "position_collection": []}
+        for step in range(n_steps):
+            mock_rod.position_collection[:] = np.random.rand(
+                *mock_rod.position_collection.shape
+            )
+            time = np.float64(0.1 * step)
+            recorder.make_callback(mock_rod, time, step)
+            if step % recorder.step_skip == 0:
+                expected["time"].append(time)
+                expected["step"].append(step)
+                expected["position_collection"].append(
+                    mock_rod.position_collection.copy()
+                )
+        return expected
+
+    @pytest.mark.parametrize("step_skip", [1, 3])
+    def test_recorder_call_back(self, step_skip):
+        mock_rod = MockRodWithElements(5)
+        recorder = RecorderCallBack(
+            step_skip,
+            final_time=2.0,
+            time_step=0.1,
+            fields=("position_collection", "director_collection"),
+        )
+        assert recorder.capacity == 20 // step_skip + 1
+
+        expected = self.record(recorder, mock_rod, 21)
+
+        for name in ("time", "step", "position_collection"):
+            np.testing.assert_array_equal(recorder.history(name), expected[name])
+        assert recorder.history("director_collection").shape == (
+            recorder.capacity,
+            3,
+            3,
+            5,
+        )
+        assert set(recorder.as_dict()) == {
+            "time",
+            "step",
+            "position_collection",
+            "director_collection",
+        }
+
+    def test_recorder_call_back_history_is_a_view(self):
+        mock_rod = MockRodWithElements(5)
+        recorder = RecorderCallBack(1, capacity=4, fields=("position_collection",))
+        self.record(recorder, mock_rod, 2)
+        history = recorder.history("position_collection")
+
+        assert history.shape == (2, 3, 5)
+        assert np.shares_memory(history, recorder.history("position_collection"))
+        assert np.shares_memory(
+            recorder.history("position_collection"),
+            recorder.as_dict()["position_collection"],
+        )
+
+    def test_recorder_call_back_full(self, caplog):
+        mock_rod = MockRodWithElements(5)
+        recorder = RecorderCallBack(1, capacity=3, fields=("position_collection",))
+        with caplog.at_level(logging.WARNING):
+            expected = self.record(recorder, mock_rod, 6)
+
+        assert "RecorderCallBack is full" in caplog.text
+        assert recorder.n_samples == 6
+        np.testing.assert_array_equal(
+            recorder.history("position_collection"),
+            expected["position_collection"][:3],
+        )
+
+    @pytest.mark.parametrize("n_steps", [2, 4, 11])
+    def test_recorder_call_back_ring_buffer(self, n_steps):
+        mock_rod = MockRodWithElements(5)
+        recorder = RecorderCallBack(
+            1, capacity=4, fields=("position_collection",), ring_buffer=True
+        )
+        expected = self.record(recorder, mock_rod, n_steps)
+
+        for name in ("time", "step", "position_collection"):
+            np.testing.assert_array_equal(recorder.history(name), expected[name][-4:])
+        assert recorder.history("position_collection").flags.c_contiguous
+
+    def test_recorder_call_back_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RecorderCallBack(1)
+        with pytest.raises(ValueError):
+            RecorderCallBack(1, capacity=0)
+        recorder = RecorderCallBack(1, capacity=2)
+        with pytest.raises(KeyError):
+            recorder.history("external_forces")
+
+
+class TestBlockRecorderCallBackClass:
+    @staticmethod
+    def build(step_skip):
+        import elastica as ea
+        from elastica.memory_block import MemoryBlockCosseratRod, MemoryBlockRigidBody
+
+        class Simulator(ea.BaseSystemCollection, ea.Forcing, ea.CallBacks):
+            pass
+
+        simulator = Simulator()
+        rods = []
+        for n_elements in (3, 5):
+            rod = ea.CosseratRod.straight_rod(
+                n_elements=n_elements,
+                start=np.random.rand(3),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.1,
+                density=1000.0,
+                youngs_modulus=1e5,
+            )
+            simulator.append(rod)
+            simulator.add_forcing_to(rod).using(
+                ea.GravityForces, acc_gravity=np.array([-9.81, 0.0, 0.0])
+            )
+            rods.append(rod)
+        sphere = ea.Sphere(center=np.zeros(3), base_radius=0.1, density=1000.0)
+        simulator.append(sphere)
+        simulator.add_forcing_to(sphere).using(
+            ea.GravityForces, acc_gravity=np.array([-9.81, 0.0, 0.0])
+        )
+
+        fields = ("position_collection", "director_collection", "kappa")
+        rod_recorder = simulator.collect_block_diagnostics(
+            MemoryBlockCosseratRod
+        ).using(BlockRecorderCallBack, step_skip, capacity=10, fields=fields)
+        rod_recorders = [
+            simulator.collect_diagnostics(rod).using(
+                RecorderCallBack, step_skip, capacity=10, fields=fields
+            )
+            for rod in rods
+        ]
+        body_recorder = simulator.collect_block_diagnostics(MemoryBlockRigidBody).using(
+            BlockRecorderCallBack,
+            step_skip,
+            capacity=10,
+            fields=("position_collection", "director_collection"),
+        )
+        simulator.finalize()
+        return simulator, rods, sphere, rod_recorder, rod_recorders, body_recorder
+
+    @pytest.mark.parametrize("step_skip", [1, 2])
+    def test_block_recorder_call_back(self, step_skip):
+        import elastica as ea
+
+        simulator, rods, sphere, rod_recorder, rod_recorders, body_recorder = (
+            self.build(step_skip)
+        )
+        ea.integrate(ea.PositionVerlet(), simulator, 1e-3, 6, progress_bar=False)
+
+        block_recorder = rod_recorder.instance
+        assert block_recorder.n_samples == 6 // step_skip + 1
+        for rod, recorder in zip(rods, rod_recorders):
+            sys_idx = simulator.get_system_index(rod)
+            for name in ("position_collection", "director_collection", "kappa"):
+                history = block_recorder.system_history(name, sys_idx)
+                assert np.shares_memory(history, block_recorder.history(name))
+                np.testing.assert_array_equal(history, recorder.instance.history(name))
+
+        sys_idx = simulator.get_system_index(sphere)
+        history = body_recorder.instance.system_history("position_collection", sys_idx)
+        assert history.shape == (6 // step_skip + 1, 3, 1)
+        np.testing.assert_array_equal(history[-1], sphere.position_collection)
+
+    def test_block_recorder_call_back_unknown_system(self):
+        simulator, rods, sphere, rod_recorder, rod_recorders, body_recorder = (
+            self.build(1)
+        )
+        with pytest.raises(KeyError):
+            rod_recorder.instance.system_history(
+                "position_collection", simulator.get_system_index(sphere)
+            )
+
+
 class TestExportCallBackClass:
     @pytest.mark.parametrize("method", ["0", 1, "numba", "test", "some string", None])
     def test_export_call_back_unavailable_save_methods(self, tmp_path, method):
@@ -0,0 +1,665 @@
+__doc__ = """ Test broad phases of contact among many rods """
+
+import numpy as np
+import pytest
+
+import elastica as ea
+from elastica.collision.AABBCollection import AABBHierarchy, FaceAABBHierarchy
+from elastica.contact_utils import _closest_point_on_triangle
+from elastica.contact_broad_phase import (
+    AABBHierarchyBroadPhase,
+    BroadPhase,
+    SweepAndPruneBroadPhase,
+    UniformGridBroadPhase,
+    VerletListBroadPhase,
+)
+
+
+def brute_force_pairs(positions, reach):
+    n = positions.shape[1]
+    pairs = set()
+    for p in range(n):
+        for q in range(p + 1, n):
+            if np.linalg.norm(positions[:, p] - positions[:, q]) < reach[p] + reach[q]:
+                pairs.add((p, q))
+    return pairs
+
+
+def random_elements(n, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-1.0, 1.0, (3, n))
+    reach = rng.uniform(0.01, 0.1, n)
+    return positions, reach
+
+
+def make_broad_phases():
+    return [
+        UniformGridBroadPhase(),
+        UniformGridBroadPhase(cell_size=0.5),
+        AABBHierarchyBroadPhase(),
+        AABBHierarchyBroadPhase(elements_per_leaf=1),
+        SweepAndPruneBroadPhase(),
+        SweepAndPruneBroadPhase(axis=2),
+        VerletListBroadPhase(skin=0.05),
+        VerletListBroadPhase(skin=0.05, broad_phase=AABBHierarchyBroadPhase()),
+    ]
+
+
+BROAD_PHASES = make_broad_phases()
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES)
+@pytest.mark.parametrize("n", [0, 1, 2, 50, 400])
+def test_broad_phase_finds_all_pairs(broad_phase, n):
+    positions, reach = random_elements(n)
+
+    first, second = broad_phase.find_pairs(positions, reach)
+
+    assert np.all(first < second)
+    found = set(zip(first.tolist(), second.tolist()))
+    assert len(found) == first.shape[0]
+    assert brute_force_pairs(positions, reach) <= found
+
+
+@pytest.mark.parametrize("outlier", [False, True])
+def test_uniform_grid_on_packed_elements(outlier):
+    """Packed elements number their cells densely, unless an outlier spreads them"""
+    rng = np.random.default_rng(0)
+    k = np.arange(512)
+    positions = np.vstack([k % 8, (k // 8) % 8, k // 64]) * 0.019
+    positions += rng.uniform(-1e-3, 1e-3, positions.shape)
+    if outlier:
+        positions[:, -1] = 100.0
+    reach = np.full(512, 0.01)
+
+    first, second = UniformGridBroadPhase().find_pairs(positions, reach)
+
+    assert np.all(first < second)
+    found = set(zip(first.tolist(), second.tolist()))
+    assert len(found) == first.shape[0]
+    assert found == brute_force_pairs(positions, reach)
+
+
+@pytest.mark.parametrize("n", [1, 3, 50, 1000])
+@pytest.mark.parametrize("elements_per_leaf", [1, 4])
+def test_aabb_hierarchy_overlapping_leaves(n, elements_per_leaf):
+    positions, reach = random_elements(n)
+    dimensions = np.vstack([reach, reach, reach])
+    hierarchy = AABBHierarchy(positions, dimensions, elements_per_leaf)
+    # Refit for moved elements
+    positions = positions[:, ::-1].copy()
+    hierarchy.refit(positions, dimensions)
+
+    leaf_start = hierarchy.leaf_start
+    n_leaves = leaf_start.shape[0] - 1
+    assert leaf_start[-1] == n
+    assert np.all(np.diff(leaf_start) > 0)
+    boxes = hierarchy.boxes
+    for leaf in range(n_leaves):
+        start, stop = leaf_start[leaf], leaf_start[leaf + 1]
+        np.testing.assert_allclose(
+            boxes[:, 0, -n_leaves + leaf],
+            positions[:, start:stop].min(axis=1) - dimensions[:, start:stop].max(),
+        )
+    for node in range(boxes.shape[2] - n_leaves):
+        children = boxes[..., 4 * node + 1 : 4 * node + 5]
+        np.testing.assert_array_equal(boxes[:, 0, node], children[:, 0].min(axis=1))
+        np.testing.assert_array_equal(boxes[:, 1, node], children[:, 1].max(axis=1))
+
+    leaves = boxes[..., -n_leaves:]
+    expected = {
+        (a, b)
+        for a in range(n_leaves)
+        for b in range(a, n_leaves)
+        if np.all(leaves[:, 0, a] <= leaves[:, 1, b])
+        and np.all(leaves[:, 0, b] <= leaves[:, 1, a])
+    }
+    first, second = hierarchy.find_overlapping_leaves()
+    assert set(zip(first.tolist(), second.tolist())) == expected
+    assert first.shape[0] == len(expected)
+
+
+def test_aabb_hierarchy_broad_phase_with_illegal_leaf_size_throws():
+    with pytest.raises(ValueError, match="elements per leaf"):
+        AABBHierarchyBroadPhase(elements_per_leaf=0)
+
+
+@pytest.mark.parametrize("n_faces", [1, 7, 2000])
+@pytest.mark.parametrize("faces_per_leaf", [1, 4])
+def test_face_aabb_hierarchy_query(n_faces, faces_per_leaf):
+    rng = np.random.default_rng(0)
+    faces = rng.uniform(-1.0, 1.0, (3, 1, n_faces)) + 0.05 * rng.normal(
+        size=(3, 3, n_faces)
+    )
+    hierarchy = FaceAABBHierarchy(faces, faces_per_leaf)
+
+    assert sorted(hierarchy.face_order.tolist()) == list(range(n_faces))
+    np.testing.assert_array_equal(hierarchy.faces, faces[..., hierarchy.face_order])
+    leaves = hierarchy.first_child < 0
+    assert np.all(
+        hierarchy.face_stop[leaves] - hierarchy.face_start[leaves] <= faces_per_leaf
+    )
+    # Every box holds the faces of its node
+    for node in range(hierarchy.boxes.shape[2]):
+        node_faces = hierarchy.faces[
+            ..., hierarchy.face_start[node] : hierarchy.face_stop[node]
+        ]
+        np.testing.assert_array_equal(
+            hierarchy.boxes[:, 0, node], node_faces.min(axis=(1, 2))
+        )
+        np.testing.assert_array_equal(
+            hierarchy.boxes[:, 1, node], node_faces.max(axis=(1, 2))
+        )
+
+    face_lower = hierarchy.faces.min(axis=1)
+    face_upper = hierarchy.faces.max(axis=1)
+    for _ in range(20):
+        lower = rng.uniform(-1.0, 1.0, 3)
+        upper = lower + rng.uniform(0.0, 0.3, 3)
+        found = hierarchy.query(lower, upper)
+        overlapping = np.all(
+            (face_lower <= upper[:, np.newaxis]) & (lower[:, np.newaxis] <= face_upper),
+            axis=0,
+        )
+        assert set(np.flatnonzero(overlapping).tolist()) <= set(found.tolist())
+        assert np.unique(found).shape[0] == found.shape[0]
+
+
+def test_face_aabb_hierarchy_closest_faces():
+    rng = np.random.default_rng(1)
+    n_faces = 500
+    faces = rng.uniform(-1.0, 1.0, (3, 1, n_faces)) + 0.1 * rng.normal(
+        size=(3, 3, n_faces)
+    )
+    hierarchy = FaceAABBHierarchy(faces, faces_per_leaf=2)
+    points = rng.uniform(-1.5, 1.5, (3, 50))
+    closest_face, closest_point = hierarchy.closest_faces(points)
+
+    for p in range(points.shape[1]):
+        distances = [
+            np.linalg.norm(
+                _closest_point_on_triangle(
+                    points[:, p], *(hierarchy.faces[:, m, k] for m in range(3))
+                )
+                - points[:, p]
+            )
+            for k in range(n_faces)
+        ]
+        assert np.linalg.norm(closest_point[:, p] - points[:, p]) == pytest.approx(
+            min(distances)
+        )
+        assert distances[closest_face[p]] == pytest.approx(min(distances))
+
+
+def test_face_aabb_hierarchy_with_illegal_leaf_size_throws():
+    with pytest.raises(ValueError, match="faces per leaf"):
+        FaceAABBHierarchy(np.zeros((3, 3, 4)), faces_per_leaf=0)
+
+
+def test_sweep_and_prune_sorts_again_with_few_swaps():
+    positions, reach = random_elements(400)
+    broad_phase = SweepAndPruneBroadPhase()
+
+    broad_phase.find_pairs(positions, reach)
+    assert broad_phase.n_swaps > 0
+    pairs = broad_phase.find_pairs(positions, reach)
+    assert broad_phase.n_swaps == 0
+
+    moved = positions + np.random.default_rng(1).normal(scale=1e-3, size=(3, 400))
+    first, second = broad_phase.find_pairs(moved, reach)
+    assert 0 < broad_phase.n_swaps < 400
+    found = set(zip(first.tolist(), second.tolist()))
+    assert brute_force_pairs(moved, reach) <= found
+    assert len(found) == first.shape[0]
+    assert pairs[0].shape[0] > 0
+
+
+def test_sweep_and_prune_axis_along_largest_spread():
+    positions, reach = random_elements(50)
+    positions[1] *= 10.0
+    broad_phase = SweepAndPruneBroadPhase()
+
+    broad_phase.find_pairs(positions, reach)
+    assert broad_phase.axis == 1
+
+
+def test_sweep_and_prune_with_illegal_axis_throws():
+    with pytest.raises(ValueError, match="axis"):
+        SweepAndPruneBroadPhase(axis=3)
+
+
+def test_verlet_list_is_reused_until_elements_move_half_the_skin():
+    positions, reach = random_elements(400)
+    broad_phase = VerletListBroadPhase(skin=0.05)
+
+    pairs = broad_phase.find_pairs(positions, reach)
+    moved = positions.copy()
+    moved[0, 7] += 0.02
+    assert broad_phase.find_pairs(moved, reach) is pairs
+    assert broad_phase.n_rebuilds == 1
+    assert broad_phase.n_pairs == pairs[0].shape[0]
+
+    # Each reused list is a superset of the pairs in contact
+    found = set(zip(pairs[0].tolist(), pairs[1].tolist()))
+    assert brute_force_pairs(moved, reach) <= found
+
+    moved[0, 7] += 0.01
+    assert broad_phase.find_pairs(moved, reach) is not pairs
+    assert broad_phase.n_rebuilds == 2
+    assert broad_phase.n_calls == 3
+
+
+def test_verlet_list_is_rebuilt_when_reach_grows():
+    positions, reach = random_elements(50)
+    broad_phase = VerletListBroadPhase(skin=0.05)
+
+    broad_phase.find_pairs(positions, reach)
+    broad_phase.find_pairs(positions, reach + 0.03)
+    assert broad_phase.n_rebuilds == 2
+
+
+@pytest.mark.parametrize("skin", [0.0, -1.0])
+def test_verlet_list_with_illegal_skin_throws(skin):
+    with pytest.raises(ValueError, match="skin"):
+        VerletListBroadPhase(skin=skin)
+
+
+def test_broad_phase_base_class_is_abstract():
+    with pytest.raises(NotImplementedError):
+        BroadPhase().find_pairs(np.zeros((3, 2)), np.ones(2))
+
+
+class RodBundleSimulator(
+    ea.BaseSystemCollection, ea.Constraints, ea.Forcing, ea.Contact, ea.Damping
+):
+    pass
+
+
+def make_rod_bundle(n_rods=5, n_elements=12, ring=False):
+    """Parallel rods closer than their diameter, and one rod crossing them"""
+    simulator = RodBundleSimulator()
+    rods = []
+    for k in range(n_rods):
+        rods.append(
+            ea.CosseratRod.straight_rod(
+                n_elements=n_elements,
+                start=np.array([0.018 * k, 0.0, 0.0]),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=0.5,
+                base_radius=0.01,
+                density=1000.0,
+                youngs_modulus=1e5,
+            )
+        )
+    rods.append(
+        ea.CosseratRod.straight_rod(
+            n_elements=n_elements + 3,
+            start=np.array([-0.1, 0.015, 0.25]),
+            direction=np.array([1.0, 0.0, 0.0]),
+            normal=np.array([0.0, 0.0, 1.0]),
+            base_length=0.3,
+            base_radius=0.01,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+    )
+    if ring:
+        rods.append(
+            ea.CosseratRod.ring_rod(
+                n_elements=n_elements,
+                ring_center_position=np.array([0.04, 0.0, 0.1]),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=0.3,
+                base_radius=0.01,
+                density=1000.0,
+                youngs_modulus=1e5,
+            )
+        )
+    for rod in rods:
+        simulator.append(rod)
+        simulator.add_forcing_to(rod).using(
+            ea.GravityForces, acc_gravity=np.array([-9.81, 0.0, 0.0])
+        )
+        simulator.dampen(rod).using(
+            ea.AnalyticalLinearDamper, damping_constant=0.1, time_step=1e-4
+        )
+    return simulator, rods
+
+
+def run(simulator, n_steps=40):
+    stepper = ea.PositionVerlet()
+    do_step, stages_and_updates = ea.extend_stepper_interface(stepper, simulator)
+    time = np.float64(0.0)
+    for _ in range(n_steps):
+        time = do_step(stepper, stages_and_updates, simulator, time, np.float64(1e-4))
+
+
+@pytest.mark.parametrize("ring", [False, True])
+@pytest.mark.parametrize("broad_phase", [None] + make_broad_phases())
+def test_contact_among_matches_pairwise_contact(ring, broad_phase):
+    pairwise, pairwise_rods = make_rod_bundle(ring=ring)
+    for a in range(len(pairwise_rods)):
+        for b in range(a + 1, len(pairwise_rods)):
+            pairwise.detect_contact_between(pairwise_rods[a], pairwise_rods[b]).using(
+                ea.RodRodContact, k=1e3, nu=1.0
+            )
+    pairwise.finalize()
+    run(pairwise)
+
+    grouped, grouped_rods = make_rod_bundle(ring=ring)
+    grouped.detect_contact_among(grouped_rods, broad_phase=broad_phase).using(
+        ea.RodRodContact, k=1e3, nu=1.0
+    )
+    grouped.finalize()
+    run(grouped)
+
+    if isinstance(broad_phase, VerletListBroadPhase):
+        assert broad_phase.n_rebuilds < broad_phase.n_calls
+    for rod, expected_rod in zip(grouped_rods, pairwise_rods):
+        np.testing.assert_array_equal(
+            rod.position_collection, expected_rod.position_collection
+        )
+        np.testing.assert_array_equal(
+            rod.velocity_collection, expected_rod.velocity_collection
+        )
+
+
+def test_contact_among_applies_contact():
+    free, free_rods = make_rod_bundle()
+    free.finalize()
+    run(free)
+
+    grouped, grouped_rods = make_rod_bundle()
+    grouped.detect_contact_among(grouped_rods).using(ea.RodRodContact, k=1e3, nu=1.0)
+    grouped.finalize()
+    run(grouped)
+
+    for rod, free_rod in zip(grouped_rods, free_rods):
+        assert not np.allclose(rod.position_collection, free_rod.position_collection)
+
+
+def test_contact_among_group_order():
+    """Rods are ordered as given in the group, not as in the memory block"""
+    pairwise, pairwise_rods = make_rod_bundle()
+    order = [3, 0, 5, 1, 4, 2]
+    for a in range(len(order)):
+        for b in range(a + 1, len(order)):
+            pairwise.detect_contact_between(
+                pairwise_rods[order[a]], pairwise_rods[order[b]]
+            ).using(ea.RodRodContact, k=1e3, nu=1.0)
+    pairwise.finalize()
+    run(pairwise)
+
+    grouped, grouped_rods = make_rod_bundle()
+    grouped.detect_contact_among([grouped_rods[k] for k in order]).using(
+        ea.RodRodContact, k=1e3, nu=1.0
+    )
+    grouped.finalize()
+    run(grouped)
+
+    for rod, expected_rod in zip(grouped_rods, pairwise_rods):
+        np.testing.assert_array_equal(
+            rod.position_collection, expected_rod.position_collection
+        )
+
+
+@pytest.mark.parametrize("ring", [False, True])
+def test_sdf_contact_among_matches_contact_per_rod(ring):
+    # Half-space y < -0.005, reached by the parallel rods and the ring
+    sdf = ea.SignedDistanceField.from_function(
+        lambda x: x[1] + 0.005,
+        lower=np.array([-0.2, -0.1, -0.1]),
+        upper=np.array([0.3, 0.1, 0.6]),
+        spacing=0.05,
+    )
+
+    per_rod, per_rod_rods = make_rod_bundle(ring=ring)
+    per_rod.append(sdf)
+    for rod in per_rod_rods:
+        per_rod.detect_contact_between(rod, sdf).using(ea.RodSDFContact, k=1e3, nu=1.0)
+    per_rod.finalize()
+    run(per_rod)
+
+    grouped, grouped_rods = make_rod_bundle(ring=ring)
+    grouped.detect_contact_among(grouped_rods).using(
+        ea.RodSDFContact, k=1e3, nu=1.0, surface=sdf
+    )
+    grouped.finalize()
+    run(grouped)
+
+    free, free_rods = make_rod_bundle(ring=ring)
+    free.finalize()
+    run(free)
+
+    assert np.any(
+        grouped_rods[0].position_collection != free_rods[0].position_collection
+    )
+    for rod, expected_rod in zip(grouped_rods, per_rod_rods):
+        np.testing.assert_array_equal(
+            rod.position_collection, expected_rod.position_collection
+        )
+        np.testing.assert_array_equal(
+            rod.velocity_collection, expected_rod.velocity_collection
+        )
+
+
+@pytest.mark.parametrize("ring", [False, True])
+def test_heightfield_contact_among_matches_contact_per_rod(ring):
+    # Wavy ground below y = -0.005, reached by the parallel rods and the ring
+    heightfield = ea.Heightfield.from_function(
+        lambda x, z: 0.002 * np.sin(30.0 * x) * np.cos(20.0 * z) - 0.005,
+        lower=np.array([-0.2, -0.1]),
+        upper=np.array([0.3, 0.6]),
+        spacing=0.01,
+        up_axis=1,
+    )
+    friction = dict(
+        k=1e3,
+        nu=1.0,
+        slip_velocity_tol=1e-4,
+        static_mu_array=np.array([0.2, 0.4, 0.6]),
+        kinetic_mu_array=np.array([0.1, 0.3, 0.5]),
+    )
+
+    per_rod, per_rod_rods = make_rod_bundle(ring=ring)
+    per_rod.append(heightfield)
+    for rod in per_rod_rods:
+        per_rod.detect_contact_between(rod, heightfield).using(
+            ea.RodHeightfieldContactWithAnisotropicFriction, **friction
+        )
+    per_rod.finalize()
+    run(per_rod)
+
+    grouped, grouped_rods = make_rod_bundle(ring=ring)
+    grouped.detect_contact_among(grouped_rods).using(
+        ea.RodHeightfieldContactWithAnisotropicFriction, surface=heightfield, **friction
+    )
+    grouped.finalize()
+    run(grouped)
+
+    free, free_rods = make_rod_bundle(ring=ring)
+    free.finalize()
+    run(free)
+
+    assert np.any(
+        grouped_rods[0].position_collection != free_rods[0].position_collection
+    )
+    for rod, expected_rod in zip(grouped_rods, per_rod_rods):
+        np.testing.assert_array_equal(
+            rod.position_collection, expected_rod.position_collection
+        )
+        np.testing.assert_array_equal(
+            rod.velocity_collection, expected_rod.velocity_collection
+        )
+        np.testing.assert_array_equal(
+            rod.omega_collection, expected_rod.omega_collection
+        )
+
+
+def test_contact_among_in_parallel_matches_serial():
+    serial, serial_rods = make_rod_bundle()
+    serial.detect_contact_among(serial_rods).using(ea.RodRodContact, k=1e3, nu=1.0)
+    serial.finalize()
+    run(serial)
+
+    parallel, parallel_rods = make_rod_bundle()
+    parallel.detect_contact_among(parallel_rods).using(
+        ea.RodRodContact, k=1e3, nu=1.0, parallel=True
+    )
+    parallel.finalize()
+    run(parallel)
+
+    for rod, serial_rod in zip(parallel_rods, serial_rods):
+        np.testing.assert_array_equal(
+            rod.position_collection, serial_rod.position_collection
+        )
+
+
+def make_sphere_pile(n_spheres=12, seed=0):
+    """Spheres overlapping their neighbours, falling on a plane"""
+    simulator = RodBundleSimulator()
+    rng = np.random.default_rng(seed)
+    spheres = []
+    for k in range(n_spheres):
+        position = np.array([0.03 * (k % 4), 0.03 + 0.03 * (k // 4), 0.0])
+        spheres.append(
+            ea.Sphere(
+                position + rng.uniform(-0.003, 0.003, 3),
+                0.016 + rng.uniform(0.0, 0.002),
+                1000.0,
+            )
+        )
+        spheres[-1].velocity_collection[:, 0] = rng.uniform(-0.1, 0.1, 3)
+    for sphere in spheres:
+        simulator.append(sphere)
+        simulator.add_forcing_to(sphere).using(
+            ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+        )
+    return simulator, spheres
+
+
+def make_cylinder_pile(n_cylinders=6):
+    """Crossed cylinders stacked closer than their diameter"""
+    simulator = RodBundleSimulator()
+    cylinders = []
+    for k in range(n_cylinders):
+        direction = np.array([1.0, 0.0, 0.0] if k % 2 == 0 else [0.0, 0.0, 1.0])
+        cylinders.append(
+            ea.Cylinder(
+                np.array([0.0, 0.018 * k, 0.0]) - 0.05 * direction,
+                direction,
+                np.array([0.0, 1.0, 0.0]),
+                0.1 + 0.01 * k,
+                0.01,
+                1000.0,
+            )
+        )
+        simulator.append(cylinders[-1])
+    return simulator, cylinders
+
+
+def assert_same_rigid_bodies(bodies, expected_bodies):
+    for body, expected_body in zip(bodies, expected_bodies):
+        np.testing.assert_array_equal(
+            body.position_collection, expected_body.position_collection
+        )
+        np.testing.assert_array_equal(
+            body.velocity_collection, expected_body.velocity_collection
+        )
+        np.testing.assert_array_equal(
+            body.omega_collection, expected_body.omega_collection
+        )
+
+
+@pytest.mark.parametrize("broad_phase", [None, SweepAndPruneBroadPhase()])
+def test_sphere_contact_among_matches_pairwise_contact(broad_phase):
+    contact = dict(
+        k=1e3, nu=1.0, velocity_damping_coefficient=10.0, friction_coefficient=0.3
+    )
+    pairwise, pairwise_spheres = make_sphere_pile()
+    for a in range(len(pairwise_spheres)):
+        for b in range(a + 1, len(pairwise_spheres)):
+            pairwise.detect_contact_between(
+                pairwise_spheres[a], pairwise_spheres[b]
+            ).using(ea.SphereSphereContact, **contact)
+    pairwise.finalize()
+    run(pairwise)
+
+    grouped, grouped_spheres = make_sphere_pile()
+    grouped.detect_contact_among(grouped_spheres, broad_phase=broad_phase).using(
+        ea.SphereSphereContact, **contact
+    )
+    grouped.finalize()
+    run(grouped)
+
+    free, free_spheres = make_sphere_pile()
+    free.finalize()
+    run(free)
+
+    assert np.any(
+        grouped_spheres[0].omega_collection != free_spheres[0].omega_collection
+    )
+    assert_same_rigid_bodies(grouped_spheres, pairwise_spheres)
+
+
+def test_sphere_plane_contact_among_matches_contact_per_sphere():
+    plane = ea.Plane(np.array([0.0, 0.04, 0.0]), np.array([0.0, 1.0, 0.0]))
+
+    per_sphere, per_sphere_spheres = make_sphere_pile()
+    per_sphere.append(plane)
+    for sphere in per_sphere_spheres:
+        per_sphere.detect_contact_between(sphere, plane).using(
+            ea.SpherePlaneContact, k=1e3, nu=1.0
+        )
+    per_sphere.finalize()
+    run(per_sphere)
+
+    grouped, grouped_spheres = make_sphere_pile()
+    grouped.detect_contact_among(grouped_spheres).using(
+        ea.SpherePlaneContact, k=1e3, nu=1.0, surface=plane
+    )
+    grouped.finalize()
+    run(grouped)
+
+    free, free_spheres = make_sphere_pile()
+    free.finalize()
+    run(free)
+
+    assert np.any(
+        grouped_spheres[0].position_collection != free_spheres[0].position_collection
+    )
+    assert_same_rigid_bodies(grouped_spheres, per_sphere_spheres)
+
+
+def test_cylinder_contact_among_matches_pairwise_contact():
+    pairwise, pairwise_cylinders = make_cylinder_pile()
+    for a in range(len(pairwise_cylinders)):
+        for b in range(a + 1, len(pairwise_cylinders)):
+            pairwise.detect_contact_between(
+                pairwise_cylinders[a], pairwise_cylinders[b]
+            ).using(ea.CylinderCylinderContact, k=1e3, nu=1.0)
+    pairwise.finalize()
+    run(pairwise)
+
+    grouped, grouped_cylinders = make_cylinder_pile()
+    grouped.detect_contact_among(grouped_cylinders).using(
+        ea.CylinderCylinderContact, k=1e3, nu=1.0
+    )
+    grouped.finalize()
+    run(grouped)
+
+    assert np.any(pairwise_cylinders[0].velocity_collection != 0.0)
+    assert_same_rigid_bodies(grouped_cylinders, pairwise_cylinders)
+
+
+def test_sphere_contact_among_with_rods_throws():
+    simulator, rods = make_rod_bundle(n_rods=1)
+    sphere = ea.Sphere(np.zeros(3), 0.01, 1000.0)
+    simulator.append(sphere)
+    simulator.detect_contact_among([rods[0], sphere]).using(
+        ea.SphereSphereContact, k=1.0, nu=0.0
+    )
+    with pytest.raises(TypeError, match="must be derived from"):
+        simulator.finalize()
@@ -8,13 +8,19 @@ from elastica.contact_forces import (
     RodCylinderContact,
     RodSelfContact,
     RodSphereContact,
+    RodMeshRigidBodyContact,
     RodPlaneContact,
+    RodSDFContact,
     RodPlaneContactWithAnisotropicFriction,
+    RodHeightfieldContactWithAnisotropicFriction,
     CylinderPlaneContact,
+    SphereSphereContact,
+    CylinderCylinderContact,
+    SpherePlaneContact,
 )
 from elastica.rod import RodBase
-from elastica.rigidbody import Cylinder, Sphere
-from elastica.surface import Plane
+from elastica.rigidbody import Cylinder, Sphere, MeshRigidBody
+from elastica.surface import Plane, SignedDistanceField, Heightfield
 import pytest
 from elastica.contact_utils import (
     _node_to_element_mass_or_force,
@@ -489,6 +495,58 @@ class TestRodSelfContact:
             atol=1e-6,
         )
 
+    @pytest.mark.parametrize("parallel", [False, True])
+    @pytest.mark.parametrize("elements_per_leaf", [1, 4, 16])
+    def test_self_contact_with_broad_phase_matches_all_pairs(
+        self, elements_per_leaf, parallel
+    ):
+        from elastica._contact_functions import _calculate_contact_forces_self_rod
+        from elastica.contact_broad_phase import AABBHierarchyBroadPhase
+
+        "Crumpled rod: random walk of unit steps, with many self collisions"
+        rng = np.random.default_rng(0)
+        n_elems = 200
+        steps = rng.normal(size=(3, n_elems))
+        steps /= np.linalg.norm(steps, axis=0)
+
+        rods = []
+        for broad_phase in [None, AABBHierarchyBroadPhase(elements_per_leaf)]:
+            mock_rod = MockRod()
+            mock_rod.n_elems = n_elems
+            mock_rod.position_collection = np.zeros((3, n_elems + 1))
+            mock_rod.position_collection[:, 1:] = np.cumsum(steps, axis=1)
+            mock_rod.radius = np.full(n_elems, 0.6)
+            mock_rod.lengths = np.ones(n_elems)
+            mock_rod.tangents = steps.copy()
+            mock_rod.velocity_collection = np.random.default_rng(1).normal(
+                size=(3, n_elems + 1)
+            )
+            mock_rod.internal_forces = np.zeros((3, n_elems + 1))
+            mock_rod.external_forces = np.zeros((3, n_elems + 1))
+            for _ in range(2):
+                if broad_phase is None:
+                    # Every pair of elements
+                    _calculate_contact_forces_self_rod(
+                        mock_rod.position_collection[..., :-1],
+                        mock_rod.radius,
+                        mock_rod.lengths,
+                        mock_rod.tangents,
+                        mock_rod.velocity_collection,
+                        mock_rod.external_forces,
+                        1.0,
+                        0.5,
+                    )
+                else:
+                    RodSelfContact(
+                        k=1.0, nu=0.5, broad_phase=broad_phase, parallel=parallel
+                    ).apply_contact(mock_rod, mock_rod)
+                # Refit of the hierarchy
+                mock_rod.position_collection *= 1.01
+            rods.append(mock_rod)
+
+        assert np.any(rods[0].external_forces != 0.0)
+        np.testing.assert_array_equal(rods[1].external_forces, rods[0].external_forces)
+
     def test_self_contact_with_rod_no_self_collision(self):
 
         "Testing Self Contact wrapper rod no self collision with analytical verified values"
@@ -560,6 +618,176 @@ class TestRodSphereContact:
         )
 
 
+def mock_rod_on_cube_init(self):
+
+    "Initializing Rod lying across the top face of the cube, crossing it by half its radius"
+
+    self.n_elem = 4
+    self.position_collection = np.zeros((3, self.n_elem + 1))
+    self.position_collection[0] = np.linspace(-1.5, 1.5, self.n_elem + 1)
+    self.position_collection[2] = 1.05
+    self.radius = np.full(self.n_elem, 0.1)
+    self.velocity_collection = np.zeros((3, self.n_elem + 1))
+    self.external_forces = np.zeros((3, self.n_elem + 1))
+
+
+MockRodOnCube = type("MockRodOnCube", (RodBase,), {"__init__": mock_rod_on_cube_init})
+
+
+class MockCubeMesh:
+    "Triangulated cube of side 2 centered at the origin, with outward normals"
+
+    def __init__(self):
+        faces = []
+        for axis in range(3):
+            u, v = (axis + 1) % 3, (axis + 2) % 3
+            for side in (-1.0, 1.0):
+                corners = np.zeros((4, 3))
+                corners[:, axis] = side
+                corners[:, u] = [-1.0, 1.0, 1.0, -1.0]
+                corners[:, v] = [-1.0, -1.0, 1.0, 1.0]
+                for triangle in ([0, 1, 2], [0, 2, 3]):
+                    vertices = corners[triangle]
+                    if side < 0.0:
+                        vertices = vertices[::-1]
+                    faces.append(vertices.T)
+        self.faces = np.stack(faces, axis=-1)
+        self.face_centers = self.faces.mean(axis=1)
+        normals = np.cross(
+            self.faces[:, 1] - self.faces[:, 0],
+            self.faces[:, 2] - self.faces[:, 0],
+            axis=0,
+        )
+        self.face_normals = normals / np.linalg.norm(normals, axis=0)
+
+
+def initialize_cube_mesh_rigid_body():
+    "Initializing the cube (side 2, centered at the origin)"
+
+    mass_second_moment_of_inertia = np.zeros((3, 3), np.float64)
+    np.fill_diagonal(mass_second_moment_of_inertia, 8.0 * 4.0 / 6.0)
+    return MeshRigidBody(
+        MockCubeMesh(), np.zeros(3), mass_second_moment_of_inertia, 1.0, 8.0
+    )
+
+
+class TestRodMeshRigidBodyContact:
+    def test_check_systems_validity_with_invalid_systems(
+        self,
+    ):
+        mock_rod = MockRod()
+        mock_list = [1, 2, 3]
+        rod_mesh_contact = RodMeshRigidBodyContact(k=1.0, nu=0.0)
+
+        # Testing Rod Mesh Rigid Body Contact wrapper with incorrect type for second argument
+        with pytest.raises(TypeError) as excinfo:
+            rod_mesh_contact._check_systems_validity(mock_rod, mock_list)
+        assert "System provided (list) must be derived from ['MeshRigidBody']." == str(
+            excinfo.value
+        )
+
+        # Testing Rod Mesh Rigid Body Contact wrapper with incorrect order
+        cube = initialize_cube_mesh_rigid_body()
+        with pytest.raises(TypeError) as excinfo:
+            rod_mesh_contact._check_systems_validity(cube, mock_rod)
+        assert (
+            "System provided (MeshRigidBody) must be derived from ['RodBase']."
+            == str(excinfo.value)
+        )
+
+    def test_contact_rod_mesh_with_collision_with_k_without_nu_and_friction(self):
+        mock_rod = MockRodOnCube()
+        cube = initialize_cube_mesh_rigid_body()
+        rod_mesh_contact = RodMeshRigidBodyContact(k=1.0, nu=0.0)
+        rod_mesh_contact.apply_contact(mock_rod, cube)
+
+        # Every element is at 0.05 from the top face, so gamma = 0.05 and the
+        # contact force on each element is 0.5 * k * gamma, along +z
+        element_force = 0.5 * 0.05
+        assert_allclose(
+            mock_rod.external_forces[2],
+            element_force * np.array([2 / 3, 4 / 3 + 1, 2, 1 + 4 / 3, 2 / 3]),
+            atol=1e-12,
+        )
+        assert_allclose(mock_rod.external_forces[:2], 0.0, atol=1e-12)
+        assert_allclose(
+            cube.external_forces[..., 0], [0.0, 0.0, -8 * element_force], atol=1e-12
+        )
+
+    def test_contact_rod_mesh_without_collision(self):
+        mock_rod = MockRodOnCube()
+        mock_rod.position_collection[2] = 1.2
+        cube = initialize_cube_mesh_rigid_body()
+        rod_mesh_contact = RodMeshRigidBodyContact(k=1.0, nu=1.0)
+        rod_mesh_contact.apply_contact(mock_rod, cube)
+
+        assert_allclose(mock_rod.external_forces, 0.0, atol=1e-12)
+        assert_allclose(cube.external_forces, 0.0, atol=1e-12)
+        assert_allclose(cube.external_torques, 0.0, atol=1e-12)
+
+    def test_contact_rod_mesh_with_moved_body(self):
+        # Rotating and translating the rod and the body together gives the same
+        # forces, rotated, and the same torques in the material frame of the body
+        mock_rod = MockRodOnCube()
+        # Tilted, so that the closest points are unique
+        mock_rod.position_collection[1] = np.linspace(-0.3, 0.6, mock_rod.n_elem + 1)
+        mock_rod.position_collection[2] = np.linspace(1.02, 1.08, mock_rod.n_elem + 1)
+        mock_rod.velocity_collection[2] = -1.0
+        cube = initialize_cube_mesh_rigid_body()
+        rod_mesh_contact = RodMeshRigidBodyContact(
+            k=1.0, nu=0.5, velocity_damping_coefficient=0.1, friction_coefficient=0.2
+        )
+        rod_mesh_contact.apply_contact(mock_rod, cube)
+
+        angle = 0.7
+        axis = np.array([1.0, -2.0, 0.5]) / np.linalg.norm([1.0, -2.0, 0.5])
+        cross_matrix = np.array(
+            [
+                [0.0, -axis[2], axis[1]],
+                [axis[2], 0.0, -axis[0]],
+                [-axis[1], axis[0], 0.0],
+            ]
+        )
+        rotation = (
+            np.eye(3)
+            + np.sin(angle) * cross_matrix
+            + (1.0 - np.cos(angle)) * cross_matrix @ cross_matrix
+        )
+        translation = np.array([3.0, -1.0, 2.0])
+        moved_rod = MockRodOnCube()
+        moved_rod.position_collection = (
+            rotation @ mock_rod.position_collection + translation[:, np.newaxis]
+        )
+        moved_rod.velocity_collection = rotation @ mock_rod.velocity_collection
+        moved_cube = initialize_cube_mesh_rigid_body()
+        moved_cube.position_collection[:, 0] = translation
+        moved_cube.director_collection[..., 0] = rotation.T
+        RodMeshRigidBodyContact(
+            k=1.0, nu=0.5, velocity_damping_coefficient=0.1, friction_coefficient=0.2
+        ).apply_contact(moved_rod, moved_cube)
+
+        assert np.any(mock_rod.external_forces != 0.0)
+        assert_allclose(
+            moved_rod.external_forces, rotation @ mock_rod.external_forces, atol=1e-12
+        )
+        assert_allclose(
+            moved_cube.external_forces, rotation @ cube.external_forces, atol=1e-12
+        )
+        assert_allclose(moved_cube.external_torques, cube.external_torques, atol=1e-12)
+
+    def test_contact_rod_mesh_builds_hierarchy_once(self):
+        mock_rod = MockRodOnCube()
+        cube = initialize_cube_mesh_rigid_body()
+        rod_mesh_contact = RodMeshRigidBodyContact(k=1.0, nu=0.0, faces_per_leaf=1)
+        rod_mesh_contact.apply_contact(mock_rod, cube)
+        hierarchy = rod_mesh_contact.hierarchy
+        assert hierarchy is not None
+        assert hierarchy.n_faces == cube.n_faces
+
+        rod_mesh_contact.apply_contact(mock_rod, cube)
+        assert rod_mesh_contact.hierarchy is hierarchy
+
+
 class TestRodPlaneContact:
     def initializer(
         self,
@@ -815,6 +1043,84 @@ class TestRodPlaneContact:
         assert_allclose(correct_forces, rod.external_forces, atol=Tolerance.atol())
 
 
+class TestRodSDFContact:
+    def test_check_systems_validity_with_invalid_systems(
+        self,
+    ):
+        mock_rod = MockRod()
+        mock_list = [1, 2, 3]
+        rod_sdf_contact = RodSDFContact(k=1.0, nu=0.0)
+
+        # Testing Rod SDF Contact wrapper with incorrect type for second argument
+        with pytest.raises(TypeError) as excinfo:
+            rod_sdf_contact._check_systems_validity(mock_rod, mock_list)
+        assert (
+            "System provided (list) must be derived from ['SignedDistanceField']."
+            == str(excinfo.value)
+        )
+
+        # Testing Rod SDF Contact wrapper with incorrect type for first argument
+        with pytest.raises(TypeError) as excinfo:
+            rod_sdf_contact._check_systems_validity(mock_list, mock_rod)
+        assert "System provided (list) must be derived from ['RodBase']." == str(
+            excinfo.value
+        )
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_rod_sdf_contact_with_plane_field_matches_rod_plane_contact(self, seed):
+        # The distance to a plane is linear, so it is interpolated exactly
+        rng = np.random.default_rng(seed)
+        n_elem = 6
+        plane_normal = rng.normal(size=3)
+        plane_normal /= np.linalg.norm(plane_normal)
+        plane = MockPlane()
+        plane.normal = plane_normal
+        plane.origin = rng.uniform(-0.1, 0.1, (3, 1))
+        sdf = SignedDistanceField.from_function(
+            lambda x: plane_normal @ (x - plane.origin),
+            lower=np.full(3, -1.0),
+            upper=np.full(3, 1.0),
+            spacing=0.2,
+        )
+
+        rods = []
+        for _ in range(2):
+            rod = MockRod()
+            rod.position_collection = rng.uniform(-0.3, 0.3, (3, n_elem + 1))
+            rod.velocity_collection = rng.normal(size=(3, n_elem + 1))
+            rod.mass = rng.uniform(0.5, 1.5, n_elem + 1)
+            rod.radius = np.full(n_elem, 0.2)
+            rod.internal_forces = rng.normal(size=(3, n_elem + 1))
+            rod.external_forces = rng.normal(size=(3, n_elem + 1))
+            rods.append(rod)
+        rods[1].position_collection = rods[0].position_collection.copy()
+        rods[1].velocity_collection = rods[0].velocity_collection.copy()
+        rods[1].mass = rods[0].mass.copy()
+        rods[1].internal_forces = rods[0].internal_forces.copy()
+        rods[1].external_forces = rods[0].external_forces.copy()
+
+        external_forces = rods[0].external_forces.copy()
+        RodPlaneContact(k=10.0, nu=2.0).apply_contact(rods[0], plane)
+        RodSDFContact(k=10.0, nu=2.0).apply_contact(rods[1], sdf)
+
+        assert np.any(rods[0].external_forces != external_forces)
+        assert_allclose(rods[1].external_forces, rods[0].external_forces, atol=1e-12)
+
+    def test_rod_sdf_contact_without_contact(self):
+        rod = MockRod()
+        rod.position_collection = rod.position_collection.astype(np.float64)
+        rod.radius = rod.radius.astype(np.float64)
+        sdf = SignedDistanceField.from_function(
+            lambda x: x[1] + 2.0, np.full(3, -1.0), np.full(3, 4.0), 0.5
+        )
+        RodSDFContact(k=1.0, nu=1.0).apply_contact(rod, sdf)
+        assert_allclose(rod.external_forces, 0.0, atol=Tolerance.atol())
+
+    def test_rod_sdf_contact_among_without_surface_throws(self):
+        with pytest.raises(ValueError, match="needs a surface"):
+            RodSDFContact(k=1.0, nu=1.0).apply_contact_among(None)
+
+
 class TestRodPlaneWithAnisotropicFriction:
     def initializer(
         self,
@@ -1168,6 +1474,189 @@ class TestRodPlaneWithAnisotropicFriction:
         assert_allclose(correct_torques, rod.external_torques, atol=Tolerance.atol())
 
 
+class TestRodHeightfieldContactWithAnisotropicFriction:
+    def test_check_systems_validity_with_invalid_systems(
+        self,
+    ):
+        mock_rod = MockRod()
+        mock_list = [1, 2, 3]
+        rod_heightfield_contact = RodHeightfieldContactWithAnisotropicFriction(
+            1.0, 0.0, 1e-2, np.zeros(3), np.zeros(3)
+        )
+
+        # Testing Rod Heightfield Contact wrapper with incorrect type for second argument
+        with pytest.raises(TypeError) as excinfo:
+            rod_heightfield_contact._check_systems_validity(mock_rod, mock_list)
+        assert "System provided (list) must be derived from ['Heightfield']." == str(
+            excinfo.value
+        )
+
+        # Testing Rod Heightfield Contact wrapper with incorrect type for first argument
+        with pytest.raises(TypeError) as excinfo:
+            rod_heightfield_contact._check_systems_validity(mock_list, mock_rod)
+        assert "System provided (list) must be derived from ['RodBase']." == str(
+            excinfo.value
+        )
+
+    @pytest.mark.parametrize("up_axis", [1, 2])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_rod_heightfield_contact_with_slope_matches_rod_plane_contact(
+        self, up_axis, seed
+    ):
+        # The heights of a slope are linear, so they are interpolated exactly and
+        # the terrain is a plane
+        rng = np.random.default_rng(seed)
+        n_elem = 8
+        slope = rng.uniform(-0.3, 0.3, 2)
+        grid_axes = [axis for axis in range(3) if axis != up_axis]
+        heightfield = Heightfield.from_function(
+            lambda u, v: slope[0] * u + slope[1] * v - 0.05,
+            lower=np.full(2, -1.0),
+            upper=np.full(2, 1.0),
+            spacing=0.2,
+            up_axis=up_axis,
+        )
+        plane = MockPlane()
+        plane.normal = np.zeros(3)
+        plane.normal[grid_axes] = -slope
+        plane.normal[up_axis] = 1.0
+        plane.normal /= np.linalg.norm(plane.normal)
+        plane.origin = np.zeros((3, 1))
+        plane.origin[up_axis] = -0.05
+
+        rods = []
+        for _ in range(2):
+            rod = MockRod()
+            rod.position_collection = rng.uniform(-0.3, 0.3, (3, n_elem + 1))
+            rod.position_collection[up_axis] = slope @ rod.position_collection[
+                grid_axes
+            ] + rng.uniform(-0.2, 0.1, n_elem + 1)
+            rod.velocity_collection = rng.normal(size=(3, n_elem + 1))
+            rod.omega_collection = rng.normal(size=(3, n_elem))
+            rod.mass = rng.uniform(0.5, 1.5, n_elem + 1)
+            rod.radius = np.full(n_elem, 0.1)
+            tangents = np.diff(rod.position_collection, axis=1)
+            rod.tangents = tangents / np.linalg.norm(tangents, axis=0)
+            rod.director_collection = np.stack(
+                [np.linalg.qr(rng.normal(size=(3, 3)))[0].T for _ in range(n_elem)],
+                axis=-1,
+            )
+            rod.internal_forces = rng.normal(size=(3, n_elem + 1))
+            rod.external_forces = rng.normal(size=(3, n_elem + 1))
+            rod.internal_torques = rng.normal(size=(3, n_elem))
+            rod.external_torques = rng.normal(size=(3, n_elem))
+            rods.append(rod)
+        for name in (
+            "position_collection",
+            "velocity_collection",
+            "omega_collection",
+            "mass",
+            "tangents",
+            "director_collection",
+            "internal_forces",
+            "external_forces",
+            "internal_torques",
+            "external_torques",
+        ):
+            setattr(rods[1], name, getattr(rods[0], name).copy())
+
+        external_forces = rods[0].external_forces.copy()
+        external_torques = rods[0].external_torques.copy()
+        friction = dict(
+            slip_velocity_tol=0.5,
+            static_mu_array=np.array([0.4, 0.6, 0.8]),
+            kinetic_mu_array=np.array([0.3, 0.5, 0.7]),
+        )
+        RodPlaneContactWithAnisotropicFriction(
+            k=10.0, nu=2.0, **friction
+        ).apply_contact(rods[0], plane)
+        RodHeightfieldContactWithAnisotropicFriction(
+            k=10.0, nu=2.0, **friction
+        ).apply_contact(rods[1], heightfield)
+
+        assert np.any(rods[0].external_forces != external_forces)
+        assert np.any(rods[0].external_torques != external_torques)
+        assert_allclose(rods[1].external_forces, rods[0].external_forces, atol=1e-12)
+        assert_allclose(rods[1].external_torques, rods[0].external_torques, atol=1e-12)
+
+    def test_rod_heightfield_contact_follows_terrain_normal(self):
+        # Rod resting across a bump, without friction: the response on every element
+        # is along the terrain normal below it
+        heightfield = Heightfield.from_function(
+            lambda u, v: 0.2 * np.sin(2.0 * u),
+            lower=np.full(2, -2.0),
+            upper=np.full(2, 2.0),
+            spacing=0.05,
+        )
+        rod = MockRod()
+        n_elem = 10
+        x = np.linspace(-1.0, 1.0, n_elem + 1)
+        rod.position_collection = np.vstack(
+            [x, np.zeros(n_elem + 1), 0.2 * np.sin(2.0 * x) + 0.05]
+        )
+        rod.velocity_collection = np.zeros((3, n_elem + 1))
+        rod.omega_collection = np.zeros((3, n_elem))
+        rod.mass = np.ones(n_elem + 1)
+        rod.radius = np.full(n_elem, 0.1)
+        tangents = np.diff(rod.position_collection, axis=1)
+        rod.tangents = tangents / np.linalg.norm(tangents, axis=0)
+        rod.director_collection = np.repeat(np.identity(3)[:, :, None], n_elem, axis=2)
+        rod.internal_forces = np.zeros((3, n_elem + 1))
+        rod.external_forces = np.zeros((3, n_elem + 1))
+        rod.internal_torques = np.zeros((3, n_elem))
+        rod.external_torques = np.zeros((3, n_elem))
+
+        contact = RodHeightfieldContactWithAnisotropicFriction(
+            1e3, 0.0, 1e-4, np.zeros(3), np.zeros(3)
+        )
+        elem_idx, node_idx, local_idx, n_points = (
+            np.arange(n_elem),
+            np.arange(n_elem),
+            np.arange(n_elem),
+            np.full(n_elem, n_elem),
+        )
+        for e in range(n_elem):
+            # One element at a time, to see its own response force
+            rod.external_forces[:] = 0.0
+            contact._apply(
+                heightfield,
+                elem_idx[e : e + 1],
+                node_idx[e : e + 1],
+                local_idx[e : e + 1],
+                n_points[e : e + 1],
+                rod,
+            )
+            force = rod.external_forces[:, e] + rod.external_forces[:, e + 1]
+            center = 0.5 * (
+                rod.position_collection[:, e : e + 1]
+                + rod.position_collection[:, e + 1 : e + 2]
+            )
+            _, normal = heightfield.evaluate(center)
+            assert np.linalg.norm(force) > 0.0
+            assert_allclose(
+                force / np.linalg.norm(force), normal[:, 0], atol=Tolerance.atol()
+            )
+        assert_allclose(rod.external_torques, 0.0, atol=Tolerance.atol())
+
+    def test_rod_heightfield_contact_without_contact(self):
+        rod = MockRod()
+        rod.position_collection = rod.position_collection.astype(np.float64)
+        rod.radius = rod.radius.astype(np.float64)
+        rod.director_collection = np.repeat(np.identity(3)[:, :, None], 2, axis=2)
+        heightfield = Heightfield(np.full((3, 3), -2.0), np.zeros(3), 1.0)
+        RodHeightfieldContactWithAnisotropicFriction(
+            1.0, 1.0, 1e-4, np.ones(3), np.ones(3)
+        ).apply_contact(rod, heightfield)
+        assert_allclose(rod.external_forces, 0.0, atol=Tolerance.atol())
+        assert_allclose(rod.external_torques, 0.0, atol=Tolerance.atol())
+
+    def test_rod_heightfield_contact_among_without_surface_throws(self):
+        with pytest.raises(ValueError, match="needs a surface"):
+            RodHeightfieldContactWithAnisotropicFriction(
+                1.0, 1.0, 1e-4, np.zeros(3), np.zeros(3)
+            ).apply_contact_among(None)
+
+
 class TestCylinderPlaneContact:
     def initializer(
         self,
@@ -1392,3 +1881,165 @@ class TestCylinderPlaneContact:
         cylinder_plane_contact.apply_contact(cylinder, plane)
 
         assert_allclose(correct_forces, cylinder.external_forces, atol=Tolerance.atol())
+
+
+def make_sphere(position, radius=1.0):
+    return Sphere(np.array(position, dtype=np.float64), radius, 1.0)
+
+
+class TestSphereSphereContact:
+    def test_check_systems_validity_with_invalid_systems(self):
+        sphere = make_sphere([0.0, 0.0, 0.0])
+        mock_list = [1, 2, 3]
+        sphere_sphere_contact = SphereSphereContact(k=1.0, nu=0.0)
+
+        with pytest.raises(TypeError) as excinfo:
+            sphere_sphere_contact._check_systems_validity(sphere, mock_list)
+        assert "System provided (list) must be derived from ['Sphere']." == str(
+            excinfo.value
+        )
+
+        with pytest.raises(TypeError) as excinfo:
+            sphere_sphere_contact._check_systems_validity(mock_list, sphere)
+        assert "System provided (list) must be derived from ['Sphere']." == str(
+            excinfo.value
+        )
+
+    def test_sphere_sphere_contact_without_contact(self):
+        sphere_one = make_sphere([0.0, 0.0, 0.0])
+        sphere_two = make_sphere([2.5, 0.0, 0.0])
+        SphereSphereContact(k=1.0, nu=1.0).apply_contact(sphere_one, sphere_two)
+
+        assert_allclose(sphere_one.external_forces, 0.0, atol=Tolerance.atol())
+        assert_allclose(sphere_two.external_forces, 0.0, atol=Tolerance.atol())
+
+    @pytest.mark.parametrize("direction", [[1.0, 0.0, 0.0], [0.0, 0.6, -0.8]])
+    def test_sphere_sphere_contact_along_line_of_centers(self, direction):
+        direction = np.array(direction)
+        sphere_one = make_sphere([0.1, 0.2, 0.3])
+        sphere_two = make_sphere(sphere_one.position_collection[:, 0] + 1.9 * direction)
+        sphere_two.velocity_collection[:, 0] = -2.0 * direction
+        SphereSphereContact(k=10.0, nu=1.0).apply_contact(sphere_one, sphere_two)
+
+        # spring on the overlap of 0.1 and damper on the approach velocity
+        correct_force = (10.0 * 0.1 + 1.0 * 2.0) * direction
+        assert_allclose(
+            sphere_two.external_forces[:, 0], correct_force, atol=Tolerance.atol()
+        )
+        assert_allclose(
+            sphere_one.external_forces[:, 0], -correct_force, atol=Tolerance.atol()
+        )
+        assert_allclose(sphere_one.external_torques, 0.0, atol=Tolerance.atol())
+        assert_allclose(sphere_two.external_torques, 0.0, atol=Tolerance.atol())
+
+    def test_sphere_sphere_contact_friction(self):
+        sphere_one = make_sphere([0.0, 0.0, 0.0])
+        sphere_two = make_sphere([1.9, 0.0, 0.0])
+        sphere_two.velocity_collection[1, 0] = 1.0
+        SphereSphereContact(
+            k=10.0, nu=0.0, velocity_damping_coefficient=1e2, friction_coefficient=0.5
+        ).apply_contact(sphere_one, sphere_two)
+
+        # Coulomb limit of the normal force of 1.0, opposing the slip
+        assert_allclose(
+            sphere_two.external_forces[:, 0], [1.0, -0.5, 0.0], atol=Tolerance.atol()
+        )
+        assert_allclose(
+            sphere_one.external_forces[:, 0], [-1.0, 0.5, 0.0], atol=Tolerance.atol()
+        )
+        # friction applied at the surface of the spheres
+        director = sphere_one.director_collection[..., 0]
+        assert_allclose(
+            sphere_one.external_torques[:, 0],
+            director @ [0.0, 0.0, 0.5],
+            atol=Tolerance.atol(),
+        )
+        assert_allclose(
+            sphere_two.external_torques[:, 0],
+            sphere_two.director_collection[..., 0] @ [0.0, 0.0, 0.5],
+            atol=Tolerance.atol(),
+        )
+
+
+class TestCylinderCylinderContact:
+    @staticmethod
+    def make_cylinder(start, direction, normal, length=2.0, radius=0.5):
+        return Cylinder(
+            np.array(start, dtype=np.float64),
+            np.array(direction, dtype=np.float64),
+            np.array(normal, dtype=np.float64),
+            length,
+            radius,
+            1.0,
+        )
+
+    def test_check_systems_validity_with_invalid_systems(self):
+        cylinder = self.make_cylinder([0, 0, 0], [1, 0, 0], [0, 0, 1])
+        mock_list = [1, 2, 3]
+        cylinder_cylinder_contact = CylinderCylinderContact(k=1.0, nu=0.0)
+
+        with pytest.raises(TypeError) as excinfo:
+            cylinder_cylinder_contact._check_systems_validity(cylinder, mock_list)
+        assert "System provided (list) must be derived from ['Cylinder']." == str(
+            excinfo.value
+        )
+
+    def test_crossed_cylinders(self):
+        cylinder_one = self.make_cylinder([-1.0, 0.0, 0.0], [1, 0, 0], [0, 0, 1])
+        cylinder_two = self.make_cylinder([0.0, -1.0, 0.9], [0, 1, 0], [0, 0, 1])
+        CylinderCylinderContact(k=10.0, nu=0.0).apply_contact(
+            cylinder_one, cylinder_two
+        )
+
+        # axes cross at their centers, 0.9 apart, with an overlap of 0.1
+        assert_allclose(
+            cylinder_two.external_forces[:, 0], [0.0, 0.0, 1.0], atol=Tolerance.atol()
+        )
+        assert_allclose(
+            cylinder_one.external_forces[:, 0], [0.0, 0.0, -1.0], atol=Tolerance.atol()
+        )
+        assert_allclose(cylinder_one.external_torques, 0.0, atol=Tolerance.atol())
+        assert_allclose(cylinder_two.external_torques, 0.0, atol=Tolerance.atol())
+
+    def test_parallel_cylinders_without_contact(self):
+        cylinder_one = self.make_cylinder([0.0, 0.0, 0.0], [1, 0, 0], [0, 0, 1])
+        cylinder_two = self.make_cylinder([0.0, 1.1, 0.0], [1, 0, 0], [0, 0, 1])
+        CylinderCylinderContact(k=10.0, nu=1.0).apply_contact(
+            cylinder_one, cylinder_two
+        )
+
+        assert_allclose(cylinder_one.external_forces, 0.0, atol=Tolerance.atol())
+        assert_allclose(cylinder_two.external_forces, 0.0, atol=Tolerance.atol())
+
+
+class TestSpherePlaneContact:
+    def test_check_systems_validity_with_invalid_systems(self):
+        sphere = make_sphere([0.0, 0.0, 0.0])
+        mock_list = [1, 2, 3]
+        sphere_plane_contact = SpherePlaneContact(k=1.0, nu=0.0)
+
+        with pytest.raises(TypeError) as excinfo:
+            sphere_plane_contact._check_systems_validity(sphere, mock_list)
+        assert "System provided (list) must be derived from ['SurfaceBase']." == str(
+            excinfo.value
+        )
+
+    @pytest.mark.parametrize("penetration", [-0.5, 0.05, 0.2])
+    def test_sphere_plane_contact(self, penetration):
+        sphere = make_sphere([0.0, 1.0 - penetration, 0.0])
+        sphere.velocity_collection[1, 0] = -0.5
+        plane = Plane(np.zeros(3), np.array([0.0, 1.0, 0.0]))
+        SpherePlaneContact(k=10.0, nu=2.0).apply_contact(sphere, plane)
+
+        correct_force = max(penetration, 0.0) * 10.0 + 2.0 * 0.5
+        if penetration < 0.0:
+            correct_force = 0.0
+        assert_allclose(
+            sphere.external_forces[:, 0],
+            [0.0, correct_force, 0.0],
+            atol=Tolerance.atol(),
+        )
+
+    def test_sphere_plane_contact_among_without_surface_throws(self):
+        with pytest.raises(ValueError, match="needs a surface"):
+            SpherePlaneContact(k=1.0, nu=0.0).apply_contact_among(None)
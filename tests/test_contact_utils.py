@@ -12,6 +12,9 @@ from elastica.contact_utils import (
     _clip,
     _out_of_bounds,
     _find_min_dist,
+    _find_min_dist_batch,
+    _closest_point_on_triangle,
+    _find_min_dist_segment_triangle,
     _aabbs_not_intersecting,
     _prune_using_aabbs_rod_cylinder,
     _prune_using_aabbs_rod_rod,
@@ -210,6 +213,113 @@ def test_find_min_dist():
     assert_allclose(contact_point_of_system1, [0, 0, 0])
 
 
+def test_find_min_dist_batch_matches_find_min_dist():
+    "Function to test the _find_min_dist_batch function against _find_min_dist"
+    rng = np.random.default_rng(0)
+    n_pairs = 1000
+    x1 = rng.normal(size=(3, n_pairs))
+    e1 = rng.normal(size=(3, n_pairs))
+    x2 = rng.normal(size=(3, n_pairs))
+    e2 = rng.normal(size=(3, n_pairs))
+    # parallel and anti-parallel segments
+    e2[:, :100] = 2.0 * e1[:, :100]
+    e2[:, 100:200] = -e1[:, 100:200]
+
+    distance_vector = np.empty((3, n_pairs))
+    s = np.empty(n_pairs)
+    t = np.empty(n_pairs)
+    _find_min_dist_batch(x1, e1, x2, e2, distance_vector, s, t)
+
+    for k in range(n_pairs):
+        min_dist_vec, contact_point_of_system2, contact_point_of_system1 = (
+            _find_min_dist(x1[:, k], e1[:, k], x2[:, k], e2[:, k])
+        )
+        np.testing.assert_array_equal(distance_vector[:, k], min_dist_vec)
+        np.testing.assert_array_equal(
+            x2[:, k] + s[k] * e2[:, k], contact_point_of_system2
+        )
+        # _find_min_dist returns x1 - t * e1 as contact point of system 1
+        np.testing.assert_array_equal(
+            x1[:, k] - t[k] * e1[:, k], contact_point_of_system1
+        )
+
+
+@pytest.mark.parametrize(
+    "point, result",
+    [
+        # Face, vertex and edge regions of the triangle
+        ([0.2, 0.3, 1.0], [0.2, 0.3, 0.0]),
+        ([-1.0, -1.0, 0.5], [0.0, 0.0, 0.0]),
+        ([2.0, -0.5, 0.0], [1.0, 0.0, 0.0]),
+        ([-0.5, 3.0, -1.0], [0.0, 1.0, 0.0]),
+        ([0.5, -1.0, 0.0], [0.5, 0.0, 0.0]),
+        ([-1.0, 0.5, 2.0], [0.0, 0.5, 0.0]),
+        ([1.0, 1.0, 0.0], [0.5, 0.5, 0.0]),
+    ],
+)
+def test_closest_point_on_triangle(point, result):
+    a = np.array([0.0, 0.0, 0.0])
+    b = np.array([1.0, 0.0, 0.0])
+    c = np.array([0.0, 1.0, 0.0])
+    assert_allclose(
+        _closest_point_on_triangle(np.array(point), a, b, c),
+        result,
+        atol=Tolerance.atol(),
+    )
+
+
+def test_find_min_dist_segment_triangle():
+    "Function to test the _find_min_dist_segment_triangle function"
+    a = np.array([0.0, 0.0, 0.0])
+    b = np.array([1.0, 0.0, 0.0])
+    c = np.array([0.0, 1.0, 0.0])
+
+    "segment above the triangle, end closest"
+    distance_vector, contact_point = _find_min_dist_segment_triangle(
+        np.array([0.2, 0.2, 0.5]), np.array([0.0, 0.0, 1.0]), a, b, c
+    )
+    assert_allclose(distance_vector, [0.0, 0.0, -0.5], atol=Tolerance.atol())
+    assert_allclose(contact_point, [0.2, 0.2, 0.0], atol=Tolerance.atol())
+
+    "segment crossing the triangle"
+    distance_vector, contact_point = _find_min_dist_segment_triangle(
+        np.array([0.2, 0.2, -0.5]), np.array([0.0, 0.0, 1.0]), a, b, c
+    )
+    assert_allclose(distance_vector, [0.0, 0.0, 0.0], atol=Tolerance.atol())
+    assert_allclose(contact_point, [0.2, 0.2, 0.0], atol=Tolerance.atol())
+
+    "segment passing beside an edge of the triangle"
+    distance_vector, contact_point = _find_min_dist_segment_triangle(
+        np.array([0.5, -1.0, -1.0]), np.array([0.0, 0.0, 2.0]), a, b, c
+    )
+    assert_allclose(distance_vector, [0.0, 1.0, 0.0], atol=Tolerance.atol())
+    assert_allclose(contact_point, [0.5, 0.0, 0.0], atol=Tolerance.atol())
+
+    "random segments, against points sampled on the segment and the triangle"
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 1.0, 51)
+    u, v = np.meshgrid(np.linspace(0.0, 1.0, 51), np.linspace(0.0, 1.0, 51))
+    inside = u + v <= 1.0
+    for _ in range(20):
+        x1, e1, a, b, c = rng.normal(size=(5, 3))
+        distance_vector, contact_point = _find_min_dist_segment_triangle(
+            x1, e1, a, b, c
+        )
+        segment = x1 + t[:, np.newaxis] * e1
+        triangle = (
+            a + u[inside][:, np.newaxis] * (b - a) + v[inside][:, np.newaxis] * (c - a)
+        )
+        sampled_distance = np.linalg.norm(
+            segment[:, np.newaxis] - triangle[np.newaxis], axis=-1
+        ).min()
+        assert np.linalg.norm(distance_vector) <= sampled_distance + 1e-12
+        # The ends of the distance vector are on the segment and the triangle
+        segment_point = contact_point - distance_vector
+        assert_allclose(np.cross(segment_point - x1, e1), 0.0, atol=Tolerance.atol())
+        normal = np.cross(b - a, c - a)
+        assert_allclose(np.dot(contact_point - a, normal), 0.0, atol=Tolerance.atol())
+
+
 def test_aabbs_not_intersecting():
     "Function to test the _aabb_intersecting function"
 
@@ -0,0 +1,397 @@
+__doc__ = """ Test ensemble of replicas simulated in one simulator """
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import elastica as ea
+from elastica.ensemble import Ensemble
+
+
+class EnsembleSimulator(
+    ea.BaseSystemCollection, ea.Constraints, ea.Forcing, ea.Damping, ea.CallBacks
+):
+    pass
+
+
+def build_cantilevers(simulator, replica_idx, youngs_modulus, gravity):
+    rods = []
+    for k in range(2):
+        rod = ea.CosseratRod.straight_rod(
+            n_elements=8 + k,
+            start=np.array([0.0, k, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=youngs_modulus,
+        )
+        simulator.append(rod)
+        simulator.constrain(rod).using(
+            ea.OneEndFixedBC,
+            constrained_position_idx=(0,),
+            constrained_director_idx=(0,),
+        )
+        simulator.add_forcing_to(rod).using(
+            ea.GravityForces, acc_gravity=np.array([gravity, 0.0, 0.0])
+        )
+        simulator.dampen(rod).using(
+            ea.AnalyticalLinearDamper, damping_constant=0.1, time_step=1e-4
+        )
+        rods.append(rod)
+    return rods
+
+
+def run(simulator):
+    ea.integrate(ea.PositionVerlet(), simulator, 0.01, 100, progress_bar=False)
+
+
+@pytest.mark.parametrize("n_replicas", [1, 3])
+def test_ensemble_matches_independent_simulations(n_replicas):
+    youngs_modulus = np.linspace(1e5, 1e6, n_replicas)
+    gravity = np.linspace(-9.81, -1.0, n_replicas)
+
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": youngs_modulus, "gravity": gravity},
+    )
+    simulator.finalize()
+
+    # All replicas share one memory block
+    blocks = list(simulator.block_systems())
+    assert len(blocks) == 1
+    assert blocks[0].n_rods == 2 * n_replicas
+
+    run(simulator)
+
+    for replica_idx in range(n_replicas):
+        reference_simulator = EnsembleSimulator()
+        reference_rods = build_cantilevers(
+            reference_simulator,
+            0,
+            youngs_modulus[replica_idx],
+            gravity[replica_idx],
+        )
+        reference_simulator.finalize()
+        run(reference_simulator)
+
+        for rod, reference_rod in zip(
+            ensemble.replica_systems(replica_idx), reference_rods
+        ):
+            assert_array_equal(
+                rod.position_collection, reference_rod.position_collection
+            )
+            assert_array_equal(
+                rod.director_collection, reference_rod.director_collection
+            )
+            assert_array_equal(
+                rod.velocity_collection, reference_rod.velocity_collection
+            )
+
+
+def test_ensemble_replica_view():
+    n_replicas = 4
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={
+            "youngs_modulus": np.full(n_replicas, 1e6),
+            "gravity": np.linspace(-9.81, -1.0, n_replicas),
+        },
+    )
+    simulator.finalize()
+    run(simulator)
+
+    # 9 + 10 nodes and one ghost node in between
+    positions = ensemble.replica_view("position_collection")
+    assert positions.shape == (n_replicas, 3, 20)
+    directors = ensemble.replica_view("director_collection")
+    assert directors.shape == (n_replicas, 3, 3, 19)
+    kappa = ensemble.replica_view("kappa")
+    assert kappa.shape == (n_replicas, 3, 18)
+
+    for replica_idx, (first_rod, second_rod) in enumerate(ensemble.replicas):
+        assert_array_equal(positions[replica_idx, :, :9], first_rod.position_collection)
+        assert_array_equal(
+            positions[replica_idx, :, 10:], second_rod.position_collection
+        )
+        assert_array_equal(
+            directors[replica_idx, ..., 10:], second_rod.director_collection
+        )
+
+    # Views share memory with the state
+    positions[1, 0, 0] = 123.0
+    assert ensemble.replicas[1][0].position_collection[0, 0] == 123.0
+
+
+def test_ensemble_set_block_parameter_matches_built_parameters():
+    n_replicas = 3
+    youngs_modulus = np.linspace(1e5, 1e6, n_replicas)
+    gravity = np.full(n_replicas, -9.81)
+
+    expected_simulator = EnsembleSimulator()
+    expected_ensemble = Ensemble(
+        expected_simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": youngs_modulus, "gravity": gravity},
+    )
+    expected_simulator.finalize()
+
+    # Same Young's modulus for all replicas, set per replica after finalize
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": np.full(n_replicas, 1e3), "gravity": gravity},
+    )
+    simulator.finalize()
+    for attribute in ["bend_matrix", "shear_matrix"]:
+        ensemble.set_block_parameter(
+            attribute,
+            [
+                getattr(rods[0], attribute)[..., 0]
+                for rods in expected_ensemble.replicas
+            ],
+        )
+
+    block = next(iter(simulator.block_systems()))
+    expected_block = next(iter(expected_simulator.block_systems()))
+    # Ghosts are left untouched
+    assert_array_equal(
+        block.bend_matrix[..., block.ghost_voronoi_idx],
+        np.zeros((3, 3, block.ghost_voronoi_idx.shape[0])),
+    )
+    block.bend_matrix[..., block.ghost_voronoi_idx] = expected_block.bend_matrix[
+        ..., block.ghost_voronoi_idx
+    ]
+    block.shear_matrix[..., block.ghost_elems_idx] = expected_block.shear_matrix[
+        ..., block.ghost_elems_idx
+    ]
+    # The matrices of a rod built with uniform radius differ by round-off only
+    assert_allclose(block.bend_matrix, expected_block.bend_matrix, rtol=1e-15)
+    assert_allclose(block.shear_matrix, expected_block.shear_matrix, rtol=1e-15)
+
+    run(simulator)
+    run(expected_simulator)
+    for rods, expected_rods in zip(ensemble.replicas, expected_ensemble.replicas):
+        for rod, expected_rod in zip(rods, expected_rods):
+            assert_allclose(
+                rod.position_collection, expected_rod.position_collection, rtol=1e-12
+            )
+
+
+def test_ensemble_set_block_parameter_ring_rods():
+    def build_rings(simulator, replica_idx):
+        rod = ea.CosseratRod.ring_rod(
+            n_elements=10,
+            ring_center_position=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        simulator.append(rod)
+        return [rod]
+
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(simulator, n_replicas=2, build_replica=build_rings)
+    simulator.finalize()
+    ensemble.set_block_parameter("mass", [2.0, 3.0])
+
+    block = next(iter(simulator.block_systems()))
+    for (rod,), mass in zip(ensemble.replicas, [2.0, 3.0]):
+        assert_array_equal(rod.mass, np.full(rod.n_nodes, mass))
+    # Periodic boundaries hold the values of the other end of each ring
+    periodic_idx = block.periodic_boundary_nodes_idx
+    assert_array_equal(block.mass[periodic_idx[0]], block.mass[periodic_idx[1]])
+
+
+def test_ensemble_set_block_parameter_invalid_values():
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=2,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": np.ones(2), "gravity": np.ones(2)},
+    )
+    simulator.finalize()
+    with pytest.raises(ValueError) as excinfo:
+        ensemble.set_block_parameter("bend_matrix", np.ones(3))
+    assert "2 entries" in str(excinfo.value)
+
+
+def test_ensemble_invalid_parameters():
+    with pytest.raises(ValueError) as excinfo:
+        Ensemble(
+            EnsembleSimulator(),
+            n_replicas=3,
+            build_replica=build_cantilevers,
+            parameters={"youngs_modulus": np.ones(2), "gravity": np.ones(3)},
+        )
+    assert "youngs_modulus" in str(excinfo.value)
+
+
+def test_ensemble_different_layout():
+    def build_replica(simulator, replica_idx):
+        return build_cantilevers(simulator, replica_idx, 1e6, -9.81)[: replica_idx + 1]
+
+    with pytest.raises(ValueError) as excinfo:
+        Ensemble(EnsembleSimulator(), n_replicas=2, build_replica=build_replica)
+    assert "same system layout" in str(excinfo.value)
+
+
+def test_ensemble_set_feature_parameter_matches_built_parameters():
+    n_replicas = 3
+    youngs_modulus = np.full(n_replicas, 1e5)
+    gravity = np.linspace(-20.0, -5.0, n_replicas)
+
+    expected_simulator = EnsembleSimulator()
+    expected_ensemble = Ensemble(
+        expected_simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": youngs_modulus, "gravity": gravity},
+    )
+    expected_simulator.finalize()
+
+    # Same gravity for all replicas, set per replica after finalize
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=n_replicas,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": youngs_modulus, "gravity": np.zeros(n_replicas)},
+    )
+    simulator.finalize()
+    acc_gravity = np.zeros((n_replicas, 3))
+    acc_gravity[:, 0] = gravity
+    ensemble.set_feature_parameter(ea.GravityForces, "acc_gravity", acc_gravity)
+
+    # Two rods, so two gravity forcings per replica
+    assert_array_equal(
+        ensemble.feature_parameter(ea.GravityForces, "acc_gravity"),
+        np.repeat(acc_gravity[:, None], 2, axis=1),
+    )
+    assert_array_equal(
+        ensemble.feature_parameter(ea.GravityForces, "acc_gravity"),
+        expected_ensemble.feature_parameter(ea.GravityForces, "acc_gravity"),
+    )
+
+    run(simulator)
+    run(expected_simulator)
+    for rods, expected_rods in zip(ensemble.replicas, expected_ensemble.replicas):
+        for rod, expected_rod in zip(rods, expected_rods):
+            assert_array_equal(
+                rod.position_collection, expected_rod.position_collection
+            )
+
+
+def test_ensemble_set_feature_parameter_damping():
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=2,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": np.full(2, 1e5), "gravity": np.full(2, -9.81)},
+    )
+    simulator.finalize()
+
+    ensemble.set_feature_parameter(
+        ea.AnalyticalLinearDamper, "translational_damping_coefficient", [1.0, 0.5]
+    )
+
+    coefficients = ensemble.feature_parameter(
+        ea.AnalyticalLinearDamper, "translational_damping_coefficient"
+    )
+    assert_array_equal(coefficients, [[1.0, 1.0], [0.5, 0.5]])
+    # Scalar parameters keep their type
+    for dampers in ensemble._locate_features(ea.AnalyticalLinearDamper):
+        for damper in dampers:
+            assert type(damper.translational_damping_coefficient) is np.float64
+
+    for rods in ensemble.replicas:
+        for rod in rods:
+            rod.velocity_collection[...] = 1.0
+    simulator.constrain_rates(time=np.float64(0.0))
+    for rods, coefficient in zip(ensemble.replicas, [1.0, 0.5]):
+        for rod in rods:
+            assert_array_equal(rod.velocity_collection[..., 1:], coefficient)
+
+
+def test_ensemble_set_feature_parameter_shared_arrays():
+    acc_gravity = np.array([-9.81, 0.0, 0.0])
+
+    def build_replica(simulator, replica_idx):
+        rods = build_cantilevers(simulator, replica_idx, 1e5, 0.0)
+        # Gravity given as the same array to every replica
+        for rod in rods:
+            simulator.add_forcing_to(rod).using(
+                ea.GravityForces, acc_gravity=acc_gravity
+            )
+        return rods
+
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(simulator, n_replicas=2, build_replica=build_replica)
+    simulator.finalize()
+
+    ensemble.set_feature_parameter(
+        ea.GravityForces, "acc_gravity", [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    )
+
+    parameters = ensemble.feature_parameter(ea.GravityForces, "acc_gravity")
+    assert parameters.shape == (2, 4, 3)
+    assert_array_equal(parameters[0], np.tile([1.0, 2.0, 3.0], (4, 1)))
+    assert_array_equal(parameters[1], np.tile([4.0, 5.0, 6.0], (4, 1)))
+    assert_array_equal(acc_gravity, [-9.81, 0.0, 0.0])
+
+
+def test_ensemble_feature_parameter_invalid():
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=2,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": np.ones(2), "gravity": np.ones(2)},
+    )
+
+    # Features are located after finalize
+    with pytest.raises(RuntimeError) as excinfo:
+        ensemble.feature_parameter(ea.GravityForces, "acc_gravity")
+    assert "after finalize" in str(excinfo.value)
+
+    simulator.finalize()
+    with pytest.raises(ValueError) as excinfo:
+        ensemble.set_feature_parameter(ea.GravityForces, "acc_gravity", np.ones(3))
+    assert "2 entries" in str(excinfo.value)
+
+
+def test_ensemble_rods_in_several_blocks():
+    simulator = EnsembleSimulator()
+    ensemble = Ensemble(
+        simulator,
+        n_replicas=2,
+        build_replica=build_cantilevers,
+        parameters={"youngs_modulus": np.ones(2), "gravity": np.ones(2)},
+    )
+    # One memory block per replica, as a custom block layout could do
+    blocks = [
+        ea.MemoryBlockCosseratRod(
+            rods, [simulator.get_system_index(rod) for rod in rods]
+        )
+        for rods in ensemble.replicas
+    ]
+    simulator.block_systems = lambda: iter(blocks)
+
+    with pytest.raises(ValueError) as excinfo:
+        ensemble.replica_view("position_collection")
+    assert "span 2 Cosserat rod memory blocks" in str(excinfo.value)
@@ -334,6 +334,43 @@ def test_block_structure_dynamic_update(n_rods):
     )  # omega collection
 
 
+@pytest.mark.parametrize("n_rods", [1, 2, 5, 6])
+def test_block_structure_fused_dynamic_update(n_rods):
+    """
+    This function is testing that the fused acceleration and rate update of the
+    block structure matches `dynamic_rates` followed by the dynamic update.
+
+    Parameters
+    ----------
+    n_rods
+
+    Returns
+    -------
+
+    """
+
+    world_rods = [MockRod(np.random.randint(10, 30 + 1)) for _ in range(n_rods)]
+    block_structure = BlockStructureWithSymplecticStepper(world_rods)
+
+    v_w = block_structure.v_w_collection.copy()
+    prefac = np.random.randn()
+
+    # BlockStructureWithSymplecticStepper mocks update_accelerations
+    MemoryBlockCosseratRod.update_accelerations(block_structure, 0)
+    dvdt_dwdt = block_structure.dvdt_dwdt_collection.copy()
+    correct_v_w = v_w + prefac * dvdt_dwdt
+
+    block_structure.v_w_collection[:] = v_w
+    block_structure.acceleration_collection[:] = 0.0
+    block_structure.alpha_collection[:] = 0.0
+    block_structure.update_dynamic_states(0, prefac)
+
+    assert_allclose(
+        dvdt_dwdt, block_structure.dvdt_dwdt_collection, atol=Tolerance.atol()
+    )
+    assert_allclose(correct_v_w, block_structure.v_w_collection, atol=Tolerance.atol())
+
+
 if __name__ == "__main__":
     from pytest import main
 
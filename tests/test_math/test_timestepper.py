@@ -223,6 +223,25 @@ class TestSteppersAgainstCollectiveSystems:
                 atol=Tolerance.atol(),
             )
 
+    @pytest.mark.parametrize("symplectic_stepper", SymplecticSteppers)
+    def test_symplectic_steppers_update_protocol_only_systems(self, symplectic_stepper):
+        # Systems implementing SymplecticSystemProtocol without the state update
+        # methods of the rods are advanced with the default kernels
+        system = SymplecticUndampedSimpleHarmonicOscillatorSystem()
+        assert not hasattr(system, "update_kinematic_states")
+        assert not hasattr(system, "update_dynamic_states")
+        stepper = symplectic_stepper()
+
+        time = 0.0
+        for _ in range(2000):
+            time = stepper.step_single_instance(system, time, 1.0 / 2000)
+
+        assert_allclose(
+            *system.compute_energy(time),
+            rtol=Tolerance.rtol() * 1e1,
+            atol=Tolerance.atol(),
+        )
+
     @pytest.mark.parametrize("explicit_stepper", ExplicitSteppers)
     def test_explicit_steppers(self, explicit_stepper):
         collective_system = ScalarExponentialDampedHarmonicOscillatorCollectiveSystem()
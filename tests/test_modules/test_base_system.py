@@ -1,5 +1,6 @@
 __doc__ = """ Test modules for base systems """
 
+import numba
 import pytest
 import numpy as np
 
@@ -243,3 +244,41 @@ class TestBaseSystemWithFeaturesUsingCosseratRod:
 
         # TODO: this is a dummy test for apply_callbacks find a better way to test them
         simulator_class.apply_callbacks(time=0, current_step=0)
+
+    @pytest.mark.parametrize(
+        "num_threads",
+        [
+            pytest.param(
+                num_threads,
+                id=f"{num_threads}_threads",
+                marks=pytest.mark.skipif(
+                    num_threads > numba.config.NUMBA_NUM_THREADS,
+                    reason=f"needs NUMBA_NUM_THREADS >= {num_threads}",
+                ),
+            )
+            for num_threads in (1, 2)
+        ],
+    )
+    @pytest.mark.parametrize(
+        "parallel, parallel_threshold, expected",
+        [(False, 0, False), (True, 0, True), (True, 11, False)],
+    )
+    def test_finalize_parallel_kernels(
+        self, load_collection, parallel, parallel_threshold, expected, num_threads
+    ):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        simulator_class, rod = load_collection
+        simulator_class.finalize(
+            parallel=parallel,
+            num_threads=num_threads,
+            parallel_threshold=parallel_threshold,
+        )
+        blocks = [
+            block
+            for block in simulator_class.block_systems()
+            if isinstance(block, MemoryBlockCosseratRod)
+        ]
+        assert len(blocks) == 1
+        assert blocks[0].parallel_kernels == expected
+        assert blocks[0].num_threads == (num_threads if expected else None)
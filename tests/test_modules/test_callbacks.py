@@ -35,6 +35,14 @@ class TestCallBacks:
         # since its a simple return
         assert load_callback.id() == 100
 
+    def test_instance_before_instantiate_throws(self, load_callback):
+        load_callback.using(self.CallBackBaseClass)
+        with pytest.raises(RuntimeError, match="finalize"):
+            load_callback.instance
+
+        callback_instance = load_callback.instantiate()
+        assert load_callback.instance is callback_instance
+
     def test_call_improper_args_throws(self, load_callback):
         # Example of bad initiailization function
         # This needs at least four args which the user might
@@ -199,3 +207,47 @@ class TestCallBacksMixin:
         assert spy.call_count == 1
         assert spy.call_args[1]["time"] == np.float64(0.0)
         assert spy.call_args[1]["current_step"] == 0
+
+    def test_block_callback_receives_block(self):
+        import elastica as ea
+        from elastica.memory_block import MemoryBlockCosseratRod
+
+        scwc = self.SystemCollectionWithCallBacksMixedin()
+        for _ in range(2):
+            scwc.append(
+                ea.CosseratRod.straight_rod(
+                    n_elements=3,
+                    start=np.zeros(3),
+                    direction=np.array([0.0, 0.0, 1.0]),
+                    normal=np.array([1.0, 0.0, 0.0]),
+                    base_length=1.0,
+                    base_radius=0.1,
+                    density=1000.0,
+                    youngs_modulus=1e5,
+                )
+            )
+
+        class MockCallBack(self.CallBackBaseClass):
+            def __init__(self):
+                self.systems = []
+
+            def make_callback(self, system, time, current_step):
+                self.systems.append(system)
+
+        _callback = scwc.collect_block_diagnostics(MemoryBlockCosseratRod).using(
+            MockCallBack
+        )
+        scwc.finalize()
+
+        (block,) = scwc.block_systems()
+        assert _callback.instance.systems == [block]
+
+    def test_block_callback_without_block_throws(self):
+        from elastica.memory_block import MemoryBlockRigidBody
+
+        scwc = self.SystemCollectionWithCallBacksMixedin()
+        scwc.collect_block_diagnostics(MemoryBlockRigidBody).using(
+            self.CallBackBaseClass
+        )
+        with pytest.raises(RuntimeError, match="No memory block"):
+            scwc.finalize()
@@ -437,3 +437,174 @@ class TestConnectionsMixin:
                 -1 * contact_force,
                 atol=Tolerance.atol(),
             )
+
+
+def make_connected_systems():
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Connections, ea.Constraints):
+        pass
+
+    class CustomJoint(ea.FreeJoint):
+        pass
+
+    simulator = Simulator()
+    systems = [
+        ea.CosseratRod.straight_rod(
+            n_elements=4 + k,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        for k in range(3)
+    ]
+    systems.append(
+        ea.CosseratRod.ring_rod(
+            n_elements=8,
+            ring_center_position=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+    )
+    systems.append(ea.Sphere(np.array([0.0, 1.0, 0.0]), 0.1, 1000.0))
+    systems.append(ea.Sphere(np.array([0.0, 2.0, 0.0]), 0.2, 1000.0))
+    for system in systems:
+        simulator.append(system)
+
+    rng = np.random.default_rng(0)
+
+    def rotation():
+        return np.linalg.qr(rng.normal(size=(3, 3)))[0]
+
+    rod_one, rod_two, rod_three, ring, sphere_one, sphere_two = systems
+    connections = [
+        (rod_one, rod_two, -1, 0, ea.FreeJoint, dict(k=1e3, nu=1.0)),
+        (ring, rod_one, 2, 3, ea.FreeJoint, dict(k=2e3, nu=0.5)),
+        (rod_two, rod_three, -1, 0, ea.FreeJoint, dict(k=3e3, nu=0.0)),
+        (
+            rod_one,
+            rod_three,
+            -1,
+            0,
+            ea.HingeJoint,
+            dict(k=1e3, nu=1.0, kt=1e2, normal_direction=rng.normal(size=3)),
+        ),
+        (
+            rod_two,
+            ring,
+            0,
+            -1,
+            ea.HingeJoint,
+            dict(k=2e3, nu=2.0, kt=2e2, normal_direction=rng.normal(size=3)),
+        ),
+        (
+            rod_three,
+            ring,
+            -1,
+            0,
+            ea.FixedJoint,
+            dict(k=1e3, nu=1.0, kt=1e2, nut=0.1, rest_rotation_matrix=rotation()),
+        ),
+        (rod_one, rod_two, 0, -1, ea.FixedJoint, dict(k=2e3, nu=0.5, kt=3e2)),
+        # Rods to rigid bodies, merged separately
+        (rod_one, sphere_one, -1, 0, ea.FixedJoint, dict(k=1e3, nu=1.0, kt=1e2)),
+        (
+            rod_two,
+            sphere_two,
+            -1,
+            0,
+            ea.FixedJoint,
+            dict(k=2e3, nu=1.0, kt=2e2, nut=0.2, rest_rotation_matrix=rotation()),
+        ),
+        # Not merged: subclass of a joint and connection over several indices
+        (rod_three, sphere_one, 0, 0, CustomJoint, dict(k=1e3, nu=1.0)),
+        (rod_one, rod_three, [0, 1], [1, 2], ea.FreeJoint, dict(k=1e3, nu=1.0)),
+    ]
+    for first, second, first_idx, second_idx, joint_cls, kwargs in connections:
+        simulator.connect(first, second, first_idx, second_idx).using(
+            joint_cls, **kwargs
+        )
+    simulator.finalize()
+
+    for block in simulator.block_systems():
+        block.position_collection[...] = rng.normal(
+            size=block.position_collection.shape
+        )
+        block.velocity_collection[...] = rng.normal(
+            size=block.velocity_collection.shape
+        )
+        block.omega_collection[...] = rng.normal(size=block.omega_collection.shape)
+        for k in range(block.director_collection.shape[2]):
+            block.director_collection[..., k] = rotation()
+    return simulator, systems
+
+
+def test_batched_joints_match_joints_per_connection(monkeypatch):
+    from elastica.modules import operator_plan
+
+    simulator, systems = make_connected_systems()
+    report = simulator.operator_plan_report()["synchronize"]
+    # One operator per joint class between rods, one for the fixed joints between
+    # rods and rigid bodies, and the two connections that are not merged
+    assert report["batched"] == 9
+    assert report["batches"] == 4
+    assert report["calls"] == 6
+
+    monkeypatch.setattr(operator_plan, "_batched_connections", {})
+    expected_simulator, expected_systems = make_connected_systems()
+    assert expected_simulator.operator_plan_report()["synchronize"]["batches"] == 0
+
+    for operator in simulator._operators_synchronize:
+        operator(time=np.float64(0.0))
+    for operator in expected_simulator._operators_synchronize:
+        operator(time=np.float64(0.0))
+
+    for system, expected_system in zip(systems, expected_systems):
+        assert np.any(system.external_forces != 0.0)
+        assert np.any(system.external_torques != 0.0)
+        np.testing.assert_array_equal(
+            system.external_forces, expected_system.external_forces
+        )
+        np.testing.assert_array_equal(
+            system.external_torques, expected_system.external_torques
+        )
+
+
+def test_batched_joints_check_connection_indices():
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Connections):
+        pass
+
+    simulator = Simulator()
+    rods = [
+        ea.CosseratRod.straight_rod(
+            n_elements=4,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        for k in range(3)
+    ]
+    for rod in rods:
+        simulator.append(rod)
+    # The last node has no element to apply the restoring torque to
+    for first, second in [(rods[0], rods[1]), (rods[1], rods[2])]:
+        simulator.connect(first, second, 4, 0).using(
+            ea.FixedJoint, k=1e3, nu=1.0, kt=1e2
+        )
+
+    with pytest.raises(IndexError, match="out of range of the elements"):
+        simulator.finalize()
@@ -349,3 +349,228 @@ class TestConstraintsMixin:
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
+
+
+def make_constrained_systems():
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Constraints):
+        pass
+
+    simulator = Simulator()
+    systems = [
+        ea.CosseratRod.straight_rod(
+            n_elements=4 + k,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        for k in range(3)
+    ]
+    systems.append(
+        ea.CosseratRod.ring_rod(
+            n_elements=8,
+            ring_center_position=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+    )
+    systems.append(ea.Sphere(np.array([0.0, 1.0, 0.0]), 0.1, 1000.0))
+    systems.append(ea.Sphere(np.array([0.0, 2.0, 0.0]), 0.2, 1000.0))
+    for system in systems:
+        simulator.append(system)
+
+    simulator.constrain(systems[0]).using(
+        ea.OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+    )
+    simulator.constrain(systems[0]).using(
+        ea.GeneralConstraint,
+        constrained_position_idx=(-1,),
+        constrained_director_idx=(-1,),
+        translational_constraint_selector=np.array([True, False, True]),
+        rotational_constraint_selector=np.array([False, True, False]),
+    )
+    simulator.constrain(systems[0]).using(
+        ea.FixedConstraint, constrained_position_idx=(2,), constrained_director_idx=(1,)
+    )
+    simulator.constrain(systems[1]).using(
+        ea.FixedConstraint,
+        constrained_position_idx=(0, -1),
+        constrained_director_idx=(0, -1),
+    )
+    simulator.constrain(systems[2]).using(ea.FreeBC)
+    simulator.constrain(systems[2]).using(
+        ea.GeneralConstraint,
+        constrained_position_idx=(1, -2),
+        constrained_director_idx=(0,),
+        translational_constraint_selector=np.array([False, True, False]),
+    )
+    simulator.constrain(systems[3]).using(
+        ea.FixedConstraint, constrained_position_idx=(3,), constrained_director_idx=(3,)
+    )
+    simulator.constrain(systems[3]).using(
+        ea.GeneralConstraint,
+        constrained_director_idx=(-1,),
+        rotational_constraint_selector=np.array([True, False, True]),
+    )
+    simulator.constrain(systems[4]).using(
+        ea.FixedConstraint, constrained_position_idx=(0,), constrained_director_idx=(0,)
+    )
+    simulator.constrain(systems[5]).using(
+        ea.GeneralConstraint,
+        constrained_position_idx=(0,),
+        constrained_director_idx=(-1,),
+        translational_constraint_selector=np.array([True, True, False]),
+        rotational_constraint_selector=np.array([False, False, True]),
+    )
+    simulator.finalize()
+
+    # Move away from the constrained state
+    rng = np.random.default_rng(0)
+    for system in systems:
+        system.position_collection[...] += rng.normal(
+            size=system.position_collection.shape
+        )
+        system.director_collection[...] = np.linalg.qr(rng.normal(size=(3, 3)))[0][
+            ..., None
+        ]
+        system.velocity_collection[...] = rng.normal(
+            size=system.velocity_collection.shape
+        )
+        system.omega_collection[...] = rng.normal(size=system.omega_collection.shape)
+    return simulator, systems
+
+
+def test_batched_constraints_match_constraints_per_system(monkeypatch):
+    from elastica.modules import operator_plan
+
+    simulator, systems = make_constrained_systems()
+    report = simulator.operator_plan_report()
+    # All constraints of a memory block are merged, whatever their class, the FreeBC
+    # is dropped and the periodic boundaries of the ring rod are synchronized last.
+    for group in ("constrain_values", "constrain_rates"):
+        assert report[group]["skipped"] == 1
+        assert report[group]["batched"] == 9
+        assert report[group]["batches"] == 2
+        assert report[group]["calls"] == 3
+
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_systems = make_constrained_systems()
+    assert expected_simulator.operator_plan_report()["constrain_values"]["batches"] == 0
+
+    for sim in (simulator, expected_simulator):
+        sim.constrain_values(time=np.float64(0.0))
+        sim.constrain_rates(time=np.float64(0.0))
+
+    for system, expected_system in zip(systems, expected_systems):
+        for name in (
+            "position_collection",
+            "director_collection",
+            "velocity_collection",
+            "omega_collection",
+        ):
+            np.testing.assert_array_equal(
+                getattr(system, name), getattr(expected_system, name)
+            )
+    np.testing.assert_array_equal(systems[1].velocity_collection[..., [0, -1]], 0.0)
+    np.testing.assert_array_equal(systems[0].velocity_collection[[0, 2], -1], 0.0)
+    assert np.all(systems[0].velocity_collection[1, -1] != 0.0)
+
+
+def test_constraint_subclasses_are_not_batched():
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Constraints):
+        pass
+
+    class FixedPositionOnlyBC(ea.OneEndFixedBC):
+        """Overrides only the helper called by `OneEndFixedBC.constrain_rates`"""
+
+        @staticmethod
+        def compute_constrain_rates(velocity_collection, omega_collection):
+            velocity_collection[..., 0] = 0.0
+
+    class InheritedFixedConstraint(ea.FixedConstraint):
+        pass
+
+    simulator = Simulator()
+    systems = []
+    for k, constraint in enumerate(
+        [
+            ea.OneEndFixedBC,
+            FixedPositionOnlyBC,
+            InheritedFixedConstraint,
+            ea.OneEndFixedBC,
+        ]
+    ):
+        rod = ea.CosseratRod.straight_rod(
+            n_elements=4,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        simulator.append(rod)
+        simulator.constrain(rod).using(
+            constraint, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        systems.append(rod)
+    simulator.finalize()
+
+    report = simulator.operator_plan_report()["constrain_rates"]
+    assert report["batched"] == 2
+    assert report["calls"] == 3
+
+    for system in systems:
+        system.velocity_collection[...] = 1.0
+        system.omega_collection[...] = 1.0
+    simulator.constrain_rates(time=np.float64(0.0))
+
+    for system in systems:
+        np.testing.assert_array_equal(system.velocity_collection[..., 0], 0.0)
+    for system, fixed_omega in zip(systems, [True, False, True, True]):
+        np.testing.assert_array_equal(
+            system.omega_collection[..., 0], 0.0 if fixed_omega else 1.0
+        )
+
+
+def test_gather_constrained_indices_rejects_subclasses():
+    import elastica as ea
+    from elastica.boundary_conditions import _gather_constrained_indices
+
+    class InheritedGeneralConstraint(ea.GeneralConstraint):
+        pass
+
+    rod = ea.CosseratRod.straight_rod(
+        n_elements=4,
+        start=np.zeros(3),
+        direction=np.array([0.0, 0.0, 1.0]),
+        normal=np.array([1.0, 0.0, 0.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=1e5,
+    )
+    constraint = InheritedGeneralConstraint(
+        rod.position_collection[..., [0]],
+        rod.director_collection[..., [0]],
+        _system=rod,
+        constrained_position_idx=(0,),
+        constrained_director_idx=(0,),
+    )
+    block = ea.MemoryBlockCosseratRod([rod], [0])
+
+    with pytest.raises(TypeError) as excinfo:
+        _gather_constrained_indices([constraint], block, np.array([0], dtype=np.int32))
+    assert "InheritedGeneralConstraint" in str(excinfo.value)
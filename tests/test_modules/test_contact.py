@@ -402,3 +402,70 @@ class TestContactMixin:
                 external_forces_system_two,
                 atol=Tolerance.atol(),
             )
+
+
+class TestContactAmong:
+    from elastica.modules import BaseSystemCollection, Constraints
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Constraints, Contact):
+        pass
+
+    @staticmethod
+    def make_rod():
+        import elastica as ea
+
+        return ea.CosseratRod.straight_rod(
+            n_elements=4,
+            start=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.1,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+
+    def test_contact_among_registers_one_operator(self):
+        from elastica.contact_forces import RodRodContact
+        from elastica.contact_broad_phase import UniformGridBroadPhase
+
+        scwc = self.SystemCollectionWithContactMixin()
+        rods = [self.make_rod() for _ in range(4)]
+        for rod in rods:
+            scwc.append(rod)
+        broad_phase = UniformGridBroadPhase()
+        _contact = scwc.detect_contact_among(rods[::-1], broad_phase=broad_phase)
+        _contact.using(RodRodContact, k=1.0, nu=0.0)
+        assert _contact.id() == [3, 2, 1, 0]
+
+        scwc.finalize()
+
+        (operator,) = list(scwc._feature_group_synchronize)
+        group = operator.keywords["contact_group"]
+        assert group.broad_phase is broad_phase
+        np.testing.assert_array_equal(np.unique(group.rank), np.arange(4))
+        # Rank follows the order of the group
+        assert np.all(group.elem_idx[group.rank == 0] >= group.elem_idx.max() - 4)
+
+    @pytest.mark.parametrize("n_rods, duplicate", [(1, False), (2, True)])
+    def test_contact_among_invalid_group_throws(self, n_rods, duplicate):
+        scwc = self.SystemCollectionWithContactMixin()
+        rods = [self.make_rod() for _ in range(n_rods)]
+        for rod in rods:
+            scwc.append(rod)
+        if duplicate:
+            rods[1] = rods[0]
+        with pytest.raises(ValueError):
+            scwc.detect_contact_among(rods)
+
+    def test_contact_among_unsupported_contact_throws(self):
+        from elastica.contact_forces import RodSelfContact
+
+        scwc = self.SystemCollectionWithContactMixin()
+        rods = [self.make_rod() for _ in range(2)]
+        for rod in rods:
+            scwc.append(rod)
+        scwc.detect_contact_among(rods).using(RodSelfContact, k=1.0, nu=0.0)
+
+        with pytest.raises(TypeError, match="does not support contact among"):
+            scwc.finalize()
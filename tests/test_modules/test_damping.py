@@ -204,3 +204,265 @@ class TestDampingMixin:
         for x, _ in scwd._dampers:
             assert num < x
             num = x
+
+
+def make_damped_systems(make_dampers):
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Constraints, ea.Damping):
+        pass
+
+    simulator = Simulator()
+    rods = [
+        ea.CosseratRod.straight_rod(
+            n_elements=4 + k,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05 + 0.01 * k,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        for k in range(3)
+    ]
+    rods.extend(
+        ea.CosseratRod.ring_rod(
+            n_elements=8 + k,
+            ring_center_position=np.array([0.0, k, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        for k in range(2)
+    )
+    for rod in rods:
+        simulator.append(rod)
+    for rod, damper_cls, kwargs in make_dampers(rods):
+        simulator.dampen(rod).using(damper_cls, **kwargs)
+    simulator.finalize()
+
+    rng = np.random.default_rng(0)
+    (block,) = simulator.block_systems()
+    block.velocity_collection[...] = rng.normal(size=block.velocity_collection.shape)
+    block.omega_collection[...] = rng.normal(size=block.omega_collection.shape)
+    return simulator, block
+
+
+def make_analytical_linear_dampers(rods):
+    from elastica import AnalyticalLinearDamper
+
+    # The second rod is not damped, the first one is damped twice
+    return [
+        (
+            rod,
+            AnalyticalLinearDamper,
+            dict(damping_constant=damping_constant, time_step=1e-2),
+        )
+        for rod, damping_constant in zip(
+            [rods[0], rods[0], rods[2], rods[3]], [0.5, 2.0, 1.0, 3.0]
+        )
+    ]
+
+
+def test_batched_analytical_linear_damper_matches_dampers_per_rod(monkeypatch):
+    from elastica.modules import operator_plan
+
+    simulator, block = make_damped_systems(make_analytical_linear_dampers)
+    report = simulator.operator_plan_report()["constrain_rates"]
+    # One call for the dampers and one for the periodic boundaries of the ring rods
+    assert report["batched"] == 4
+    assert report["calls"] == 2
+
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_block = make_damped_systems(
+        make_analytical_linear_dampers
+    )
+    assert expected_simulator.operator_plan_report()["constrain_rates"]["calls"] == 5
+
+    rng = np.random.default_rng(1)
+    dilatation = 1.0 + 0.1 * rng.normal(size=block.dilatation.shape)
+    # The second step reuses the rotational damping factors of the first one
+    for new_dilatation in [dilatation, dilatation, dilatation[::-1]]:
+        block.dilatation[...] = new_dilatation
+        expected_block.dilatation[...] = new_dilatation
+        simulator.constrain_rates(time=np.float64(0.0))
+        expected_simulator.constrain_rates(time=np.float64(0.0))
+
+        # Ghosts and rods without damper are left untouched
+        np.testing.assert_array_equal(
+            block.velocity_collection, expected_block.velocity_collection
+        )
+        np.testing.assert_array_equal(
+            block.omega_collection, expected_block.omega_collection
+        )
+
+
+def test_batched_analytical_linear_damper_reads_coefficients_changed_after_finalize(
+    monkeypatch,
+):
+    from elastica import AnalyticalLinearDamper
+    from elastica.modules import operator_plan
+
+    simulator, block = make_damped_systems(make_analytical_linear_dampers)
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_block = make_damped_systems(
+        make_analytical_linear_dampers
+    )
+
+    for sim in (simulator, expected_simulator):
+        sim.constrain_rates(time=np.float64(0.0))
+        dampers = [
+            operator.func.__self__
+            for operator in sim._feature_group_constrain_rates
+            if type(operator.func.__self__) is AnalyticalLinearDamper
+        ]
+        # Rebound and changed in place
+        dampers[0].translational_damping_coefficient = np.float64(0.5)
+        dampers[-1].rotational_damping_coefficient *= 0.5
+        sim.constrain_rates(time=np.float64(0.0))
+
+    np.testing.assert_array_equal(
+        block.velocity_collection, expected_block.velocity_collection
+    )
+    np.testing.assert_array_equal(
+        block.omega_collection, expected_block.omega_collection
+    )
+
+
+def test_analytical_linear_damper_subclasses_are_not_batched():
+    from elastica import AnalyticalLinearDamper
+
+    class TranslationalDamper(AnalyticalLinearDamper):
+        """Damps the velocities only"""
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.rotational_damping_coefficient[...] = 1.0
+
+    def make_dampers(rods):
+        return [
+            (rod, damper_cls, dict(damping_constant=1.0, time_step=1e-2))
+            for rod, damper_cls in zip(
+                rods,
+                [AnalyticalLinearDamper, TranslationalDamper, AnalyticalLinearDamper],
+            )
+        ]
+
+    simulator, block = make_damped_systems(make_dampers)
+    report = simulator.operator_plan_report()["constrain_rates"]
+    # Dampers of the first and third rods, subclass, periodic boundaries
+    assert report["batched"] == 2
+    assert report["calls"] == 3
+
+    omega = [rod.omega_collection.copy() for rod in simulator[:3]]
+    simulator.constrain_rates(time=np.float64(0.0))
+    for rod, rod_omega, damped in zip(simulator[:3], omega, [True, False, True]):
+        assert np.all(rod.omega_collection != rod_omega) == damped
+
+
+def make_laplace_dissipation_filters(rods):
+    from elastica import AnalyticalLinearDamper, LaplaceDissipationFilter
+
+    # The second rod is not filtered, the first one is filtered twice, the first rod
+    # and the last ring rod are damped before being filtered
+    damper_kwargs = dict(damping_constant=1.0, time_step=1e-2)
+    return [
+        (rods[0], AnalyticalLinearDamper, damper_kwargs),
+        (rods[0], LaplaceDissipationFilter, dict(filter_order=2)),
+        (rods[0], LaplaceDissipationFilter, dict(filter_order=5)),
+        (rods[2], LaplaceDissipationFilter, dict(filter_order=3)),
+        (rods[3], LaplaceDissipationFilter, dict(filter_order=1)),
+        (rods[4], AnalyticalLinearDamper, damper_kwargs),
+        (rods[4], LaplaceDissipationFilter, dict(filter_order=4)),
+    ]
+
+
+def test_batched_laplace_dissipation_filter_matches_filters_per_rod(monkeypatch):
+    from elastica.modules import operator_plan
+
+    simulator, block = make_damped_systems(make_laplace_dissipation_filters)
+    report = simulator.operator_plan_report()["constrain_rates"]
+    # One call for the dampers, one for the filters and one for the periodic
+    # boundaries of the ring rods
+    assert report["batched"] == 7
+    assert report["calls"] == 3
+
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_block = make_damped_systems(
+        make_laplace_dissipation_filters
+    )
+    assert expected_simulator.operator_plan_report()["constrain_rates"]["calls"] == 8
+
+    for _ in range(2):
+        simulator.constrain_rates(time=np.float64(0.0))
+        expected_simulator.constrain_rates(time=np.float64(0.0))
+
+        # Ghosts and rods without filter are left untouched
+        np.testing.assert_array_equal(
+            block.velocity_collection, expected_block.velocity_collection
+        )
+        np.testing.assert_array_equal(
+            block.omega_collection, expected_block.omega_collection
+        )
+
+
+def test_laplace_dissipation_filter_subclasses_are_not_batched():
+    from elastica import LaplaceDissipationFilter
+
+    class IdleFilter(LaplaceDissipationFilter):
+        """Replaces the filter function chosen by `LaplaceDissipationFilter`"""
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.filter_function = lambda *args: None
+
+    def make_filters(rods):
+        return [
+            (rod, filter_cls, dict(filter_order=2))
+            for rod, filter_cls in zip(
+                rods, [LaplaceDissipationFilter, IdleFilter, LaplaceDissipationFilter]
+            )
+        ]
+
+    simulator, block = make_damped_systems(make_filters)
+    report = simulator.operator_plan_report()["constrain_rates"]
+    # Filters of the first and third rods, subclass, periodic boundaries
+    assert report["batched"] == 2
+    assert report["calls"] == 3
+
+    velocities = [rod.velocity_collection.copy() for rod in simulator[:3]]
+    simulator.constrain_rates(time=np.float64(0.0))
+    for rod, velocity, filtered in zip(simulator[:3], velocities, [True, False, True]):
+        assert np.any(rod.velocity_collection != velocity) == filtered
+
+
+def test_batched_laplace_dissipation_filter_rejects_subclasses():
+    import elastica as ea
+    from elastica.dissipation import _batched_laplace_dissipation_filter
+
+    class InheritedFilter(ea.LaplaceDissipationFilter):
+        pass
+
+    rod = ea.CosseratRod.straight_rod(
+        n_elements=4,
+        start=np.zeros(3),
+        direction=np.array([0.0, 0.0, 1.0]),
+        normal=np.array([1.0, 0.0, 0.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=1e5,
+    )
+    block = ea.MemoryBlockCosseratRod([rod], [0])
+
+    with pytest.raises(TypeError) as excinfo:
+        _batched_laplace_dissipation_filter(
+            [InheritedFilter(filter_order=2, _system=rod)],
+            block,
+            np.array([0], dtype=np.int32),
+        )
+    assert "InheritedFilter" in str(excinfo.value)
@@ -1,5 +1,7 @@
 from elastica.modules.operator_group import OperatorGroupFIFO
 import functools
+import gc
+import weakref
 
 
 def test_add_ids():
@@ -140,3 +142,40 @@ class TestOperatorGroupingWithCallableModules:
 
         assert op_a.value == 1
         assert op_b.value2 == -1
+
+
+def test_ids_of_released_features_are_not_reused():
+    class Feature:
+        pass
+
+    group = OperatorGroupFIFO()
+    features = [Feature() for _ in range(10)]
+    for k, feature in enumerate(features):
+        group.append_id(feature)
+        group.add_operators(feature, [k])
+    # Features are released after finalize, before features created at finalize
+    # register their operators
+    del features, feature
+    late_features = [Feature() for _ in range(10)]
+    for k, feature in enumerate(late_features):
+        group.append_id(feature)
+        group.add_operators(feature, [10 + k])
+
+    assert list(group) == list(range(20))
+
+
+def test_group_keeps_features_alive():
+    # Features are looked up by id, which is only unique among live objects
+    class Feature:
+        pass
+
+    group = OperatorGroupFIFO()
+    feature = Feature()
+    reference = weakref.ref(feature)
+    group.append_id(feature)
+    group.add_operators(feature, [0])
+    del feature
+    gc.collect()
+
+    assert reference() is not None
+    assert group.is_last(reference())
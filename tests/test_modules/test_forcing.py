@@ -230,3 +230,183 @@ class TestForcingMixin:
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
+
+
+def make_forced_systems():
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Forcing, ea.Constraints):
+        pass
+
+    simulator = Simulator()
+    systems = [
+        ea.CosseratRod.straight_rod(
+            n_elements=4 + k,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0 + 100.0 * k,
+            youngs_modulus=1e5,
+        )
+        for k in range(3)
+    ]
+    systems.append(
+        ea.CosseratRod.ring_rod(
+            n_elements=8,
+            ring_center_position=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+    )
+    systems.append(ea.Sphere(np.array([0.0, 1.0, 0.0]), 0.1, 1000.0))
+    systems.append(ea.Sphere(np.array([0.0, 2.0, 0.0]), 0.2, 1000.0))
+    rng = np.random.default_rng(0)
+    for system in systems:
+        simulator.append(system)
+        system.director_collection[...] = np.linalg.qr(rng.normal(size=(3, 3)))[0][
+            ..., None
+        ]
+    for k, system in enumerate(systems):
+        simulator.add_forcing_to(system).using(
+            ea.GravityForces, acc_gravity=rng.normal(size=3)
+        )
+        simulator.add_forcing_to(system).using(
+            ea.UniformForces, force=1.0 + k, direction=rng.normal(size=3)
+        )
+        simulator.add_forcing_to(system).using(
+            ea.UniformTorques, torque=2.0 + k, direction=rng.normal(size=3)
+        )
+        simulator.add_forcing_to(system).using(
+            ea.EndpointForces,
+            start_force=rng.normal(size=3),
+            end_force=rng.normal(size=3),
+            ramp_up_time=0.5 + k,
+        )
+    # Second gravity on the first rod, after the other forcings
+    simulator.add_forcing_to(systems[0]).using(
+        ea.GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+    )
+    simulator.finalize()
+    return simulator, systems
+
+
+@pytest.mark.parametrize("time", [0.0, 0.25, 10.0])
+def test_batched_forcing_matches_forcing_per_system(monkeypatch, time):
+    from elastica.modules import operator_plan
+
+    simulator, systems = make_forced_systems()
+    report = simulator.operator_plan_report()["synchronize"]
+    # Rods and rigid bodies are in two memory blocks and each forcing class is merged
+    # per block. The second gravity of the first rod cannot move before its other
+    # forcings, so it is called on its own.
+    assert report["batches"] == 8
+    assert report["calls"] == 9
+
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_systems = make_forced_systems()
+    assert expected_simulator.operator_plan_report()["synchronize"]["batches"] == 0
+
+    for operator in simulator._operators_synchronize:
+        operator(time=np.float64(time))
+    for operator in expected_simulator._operators_synchronize:
+        operator(time=np.float64(time))
+
+    for system, expected_system in zip(systems, expected_systems):
+        assert np.any(system.external_forces != 0.0)
+        np.testing.assert_array_equal(
+            system.external_forces, expected_system.external_forces
+        )
+        np.testing.assert_array_equal(
+            system.external_torques, expected_system.external_torques
+        )
+
+
+def make_gravity_rods(override_helper):
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Forcing):
+        pass
+
+    class HalfGravityForces(ea.GravityForces):
+        """Overrides only the helper called by `GravityForces.apply_forces`"""
+
+        @staticmethod
+        def compute_gravity_forces(acc_gravity, mass, external_forces):
+            external_forces += 0.5 * acc_gravity[:, None] * mass
+
+    simulator = Simulator()
+    systems = []
+    for k, half in enumerate(override_helper):
+        rod = ea.CosseratRod.straight_rod(
+            n_elements=4,
+            start=np.array([0.1 * k, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e5,
+        )
+        simulator.append(rod)
+        simulator.add_forcing_to(rod).using(
+            HalfGravityForces if half else ea.GravityForces,
+            acc_gravity=np.array([0.0, -9.81, -19.62]),
+        )
+        systems.append(rod)
+    simulator.finalize()
+    return simulator, systems
+
+
+def test_forcing_subclasses_are_not_batched():
+    simulator, systems = make_gravity_rods([False, True, False])
+    assert simulator.operator_plan_report()["synchronize"]["batched"] == 2
+
+    for operator in simulator._operators_synchronize:
+        operator(time=np.float64(0.0))
+
+    for system, factor in zip(systems, [1.0, 0.5, 1.0]):
+        np.testing.assert_allclose(
+            system.external_forces[1:],
+            factor * np.array([[-9.81], [-19.62]]) * system.mass,
+        )
+
+
+def test_batched_forcing_reads_parameters_changed_after_finalize(monkeypatch):
+    import elastica as ea
+    from elastica.modules import operator_plan
+
+    simulator, systems = make_forced_systems()
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    expected_simulator, expected_systems = make_forced_systems()
+
+    for sim in (simulator, expected_simulator):
+        for operator in sim._feature_group_synchronize:
+            forcing = operator.func.__self__
+            if type(forcing) is ea.GravityForces:
+                # Changed in place
+                forcing.acc_gravity[1] = 0.0
+            elif type(forcing) is ea.EndpointForces:
+                # Rebound
+                forcing.start_force = 2.0 * forcing.start_force
+                forcing.ramp_up_time = np.float64(0.1)
+            elif type(forcing) is ea.UniformForces:
+                forcing.force *= 3.0
+
+    for operator in simulator._operators_synchronize:
+        operator(time=np.float64(0.3))
+    for operator in expected_simulator._operators_synchronize:
+        operator(time=np.float64(0.3))
+
+    for system, expected_system in zip(systems, expected_systems):
+        np.testing.assert_array_equal(
+            system.external_forces, expected_system.external_forces
+        )
+        np.testing.assert_array_equal(
+            system.external_torques, expected_system.external_torques
+        )
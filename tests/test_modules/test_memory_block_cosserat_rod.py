@@ -1,5 +1,10 @@
 __doc__ = """" Test modules to construct memory block for Cosserat rods """
 
+import os
+import subprocess
+import sys
+
+import numba
 import pytest
 import random
 import numpy as np
@@ -222,3 +227,238 @@ def test_memory_block_rod(n_straight_rods, n_ring_rods):
                 memory_block.__dict__[attr_x],
                 memory_block.__dict__[attr_y],
             )
+
+
+@pytest.mark.parametrize("n_straight_rods", [1, 2, 5])
+@pytest.mark.parametrize("n_ring_rods", [0, 1, 2])
+def test_memory_block_rod_internal_forces_and_torques_with_workspace(
+    n_straight_rods, n_ring_rods
+):
+    """
+    Test that computing internal forces and torques of the memory block using the
+    preallocated workspace gives exactly the same result as the allocating
+    implementation of CosseratRod, and that the workspace is not reallocated.
+
+    Parameters
+    ----------
+    n_straight_rods: int
+        Number of straight rods.
+    n_ring_rods: int
+        Number of ring rods.
+
+    """
+    from elastica.rod.cosserat_rod import CosseratRod
+
+    n_rods = n_straight_rods + n_ring_rods
+    n_elems = np.random.randint(low=10, high=31, size=(n_rods,))
+    systems = [
+        BaseRodForTesting(n_elems=n_elems[k], ring_rod_flag=False)
+        for k in range(n_straight_rods)
+    ] + [
+        BaseRodForTesting(n_elems=n_elems[k + n_straight_rods], ring_rod_flag=True)
+        for k in range(n_ring_rods)
+    ]
+    memory_block = MemoryBlockCosseratRod(
+        systems=systems, system_idx_list=np.arange(0, n_rods)
+    )
+    workspace_buffers = dict(vars(memory_block.workspace))
+
+    output_attrs = [
+        "lengths",
+        "tangents",
+        "radius",
+        "dilatation",
+        "voronoi_dilatation",
+        "dilatation_rate",
+        "sigma",
+        "kappa",
+        "internal_stress",
+        "internal_couple",
+        "internal_forces",
+        "internal_torques",
+    ]
+
+    CosseratRod.compute_internal_forces_and_torques(memory_block, np.float64(0.0))
+    expected = {attr: memory_block.__dict__[attr].copy() for attr in output_attrs}
+
+    for attr in output_attrs:
+        memory_block.__dict__[attr][...] = np.random.randn(
+            *memory_block.__dict__[attr].shape
+        )
+    memory_block.compute_internal_forces_and_torques(np.float64(0.0))
+
+    for attr in output_attrs:
+        assert_array_equal(memory_block.__dict__[attr], expected[attr])
+
+    for name, buffer in workspace_buffers.items():
+        assert getattr(memory_block.workspace, name) is buffer
+
+
+# Thread counts the parallel kernels are tested with. Counts above NUMBA_NUM_THREADS
+# are skipped, and run by test_parallel_kernels_with_two_threads in a subprocess.
+thread_counts = [
+    pytest.param(
+        num_threads,
+        id=f"{num_threads}_threads",
+        marks=pytest.mark.skipif(
+            num_threads > numba.config.NUMBA_NUM_THREADS,
+            reason=f"needs NUMBA_NUM_THREADS >= {num_threads}",
+        ),
+    )
+    for num_threads in (1, 2)
+]
+
+
+@pytest.mark.parametrize("num_threads", thread_counts)
+@pytest.mark.parametrize("n_straight_rods", [1, 3])
+@pytest.mark.parametrize("n_ring_rods", [0, 2])
+def test_memory_block_rod_parallel_kernels(n_straight_rods, n_ring_rods, num_threads):
+    """
+    Test that the multithreaded kernels of the memory block give exactly the same
+    result as the serial kernels.
+
+    Parameters
+    ----------
+    n_straight_rods: int
+        Number of straight rods.
+    n_ring_rods: int
+        Number of ring rods.
+    num_threads: int
+        Number of threads of the parallel kernels.
+
+    """
+    n_rods = n_straight_rods + n_ring_rods
+    n_elems = np.random.randint(low=10, high=31, size=(n_rods,))
+    systems = [
+        BaseRodForTesting(n_elems=n_elems[k], ring_rod_flag=False)
+        for k in range(n_straight_rods)
+    ] + [
+        BaseRodForTesting(n_elems=n_elems[k + n_straight_rods], ring_rod_flag=True)
+        for k in range(n_ring_rods)
+    ]
+    memory_block = MemoryBlockCosseratRod(
+        systems=systems, system_idx_list=np.arange(0, n_rods)
+    )
+    assert not memory_block.parallel_kernels
+
+    state_attrs = [
+        "position_collection",
+        "director_collection",
+        "velocity_collection",
+        "omega_collection",
+        "acceleration_collection",
+        "alpha_collection",
+        "internal_forces",
+        "internal_torques",
+        "kappa",
+        "dilatation_rate",
+    ]
+    initial_state = {attr: memory_block.__dict__[attr].copy() for attr in state_attrs}
+
+    def advance(block):
+        block.update_kinematic_states(np.float64(0.0), np.float64(1e-3))
+        block.compute_internal_forces_and_torques(np.float64(0.0))
+        block.update_dynamic_states(np.float64(0.0), np.float64(1e-3))
+
+    advance(memory_block)
+    expected = {attr: memory_block.__dict__[attr].copy() for attr in state_attrs}
+
+    for attr in state_attrs:
+        memory_block.__dict__[attr][...] = initial_state[attr]
+    memory_block.enable_parallel_kernels(num_threads=num_threads)
+    advance(memory_block)
+
+    assert memory_block.parallel_kernels
+    for attr in state_attrs:
+        assert_array_equal(memory_block.__dict__[attr], expected[attr])
+
+
+@pytest.mark.skipif(
+    numba.config.NUMBA_NUM_THREADS < 2, reason="needs NUMBA_NUM_THREADS >= 2"
+)
+def test_memory_block_rod_parallel_kernels_2_threads_restore_num_threads(
+    monkeypatch,
+):
+    """
+    Test that the parallel kernels run with the thread count of the block, and that
+    numba's thread count is restored after each call.
+    """
+    import elastica.memory_block.memory_block_rod as memory_block_rod
+
+    kernel_names = [
+        "overload_operator_kinematic_numba_parallel",
+        "_compute_internal_forces_and_torques_parallel",
+        "_update_accelerations_and_rates_parallel",
+    ]
+    num_threads_in_kernels = []
+    for kernel_name in kernel_names:
+        kernel = getattr(memory_block_rod, kernel_name)
+
+        def recording_kernel(*args, kernel=kernel, **kwargs):
+            num_threads_in_kernels.append(numba.get_num_threads())
+            kernel(*args, **kwargs)
+
+        monkeypatch.setattr(memory_block_rod, kernel_name, recording_kernel)
+
+    systems = [BaseRodForTesting(n_elems=10, ring_rod_flag=False)]
+    memory_block = MemoryBlockCosseratRod(
+        systems=systems, system_idx_list=np.arange(0, 1)
+    )
+    memory_block.enable_parallel_kernels(num_threads=1)
+    previous_num_threads = numba.get_num_threads()
+    numba.set_num_threads(2)
+    try:
+        memory_block.update_kinematic_states(np.float64(0.0), np.float64(1e-3))
+        memory_block.compute_internal_forces_and_torques(np.float64(0.0))
+        memory_block.update_dynamic_states(np.float64(0.0), np.float64(1e-3))
+        assert numba.get_num_threads() == 2
+    finally:
+        numba.set_num_threads(previous_num_threads)
+    assert num_threads_in_kernels == [1, 1, 1]
+
+
+@pytest.mark.skipif(
+    numba.config.NUMBA_NUM_THREADS >= 2,
+    reason="the tests with 2 threads run in this process",
+)
+def test_parallel_kernels_with_two_threads():
+    """
+    Run the tests of the parallel kernels with 2 threads in a subprocess when numba
+    was started with fewer threads in this one. The workqueue threading layer is
+    used because TBB may refuse to start workers on machines with one CPU.
+    """
+    tests_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, NUMBA_NUM_THREADS="2", NUMBA_THREADING_LAYER="workqueue")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "-k",
+            "2_threads",
+            os.path.join(
+                tests_dir, "test_modules", "test_memory_block_cosserat_rod.py"
+            ),
+            os.path.join(tests_dir, "test_modules", "test_base_system.py"),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "skipped" not in result.stdout, result.stdout
+
+
+@pytest.mark.parametrize("num_threads", [0, -1, 10**6])
+def test_memory_block_rod_parallel_kernels_invalid_num_threads(num_threads):
+    systems = [BaseRodForTesting(n_elems=10, ring_rod_flag=False)]
+    memory_block = MemoryBlockCosseratRod(
+        systems=systems, system_idx_list=np.arange(0, 1)
+    )
+    with pytest.raises(ValueError) as excinfo:
+        memory_block.enable_parallel_kernels(num_threads=num_threads)
+    assert "num_threads" in str(excinfo.value)
+    assert not memory_block.parallel_kernels
@@ -0,0 +1,480 @@
+__doc__ = """ Test compilation of operator groups into operator plans """
+
+import functools
+
+import numpy as np
+import pytest
+
+from elastica.modules import operator_plan
+from elastica.modules.operator_plan import OperatorPlan
+
+
+class MockSystem:
+    pass
+
+
+class Recorder:
+    """Stores the calls made by operators, in order"""
+
+    def __init__(self):
+        self.calls = []
+
+
+class RecordingOperator:
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def apply(self, system, time=0.0):
+        self.recorder.calls.append((self.name, system))
+
+    def apply_second(self, system, time=0.0):
+        self.recorder.calls.append((f"second-{self.name}", system))
+
+    def do_nothing(self, system, time=0.0):
+        pass
+
+
+class OtherRecordingOperator(RecordingOperator):
+    def apply(self, system, time=0.0):
+        self.recorder.calls.append((f"other-{self.name}", system))
+
+
+def batched_apply(instances, block, rod_indices):
+    def apply(time=0.0):
+        for instance, rod_idx in zip(instances, rod_indices):
+            instance.recorder.calls.append((instance.name, block.rods[rod_idx]))
+
+    return apply
+
+
+def batched_apply_second(instances, block, rod_indices):
+    def apply_second(time=0.0):
+        for instance, rod_idx in zip(instances, rod_indices):
+            instance.recorder.calls.append(
+                (f"second-{instance.name}", block.rods[rod_idx])
+            )
+
+    return apply_second
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(operator_plan, "_noop_methods", set())
+    monkeypatch.setattr(operator_plan, "_batched_methods", {})
+    operator_plan.register_noop_operator(RecordingOperator.do_nothing)
+    operator_plan.register_batched_operator(RecordingOperator.apply, batched_apply)
+
+
+@pytest.fixture
+def block_layout():
+    class MockBlock:
+        def __init__(self, rods):
+            self.rods = rods
+
+    rods = [MockSystem() for _ in range(4)]
+    block = MockBlock(rods)
+    rod_locations = {id(rod): (block, k) for k, rod in enumerate(rods)}
+    block_members = {id(block): {id(rod) for rod in rods}}
+    return rods, block, rod_locations, block_members
+
+
+def run(operators):
+    for operator in operators:
+        operator(time=0.0)
+
+
+def test_noop_operators_are_skipped(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+    operators = [
+        functools.partial(RecordingOperator(recorder, k).do_nothing, system=rod)
+        for k, rod in enumerate(rods)
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.operators == []
+    assert plan.report() == {
+        "registered": 4,
+        "skipped": 4,
+        "batched": 0,
+        "batches": 0,
+        "calls": 0,
+    }
+
+
+def test_noop_is_not_inherited_by_override(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+
+    class Overridden(RecordingOperator):
+        def do_nothing(self, system, time=0.0):
+            self.recorder.calls.append(("overridden", system))
+
+    recorder = Recorder()
+    operators = [functools.partial(Overridden(recorder, 0).do_nothing, system=rods[0])]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.n_skipped == 0
+    run(plan)
+    assert recorder.calls == [("overridden", rods[0])]
+
+
+def test_subclasses_are_not_batched(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+
+    class Inherited(RecordingOperator):
+        # Does not override apply, but may override anything apply relies on
+        pass
+
+    recorder = Recorder()
+    operators = [
+        functools.partial(RecordingOperator(recorder, 0).apply, system=rods[0]),
+        functools.partial(Inherited(recorder, 1).apply, system=rods[1]),
+        functools.partial(RecordingOperator(recorder, 2).apply, system=rods[2]),
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.report() == {
+        "registered": 3,
+        "skipped": 0,
+        "batched": 2,
+        "batches": 1,
+        "calls": 2,
+    }
+    run(plan)
+    assert sorted(recorder.calls, key=lambda call: call[0]) == [
+        (0, rods[0]),
+        (1, rods[1]),
+        (2, rods[2]),
+    ]
+
+
+def test_batching_preserves_order_per_system(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+    operators = []
+    for k, rod in enumerate(rods):
+        operators.append(
+            functools.partial(RecordingOperator(recorder, k).apply, system=rod)
+        )
+        # Not batched: subclass overrides the batched method
+        operators.append(
+            functools.partial(OtherRecordingOperator(recorder, k).apply, system=rod)
+        )
+
+    expected_recorder = Recorder()
+    for operator in operators:
+        operator.func.__self__.recorder = expected_recorder
+    run(operators)
+    for operator in operators:
+        operator.func.__self__.recorder = recorder
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.report() == {
+        "registered": 8,
+        "skipped": 0,
+        "batched": 4,
+        "batches": 1,
+        "calls": 5,
+    }
+    run(plan)
+    for rod in rods:
+        assert [call for call in recorder.calls if call[1] is rod] == [
+            call for call in expected_recorder.calls if call[1] is rod
+        ]
+
+
+def test_batching_does_not_reorder_operators_on_same_system(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+    operators = [
+        functools.partial(RecordingOperator(recorder, 0).apply, system=rods[0]),
+        functools.partial(OtherRecordingOperator(recorder, 1).apply, system=rods[1]),
+        functools.partial(RecordingOperator(recorder, 2).apply, system=rods[1]),
+        functools.partial(RecordingOperator(recorder, 3).apply, system=rods[2]),
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    # Operator 2 cannot move before operator 1, so it opens a new batch with operator 3
+    assert plan.n_batches == 1
+    assert plan.n_calls == 3
+    run(plan)
+    assert recorder.calls == [
+        (0, rods[0]),
+        ("other-1", rods[1]),
+        (2, rods[1]),
+        (3, rods[2]),
+    ]
+
+
+def test_interleaved_batched_methods_are_merged(registry, block_layout):
+    """Two batched methods registered on each rod in turn, e.g. two forcings"""
+    operator_plan.register_batched_operator(
+        RecordingOperator.apply_second, batched_apply_second
+    )
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+    operators = []
+    for k, rod in enumerate(rods):
+        operator = RecordingOperator(recorder, k)
+        operators.append(functools.partial(operator.apply, system=rod))
+        operators.append(functools.partial(operator.apply_second, system=rod))
+    # Cannot join the first batch, which would move it before "second-0"
+    operators.append(
+        functools.partial(RecordingOperator(recorder, 4).apply, system=rods[0])
+    )
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.report() == {
+        "registered": 9,
+        "skipped": 0,
+        "batched": 8,
+        "batches": 2,
+        "calls": 3,
+    }
+    run(plan)
+    assert recorder.calls == [(k, rod) for k, rod in enumerate(rods)] + [
+        (f"second-{k}", rod) for k, rod in enumerate(rods)
+    ] + [(4, rods[0])]
+
+
+def test_unknown_operators_close_batches(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+
+    def closure(time=0.0):
+        recorder.calls.append(("closure", None))
+
+    operators = [
+        functools.partial(RecordingOperator(recorder, 0).apply, system=rods[0]),
+        functools.partial(RecordingOperator(recorder, 1).apply, system=rods[1]),
+        functools.partial(closure),
+        functools.partial(RecordingOperator(recorder, 2).apply, system=rods[2]),
+        functools.partial(RecordingOperator(recorder, 3).apply, system=rods[3]),
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.report() == {
+        "registered": 5,
+        "skipped": 0,
+        "batched": 4,
+        "batches": 2,
+        "calls": 3,
+    }
+    run(plan)
+    assert recorder.calls == [
+        (0, rods[0]),
+        (1, rods[1]),
+        ("closure", None),
+        (2, rods[2]),
+        (3, rods[3]),
+    ]
+
+
+def test_connections_only_touch_their_systems(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+
+    def connection(
+        time,
+        connect_instance,
+        system_one,
+        first_connect_idx,
+        system_two,
+        second_connect_idx,
+    ):
+        recorder.calls.append(("connection", system_one))
+
+    operators = [
+        functools.partial(RecordingOperator(recorder, 0).apply, system=rods[0]),
+        functools.partial(RecordingOperator(recorder, 2).apply, system=rods[2]),
+        functools.partial(
+            connection,
+            connect_instance=None,
+            system_one=rods[0],
+            first_connect_idx=-1,
+            system_two=rods[1],
+            second_connect_idx=0,
+        ),
+        # Joins the first batch, the connection does not act on rods[3]
+        functools.partial(RecordingOperator(recorder, 3).apply, system=rods[3]),
+        # Cannot move before the connection
+        functools.partial(RecordingOperator(recorder, 1).apply, system=rods[1]),
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.report() == {
+        "registered": 5,
+        "skipped": 0,
+        "batched": 3,
+        "batches": 1,
+        "calls": 3,
+    }
+    run(plan)
+    assert recorder.calls == [
+        (0, rods[0]),
+        (2, rods[2]),
+        (3, rods[3]),
+        ("connection", rods[0]),
+        (1, rods[1]),
+    ]
+
+
+def test_connections_are_merged_per_joint_class(registry, block_layout, monkeypatch):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+
+    class Joint:
+        pass
+
+    class OtherJoint(Joint):
+        pass
+
+    def batched_joints(
+        instances,
+        block_one,
+        system_indices_one,
+        connect_indices_one,
+        block_two,
+        system_indices_two,
+        connect_indices_two,
+    ):
+        def apply(time=0.0):
+            for rod_one, idx_one, rod_two, idx_two in zip(
+                system_indices_one,
+                connect_indices_one,
+                system_indices_two,
+                connect_indices_two,
+            ):
+                recorder.calls.append(
+                    (
+                        "batched",
+                        block_one.rods[rod_one],
+                        idx_one,
+                        block_two.rods[rod_two],
+                        idx_two,
+                    )
+                )
+
+        return apply
+
+    def connection(
+        time,
+        connect_instance,
+        system_one,
+        first_connect_idx,
+        system_two,
+        second_connect_idx,
+    ):
+        recorder.calls.append(
+            ("single", system_one, first_connect_idx, system_two, second_connect_idx)
+        )
+
+    monkeypatch.setattr(operator_plan, "_batched_connections", {})
+    operator_plan.register_batched_connection(Joint, batched_joints)
+    connections = [
+        (Joint(), rods[0], -1, rods[1], 0),
+        # Subclass and connection over several indices are not merged
+        (OtherJoint(), rods[1], -1, rods[2], 0),
+        (Joint(), rods[0], [0, 1], rods[1], [1, 2]),
+        (Joint(), rods[2], -1, rods[3], 0),
+    ]
+    operators = [
+        functools.partial(
+            connection,
+            connect_instance=joint,
+            system_one=system_one,
+            first_connect_idx=idx_one,
+            system_two=system_two,
+            second_connect_idx=idx_two,
+        )
+        for joint, system_one, idx_one, system_two, idx_two in connections
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    # The last connection acts on rods[2] after the subclass, so it stays behind it
+    assert plan.n_batches == 0
+    assert plan.n_calls == 4
+
+    operators.append(operators.pop(1))
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.n_batches == 1
+    assert plan.n_calls == 3
+    run(plan)
+    assert recorder.calls == [
+        ("batched", rods[0], -1, rods[1], 0),
+        ("batched", rods[2], -1, rods[3], 0),
+        ("single", rods[0], [0, 1], rods[1], [1, 2]),
+        ("single", rods[1], -1, rods[2], 0),
+    ]
+
+
+def test_block_operators_touch_all_rods(registry, block_layout):
+    rods, block, rod_locations, block_members = block_layout
+    recorder = Recorder()
+    operators = [
+        functools.partial(RecordingOperator(recorder, 0).apply, system=rods[0]),
+        functools.partial(OtherRecordingOperator(recorder, 1).apply, system=block),
+        functools.partial(RecordingOperator(recorder, 2).apply, system=rods[2]),
+    ]
+
+    plan = OperatorPlan(operators, rod_locations, block_members)
+
+    assert plan.n_batches == 0
+    assert plan.n_calls == 3
+
+
+@pytest.mark.parametrize("n_rods", [1, 3])
+def test_simulator_operator_plan_report(n_rods):
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection, ea.Forcing, ea.Constraints, ea.CallBacks):
+        pass
+
+    simulator = Simulator()
+    for _ in range(n_rods):
+        rod = ea.CosseratRod.straight_rod(
+            n_elements=5,
+            start=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.1,
+            density=1000.0,
+            youngs_modulus=1e6,
+        )
+        simulator.append(rod)
+        simulator.add_forcing_to(rod).using(
+            ea.GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+        )
+        simulator.constrain(rod).using(ea.FreeBC)
+        simulator.collect_diagnostics(rod).using(ea.CallBackBaseClass)
+    simulator.finalize()
+
+    report = simulator.operator_plan_report()
+    # GravityForces.apply_torques, FreeBC and CallBackBaseClass do nothing, and
+    # GravityForces.apply_forces of all rods is merged into one operator
+    assert report["synchronize"] == {
+        "registered": 2 * n_rods,
+        "skipped": n_rods,
+        "batched": n_rods if n_rods > 1 else 0,
+        "batches": 1 if n_rods > 1 else 0,
+        "calls": 1,
+    }
+    for group in ["constrain_values", "constrain_rates", "callback"]:
+        assert report[group]["registered"] == n_rods
+        assert report[group]["calls"] == 0
+
+    stepper = ea.PositionVerlet()
+    report = simulator.operator_plan_report(stepper)
+    assert report["calls_per_step"] == stepper.n_stages - 1
@@ -11,7 +11,14 @@ from elastica.modules import (
     Connections,
     CallBacks,
 )
-from elastica.restart import save_state, load_state
+from elastica.restart import (
+    save_state,
+    load_state,
+    save_checkpoint,
+    load_checkpoint,
+    read_checkpoint,
+    AsyncCheckpointer,
+)
 import elastica as ea
 
 
@@ -236,3 +243,429 @@ class TestRestartFunctionsWithFeaturesUsingRigidBodies:
                 test_value = getattr(test_cylinder, key)
 
                 assert_allclose(test_value, correct_value)
+
+
+class TestCheckpoint:
+    @staticmethod
+    def build(n_rods=3, n_elements=6, ring=False):
+        simulator = GenericSimulatorClass()
+        for k in range(n_rods):
+            simulator.append(
+                ea.CosseratRod.straight_rod(
+                    n_elements=n_elements,
+                    start=np.array([k, 0.0, 0.0]),
+                    direction=np.array([0.0, 0.0, 1.0]),
+                    normal=np.array([1.0, 0.0, 0.0]),
+                    base_length=1.0,
+                    base_radius=0.05,
+                    density=1000.0,
+                    youngs_modulus=1e5,
+                )
+            )
+        if ring:
+            simulator.append(
+                ea.CosseratRod.ring_rod(
+                    n_elements=n_elements,
+                    ring_center_position=np.zeros(3),
+                    direction=np.array([0.0, 0.0, 1.0]),
+                    normal=np.array([1.0, 0.0, 0.0]),
+                    base_length=1.0,
+                    base_radius=0.05,
+                    density=1000.0,
+                    youngs_modulus=1e5,
+                )
+            )
+        simulator.append(ea.Sphere(center=np.zeros(3), base_radius=0.1, density=1000.0))
+        simulator.finalize()
+        return simulator
+
+    @staticmethod
+    def randomize(simulator):
+        for block in simulator.block_systems():
+            block.rate_collection[:] = np.random.rand(*block.rate_collection.shape)
+            block.position_collection[:] = np.random.rand(
+                *block.position_collection.shape
+            )
+
+    def test_save_load(self, tmp_path):
+        path = (tmp_path / "checkpoint" / "state.bin").as_posix()
+        simulator = self.build(ring=True)
+        self.randomize(simulator)
+        stepper = ea.PositionVerlet()
+        save_checkpoint(simulator, path, time=np.float64(0.25), time_stepper=stepper)
+        expected = [
+            (block.position_collection.copy(), block.rate_collection.copy())
+            for block in simulator.block_systems()
+        ]
+
+        restarted = self.build(ring=True)
+        assert load_checkpoint(restarted, path, time_stepper=stepper) == 0.25
+        for block, (position, rates) in zip(restarted.block_systems(), expected):
+            np.testing.assert_array_equal(block.position_collection, position)
+            np.testing.assert_array_equal(block.rate_collection, rates)
+        # Views of the systems see the loaded data
+        for system, expected_system in zip(restarted, simulator):
+            np.testing.assert_array_equal(
+                system.velocity_collection, expected_system.velocity_collection
+            )
+
+    def test_read_checkpoint_is_memory_mapped(self, tmp_path):
+        path = (tmp_path / "state.bin").as_posix()
+        simulator = self.build()
+        self.randomize(simulator)
+        save_checkpoint(simulator, path, time=np.float64(1.5))
+
+        header, arrays = read_checkpoint(path)
+
+        assert header["time"] == 1.5
+        assert header["stepper"] is None
+        assert [block["type"] for block in header["blocks"]] == [
+            type(block).__name__ for block in simulator.block_systems()
+        ]
+        for block, block_arrays in zip(simulator.block_systems(), arrays):
+            rate_collection = block_arrays["rate_collection"]
+            assert isinstance(rate_collection, np.memmap)
+            assert not rate_collection.flags.writeable
+            np.testing.assert_array_equal(rate_collection, block.rate_collection)
+            np.testing.assert_array_equal(
+                block_arrays["system_idx_list"], block.system_idx_list
+            )
+
+    def test_load_different_layout_raises(self, tmp_path):
+        path = (tmp_path / "state.bin").as_posix()
+        save_checkpoint(self.build(n_elements=6), path)
+
+        with pytest.raises(ValueError, match="does not match"):
+            load_checkpoint(self.build(n_elements=7), path)
+        with pytest.raises(ValueError, match="does not match"):
+            load_checkpoint(self.build(ring=True), path)
+
+    def test_load_different_stepper_raises(self, tmp_path):
+        path = (tmp_path / "state.bin").as_posix()
+        save_checkpoint(self.build(), path, time_stepper=ea.PositionVerlet())
+
+        with pytest.raises(ValueError, match="PositionVerlet"):
+            load_checkpoint(self.build(), path, time_stepper=ea.PEFRL())
+
+    def test_not_a_checkpoint_raises(self, tmp_path):
+        path = tmp_path / "state.bin"
+        path.write_bytes(b"not a checkpoint file at all")
+
+        with pytest.raises(ValueError, match="not a checkpoint"):
+            read_checkpoint(path.as_posix())
+
+
+class TestAsyncCheckpointer:
+    @staticmethod
+    def build():
+        simulator = GenericSimulatorClass()
+        for k in range(2):
+            rod = ea.CosseratRod.straight_rod(
+                n_elements=6,
+                start=np.array([k, 0.0, 0.0]),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e5,
+            )
+            simulator.append(rod)
+            simulator.add_forcing_to(rod).using(
+                ea.GravityForces, acc_gravity=np.array([-9.81, 0.0, 0.0])
+            )
+        simulator.finalize()
+        return simulator
+
+    def test_integrate_with_checkpointer(self, tmp_path):
+        stepper = ea.PositionVerlet()
+        simulator = self.build()
+        checkpointer = AsyncCheckpointer(
+            simulator, tmp_path.as_posix(), step_skip=5, time_stepper=stepper
+        )
+        ea.integrate(
+            stepper, simulator, 2e-3, 20, progress_bar=False, checkpointer=checkpointer
+        )
+        checkpointer.close()
+
+        assert checkpointer.n_written == 4
+        assert checkpointer.saved_paths == [
+            (tmp_path / f"checkpoint_{step:09d}.ckpt").as_posix()
+            for step in (5, 10, 15, 20)
+        ]
+        assert checkpointer.get_last_saved_path() == checkpointer.saved_paths[-1]
+
+        # Last checkpoint holds the final state
+        restarted = self.build()
+        time = load_checkpoint(restarted, checkpointer.saved_paths[-1], stepper)
+        assert time == pytest.approx(2e-3)
+        for rod, expected_rod in zip(restarted, simulator):
+            np.testing.assert_array_equal(
+                rod.position_collection, expected_rod.position_collection
+            )
+            np.testing.assert_array_equal(
+                rod.velocity_collection, expected_rod.velocity_collection
+            )
+
+        # First checkpoint holds the state after 5 steps
+        reference = self.build()
+        ea.integrate(stepper, reference, 5e-4, 5, progress_bar=False)
+        load_checkpoint(restarted, checkpointer.saved_paths[0])
+        for rod, expected_rod in zip(restarted, reference):
+            np.testing.assert_array_equal(
+                rod.position_collection, expected_rod.position_collection
+            )
+
+    def test_resumed_integrate_continues_checkpoint_numbering(self, tmp_path):
+        stepper = ea.PositionVerlet()
+        simulator = self.build()
+        with AsyncCheckpointer(
+            simulator, tmp_path.as_posix(), step_skip=5, time_stepper=stepper
+        ) as checkpointer:
+            time = ea.integrate(
+                stepper,
+                simulator,
+                1e-3,
+                10,
+                progress_bar=False,
+                checkpointer=checkpointer,
+            )
+            first_run_paths = list(checkpointer.saved_paths)
+            ea.integrate(
+                stepper,
+                simulator,
+                1e-3,
+                10,
+                restart_time=time,
+                progress_bar=False,
+                checkpointer=checkpointer,
+            )
+        assert checkpointer._thread is None
+
+        assert checkpointer.saved_paths == [
+            (tmp_path / f"checkpoint_{step:09d}.ckpt").as_posix()
+            for step in (5, 10, 15, 20)
+        ]
+        # The checkpoints of the first run are not overwritten
+        restarted = self.build()
+        assert load_checkpoint(restarted, first_run_paths[-1]) == pytest.approx(1e-3)
+        assert load_checkpoint(
+            restarted, checkpointer.saved_paths[-1]
+        ) == pytest.approx(2e-3)
+
+    def test_integrate_with_checkpointer_and_single_system_throws(self, tmp_path):
+        simulator = self.build()
+        checkpointer = AsyncCheckpointer(simulator, tmp_path.as_posix(), step_skip=1)
+        with pytest.raises(TypeError) as excinfo:
+            ea.integrate(
+                ea.PositionVerlet(),
+                simulator[0],
+                1e-3,
+                10,
+                progress_bar=False,
+                checkpointer=checkpointer,
+            )
+        assert "system collection" in str(excinfo.value)
+        checkpointer.close()
+        assert checkpointer.n_written == 0
+
+    def test_back_pressure(self, tmp_path, monkeypatch):
+        import time as time_module
+        from elastica import restart
+
+        write_checkpoint = restart._write_checkpoint
+
+        def slow_write_checkpoint(*args, **kwargs):
+            time_module.sleep(0.02)
+            write_checkpoint(*args, **kwargs)
+
+        monkeypatch.setattr(restart, "_write_checkpoint", slow_write_checkpoint)
+        simulator = self.build()
+        checkpointer = AsyncCheckpointer(
+            simulator, tmp_path.as_posix(), step_skip=1, max_pending=1
+        )
+        for step in range(1, 6):
+            checkpointer.make_checkpoint(np.float64(step), step)
+        checkpointer.close()
+
+        assert checkpointer.n_waits > 0
+        assert checkpointer.n_written == 5
+        assert checkpointer._free_buffers.qsize() == 1
+
+    def test_writer_error_is_raised(self, tmp_path, monkeypatch):
+        from elastica import restart
+
+        def failing_write_checkpoint(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(restart, "_write_checkpoint", failing_write_checkpoint)
+        simulator = self.build()
+        checkpointer = AsyncCheckpointer(simulator, tmp_path.as_posix(), step_skip=1)
+        checkpointer.make_checkpoint(np.float64(0.0), 1)
+
+        with pytest.raises(RuntimeError, match="checkpoint failed"):
+            checkpointer.flush()
+        assert checkpointer.n_written == 0
+        checkpointer.close()
+
+    @pytest.mark.parametrize("kwargs", [{"step_skip": 0}, {"max_pending": 0}])
+    def test_invalid_arguments(self, tmp_path, kwargs):
+        arguments = {"step_skip": 1, **kwargs}
+        with pytest.raises(ValueError):
+            AsyncCheckpointer(self.build(), tmp_path.as_posix(), **arguments)
+
+
+class TestSnapshotRestore:
+    class Simulator(BaseSystemCollection, Constraints, Forcing, CallBacks, ea.Damping):
+        pass
+
+    class Recorder(ea.CallBackBaseClass):
+        def __init__(self, step_skip, callback_params):
+            super().__init__()
+            self.step_skip = step_skip
+            self.callback_params = callback_params
+            self.n_calls = 0
+
+        def make_callback(self, system, time, current_step):
+            self.n_calls += 1
+            if current_step % self.step_skip == 0:
+                self.callback_params["time"].append(time)
+                self.callback_params["position"].append(
+                    system.position_collection.copy()
+                )
+
+    @pytest.fixture(scope="function")
+    def simulation(self):
+        simulator = self.Simulator()
+        dt = 1e-4
+        rods = []
+        recorded = []
+        for k in range(3):
+            rod = ea.CosseratRod.straight_rod(
+                n_elements=8,
+                start=np.array([k, 0.0, 0.0]),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e5,
+            )
+            simulator.append(rod)
+            simulator.constrain(rod).using(
+                ea.OneEndFixedBC,
+                constrained_position_idx=(0,),
+                constrained_director_idx=(0,),
+            )
+            simulator.add_forcing_to(rod).using(
+                ea.GravityForces, acc_gravity=np.array([-9.81, 0.0, 0.0])
+            )
+            simulator.dampen(rod).using(
+                ea.AnalyticalLinearDamper,
+                damping_constant=0.1,
+                time_step=dt,
+            )
+            params = {"time": [], "position": []}
+            simulator.collect_diagnostics(rod).using(
+                self.Recorder, step_skip=5, callback_params=params
+            )
+            rods.append(rod)
+            recorded.append(params)
+        simulator.finalize()
+        return simulator, rods, recorded, dt
+
+    @staticmethod
+    def run(simulator, time, dt, n_steps):
+        stepper = ea.PositionVerlet()
+        do_step, stages_and_updates = ea.extend_stepper_interface(stepper, simulator)
+        for _ in range(n_steps):
+            time = do_step(stepper, stages_and_updates, simulator, time, dt)
+        return time
+
+    @staticmethod
+    def state(rods):
+        return [
+            (
+                rod.position_collection.copy(),
+                rod.velocity_collection.copy(),
+                rod.director_collection.copy(),
+                rod.omega_collection.copy(),
+            )
+            for rod in rods
+        ]
+
+    def test_restore_resets_state_and_features(self, simulation):
+        simulator, rods, recorded, dt = simulation
+        time = self.run(simulator, np.float64(0.0), dt, 10)
+
+        snapshot = simulator.snapshot(time)
+        expected_state = self.state(rods)
+        expected_lengths = [len(params["time"]) for params in recorded]
+        recorders = [
+            operator.func.__self__ for operator in simulator._feature_group_callback
+        ]
+        expected_calls = [recorder.n_calls for recorder in recorders]
+
+        self.run(simulator, time, dt, 20)
+        restored_time = simulator.restore(snapshot)
+
+        assert restored_time == time
+        for state, expected in zip(self.state(rods), expected_state):
+            for value, expected_value in zip(state, expected):
+                np.testing.assert_array_equal(value, expected_value)
+        assert [len(params["time"]) for params in recorded] == expected_lengths
+        assert [recorder.n_calls for recorder in recorders] == expected_calls
+        # Recorded lists are restored in place
+        assert all(
+            recorder.callback_params is params
+            for recorder, params in zip(recorders, recorded)
+        )
+
+    def test_rerun_after_restore_is_identical(self, simulation):
+        simulator, rods, recorded, dt = simulation
+        snapshot = simulator.snapshot(np.float64(0.0))
+
+        time = self.run(simulator, np.float64(0.0), dt, 25)
+        expected_state = self.state(rods)
+        expected_positions = [list(params["position"]) for params in recorded]
+
+        # Restoring twice from the same snapshot gives the same run again
+        for _ in range(2):
+            restored_time = simulator.restore(snapshot)
+            assert self.run(simulator, restored_time, dt, 25) == time
+            for state, expected in zip(self.state(rods), expected_state):
+                for value, expected_value in zip(state, expected):
+                    np.testing.assert_array_equal(value, expected_value)
+            for params, expected in zip(recorded, expected_positions):
+                assert len(params["position"]) == len(expected)
+                for value, expected_value in zip(params["position"], expected):
+                    np.testing.assert_array_equal(value, expected_value)
+
+    def test_snapshot_reuses_buffers(self, simulation):
+        simulator, rods, recorded, dt = simulation
+        snapshot = simulator.snapshot(np.float64(0.0))
+        buffers = [buffer for _, buffer in snapshot._arrays]
+
+        time = self.run(simulator, np.float64(0.0), dt, 5)
+        expected_state = self.state(rods)
+        assert simulator.snapshot(time, out=snapshot) is snapshot
+        assert all(
+            buffer is reused for (_, buffer), reused in zip(snapshot._arrays, buffers)
+        )
+
+        self.run(simulator, time, dt, 5)
+        assert simulator.restore(snapshot) == time
+        for state, expected in zip(self.state(rods), expected_state):
+            for value, expected_value in zip(state, expected):
+                np.testing.assert_array_equal(value, expected_value)
+
+    def test_snapshot_of_other_simulator_raises(self, simulation):
+        simulator, rods, recorded, dt = simulation
+        other = self.Simulator()
+        other.finalize()
+        snapshot = other.snapshot()
+
+        with pytest.raises(ValueError, match="another simulator"):
+            simulator.restore(snapshot)
+        with pytest.raises(ValueError, match="another simulator"):
+            simulator.snapshot(out=snapshot)
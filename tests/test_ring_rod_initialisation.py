@@ -1096,3 +1096,40 @@ def test_ring_rod(n_elems):
         inv_mass_second_moment_of_inertia,
         atol=Tolerance.atol(),
     )
+
+
+def test_ring_rod_requisite_modules_only_on_ring_rods():
+    # Ring rods require Constraints to synchronize their periodic boundaries, which
+    # must not be required from straight rods created afterwards
+    ring_rod = ea.CosseratRod.ring_rod(
+        n_elements=10,
+        ring_center_position=np.zeros(3),
+        direction=np.array([0.0, 0.0, 1.0]),
+        normal=np.array([1.0, 0.0, 0.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=1e5,
+    )
+    straight_rod = ea.CosseratRod.straight_rod(
+        n_elements=10,
+        start=np.zeros(3),
+        direction=np.array([0.0, 0.0, 1.0]),
+        normal=np.array([1.0, 0.0, 0.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=1e5,
+    )
+    assert ea.Constraints in ring_rod.REQUISITE_MODULES
+    assert ea.Constraints not in straight_rod.REQUISITE_MODULES
+    assert ea.Constraints not in ea.CosseratRod.REQUISITE_MODULES
+
+    # A simulator without Constraints accepts straight rods but not ring rods
+    class Simulator(ea.BaseSystemCollection):
+        pass
+
+    simulator = Simulator()
+    simulator.append(straight_rod)
+    with pytest.raises(RuntimeError):
+        simulator.append(ring_rod)
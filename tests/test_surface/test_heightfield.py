@@ -0,0 +1,79 @@
+__doc__ = """Tests for heightfield surface class"""
+import numpy as np
+from numpy.testing import assert_allclose
+from elastica.utils import Tolerance
+from elastica.surface import Heightfield
+import pytest
+
+
+def test_heightfield_initialization():
+    heights = np.random.rand(4, 5)
+    heightfield = Heightfield(heights, np.array([1.0, 2.0, 3.0]), 0.5)
+    assert_allclose(heightfield.heights, heights, atol=Tolerance.atol())
+    assert_allclose(
+        heightfield.origin, np.array([[1.0], [2.0], [3.0]]), atol=Tolerance.atol()
+    )
+    assert_allclose(heightfield.spacing, [0.5, 0.5], atol=Tolerance.atol())
+    assert heightfield.up_axis == 2
+    assert_allclose(heightfield.grid_axes, [0, 1])
+    assert heightfield.normals.shape == (4, 5, 3)
+    assert_allclose(
+        np.linalg.norm(heightfield.normals, axis=-1), 1.0, atol=Tolerance.atol()
+    )
+    assert np.all(heightfield.normals[..., 2] > 0.0)
+
+    with pytest.raises(ValueError, match="at least 2 points per axis"):
+        Heightfield(np.zeros((1, 5)), np.zeros(3), 0.5)
+    with pytest.raises(ValueError, match="at least 2 points per axis"):
+        Heightfield(np.zeros((3, 4, 5)), np.zeros(3), 0.5)
+    with pytest.raises(ValueError, match="spacing must be positive"):
+        Heightfield(heights, np.zeros(3), np.array([0.5, 0.0]))
+    with pytest.raises(ValueError, match="up axis"):
+        Heightfield(heights, np.zeros(3), 0.5, up_axis=3)
+
+
+@pytest.mark.parametrize("up_axis", [0, 1, 2])
+def test_heightfield_interpolates_slope_exactly(up_axis):
+    slope = np.array([0.3, -0.5])
+    heightfield = Heightfield.from_function(
+        lambda u, v: slope[0] * u + slope[1] * v + 0.1,
+        lower=np.array([-1.0, -1.0]),
+        upper=np.array([1.0, 1.05]),
+        spacing=0.25,
+        up_axis=up_axis,
+    )
+    grid_axes = [axis for axis in range(3) if axis != up_axis]
+    assert_allclose(heightfield.heights.shape, (9, 10))
+    assert_allclose(heightfield.origin[grid_axes, 0], [-1.0, -1.0])
+
+    expected_normal = np.zeros(3)
+    expected_normal[grid_axes] = -slope
+    expected_normal[up_axis] = 1.0
+    expected_normal /= np.linalg.norm(expected_normal)
+
+    points = np.random.uniform(-1.0, 1.0, (3, 20))
+    height, normal = heightfield.evaluate(points)
+    assert_allclose(
+        height,
+        slope @ points[grid_axes] + 0.1,
+        atol=Tolerance.atol(),
+    )
+    assert_allclose(
+        normal, np.repeat(expected_normal[:, None], 20, axis=1), atol=Tolerance.atol()
+    )
+
+
+def test_heightfield_clamps_points_outside_grid():
+    heightfield = Heightfield.from_function(
+        lambda u, v: u**2 + v,
+        lower=np.array([0.0, 0.0]),
+        upper=np.array([1.0, 1.0]),
+        spacing=0.5,
+    )
+    points = np.array([[2.0, -1.0], [0.5, 3.0], [7.0, -7.0]])
+    height, normal = heightfield.evaluate(points)
+    clamped_height, clamped_normal = heightfield.evaluate(
+        np.array([[1.0, 0.0], [0.5, 1.0], [0.0, 0.0]])
+    )
+    assert_allclose(height, clamped_height, atol=Tolerance.atol())
+    assert_allclose(normal, clamped_normal, atol=Tolerance.atol())
@@ -0,0 +1,166 @@
+__doc__ = """Tests for signed distance field surface class"""
+import numpy as np
+from numpy.testing import assert_allclose
+from elastica.utils import Tolerance
+from elastica.surface import SignedDistanceField
+from elastica.surface.signed_distance_field import (
+    box_distance,
+    capsule_distance,
+    sphere_distance,
+)
+import pytest
+
+
+def cube_mesh():
+    "Triangulated cube of side 2 centered at the origin, with outward normals"
+
+    class CubeMesh:
+        pass
+
+    faces = []
+    for axis in range(3):
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        for side in (-1.0, 1.0):
+            corners = np.zeros((4, 3))
+            corners[:, axis] = side
+            corners[:, u] = [-1.0, 1.0, 1.0, -1.0]
+            corners[:, v] = [-1.0, -1.0, 1.0, 1.0]
+            for triangle in ([0, 1, 2], [0, 2, 3]):
+                vertices = corners[triangle]
+                faces.append(vertices[::-1].T if side < 0.0 else vertices.T)
+    mesh = CubeMesh()
+    mesh.faces = np.stack(faces, axis=-1)
+    normals = np.cross(
+        mesh.faces[:, 1] - mesh.faces[:, 0], mesh.faces[:, 2] - mesh.faces[:, 0], axis=0
+    )
+    mesh.face_normals = normals / np.linalg.norm(normals, axis=0)
+    return mesh
+
+
+def tetrahedron_mesh():
+    "Regular tetrahedron inscribed in the cube of side 2, with outward normals"
+
+    class TetrahedronMesh:
+        pass
+
+    vertices = np.array(
+        [[1.0, 1.0, 1.0], [1.0, -1.0, -1.0], [-1.0, 1.0, -1.0], [-1.0, -1.0, 1.0]]
+    )
+    triangles = [[0, 1, 2], [0, 3, 1], [0, 2, 3], [1, 3, 2]]
+    mesh = TetrahedronMesh()
+    mesh.faces = np.stack([vertices[triangle].T for triangle in triangles], axis=-1)
+    normals = np.cross(
+        mesh.faces[:, 1] - mesh.faces[:, 0], mesh.faces[:, 2] - mesh.faces[:, 0], axis=0
+    )
+    mesh.face_normals = normals / np.linalg.norm(normals, axis=0)
+    return mesh
+
+
+def test_signed_distance_field_initialization():
+    distance = np.random.rand(3, 4, 5)
+    sdf = SignedDistanceField(distance, np.array([1.0, 2.0, 3.0]), 0.5)
+    assert_allclose(sdf.distance, distance, atol=Tolerance.atol())
+    assert_allclose(sdf.origin, np.array([[1.0], [2.0], [3.0]]), atol=Tolerance.atol())
+    assert_allclose(sdf.spacing, [0.5, 0.5, 0.5], atol=Tolerance.atol())
+
+    with pytest.raises(ValueError, match="at least 2 points per axis"):
+        SignedDistanceField(np.zeros((3, 1, 5)), np.zeros(3), 0.5)
+    with pytest.raises(ValueError, match="at least 2 points per axis"):
+        SignedDistanceField(np.zeros((3, 5)), np.zeros(3), 0.5)
+    with pytest.raises(ValueError, match="spacing must be positive"):
+        SignedDistanceField(distance, np.zeros(3), np.array([0.5, 0.0, 0.5]))
+
+
+def test_signed_distance_field_interpolates_linear_field_exactly():
+    gradient = np.array([0.3, -0.5, 0.2])
+    sdf = SignedDistanceField.from_function(
+        lambda x: gradient @ x + 0.1,
+        lower=np.array([-1.0, -1.0, -1.0]),
+        upper=np.array([1.0, 1.0, 1.05]),
+        spacing=0.1,
+    )
+    # Upper corner rounded up to a whole number of grid spacings
+    assert sdf.distance.shape == (21, 21, 22)
+
+    points = np.random.default_rng(0).uniform(-1.0, 1.0, (3, 100))
+    distance, distance_gradient = sdf.evaluate(points)
+    assert_allclose(distance, gradient @ points + 0.1, atol=Tolerance.atol())
+    assert_allclose(
+        distance_gradient,
+        np.repeat(gradient[:, np.newaxis], 100, axis=1),
+        atol=Tolerance.atol(),
+    )
+
+
+def test_signed_distance_field_outside_the_grid():
+    sdf = SignedDistanceField.from_function(
+        lambda x: x[0], np.full(3, -1.0), np.full(3, 1.0), 0.5
+    )
+    distance, gradient = sdf.evaluate(np.array([[3.0, -1.0], [0.0, 3.0], [0.0, 4.0]]))
+    # Value at the closest point of the grid plus the distance to the grid
+    assert_allclose(distance, [1.0 + 2.0, -1.0 + np.sqrt(2.0**2 + 3.0**2)])
+    assert_allclose(gradient[0], [1.0, 1.0], atol=Tolerance.atol())
+
+
+@pytest.mark.parametrize(
+    "function, exact_gradient",
+    [
+        (
+            lambda x: sphere_distance(x, np.zeros(3), 1.0),
+            lambda x: x / np.linalg.norm(x, axis=0),
+        ),
+        (
+            lambda x: capsule_distance(
+                x, np.array([0.0, 0.0, -5.0]), np.array([0.0, 0.0, 5.0]), 1.0
+            ),
+            lambda x: np.vstack([x[:2], np.zeros(x.shape[1])])
+            / np.linalg.norm(x[:2], axis=0),
+        ),
+    ],
+)
+def test_signed_distance_field_of_primitives(function, exact_gradient):
+    sdf = SignedDistanceField.from_function(
+        function, np.full(3, -2.0), np.full(3, 2.0), 0.05
+    )
+    rng = np.random.default_rng(1)
+    points = rng.uniform(-1.8, 1.8, (3, 500))
+    # Away from the center and axis, where the distance is not smooth
+    points = points[:, np.linalg.norm(points[:2], axis=0) > 0.3]
+    distance, gradient = sdf.evaluate(points)
+    assert_allclose(distance, function(points), atol=5e-3)
+    assert_allclose(gradient, exact_gradient(points), atol=0.1)
+
+
+def test_signed_distance_field_from_mesh_matches_box():
+    sdf = SignedDistanceField.from_mesh(cube_mesh(), spacing=0.1, padding=0.5)
+    assert_allclose(sdf.origin[:, 0], [-1.5, -1.5, -1.5], atol=Tolerance.atol())
+    expected = SignedDistanceField.from_function(
+        lambda x: box_distance(x, np.zeros(3), np.ones(3)),
+        sdf.origin[:, 0],
+        np.full(3, 1.5),
+        0.1,
+    )
+    assert sdf.distance.shape == expected.distance.shape
+    assert_allclose(sdf.distance, expected.distance, atol=Tolerance.atol())
+
+
+def test_signed_distance_field_from_mesh_tetrahedron_sign():
+    # The closest point of most points outside a tetrahedron is on an edge or a
+    # vertex, whose adjacent faces do not all face the point
+    mesh = tetrahedron_mesh()
+    sdf = SignedDistanceField.from_mesh(mesh, spacing=0.1, padding=0.5)
+    points = sdf.origin + sdf.spacing[:, np.newaxis] * np.indices(
+        sdf.distance.shape
+    ).reshape(3, -1)
+    # Largest signed distance to the planes of the faces
+    plane_distance = np.max(
+        np.einsum("ik,in->kn", mesh.face_normals, points)
+        - np.einsum("ik,ik->k", mesh.face_normals, mesh.faces[:, 0])[:, np.newaxis],
+        axis=0,
+    )
+    distance = sdf.distance.ravel()
+    inside = plane_distance < -Tolerance.atol()
+    outside = plane_distance > Tolerance.atol()
+    assert np.any(inside) and np.any(outside)
+    assert_allclose(distance[inside], plane_distance[inside], atol=Tolerance.atol())
+    assert np.all(distance[outside] >= plane_distance[outside] - Tolerance.atol())
@@ -182,3 +182,43 @@ def test_ConstrainPeriodicBoundaries():
     assert_allclose(
         test_omega_collection, test_rod.omega_collection, atol=Tolerance.atol()
     )
+
+
+def test_ConstrainPeriodicBoundaries_called_with_system_keyword():
+    # Constraint operators pass the rod as system=, as for any other constraint
+    import elastica as ea
+
+    class RingRodSimulator(ea.BaseSystemCollection, ea.Constraints):
+        pass
+
+    simulator = RingRodSimulator()
+    ring_rod = ea.CosseratRod.ring_rod(
+        n_elements=10,
+        ring_center_position=np.zeros(3),
+        direction=np.array([0.0, 0.0, 1.0]),
+        normal=np.array([1.0, 0.0, 0.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=1e5,
+    )
+    simulator.append(ring_rod)
+    simulator.finalize()
+    block = next(iter(simulator.block_systems()))
+    block.position_collection[...] = np.random.rand(*block.position_collection.shape)
+    block.velocity_collection[...] = np.random.rand(*block.velocity_collection.shape)
+
+    simulator.constrain_values(time=np.float64(0.0))
+    simulator.constrain_rates(time=np.float64(0.0))
+
+    periodic_idx = block.periodic_boundary_nodes_idx
+    assert_allclose(
+        block.position_collection[:, periodic_idx[0]],
+        block.position_collection[:, periodic_idx[1]],
+        atol=Tolerance.atol(),
+    )
+    assert_allclose(
+        block.velocity_collection[:, periodic_idx[0]],
+        block.velocity_collection[:, periodic_idx[1]],
+        atol=Tolerance.atol(),
+    )